@@ -0,0 +1,5 @@
+"""Benchmarks and stub based tests of the common helpers and connectors.
+
+Benchmarks are run from the repository root as ``python -m benchmarks.<name>``
+and the tests as ``python -m pytest benchmarks``.
+"""
@@ -0,0 +1,130 @@
+"""Benchmark of the streaming Espi Atom parser against the ElementTree loops.
+
+Builds a feed fixture of 15 minutes interval readings and computes usage of
+every hour of the feed with the previous per-hour tree walk and with the
+single pass streaming parser.
+"""
+
+import tracemalloc
+import xml.etree.ElementTree as ET
+from typing import Dict, List
+
+from benchmarks.stubs import get_logger
+from common.elapsed_time import elapsed_timer
+from integration.coned.espi import (
+    ATOM_NS,
+    ESPI_NS,
+    get_hour_usage,
+    get_interval_usage,
+)
+
+DAYS = 31
+INTERVAL = 15
+START_TIMESTAMP = 1672531200
+HOURS_SAMPLE = 48
+
+
+def build_feed(days: int) -> str:
+    """Build Espi Atom feed having an entry with an interval block per day"""
+    entries = []
+    for day in range(days):
+        day_start = START_TIMESTAMP + day * 86400
+        readings = "".join(
+            "<espi:intervalReading>"
+            f"<espi:timePeriod><espi:duration>{INTERVAL * 60}</espi:duration>"
+            f"<espi:start>{start}</espi:start></espi:timePeriod>"
+            f"<espi:value>{(start // 60) % 997}</espi:value>"
+            "</espi:intervalReading>"
+            for start in range(day_start, day_start + 86400, INTERVAL * 60)
+        )
+        entries.append(
+            "<entry><content><espi:intervalBlocks><espi:intervalBlock>"
+            f"{readings}"
+            "</espi:intervalBlock></espi:intervalBlocks></content></entry>"
+        )
+    return (
+        f'<feed xmlns="{ATOM_NS}" xmlns:espi="{ESPI_NS}">'
+        f'{"".join(entries)}</feed>'
+    )
+
+
+def legacy_hour_usage(feed: str, required_intervals: List[int]) -> float:
+    """Previous implementation walking the whole tree for an hour"""
+    value = 0
+    root = ET.fromstring(feed)
+    for item in root:
+        if item.tag != f"{{{ATOM_NS}}}entry":
+            continue
+        for item2 in item:
+            if item2.tag != f"{{{ATOM_NS}}}content":
+                continue
+            for item3 in item2:
+                if item3.tag != f"{{{ESPI_NS}}}intervalBlocks":
+                    continue
+                for item4 in item3:
+                    if item4.tag != f"{{{ESPI_NS}}}intervalBlock":
+                        continue
+                    for item5 in item4:
+                        if item5.tag != f"{{{ESPI_NS}}}intervalReading":
+                            continue
+                        current_value, applicable = None, False
+                        for item6 in item5:
+                            if item6.tag == f"{{{ESPI_NS}}}value":
+                                current_value = float(item6.text)
+                            elif item6.tag == f"{{{ESPI_NS}}}timePeriod":
+                                for item7 in item6:
+                                    if item7.tag == f"{{{ESPI_NS}}}start" and (
+                                        int(item7.text) in required_intervals
+                                    ):
+                                        applicable = True
+                        if applicable:
+                            value += current_value
+    return value
+
+
+def get_hours() -> Dict[int, List[int]]:
+    """Get required intervals of the sampled hours"""
+    step = max(DAYS * 24 // HOURS_SAMPLE, 1)
+    return {
+        hour: list(range(hour, hour + 3600, INTERVAL * 60))
+        for hour in range(START_TIMESTAMP, START_TIMESTAMP + DAYS * 86400, 3600 * step)
+    }
+
+
+if __name__ == "__main__":
+    logger = get_logger("CONED PARSER BENCHMARK")
+
+    fixture = build_feed(DAYS)
+    hours = get_hours()
+
+    with elapsed_timer() as elapsed:
+        legacy = {
+            hour: legacy_hour_usage(fixture, hour_intervals)
+            for hour, hour_intervals in hours.items()
+        }
+        legacy_time = elapsed()
+
+    with elapsed_timer() as elapsed:
+        interval_usage = get_interval_usage(fixture)
+        streaming = {
+            hour: get_hour_usage(interval_usage, hour_intervals)[1]
+            for hour, hour_intervals in hours.items()
+        }
+        streaming_time = elapsed()
+
+    if legacy != streaming:
+        raise ValueError("Parsers results are different.")
+
+    tracemalloc.start()
+    ET.fromstring(fixture)
+    legacy_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    get_interval_usage(fixture)
+    streaming_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    logger.info(
+        f"{len(hours)} hours of a {DAYS} days feed ({len(fixture) // 1024} KiB): "
+        f"tree walk {legacy_time:.3f}s, peak {legacy_peak // 1024} KiB; "
+        f"streaming {streaming_time:.3f}s, peak {streaming_peak // 1024} KiB."
+    )
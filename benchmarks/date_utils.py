@@ -0,0 +1,68 @@
+"""Benchmark of the date parsing and formatting fast path.
+
+Measures the per-call cost of ``parse`` and ``format_date`` for the project
+fixed formats on a million calls against the generic pendulum based
+implementation used before.
+"""
+
+from typing import Callable, List
+
+import pendulum as pdl
+
+from benchmarks.stubs import get_logger
+from common.date_utils import format_date, parse, truncate
+from common.elapsed_time import elapsed_timer
+from common.settings import HOUR_ID_DATE_FORMAT, PROCESSING_DATE_FORMAT
+
+CALLS = 1000000
+HOURS = 24 * 31
+
+
+def legacy_parse(value: str, dt_format: str) -> pdl.DateTime:
+    """Previous implementation of the parsing by format"""
+    return pdl.from_format(value, dt_format)
+
+
+def legacy_format_date(value: pdl.DateTime, dt_format: str) -> str:
+    """Previous implementation of the formatting"""
+    return value.format(dt_format, locale="en")
+
+
+def measure(func: Callable, values: List, dt_format: str) -> float:
+    """Return the per-call cost in microseconds"""
+    amount = len(values)
+    with elapsed_timer() as elapsed:
+        for idx in range(CALLS):
+            func(values[idx % amount], dt_format)
+    return elapsed() / CALLS * 1e6
+
+
+if __name__ == "__main__":
+    logger = get_logger("DATE UTILS BENCHMARK")
+
+    start_date = truncate(pdl.now(tz="UTC"), level="day").subtract(hours=HOURS)
+    hours = [start_date.add(hours=hour) for hour in range(HOURS)]
+
+    for date_format in (PROCESSING_DATE_FORMAT, HOUR_ID_DATE_FORMAT):
+        hour_strings = [hour.format(date_format) for hour in hours]
+        assert [parse(x, dt_format=date_format) for x in hour_strings] == [
+            legacy_parse(x, date_format) for x in hour_strings
+        ]
+        assert [format_date(x, date_format) for x in hours] == hour_strings
+
+        legacy_parse_cost = measure(legacy_parse, hour_strings, date_format)
+        parse_cost = measure(
+            lambda value, dt_format: parse(value, dt_format=dt_format),
+            hour_strings,
+            date_format,
+        )
+        legacy_format_cost = measure(legacy_format_date, hours, date_format)
+        format_cost = measure(format_date, hours, date_format)
+
+        logger.info(
+            f"'{date_format}' on {CALLS} calls: "
+            f"parse {legacy_parse_cost:.2f}us -> {parse_cost:.2f}us "
+            f"({legacy_parse_cost / parse_cost:.1f}x), "
+            f"format {legacy_format_cost:.2f}us -> {format_cost:.2f}us "
+            f"({legacy_format_cost / format_cost:.1f}x)."
+        )
@@ -0,0 +1,218 @@
+"""Benchmark of the streaming Ecostruxture workbook ingestion.
+
+Builds a large synthetic daily workbook and measures time and peak memory
+of the attachment unbundling against the previous implementation, which
+loaded the whole workbook for editing, built a frame per sheet and collected
+the sheet frame again for every meter hour. Both must give the same
+consumption of every meter hour.
+"""
+
+import tracemalloc
+from io import BytesIO
+from pathlib import Path
+from queue import Queue
+from typing import Callable, Dict, Tuple
+
+import openpyxl
+import pendulum as pdl
+import polars as pl
+from expiringdict import ExpiringDict
+from imap_tools import MailAttachment
+
+from benchmarks.stubs import get_logger
+from common import settings as CFG
+from common.date_utils import format_date, parse, truncate
+from common.elapsed_time import elapsed_timer
+from integration.base_integration import ExtraInfo, MeterCfg, StorageInfo
+from integration.ecostruxture.config import EcoStruxtureCfg
+from integration.ecostruxture.workers import FetchWorker
+
+SHEETS = 20
+POINT_MINUTES = 1
+EXCESS_COLUMNS = 4
+
+
+class SyntheticAttachment(MailAttachment):
+    """Mail attachment stub having the given payload"""
+
+    def __init__(self, payload: bytes) -> None:  # pylint:disable=super-init-not-called
+        self._payload = payload
+
+    @property
+    def payload(self) -> bytes:
+        return self._payload
+
+
+def get_workbook(day: pdl.DateTime) -> bytes:
+    """Build daily workbook with a summary and a sheet of points per meter"""
+    workbook = openpyxl.Workbook(write_only=True)
+    workbook.create_sheet("Summary").append(["Summary"])
+    for idx in range(SHEETS):
+        sheet = workbook.create_sheet(f"sheet_{idx}")
+        sheet.append(["Date", "Value"] + [f"Excess {x}" for x in range(EXCESS_COLUMNS)])
+        for point in range(24 * 60 // POINT_MINUTES):
+            date = day.add(minutes=point * POINT_MINUTES)
+            sheet.append(
+                [date.format("YYYY-MM-DDTHH:mm:ss"), point * (idx + 1) * 0.5]
+                + [point] * EXCESS_COLUMNS
+            )
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def get_config() -> EcoStruxtureCfg:
+    """Get connector config having a meter per workbook sheet"""
+    return EcoStruxtureCfg(
+        meters=[
+            MeterCfg(
+                meter_name=f"meter_{idx}",
+                type="Electric",
+                standardized=StorageInfo(bucket="benchmark", path=f"meter_{idx}"),
+            )
+            for idx in range(SHEETS)
+        ],
+        extra=ExtraInfo(raw=StorageInfo(bucket="benchmark", path="raw")),
+        meters_sheet_mapper={f"meter_{idx}": f"sheet_{idx}" for idx in range(SHEETS)},
+    )
+
+
+def get_worker(config: EcoStruxtureCfg, payload: bytes) -> FetchWorker:
+    """Get fetch worker having all hours of the workbook day missed"""
+    missed_hours = ExpiringDict(max_len=24, max_age_seconds=3600)
+    worker = FetchWorker(
+        missed_hours=missed_hours,
+        fetched_files=Queue(),
+        fetch_update=Queue(),
+        config=config,
+    )
+    worker.configure(pdl.now(tz="UTC"))
+    workbook = openpyxl.load_workbook(BytesIO(payload), read_only=True)
+    # pylint:disable=protected-access
+    for mtr_hr in worker._get_meter_hour_form_excel(workbook):
+        missed_hours[mtr_hr] = Queue()
+        for mtr_cfg in config.meters:
+            missed_hours[mtr_hr].put(mtr_cfg)
+    workbook.close()
+    return worker
+
+
+def streaming_unbundle(worker: FetchWorker, payload: bytes) -> Dict[Tuple, float]:
+    """Unbundle attachment with the fetch worker"""
+    # pylint:disable=protected-access
+    worker._fetched_atachments_q.put(("1", SyntheticAttachment(payload)))
+    worker._run_consumers(
+        [(worker.unbundle_fetch_data_consumer, [])], run_parallel=False
+    )
+    consumption = {}
+    while not worker._fetched_files_queue.empty():
+        data_file = worker._fetched_files_queue.get()
+        mtr_hr = data_file.timestamps.queue[0]
+        mtr_cfg = data_file.meters.queue[0]
+        meter_hour = format_date(truncate(mtr_hr, level="hour"), "YYYY-MM-DDTHH")
+        consumption[(mtr_cfg.meter_name, meter_hour)] = data_file.body.filter(
+            pl.col("MeterHour")
+            == format_date(truncate(mtr_hr, level="hour"), CFG.PROCESSING_DATE_FORMAT)
+        )["Consumption"][0]
+    return consumption
+
+
+def legacy_unbundle(worker: FetchWorker, payload: bytes) -> Dict[Tuple, float]:
+    """Previous implementation of the attachment unbundling"""
+    workbook = openpyxl.reader.excel.load_workbook(BytesIO(payload), read_only=False)
+    workbook.remove(workbook["Summary"])
+    sheets_idx = {}
+    for sheet in workbook.worksheets:
+        sheet.delete_cols(3, 4)
+        values = sheet.values
+        next(values)
+        sheets_idx[sheet.title] = (
+            pl.DataFrame(values)
+            .lazy()
+            .rename({"column_0": "RawDates", "column_1": "RawConsumption"})
+            .unique()
+            .with_columns(pl.col("RawConsumption").cast(pl.Float64, strict=False))
+            .with_columns(
+                pl.col("RawDates")
+                .apply(lambda y: parse(y, tz_info="UTC"))
+                .alias("Dates")
+            )
+            .with_columns(
+                pl.col("Dates")
+                .apply(lambda y: truncate(y, level="hour"))
+                .alias("Hours")
+            )
+            .with_columns(
+                pl.col("Hours")
+                .apply(lambda y: format_date(y, CFG.PROCESSING_DATE_FORMAT))
+                .alias("MeterHour")
+            )
+            .with_columns(
+                pl.col("Dates").apply(lambda y: int(y.timestamp())).alias("Timestamp")
+            )
+            .sort(["Timestamp"])
+            .with_columns(
+                pl.col("RawConsumption").min().over("MeterHour").suffix("_min")
+            )
+            .with_columns(
+                pl.col("RawConsumption").max().over("MeterHour").suffix("_max")
+            )
+            .with_columns(
+                (pl.col("RawConsumption_max") - pl.col("RawConsumption_min")).alias(
+                    "Consumption"
+                )
+            )
+        )
+
+    consumption = {}
+    # pylint:disable=protected-access
+    for mtr_hr in worker._missed_hours_queue.keys():
+        for mtr_cfg in worker._missed_hours_queue[mtr_hr].queue:
+            mt_name = Path(mtr_cfg.meter_name).stem
+            sheet_name = worker._config.meters_sheet_mapper[mt_name]
+            body = sheets_idx[sheet_name].collect()
+            meter_hour = format_date(truncate(mtr_hr, level="hour"), "YYYY-MM-DDTHH")
+            consumption[(mtr_cfg.meter_name, meter_hour)] = body.filter(
+                pl.col("MeterHour")
+                == format_date(
+                    truncate(mtr_hr, level="hour"), CFG.PROCESSING_DATE_FORMAT
+                )
+            )["Consumption"][0]
+    return consumption
+
+
+def measure(func: Callable, config: EcoStruxtureCfg, payload: bytes) -> Tuple:
+    """Return result, elapsed time and peak of the allocated memory in MB"""
+    worker = get_worker(config, payload)
+    tracemalloc.start()
+    with elapsed_timer() as elapsed:
+        result = func(worker, payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed(), peak / 2**20
+
+
+if __name__ == "__main__":
+    logger = get_logger("ECOSTRUXTURE INGESTION BENCHMARK")
+
+    bench_config = get_config()
+    bench_payload = get_workbook(
+        truncate(pdl.now(tz="UTC"), level="day").subtract(days=1)
+    )
+
+    legacy, legacy_time, legacy_peak = measure(
+        legacy_unbundle, bench_config, bench_payload
+    )
+    streaming, streaming_time, streaming_peak = measure(
+        streaming_unbundle, bench_config, bench_payload
+    )
+    assert len(streaming) == SHEETS * 24, len(streaming)
+    assert streaming == legacy
+
+    logger.info(
+        f"Unbundled {SHEETS} sheets of {24 * 60 // POINT_MINUTES} points "
+        f"({len(bench_payload) / 2**20:.1f}MB) into {len(streaming)} meter hours: "
+        f"{legacy_time:.2f}s -> {streaming_time:.2f}s "
+        f"({legacy_time / streaming_time:.1f}x), peak memory "
+        f"{legacy_peak:.1f}MB -> {streaming_peak:.1f}MB."
+    )
@@ -0,0 +1,88 @@
+"""Benchmark of the pooled HTTP session against a connection per request.
+
+Runs a local keep-alive stub server and requests it from the workers of the
+shared thread pool, the way fetch workers request meter-hours.
+"""
+
+from queue import Empty, Queue
+from typing import Callable
+
+import requests
+
+from benchmarks.stubs import StubHandler, get_logger, get_stub_url, start_stub_server
+from common.elapsed_time import elapsed_timer
+from common.request_helpers.http_client import (
+    close_http_sessions,
+    get_http_session,
+    get_http_timeout,
+)
+from common.thread_pool_executor import (
+    run_thread_pool_executor,
+    shutdown_thread_pool_executor,
+)
+
+REQUESTS_AMOUNT = 2000
+WORKERS_AMOUNT = 10
+ROUNDS = 3
+RESPONSE_BODY = b'{"data": []}'
+
+
+class DataHandler(StubHandler):
+    """Keep-alive handler returning a small JSON document"""
+
+    def do_GET(self) -> None:  # pylint:disable=invalid-name
+        """Return the stub response"""
+        self.send_json(RESPONSE_BODY)
+
+
+def request_worker(
+    url: str,
+    tasks: Queue,
+    request: Callable,
+    worker_idx: str,  # pylint:disable=unused-argument
+) -> None:
+    """Request the stub server until the tasks queue is drained"""
+    while True:
+        try:
+            tasks.get_nowait()
+        except Empty:
+            break
+        request(url, timeout=get_http_timeout()).raise_for_status()
+
+
+def measure(url: str, request: Callable) -> float:
+    """Return the best average latency of a request in milliseconds"""
+    timings = []
+    for _ in range(ROUNDS):
+        tasks = Queue()
+        for idx in range(REQUESTS_AMOUNT):
+            tasks.put(idx)
+        with elapsed_timer() as elapsed:
+            for fut in run_thread_pool_executor(
+                workers=[(request_worker, [url, tasks, request])],
+                worker_replica=WORKERS_AMOUNT,
+            ):
+                fut.result()
+        timings.append(elapsed())
+    return min(timings) * 1000 * WORKERS_AMOUNT / REQUESTS_AMOUNT
+
+
+if __name__ == "__main__":
+    logger = get_logger("HTTP CLIENT BENCHMARK")
+
+    server = start_stub_server(DataHandler)
+    stub_url = f"{get_stub_url(server)}/data"
+
+    per_request = measure(stub_url, requests.get)
+    pooled = measure(stub_url, get_http_session(pool_size=WORKERS_AMOUNT).get)
+
+    close_http_sessions()
+    shutdown_thread_pool_executor()
+    server.shutdown()
+
+    logger.info(
+        f"{REQUESTS_AMOUNT} requests by {WORKERS_AMOUNT} workers: "
+        f"connection per request {per_request:.2f}ms, "
+        f"pooled session {pooled:.2f}ms per request, "
+        f"speedup {per_request / pooled:.2f}x."
+    )
@@ -0,0 +1,115 @@
+"""Benchmark of the pull connectors meter config lookup.
+
+Configures a participant of five thousand meters and looks up the config of
+every meter hour by name and by type, like the standardize paths do, with the
+meters index and with the previous linear scan of the meters configs. Both
+must find the same configs.
+"""
+
+import base64
+from dataclasses import dataclass, field
+from json import dumps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.stubs import get_logger
+from common.elapsed_time import elapsed_timer
+from integration.base_integration import BasePullConnector, ExtraInfo, MeterCfg
+
+METERS = 5000
+HOURS = 2
+TYPES = ("Electric", "Gas", "Water", "Steam", "Occupancy")
+
+
+@dataclass
+class BenchmarkCfg:
+    """Participant config"""
+
+    meters: List[MeterCfg] = field(default_factory=list)
+    extra: ExtraInfo = field(default_factory=ExtraInfo)
+    timestamp_shift: Dict = field(default_factory=dict)
+
+
+class BenchmarkConnector(BasePullConnector):
+    """Pull connector loading the participant config only"""
+
+    def configure(self, data: bytes) -> None:
+        self._config = self._config_factory(data, BenchmarkCfg)
+
+
+def get_config_data() -> Dict[str, bytes]:
+    """Get raw participant config having meters of the several types"""
+    cfg = {
+        "meters": [
+            {
+                "meter_name": f" Meter_{idx} ",
+                "meter_id": idx,
+                "meter_uri": f"https://meters/{idx}",
+                "type": TYPES[idx % len(TYPES)] if idx < len(TYPES) else "Electric",
+                "standardized": {"bucket": "benchmark", "path": f"meter_{idx}"},
+            }
+            for idx in range(METERS)
+        ],
+        "extra": {"participant_id": 1},
+    }
+    return {"data": base64.b64encode(dumps({"data": cfg}).encode("utf-8"))}
+
+
+def legacy_by_name(connector: BenchmarkConnector, mtr_name: str) -> Optional[Any]:
+    """Previous linear lookup by the meter name"""
+    # pylint:disable=protected-access
+    for mtr_cfg in connector._config.meters:
+        if mtr_cfg.meter_name.strip().lower() == mtr_name.strip().lower():
+            return mtr_cfg
+    return None
+
+
+def legacy_by_type(connector: BenchmarkConnector, mtr_type: str) -> Optional[Any]:
+    """Previous linear lookup by the meter type, without the debug logging"""
+    # pylint:disable=protected-access
+    for mtr_cfg in connector._config.meters:
+        if mtr_cfg.type.strip().lower() == mtr_type.strip().lower():
+            return mtr_cfg
+    return None
+
+
+def lookup(
+    connector: BenchmarkConnector, by_name: Callable, by_type: Callable
+) -> Tuple[List, float]:
+    """Look up config of every meter hour, return found configs and time"""
+    found = []
+    with elapsed_timer() as elapsed:
+        for _ in range(HOURS):
+            for idx in range(METERS):
+                found.append(by_name(connector, f"meter_{idx}"))
+                found.append(by_type(connector, TYPES[idx % len(TYPES)].lower()))
+    return found, elapsed()
+
+
+if __name__ == "__main__":
+    logger = get_logger("METERS INDEX BENCHMARK")
+
+    bench_connector = BenchmarkConnector(env_tz_info="UTC")
+    with elapsed_timer() as configure_elapsed:
+        bench_connector.configure(get_config_data())
+    configure_time = configure_elapsed()
+    # pylint:disable=protected-access
+    assert bench_connector._meters_index.meters is bench_connector._config.meters
+
+    legacy, legacy_time = lookup(bench_connector, legacy_by_name, legacy_by_type)
+    indexed, indexed_time = lookup(
+        bench_connector,
+        BenchmarkConnector._get_meter_config_by_name,
+        BenchmarkConnector._get_meter_config_by_type,
+    )
+    assert all(mtr_cfg is not None for mtr_cfg in indexed)
+    assert all(new is old for new, old in zip(indexed, legacy))
+    assert bench_connector.meters_index.get_by_id(METERS - 1).meter_uri == (
+        f"https://meters/{METERS - 1}"
+    )
+    assert bench_connector.meters_index.get_by_uri("HTTPS://METERS/0").meter_id == 0
+
+    logger.info(
+        f"Looked up {len(indexed)} configs of {METERS} meters: "
+        f"{legacy_time:.2f}s -> {indexed_time:.3f}s "
+        f"({legacy_time / indexed_time:.0f}x), configured in {configure_time:.2f}s."
+    )
@@ -0,0 +1,62 @@
+"""Micro-benchmark of the standardized files gap detection.
+
+Runs ``get_missed_standardized_files`` against 50k synthetic blob names
+returned by an in-memory storage client, so only the gap detection itself
+is measured.
+"""
+
+import random
+from typing import NamedTuple
+
+import pendulum as pdl
+
+from benchmarks.stubs import SyntheticClient, get_logger
+from common.bucket_helpers import get_missed_standardized_files
+from common.date_utils import GapDatePeriod, format_date, truncate
+from common.elapsed_time import elapsed_timer
+from common.settings import PROCESSING_DATE_FORMAT
+
+BLOBS_AMOUNT = 50000
+GAPS_RATIO = 0.1
+METER_PATH = "meter/standardized"
+ROUNDS = 5
+
+
+class SyntheticBlob(NamedTuple):
+    """Blob stub having the name only"""
+
+    name: str
+
+
+if __name__ == "__main__":
+    logger = get_logger("GAP DETECTION BENCHMARK")
+
+    end_date = truncate(pdl.now(tz="UTC"))
+    start_date = end_date.subtract(hours=BLOBS_AMOUNT - 1)
+    random.seed(BLOBS_AMOUNT)
+    client = SyntheticClient(
+        [
+            SyntheticBlob(
+                f"{METER_PATH}/"
+                f"{format_date(start_date.add(hours=hour), PROCESSING_DATE_FORMAT)}"
+            )
+            for hour in range(BLOBS_AMOUNT)
+            if random.random() > GAPS_RATIO
+        ]
+    )
+
+    timings, gaps = [], []
+    for _ in range(ROUNDS):
+        with elapsed_timer() as elapsed:
+            gaps = get_missed_standardized_files(
+                bucket_name="benchmark",
+                bucket_path=METER_PATH,
+                date_range=GapDatePeriod(end_date, BLOBS_AMOUNT - 1),
+                client=client,
+            )
+        timings.append(elapsed())
+
+    logger.info(
+        f"Detected {len(gaps)} gaps in {BLOBS_AMOUNT} hours, "
+        f"best of {ROUNDS} runs {min(timings):.3f}s."
+    )
@@ -0,0 +1,106 @@
+"""Benchmark of the standardized meter creation and serialization.
+
+Creates and serializes 100k meter values with the previous ``Meter``
+building element makers per instance, the current ``Meter`` and the
+lightweight ``CompactMeter`` checking all of them produce the same XML.
+"""
+
+from typing import Callable, List
+
+import pendulum as pdl
+from lxml import builder
+
+from benchmarks.stubs import get_logger
+from common.data_representation.standardized.meter import CompactMeter, Meter
+from common.date_utils import format_date, truncate
+from common.elapsed_time import elapsed_timer
+
+METERS = 100000
+METER_URI = "https://hourlybuildingdata.com/participant/0/meter/benchmark"
+
+
+class LegacyMeter(Meter):
+    """Previous implementation building element makers per instance"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # pylint: disable=c-extension-no-member
+        self._root_element_maker = builder.ElementMaker(
+            namespace=self.hbd, nsmap=self._namespaces
+        )
+        self._hbd_element_maker = builder.ElementMaker(namespace=self.hbd)
+        self._espm_element_maker = builder.ElementMaker(namespace=self.espm)
+
+    def as_xml(self):
+        """Generate XML representation of the meter data"""
+        root_tag = self._root_element_maker.meterData(
+            self._hbd_element_maker.meteredData(
+                self._hbd_element_maker.meterURI(self.meter_uri),
+                self._hbd_element_maker.startTime(
+                    format_date(self.start_time, dt_format=self.meter_xml_data_format)
+                ),
+                self._hbd_element_maker.endTime(
+                    format_date(self.end_time, dt_format=self.meter_xml_data_format)
+                ),
+                self._hbd_element_maker.usage(str(self.usage)),
+                self._hbd_element_maker.audit(
+                    self._espm_element_maker.createdBy(self.created_by),
+                    self._espm_element_maker.createdDate(self.created_date),
+                ),
+            )
+        )
+        root_tag.attrib[f"{{{self.xsi}}}schemaLocation"] = self.schema_location
+        return root_tag
+
+
+def build_meters(meter_cls: Callable, hours: List[pdl.DateTime], run_time) -> List:
+    """Build meter per hour the same way standardize workers do"""
+    meters = []
+    for idx, hour in enumerate(hours):
+        meter = meter_cls()
+        meter.created_date = run_time
+        meter.start_time = hour
+        meter.end_time = hour.add(minutes=59, seconds=59)
+        meter.created_by = "Benchmark Connector"
+        meter.usage = idx / 10
+        meter.meter_uri = METER_URI
+        meters.append(meter)
+    return meters
+
+
+def measure(meter_cls: Callable, hours: List, run_time, pretty_print: bool = True):
+    """Return build and serialization time and the serialized meters"""
+    with elapsed_timer() as elapsed:
+        meters = build_meters(meter_cls, hours, run_time)
+        build_time = elapsed()
+        data = [meter.as_str(pretty_print=pretty_print) for meter in meters]
+        serialize_time = elapsed() - build_time
+    return build_time, serialize_time, data
+
+
+if __name__ == "__main__":
+    logger = get_logger("STANDARDIZED METER BENCHMARK")
+
+    now = truncate(pdl.now(tz="UTC"))
+    start_date = now.subtract(hours=METERS)
+    meter_hours = [start_date.add(hours=hour) for hour in range(METERS)]
+
+    results = {
+        "legacy meter": measure(LegacyMeter, meter_hours, now),
+        "meter": measure(Meter, meter_hours, now),
+        "compact meter": measure(CompactMeter, meter_hours, now),
+        "compact meter, not pretty": measure(
+            CompactMeter, meter_hours, now, pretty_print=False
+        ),
+    }
+    assert (
+        results["legacy meter"][2]
+        == results["meter"][2]
+        == results["compact meter"][2]
+    )
+
+    for name, (build_time, serialize_time, _) in results.items():
+        logger.info(
+            f"{name}: {METERS} meters built in {build_time:.3f}s "
+            f"and serialized in {serialize_time:.3f}s."
+        )
@@ -0,0 +1,89 @@
+"""Stubs shared by the benchmarks and the stub based tests"""
+
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from threading import Lock, Thread
+from typing import Any, List, Optional, Type
+
+from common.logging import Logger
+from integration.base_integration import MeterCfg, StorageInfo
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive stub handler counting the requests by path"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    requests: Counter = Counter()
+    requests_lock: Lock = Lock()
+
+    def count_request(self, key: str) -> None:
+        """Count request of the given key"""
+        with self.requests_lock:
+            self.requests[key] += 1
+
+    def send_json(self, body: Any) -> None:
+        """Send JSON response of the given body"""
+        data = body if isinstance(body, bytes) else dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args) -> None:  # pylint:disable=arguments-differ
+        """Do not log requests"""
+
+
+def start_stub_server(handler: Type[StubHandler]) -> ThreadingHTTPServer:
+    """Start local stub server of the given handler in a daemon thread"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def get_stub_url(server: ThreadingHTTPServer) -> str:
+    """Get base URL of the stub server"""
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+class SyntheticClient:
+    """Storage client stub listing the given blobs"""
+
+    def __init__(self, blobs: Optional[List[Any]] = None) -> None:
+        self._blobs = blobs or []
+
+    def bucket(self, bucket_name: str) -> str:
+        """Return bucket name as the bucket"""
+        return bucket_name
+
+    def list_blobs(self, **kwargs) -> List[Any]:  # pylint:disable=unused-argument
+        """Return the synthetic blobs"""
+        return self._blobs
+
+
+def get_logger(description: str) -> Logger:
+    """Get logger of the benchmark results"""
+    return Logger(
+        name="BENCHMARK",
+        level="DEBUG",
+        description=description,
+        trace_id=uuid.uuid4(),
+    )
+
+
+def get_meter_configs(amount: int, meter_type: str, **kwargs) -> List[MeterCfg]:
+    """Get configs of the given amount of meters of the same type"""
+    return [
+        MeterCfg(
+            meter_name=f"meter_{idx}",
+            type=meter_type,
+            standardized=StorageInfo(bucket="benchmark", path=f"meter_{idx}"),
+            **{name: value.format(idx=idx) for name, value in kwargs.items()},
+        )
+        for idx in range(amount)
+    ]
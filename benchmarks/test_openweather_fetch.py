@@ -0,0 +1,100 @@
+"""Test of the OpenWeather fetching against a local timemachine stub.
+
+The stub returns the single requested point with a fixed latency, the test
+checks every missed hour is requested once and the fetch consumer replicas
+request the hours in parallel.
+"""
+
+import time
+from collections import Counter
+from queue import Queue
+from urllib.parse import parse_qs, urlparse
+
+import pendulum as pdl
+from expiringdict import ExpiringDict
+
+from benchmarks.stubs import (
+    StubHandler,
+    SyntheticClient,
+    get_meter_configs,
+    get_stub_url,
+    start_stub_server,
+)
+from common.date_utils import truncate
+from common.elapsed_time import elapsed_timer
+from common.thread_pool_executor import run_thread_pool_executor
+from integration.base_integration import ExtraInfo, StorageInfo
+from integration.openweather.config import OpenWeatherCfg
+from integration.openweather.workers import FetchWorker
+
+DAYS = 5
+LATENCY = 0.02
+METERS = 7
+
+
+class TimemachineHandler(StubHandler):
+    """Timemachine stub returning the requested point"""
+
+    requests = Counter()
+
+    def do_GET(self) -> None:  # pylint:disable=invalid-name
+        """Return the stub response"""
+        self.count_request(urlparse(self.path).path)
+        params = parse_qs(urlparse(self.path).query)
+        time.sleep(LATENCY)
+        self.send_json(
+            {
+                "lat": float(params["lat"][0]),
+                "lon": float(params["lon"][0]),
+                "timezone": "UTC",
+                "timezone_offset": 0,
+                "data": [{"dt": int(params["dt"][0]), "temp": 50, "humidity": 50}],
+            }
+        )
+
+
+def get_config() -> OpenWeatherCfg:
+    """Get connector config of the meters sharing the location"""
+    return OpenWeatherCfg(
+        meters=get_meter_configs(METERS, "Ambient Temperature"),
+        extra=ExtraInfo(raw=StorageInfo(bucket="benchmark", path="raw")),
+        city_coordinates_latitude="40.7",
+        city_coordinates_longitude="-74.0",
+        gap_regeneration_window=DAYS * 24,
+    )
+
+
+def test_fetch_requests_every_missed_hour_once() -> None:
+    """Missed hours of all meters are fetched by a request per hour"""
+    config = get_config()
+    run_time = truncate(pdl.now(tz="UTC"), level="day")
+    missed_hours = ExpiringDict(max_len=DAYS * 24, max_age_seconds=3600)
+    for hour in range(DAYS * 24):
+        meters = Queue()
+        for mtr_cfg in config.meters:
+            meters.put(mtr_cfg)
+        missed_hours[run_time.subtract(hours=hour + 1)] = meters
+
+    server = start_stub_server(TimemachineHandler)
+    worker = FetchWorker(
+        missed_hours=missed_hours,
+        fetched_files=Queue(),
+        fetch_update=Queue(),
+        config=config,
+    )
+    worker.__api_url__ = f"{get_stub_url(server)}/timemachine"
+    worker.configure(run_time)
+    try:
+        with elapsed_timer() as elapsed:
+            for fut in run_thread_pool_executor(
+                workers=[(worker.fetch_consumer, [SyntheticClient(), Queue()])],
+                worker_replica=worker.__workers_amount__,
+            ):
+                fut.result()
+    finally:
+        server.shutdown()
+
+    # pylint:disable=protected-access
+    assert worker._fetched_files_queue.qsize() == DAYS * 24
+    assert TimemachineHandler.requests["/timemachine"] == DAYS * 24
+    assert elapsed() < DAYS * 24 * LATENCY / 2
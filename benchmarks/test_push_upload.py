@@ -0,0 +1,122 @@
+"""Test of the push connectors standardized files uploading.
+
+Standardizes a thousand and fifty thousand files of a push connector against
+an in-memory stub of the storage client having a fixed upload latency. The
+files are streamed to the upload threads as they are generated, so the peak
+memory above the kept update status locations must stay the same for both
+amounts of files.
+"""
+
+import tracemalloc
+from itertools import chain
+from time import sleep
+from typing import Any, Dict, Iterator
+
+import pendulum as pdl
+
+from common import settings as CFG
+from common.data_representation.standardized.meter import meter_to_xml, xml_to_str
+from common.date_utils import format_date
+from common.upload_pipeline import UploadPipeline
+from integration.base_integration import BasePushConnector
+
+FILES = (1000, 50000)
+LATENCY = 0.001
+MAX_BYTES = 256 * 2**10
+UPLOADED = set()
+
+
+class StubBlob:
+    """Storage blob stub"""
+
+    def __init__(self, bucket: str, name: str) -> None:
+        self.bucket = bucket
+        self.name = name
+        self.content_encoding = None
+
+    def upload_from_string(self, data: Any, **kwargs) -> None:
+        """Upload the blob with a fixed latency"""
+        sleep(LATENCY)
+        UPLOADED.add((self.bucket, self.name))
+
+
+class StubBucket:
+    """Storage bucket stub"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def blob(self, blob_name: str) -> StubBlob:
+        """Get blob of the bucket"""
+        return StubBlob(self.name, blob_name)
+
+
+class StubClient:
+    """Storage client stub"""
+
+    def bucket(self, bucket_name: str) -> StubBucket:
+        """Get bucket handle"""
+        return StubBucket(bucket_name)
+
+
+class BenchmarkConnector(BasePushConnector):
+    """Push connector generating standardized files of a single meter"""
+
+    def configure(self, data: bytes) -> None:
+        self._run_time = pdl.now(tz="UTC")
+
+    def iter_files(self, amount: int) -> Iterator[Dict[str, Any]]:
+        """Generate standardized files of the consecutive hours"""
+        start = pdl.datetime(2020, 1, 1, tz="UTC")
+        xml_format = CFG.STANDARDIZED_METER_DATE_FORMAT
+        created_date = format_date(self._run_time, xml_format)
+        for idx in range(amount):
+            start_time = start.add(hours=idx)
+            yield {
+                "meter_type": "electric",
+                "bucket": "benchmark",
+                "preffix": "electric",
+                "filename": format_date(start_time, CFG.PROCESSING_DATE_FORMAT),
+                "file_body": xml_to_str(
+                    meter_to_xml(
+                        meter_uri="https://meters/benchmark",
+                        start_time=format_date(start_time, xml_format),
+                        end_time=format_date(
+                            start_time.add(minutes=59, seconds=59), xml_format
+                        ),
+                        usage=str(idx),
+                        created_by=self.__created_by__,
+                        created_date=created_date,
+                    )
+                ),
+            }
+
+
+def upload_streaming(amount: int) -> float:
+    """Upload standardized files as they are generated, return peak memory.
+
+    The peak memory in MB is measured above the kept file locations.
+    """
+    UPLOADED.clear()
+    connector = BenchmarkConnector(env_tz_info="UTC")
+    connector.configure(b"")
+    # pylint:disable=protected-access
+    connector._upload_pipeline = UploadPipeline(
+        max_bytes=MAX_BYTES, client=StubClient()
+    )
+    tracemalloc.start()
+    for fl_info in connector.iter_files(amount):
+        connector._put_standardized_file(fl_info)
+    connector._wait_for_uploads()
+    for fl_info in chain.from_iterable(connector._standardized_files.values()):
+        fl_info.pop("file_body", None)
+    kept, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(UPLOADED) == amount, len(UPLOADED)
+    return (peak - kept) / 2**20
+
+
+def test_peak_memory_does_not_depend_on_files_amount() -> None:
+    """Peak memory of the files in flight stays the same for more files"""
+    small, large = (upload_streaming(amount) for amount in FILES)
+    assert large < 1.5 * small + MAX_BYTES / 2**20, (small, large)
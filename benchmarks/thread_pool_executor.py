@@ -0,0 +1,97 @@
+"""Benchmark of the shared thread pool against a pool created per call.
+
+Simulates a connector run where the meter-hours of every meter go through
+the fetch, standardize, upload, move and finalize stages, each stage of a
+meter being a separate ``run_thread_pool_executor`` call.
+"""
+
+import queue
+import time
+from concurrent.futures import ALL_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.stubs import get_logger
+from common.elapsed_time import elapsed_timer
+from common.thread_pool_executor.thread_pool_executor import (
+    run_thread_pool_executor,
+    shutdown_thread_pool_executor,
+)
+
+STAGES = ("fetch", "standardize", "upload", "move", "finalize")
+METERS = 100
+HOURS_PER_METER = 24
+WORKER_REPLICA = 10
+IO_LATENCY = 0.0001
+ROUNDS = 5
+
+
+def per_call_thread_pool_executor(
+    workers: List[Tuple[Callable, List[Any]]],
+    worker_replica: int = 1,
+    max_pool_workers: int = 10,
+) -> Dict:
+    """Previous implementation creating the pool on every call."""
+    futures = {}
+    with ThreadPoolExecutor(max_workers=max_pool_workers) as executor:
+        for idx, (worker, args) in enumerate(workers, 1):
+            for replica_idx in range(1, worker_replica + 1):
+                key = f"{idx}_{replica_idx}_{worker.__name__}"
+                if replica_idx == 1:
+                    args.append(key)
+                else:
+                    args[-1] = key
+                futures[executor.submit(worker, *args)] = key
+        wait(futures, timeout=1, return_when=ALL_COMPLETED)
+    return futures
+
+
+def stage_worker(
+    task_queue: queue.Queue,
+    worker_idx: str,  # pylint:disable=unused-argument
+) -> None:
+    """Process simulated meter-hours until the queue is drained"""
+    while True:
+        try:
+            task_queue.get_nowait()
+        except queue.Empty:
+            break
+        time.sleep(IO_LATENCY)
+        task_queue.task_done()
+
+
+def run_connector(runner: Callable) -> None:
+    """Run all stages of a simulated connector"""
+    for _ in range(METERS):
+        for _ in STAGES:
+            task_queue = queue.Queue()
+            for meter_hour in range(HOURS_PER_METER):
+                task_queue.put(meter_hour)
+            for fut in runner(
+                workers=[(stage_worker, [task_queue])],
+                worker_replica=WORKER_REPLICA,
+            ):
+                fut.result()
+
+
+def measure(runner: Callable) -> float:
+    """Return the best run time of the simulated connector"""
+    timings = []
+    for _ in range(ROUNDS):
+        with elapsed_timer() as elapsed:
+            run_connector(runner)
+        timings.append(elapsed())
+    return min(timings)
+
+
+if __name__ == "__main__":
+    logger = get_logger("THREAD POOL BENCHMARK")
+
+    per_call = measure(per_call_thread_pool_executor)
+    shared = measure(run_thread_pool_executor)
+    shutdown_thread_pool_executor()
+
+    logger.info(
+        f"{METERS * HOURS_PER_METER} meter-hours through {len(STAGES)} stages: "
+        f"per call pool {per_call:.3f}s, shared pool {shared:.3f}s, "
+        f"speedup {per_call / shared:.2f}x."
+    )
@@ -0,0 +1,180 @@
+"""Benchmark of the standardize update status manifests.
+
+Saves update status of a hundred thousand standardized meter hours of a pull
+connector as NDJSON manifests, plain and gzip compressed, and compares them
+with the previous manifests built from dicts and dumped with indentation.
+The DB load worker must read the same contents from both.
+"""
+
+from json import dumps, loads
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+from unittest import mock
+
+import pendulum as pdl
+
+from benchmarks.stubs import get_logger
+from common import settings as CFG
+from common.data_representation.standardized.meter import CompactMeter
+from common.date_utils import format_date
+from common.elapsed_time import elapsed_timer
+from common.update_manifest import ManifestWriter, load_manifest
+from integration.base_integration import (
+    BasePullConnector,
+    ExtraInfo,
+    MeterCfg,
+    StorageInfo,
+)
+
+HOURS = 100000
+PARTICIPANT_ID = 7
+
+
+class BenchmarkConnector(BasePullConnector):
+    """Pull connector keeping the update status files in memory"""
+
+    def __init__(self, env_tz_info: str) -> None:
+        super().__init__(env_tz_info=env_tz_info)
+        self.update_files: Dict[str, bytes] = {}
+
+    def configure(self, data: bytes) -> None:
+        self._config = SimpleNamespace(
+            meters=[
+                MeterCfg(
+                    meter_name="meter",
+                    type="electric",
+                    standardized=StorageInfo(bucket="benchmark", path="electric"),
+                )
+            ],
+            extra=ExtraInfo(
+                participant_id=PARTICIPANT_ID,
+                raw=StorageInfo(bucket="benchmark", path="raw"),
+            ),
+        )
+        self._run_time = pdl.datetime(2023, 1, 1, tz="UTC")
+
+    def _upload_update_status_file(
+        self, raw_data: Any, str_bucket: str, str_path: str, filename: str
+    ) -> None:
+        self.update_files[filename] = raw_data
+
+
+def get_standardized_files() -> List[Tuple[str, str, str, CompactMeter]]:
+    """Get standardized files of the consecutive meter hours"""
+    files, start = [], pdl.datetime(2012, 1, 1, tz="UTC")
+    for idx in range(HOURS):
+        meter = CompactMeter()
+        meter.start_time = start.add(hours=idx)
+        meter.usage = idx * 0.25
+        meter.meter_uri = "https://meters/benchmark"
+        files.append(
+            (
+                "benchmark",
+                "electric",
+                format_date(meter.start_time, CFG.PROCESSING_DATE_FORMAT),
+                meter,
+            )
+        )
+    return files
+
+
+def legacy_manifests(
+    files: List[Tuple[str, str, str, CompactMeter]], chunk_size: int
+) -> List[str]:
+    """Previous manifests accumulated as dicts and dumped with indentation"""
+    manifests = []
+    for pos in range(0, len(files), chunk_size):
+        chunk = files[pos : pos + chunk_size]
+        update = {"amounts": len(chunk), "files": [], "updates": []}
+        for bucket, path, filename, mtr in chunk:
+            update["files"].append(
+                {"bucket": bucket, "path": path, "filename": filename}
+            )
+            update["updates"].append(
+                {
+                    "ref_hour_id": int(
+                        format_date(mtr.start_time, CFG.HOUR_ID_DATE_FORMAT)
+                    ),
+                    "ref_participant_id": PARTICIPANT_ID,
+                    "ref_meter_id": int(mtr.meter_id),
+                    "data": float(mtr.usage),
+                }
+            )
+        manifests.append(dumps(update, indent=4, sort_keys=True))
+    return manifests
+
+
+def save_manifests(
+    files: List[Tuple[str, str, str, CompactMeter]], gzip_encoding: bool
+) -> List[bytes]:
+    """Save update status with the connector"""
+    connector = BenchmarkConnector(env_tz_info="UTC")
+    connector.configure(b"")
+    # pylint:disable=protected-access
+    connector._standardized_files["electric"] = files
+    with mock.patch.object(CFG, "UPDATE_MANIFEST_GZIP", gzip_encoding), mock.patch(
+        "integration.base_integration.base.save_covered_hours"
+    ):
+        connector._save_standardize_update_status()
+    return [
+        connector.update_files[name]
+        for name in sorted(
+            connector.update_files, key=lambda name: int(name.split("-")[1])
+        )
+    ]
+
+
+def read_manifest(body: Any) -> Dict:
+    """Read manifest like the DB load worker"""
+    with mock.patch(
+        "common.update_manifest.update_manifest.get_file_contents",
+        return_value=body.encode("utf-8") if isinstance(body, str) else body,
+    ):
+        return load_manifest(
+            bucket="benchmark", path="electric/updates", filename="updates-1"
+        )
+
+
+if __name__ == "__main__":
+    logger = get_logger("UPDATE MANIFEST BENCHMARK")
+
+    st_files = get_standardized_files()
+    max_chunk_size = BenchmarkConnector.__max_chunk_size__
+
+    with elapsed_timer() as legacy_elapsed:
+        legacy = legacy_manifests(st_files, max_chunk_size)
+    legacy_time = legacy_elapsed()
+
+    with elapsed_timer() as ndjson_elapsed:
+        ndjson = save_manifests(st_files, gzip_encoding=False)
+    ndjson_time = ndjson_elapsed()
+
+    with elapsed_timer() as gzip_elapsed:
+        gzipped = save_manifests(st_files, gzip_encoding=True)
+    gzip_time = gzip_elapsed()
+
+    assert len(legacy) == len(ndjson) == len(gzipped) == HOURS // max_chunk_size
+    for legacy_body, ndjson_body, gzip_body in zip(legacy, ndjson, gzipped):
+        expected = loads(legacy_body)
+        assert read_manifest(legacy_body) == expected
+        assert read_manifest(ndjson_body) == expected
+        assert read_manifest(gzip_body) == expected
+
+    writer = ManifestWriter(gzip_encoding=False)
+    assert writer.getvalue() == writer.getvalue()
+    assert read_manifest(writer.getvalue()) == {
+        "amounts": 0,
+        "files": [],
+        "updates": [],
+    }
+
+    def size(bodies: List[Any]) -> float:
+        """Total size in MB"""
+        return sum(len(body) for body in bodies) / 2**20
+
+    logger.info(
+        f"Saved {len(ndjson)} manifests of {HOURS} meter hours: "
+        f"{legacy_time:.2f}s, {size(legacy):.1f}MB -> NDJSON {ndjson_time:.2f}s, "
+        f"{size(ndjson):.1f}MB ({legacy_time / ndjson_time:.1f}x), gzip "
+        f"{gzip_time:.2f}s, {size(gzipped):.2f}MB."
+    )
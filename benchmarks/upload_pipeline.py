@@ -0,0 +1,102 @@
+"""Benchmark of the pull connectors upload pipeline.
+
+Saves ten thousand small fetched files of a pull connector against a local
+stub of the storage upload API having a fixed latency, pointed to by the
+``STORAGE_EMULATOR_HOST`` like a storage emulator. Compares the pipeline with
+the previous uploading of the files one at a time on the calling thread.
+"""
+
+import os
+from collections import Counter
+from json import dumps
+from time import sleep
+from types import SimpleNamespace
+
+from google.auth.credentials import AnonymousCredentials
+from google.cloud.storage import Client
+
+from benchmarks.stubs import StubHandler, get_logger, get_stub_url, start_stub_server
+from common.bucket_helpers import upload_file_to_bucket
+from common.elapsed_time import elapsed_timer
+from common.upload_pipeline import UploadPipeline
+from integration.base_integration import BasePullConnector, StorageInfo
+
+FILES = 10000
+LATENCY = 0.01
+MAX_BYTES = 256 * 2**10
+
+
+class UploadHandler(StubHandler):
+    """Storage upload API stub accepting multipart uploads"""
+
+    requests = Counter()
+
+    def do_POST(self) -> None:  # pylint:disable=invalid-name
+        """Accept the uploaded object"""
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        sleep(LATENCY)
+        self.count_request("uploads")
+        if b'"contentEncoding": "gzip"' in body:
+            self.count_request("gzip")
+        self.send_json({"name": "object", "bucket": "benchmark"})
+
+
+class BenchmarkConnector(BasePullConnector):
+    """Pull connector saving fetched files only"""
+
+    def configure(self, data: bytes) -> None:
+        self._config = SimpleNamespace(
+            extra=SimpleNamespace(raw=StorageInfo(bucket="benchmark", path="raw"))
+        )
+
+
+def run_pipeline(client: Client, gzip_encoding: bool) -> float:
+    """Save fetched files with the connector, return elapsed time"""
+    connector = BenchmarkConnector(env_tz_info="UTC")
+    connector.configure(b"")
+    # pylint:disable=protected-access
+    connector._upload_pipeline = UploadPipeline(
+        max_bytes=MAX_BYTES, gzip_encoding=gzip_encoding, client=client
+    )
+    with elapsed_timer() as elapsed:
+        for idx in range(FILES):
+            connector._save_fetched_data(
+                {"idx": idx, "value": "x" * 100}, f"file_{idx}", f"meter_{idx % 10}"
+            )
+        connector._wait_for_uploads()
+    saved = sum(len(files) for files in connector._fetched_files.values())
+    assert saved == FILES, saved
+    return elapsed()
+
+
+if __name__ == "__main__":
+    logger = get_logger("UPLOAD PIPELINE BENCHMARK")
+
+    server = start_stub_server(UploadHandler)
+    os.environ["STORAGE_EMULATOR_HOST"] = get_stub_url(server)
+    storage_client = Client(project="benchmark", credentials=AnonymousCredentials())
+
+    with elapsed_timer() as legacy_elapsed:
+        for file_idx in range(FILES):
+            upload_file_to_bucket(
+                "benchmark",
+                dumps({"idx": file_idx, "value": "x" * 100}),
+                blob_path="raw",
+                file_name=f"file_{file_idx}",
+                client=storage_client,
+            )
+    legacy_time = legacy_elapsed()
+    assert UploadHandler.requests["uploads"] == FILES, UploadHandler.requests
+
+    pipeline_time = run_pipeline(storage_client, gzip_encoding=False)
+    gzip_time = run_pipeline(storage_client, gzip_encoding=True)
+    server.shutdown()
+    assert UploadHandler.requests["uploads"] == 3 * FILES, UploadHandler.requests
+    assert UploadHandler.requests["gzip"] == FILES, UploadHandler.requests
+
+    logger.info(
+        f"Uploaded {FILES} files with {LATENCY * 1000:.0f}ms latency: "
+        f"{legacy_time:.2f}s -> {pipeline_time:.2f}s "
+        f"({legacy_time / pipeline_time:.1f}x), with gzip encoding "
+        f"{gzip_time:.2f}s."
+    )
@@ -0,0 +1,176 @@
+"""Benchmark of the range-based Wattime fetching.
+
+Runs the marginal and average emissions fetch consumers against a local stub
+of the Wattime API, and checks the workers share a single login, every range
+of missed hours is requested once and saved as a single raw file having
+standardized all hours of the range.
+"""
+
+from collections import Counter
+from queue import Queue
+from urllib.parse import parse_qs, urlparse
+
+import pendulum as pdl
+from expiringdict import ExpiringDict
+
+from benchmarks.stubs import (
+    StubHandler,
+    SyntheticClient,
+    get_logger,
+    get_meter_configs,
+    get_stub_url,
+    start_stub_server,
+)
+from common.date_utils import format_date, parse, truncate
+from common.elapsed_time import elapsed_timer
+from common.settings import PROCESSING_DATE_FORMAT
+from integration.base_integration import ExtraInfo, StorageInfo
+from integration.wattime.config import WattimeCfg
+from integration.wattime.worker import (
+    AverageEmFetchWorker,
+    AverageEmStandardizeWorker,
+    MarginalEmFetchWorker,
+    MarginalEmStandardizeWorker,
+)
+
+HOURS = 24 * 7
+METERS = 5
+POINT_MINUTES = 5
+
+
+class WattimeHandler(StubHandler):
+    """Wattime stub returning points of every hour of the requested range"""
+
+    requests = Counter()
+
+    def do_GET(self) -> None:  # pylint:disable=invalid-name
+        """Return the stub response"""
+        url = urlparse(self.path)
+        self.count_request(url.path)
+        if url.path == "/login":
+            body = {"token": "token"}
+        else:
+            params = parse_qs(url.query)
+            start_date = parse(params["starttime"][0], dt_format=PROCESSING_DATE_FORMAT)
+            end_date = parse(params["endtime"][0], dt_format=PROCESSING_DATE_FORMAT)
+            points = int((end_date - start_date).in_hours() + 1) * 60 // POINT_MINUTES
+            body = [
+                {
+                    "point_time": start_date.add(
+                        minutes=idx * POINT_MINUTES
+                    ).to_iso8601_string(),
+                    "value": idx,
+                    "ba": params["ba"][0],
+                }
+                for idx in range(points)
+            ]
+        self.send_json(body)
+
+
+def get_config(meter_type: str) -> WattimeCfg:
+    """Get connector config having the given meters type"""
+    return WattimeCfg(
+        meters=get_meter_configs(
+            METERS, meter_type, meter_uri=f"https://meters/{meter_type}/{{idx}}"
+        ),
+        extra=ExtraInfo(raw=StorageInfo(bucket="benchmark", path="raw")),
+        username="username",
+        password="password",
+        grid_regions_name="CAISO_NORTH",
+        gap_regeneration_window=HOURS,
+    )
+
+
+def get_meters(config: WattimeCfg) -> Queue:
+    """Get queue of the configured meters"""
+    meters = Queue()
+    for mtr_cfg in config.meters:
+        meters.put(mtr_cfg)
+    return meters
+
+
+def standardize(worker_cls: type, fetched_files: Queue, config: WattimeCfg) -> int:
+    """Standardize fetched raw files, return amount of standardized files"""
+    worker = worker_cls(
+        raw_files=Queue(),
+        standardized_files=Queue(),
+        standardize_update=Queue(),
+        config=config,
+    )
+    worker.configure(pdl.now(tz="UTC"))
+    amount = 0
+    while not fetched_files.empty():
+        # pylint:disable=protected-access
+        amount += len(worker._standardize(fetched_files.get()))
+    return amount
+
+
+if __name__ == "__main__":
+    logger = get_logger("WATTIME FETCH BENCHMARK")
+
+    server = start_stub_server(WattimeHandler)
+    api_url = get_stub_url(server)
+
+    run_time = truncate(pdl.now(tz="UTC"), level="day")
+    # Two ranges of missed hours split by a single stored hour
+    missed = [
+        run_time.subtract(hours=hour + 1) for hour in range(HOURS) if hour != HOURS // 2
+    ]
+
+    marginal_cfg = get_config("Marginal Grid Emissions")
+    marginal_hours = ExpiringDict(max_len=HOURS, max_age_seconds=3600)
+    for mtr_hr in missed:
+        marginal_hours[mtr_hr] = get_meters(marginal_cfg)
+    marginal = MarginalEmFetchWorker(
+        missed_hours=marginal_hours,
+        fetched_files=Queue(),
+        fetch_update=Queue(),
+        config=marginal_cfg,
+    )
+
+    average_cfg = get_config("Average Grid Emissions")
+    average_hours = ExpiringDict(max_len=HOURS, max_age_seconds=3600)
+    average_hours[tuple(sorted(missed)[: HOURS // 2])] = get_meters(average_cfg)
+    average_hours[tuple(sorted(missed)[HOURS // 2 :])] = get_meters(average_cfg)
+    average = AverageEmFetchWorker(
+        missed_hours=average_hours,
+        fetched_files=Queue(),
+        fetch_update=Queue(),
+        config=average_cfg,
+    )
+
+    for worker, path in ((marginal, "/data"), (average, "/avgemissions")):
+        worker.__auth_url__ = f"{api_url}/login"
+        worker.__fetch_url__ = f"{api_url}{path}"
+        worker.configure(run_time)
+
+    with elapsed_timer() as elapsed:
+        # pylint:disable=protected-access
+        marginal._group_missed_hours()
+        marginal.fetch_consumer(SyntheticClient(), Queue(), "worker_idx_benchmark")
+        average.fetch_consumer(Queue(), "worker_idx_benchmark")
+    server.shutdown()
+
+    # pylint:disable=protected-access
+    assert WattimeHandler.requests["/login"] == 1, WattimeHandler.requests
+    assert WattimeHandler.requests["/data"] == 2, WattimeHandler.requests
+    assert WattimeHandler.requests["/avgemissions"] == 2, WattimeHandler.requests
+    assert marginal._fetched_files_queue.qsize() == 2
+    assert average._fetched_files_queue.qsize() == 2
+    for worker_cls, worker in (
+        (MarginalEmStandardizeWorker, marginal),
+        (AverageEmStandardizeWorker, average),
+    ):
+        standardized = standardize(
+            worker_cls, worker._fetched_files_queue, worker._config
+        )
+        assert standardized == len(missed) * METERS, standardized
+
+    logger.info(
+        f"Fetched {len(missed)} hours of {METERS} meters of both emissions types "
+        f"with {sum(WattimeHandler.requests.values())} requests instead of "
+        f"{len(missed) + 4} "
+        f"into 4 raw files instead of {len(missed) * (1 + 60 // POINT_MINUTES)} "
+        f"in {elapsed():.3f}s, first hour "
+        f"'{format_date(min(missed), PROCESSING_DATE_FORMAT)}'."
+    )
@@ -0,0 +1,137 @@
+"""Benchmark of the XLSX connector standardization.
+
+Standardizes a synthetic workbook of a hundred thousand rows with the
+column-wise connector path and with the previous row by row implementation,
+which built a meter and logged every row. Both must give the same
+standardized files.
+"""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Tuple
+
+import pandas as pd
+import pendulum as pdl
+
+from benchmarks.stubs import get_logger
+from common import settings as CFG
+from common.data_representation.standardized.meter import Meter
+from common.date_utils import format_date, parse, truncate
+from common.elapsed_time import elapsed_timer
+from integration.base_integration import StorageInfo
+from integration.xlsx.connector import MeterCfg, XLSXCfg, XLSXConnector
+
+ROWS = 100000
+METERS = 2
+
+
+def get_workbook(file_path: Path, start_date: pdl.DateTime) -> None:
+    """Save workbook having an hourly value per row"""
+    pd.DataFrame(
+        {
+            "Time": pd.date_range(
+                start_date.naive(), periods=ROWS, freq="H"
+            ).to_pydatetime(),
+            "Value": [idx * 0.25 for idx in range(ROWS)],
+            "Comment": ["comment"] * ROWS,
+        }
+    ).to_excel(file_path, sheet_name="Sheet1", index=False)
+
+
+def get_connector(run_time: pdl.DateTime) -> XLSXConnector:
+    """Get connector collecting standardized files instead of uploading them"""
+    connector = XLSXConnector(env_tz_info="UTC")
+    # pylint:disable=protected-access
+    connector._config = XLSXCfg(
+        meters=[
+            MeterCfg(
+                meter_name=f"meter_{idx}",
+                meter_uri=f"https://meters/{idx}",
+                type="Electric",
+                standardized=StorageInfo(bucket="benchmark", path=f"meter_{idx}"),
+            )
+            for idx in range(METERS)
+        ]
+    )
+    connector._run_time = run_time
+    connector.standardized_bodies = {}
+
+    def put_standardized_file(fl_info: Dict) -> None:
+        key = (fl_info["preffix"], fl_info["filename"])
+        connector.standardized_bodies[key] = fl_info["file_body"]
+
+    connector._put_standardized_file = put_standardized_file
+    return connector
+
+
+def legacy_standardize(
+    connector: XLSXConnector, file_path: Path
+) -> Dict[Tuple[str, str], bytes]:
+    """Previous row by row implementation of the standardization"""
+    row_logger = logging.getLogger("xlsx_benchmark_legacy")
+    row_logger.propagate = False
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        row_logger.addHandler(logging.StreamHandler(devnull))
+        row_logger.setLevel(logging.INFO)
+        files = {}
+        dfs = pd.read_excel(file_path, sheet_name="Sheet1")
+        # pylint:disable=protected-access
+        for _, row in dfs.iterrows():
+            row_logger.info(f"TIME AND VALUE IN ROW {row['Time']}, {row['Value']}")
+            for meter_info in connector._config.meters:
+                start_date = truncate(parse(row["Time"]), level="hour")
+                meter = Meter()
+                meter.created_date = connector._run_time
+                meter.start_time = start_date
+                meter.end_time = start_date.add(minutes=59, seconds=59)
+                meter.created_by = connector.__created_by__
+                meter.usage = row["Value"]
+                meter.meter_uri = meter_info.meter_uri
+                files[
+                    (
+                        meter_info.standardized.path,
+                        format_date(start_date, CFG.PROCESSING_DATE_FORMAT),
+                    )
+                ] = meter.as_str()
+    return files
+
+
+def standardize(
+    connector: XLSXConnector, file_path: Path
+) -> Dict[Tuple[str, str], bytes]:
+    """Standardize with the connector"""
+    # pylint:disable=protected-access
+    connector._fetched_files = [{"filename": file_path.name, "local": file_path}]
+    connector.standardize(str(file_path.parent))
+    return connector.standardized_bodies
+
+
+if __name__ == "__main__":
+    logger = get_logger("XLSX STANDARDIZE BENCHMARK")
+
+    bench_run_time = pdl.now(tz="UTC")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workbook_path = Path(tmp_dir).joinpath("raw-data-benchmark.xlsx")
+        get_workbook(
+            workbook_path,
+            truncate(pdl.now(tz="UTC"), level="day").subtract(hours=ROWS),
+        )
+
+        with elapsed_timer() as legacy_elapsed:
+            legacy = legacy_standardize(get_connector(bench_run_time), workbook_path)
+        legacy_time = legacy_elapsed()
+
+        with elapsed_timer() as elapsed:
+            standardized = standardize(get_connector(bench_run_time), workbook_path)
+        standardized_time = elapsed()
+
+    assert len(standardized) == ROWS * METERS, len(standardized)
+    assert standardized == legacy
+
+    logger.info(
+        f"Standardized {ROWS} rows of {METERS} meters: "
+        f"{legacy_time:.2f}s -> {standardized_time:.2f}s "
+        f"({legacy_time / standardized_time:.1f}x)."
+    )
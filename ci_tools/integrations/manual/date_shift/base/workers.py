@@ -267,29 +267,19 @@ class StandardizeWorker(BaseStandardizeWorker):
     def _save_files_worker(
         self,
         files_queue: Queue,
-        logs: Queue,
-        worker_idx: str,
+        logs: Queue,  # pylint:disable=unused-argument
+        worker_idx: str,  # pylint:disable=unused-argument
+        stage: str = "save_files_worker",
     ) -> None:
-        if files_queue.empty():
-            self._th_logger.warning("The files queue is empty. Shutdown worker.")
-            return None
-        empty_run_count = 0
-        while True:
-            if files_queue.empty():
-                if empty_run_count == 3:
-                    break
-                empty_run_count += 1
-            else:
-                file_info = files_queue.get()
-                filepath = Path(file_info.path).joinpath(file_info.file_name)
+        for file_info in self._consume(files_queue, stage=stage):
+            filepath = Path(file_info.path).joinpath(file_info.file_name)
 
-                with open(filepath, "w", encoding="utf-8") as mtr_fl:
-                    mtr_fl.write(file_info.body)
+            with open(filepath, "w", encoding="utf-8") as mtr_fl:
+                mtr_fl.write(file_info.body)
 
-                self._th_logger.info(
-                    f"Saved file '{filepath}'.",
-                )
-                files_queue.task_done()
+            self._th_logger.info(
+                f"Saved file '{filepath}'.",
+            )
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
@@ -43,39 +43,36 @@ def _insert_json_to_bigquery_worker(
     backoff: int = 2,
     work_idx: int = -1,
 ) -> None:
-    empty_run_count = 0
     count_run = 0
     while True:
-        if worker_queue.empty():
-            if empty_run_count == 3:
-                break
-            empty_run_count += 1
-        else:
-            count_run += 1
-            json_rows = worker_queue.get()
-            delay_time = delay
-            for _ in range(max_retries):
-                try:
-                    connection.load_table_from_json(
-                        json_rows, full_table_id, job_config=job_config
-                    )
-                    break
-                except exceptions as err:
-                    LOGGER.error(
-                        f"ERROR: BIG_QUERY JSON INSERT WORKER {work_idx}. "
-                        f" Failed insetion due to the error '{err}'"
-                        f"Retrying in {delay_time} seconds..."
-                    )
-                    time.sleep(delay_time)
-                    delay_time *= backoff
-                else:
-                    worker_queue.task_done()
-            else:
+        try:
+            json_rows = worker_queue.get_nowait()
+        except queue.Empty:
+            break
+        count_run += 1
+        delay_time = delay
+        for _ in range(max_retries):
+            try:
                 connection.load_table_from_json(
                     json_rows, full_table_id, job_config=job_config
                 )
+                break
+            except exceptions as err:
+                LOGGER.error(
+                    f"ERROR: BIG_QUERY JSON INSERT WORKER {work_idx}. "
+                    f" Failed insetion due to the error '{err}'"
+                    f"Retrying in {delay_time} seconds..."
+                )
+                time.sleep(delay_time)
+                delay_time *= backoff
+            else:
                 worker_queue.task_done()
-            time.sleep(1)
+        else:
+            connection.load_table_from_json(
+                json_rows, full_table_id, job_config=job_config
+            )
+            worker_queue.task_done()
+        time.sleep(1)
 
 
 def insert_json_data(
@@ -7,14 +7,15 @@ from datetime import datetime, timedelta
 from json import loads
 from os import path
 from pathlib import Path
-from typing import Any, List, Optional, Tuple, Union
+from typing import Iterable, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 import polars as pl
+from google.api_core.exceptions import NotFound
 from google.cloud.storage import Blob, Bucket, Client
 from pendulum import DateTime
 
-from common.cache import lru_cache_expiring
+from common.cache import lru_cache_expiring, ttl_cache
 from common.date_utils import (
     GapDatePeriod,
     date_range_in_past,
@@ -23,6 +24,15 @@ from common.date_utils import (
     truncate,
 )
 from common.logging import Logger
+from common.packed_format import (
+    XML_FORMAT,
+    get_packed_file_name,
+    get_packed_hours,
+    get_packed_path,
+    is_packed_format,
+)
+from common.packed_format import loads as packed_loads
+from common import settings as CFG
 from common.settings import PROCESSING_DATE_FORMAT
 
 LOGGER = Logger(
@@ -44,6 +54,17 @@ def get_storadge_client() -> Client:
     return Client()
 
 
+@lru_cache_expiring(maxsize=512, expires=3600)
+def get_bucket(bucket_name: str, client: Optional[Client] = None) -> Bucket:
+    """Return cached bucket handle without fetching the bucket metadata."""
+    return require_client(client).bucket(bucket_name)
+
+
+def _chunks(items: List, size: int) -> Iterable[List]:
+    for idx in range(0, len(items), max(size, 1)):
+        yield items[idx : idx + max(size, 1)]
+
+
 def file_exists(
     bucket: str,
     subdirectory: Optional[str] = None,
@@ -58,10 +79,63 @@ def file_exists(
     prefix = "/" if subdirectory is None else f'{subdirectory.rstrip("/").lstrip("/")}'
 
     return Blob(
-        bucket=storage_client.get_bucket(bucket), name=path.join(prefix, file_name)
+        bucket=get_bucket(bucket, storage_client), name=path.join(prefix, file_name)
     ).exists(storage_client)
 
 
+def list_blob_names(
+    bucket_name: str,
+    prefix: Optional[str] = None,
+    client: Optional[Client] = None,
+    start_offset: Optional[str] = None,
+    end_offset: Optional[str] = None,
+) -> Set[str]:
+    """Return names of the files located directly in the given prefix."""
+    storage_client = require_client(client)
+    dir_prefix = f'{prefix.rstrip("/").lstrip("/")}/' if prefix else ""
+    blobs = storage_client.list_blobs(
+        bucket_or_name=get_bucket(bucket_name, storage_client),
+        prefix=dir_prefix or None,
+        delimiter="/",
+        start_offset=start_offset,
+        end_offset=end_offset,
+        fields="items(name),nextPageToken",
+    )
+    return {
+        blob.name[len(dir_prefix) :]
+        for blob in blobs
+        if blob.name != dir_prefix
+    }
+
+
+def get_existing_files(
+    bucket: str,
+    subdirectory: Optional[str] = None,
+    file_names: Optional[Iterable[str]] = None,
+    client: Optional[Client] = None,
+) -> Set[str]:
+    """Bulk existence check of files based on a single prefix listing.
+
+    The listing is bounded by the lowest and highest of the given file names,
+    so it fits names ordered the same way as the dates they represent.
+    """
+    file_names = sorted(set(file_names or []))
+    if not file_names:
+        return set()
+
+    prefix = f'{subdirectory.rstrip("/").lstrip("/")}/' if subdirectory else ""
+    last_name = file_names[-1]
+    existing = list_blob_names(
+        bucket_name=bucket,
+        prefix=prefix,
+        client=client,
+        start_offset=f"{prefix}{file_names[0]}",
+        # end offset is exclusive, so bound it right after the highest name
+        end_offset=f"{prefix}{last_name[:-1]}{chr(ord(last_name[-1]) + 1)}",
+    )
+    return existing.intersection(file_names)
+
+
 # TOOD: Should be removed as outdated
 def upload_file(  # pylint:disable=too-many-arguments
     bucket_name: str,
@@ -103,12 +177,15 @@ def upload_file_to_bucket(
 
     storage_client = require_client(client)
 
-    storage_client.get_bucket(bucket_name).blob(
+    get_bucket(bucket_name, storage_client).blob(
         f"{blob_path}{file_name}"
     ).upload_from_string(blob_text)
 
 
-@lru_cache_expiring(maxsize=256, expires=3600)
+@ttl_cache(
+    max_bytes=CFG.FILE_CONTENTS_CACHE_MAX_BYTES,
+    expires=CFG.FILE_CONTENTS_CACHE_EXPIRES,
+)
 def get_file_contents(
     bucket_name: str,
     blob_path: str,
@@ -119,7 +196,7 @@ def get_file_contents(
 
     storage_client = get_storadge_client() if client is None else client
 
-    blob = storage_client.get_bucket(bucket_name).blob(blob_path)
+    blob = get_bucket(bucket_name, storage_client).blob(blob_path)
 
     if not binary_mode:
         return blob.download_as_string().decode("utf-8")
@@ -127,6 +204,19 @@ def get_file_contents(
     return blob.download_as_bytes()
 
 
+def get_blob_contents(
+    bucket_name: str,
+    blob_path: str,
+    client: Optional[Client] = None,
+) -> Optional[bytes]:
+    """Downloads the current blob content bypassing cache, None if it is absent."""
+    storage_client = require_client(client)
+    try:
+        return storage_client.bucket(bucket_name).blob(blob_path).download_as_bytes()
+    except NotFound:
+        return None
+
+
 #  TOTO: Remove as outdated
 def get_configuration(bucket_name, integration):
     """Downloads configuration file from the bucket and returns its content."""
@@ -136,26 +226,53 @@ def get_configuration(bucket_name, integration):
     ]
 
 
-def __df_get_blob_path(blb_df, src_column: str, dest_column: str):
-    return blb_df.lazy().with_columns(
-        [(pl.col(src_column).apply(lambda x: Path(x.name))).alias(dest_column)]
+def __df_meter_hours_str(blb_df, src_column: str, dest_column: str, bucket_path: Path):
+    """Get file names of the blobs located directly in the given path"""
+    prefix = f'{str(bucket_path).rstrip("/")}/'
+    file_path = pl.col(src_column).str.rstrip("/")
+    file_name = file_path.str.slice(len(prefix))
+    return (
+        blb_df.lazy()
+        .filter(file_path.str.starts_with(prefix))
+        .filter(~file_name.str.contains("/", literal=True))
+        .select([file_name.alias(dest_column)])
     )
 
 
-def __df_drop_nested(blb_df, column: str, value: Any):
-    return blb_df.lazy().filter(pl.col(column).apply(lambda x: x.parent == value))
-
-
-def __df_meter_hours_str(blb_df, src_column: str, dest_column: str):
-    return blb_df.lazy().with_columns(
-        [(pl.col(src_column).apply(lambda x: str(x.name))).alias(dest_column)]
+def __df_packed_hours(
+    storage_client: Client,
+    bucket: Bucket,
+    bucket_path: Path,
+    date_range: GapDatePeriod,
+    standardized_format: str,
+) -> pl.LazyFrame:
+    """Get hours stored in the packed files covering the given range"""
+    packed_path = Path(get_packed_path(str(bucket_path)))
+    # Packed files are named by the meter local day so take a day around.
+    fls = list_blobs_with_prefix(
+        client=storage_client,
+        bucket_name=bucket,
+        start_offset=str(
+            packed_path.joinpath(
+                get_packed_file_name(
+                    date_range.start_date.subtract(days=1), standardized_format
+                )
+            )
+        ),
+        end_offset=str(
+            packed_path.joinpath(
+                get_packed_file_name(
+                    date_range.end_date.add(days=2), standardized_format
+                )
+            )
+        ),
     )
-
-
-def __get_date_from_filenames(blb_df, src_column: str, dest_column: str):
-    return blb_df.lazy().with_columns(
-        [(pl.col(src_column).apply(lambda x: parse(x.name))).alias(dest_column)]
+    hours = get_packed_hours(
+        packed_loads(blb.download_as_bytes(client=storage_client), standardized_format)
+        for blb in fls
+        if str(Path(blb.name).parent) == str(packed_path)
     )
+    return pl.DataFrame({"hours": hours}, schema={"hours": pl.Utf8}).lazy()
 
 
 # TODO: @todo Remove except_values parameter
@@ -168,8 +285,13 @@ def get_missed_standardized_files(  # pylint:disable=too-many-arguments
     except_values: Optional[Tuple[DateTime]] = None,  # pylint:disable=unused-argument
     date_range: Optional[GapDatePeriod] = None,
     client: Optional[Client] = None,
+    standardized_format: str = XML_FORMAT,
 ) -> List[DateTime]:
-    """Check bucket contents for missing files representing polling responses."""
+    """Check bucket contents for missing files representing polling responses.
+
+    Hours stored in packed files are taken into account for the packed
+    standardized format in addition to the hourly files.
+    """
 
     storage_client = require_client(client)
     bucket = storage_client.bucket(bucket_name)
@@ -190,25 +312,27 @@ def get_missed_standardized_files(  # pylint:disable=too-many-arguments
         ),
     )
 
-    if not fls:
-        return date_range.range.collect()["dates"].to_list()
-
-    blb_df = pl.DataFrame({"blobs": fls}).lazy()
-    blb_df = (
-        blb_df.pipe(__df_get_blob_path, "blobs", "file_path")
-        .pipe(__df_drop_nested, "file_path", bucket_path)
-        .pipe(__get_date_from_filenames, "file_path", "dates")
-        .pipe(__df_meter_hours_str, "file_path", "hours")
-        .drop(["blobs", "file_path"])
-    )
-
-    gaps = (
-        date_range.range.select(["dates", "hours"])
-        .join(blb_df, on="hours", how="anti")
-        .unique(subset=["hours"])
-    )
+    range_df = date_range.range
+    blb_frames = []
+    if fls:
+        blb_frames.append(
+            pl.DataFrame({"blobs": [blb.name for blb in fls]}).pipe(
+                __df_meter_hours_str, "blobs", "hours", bucket_path
+            )
+        )
+    if is_packed_format(standardized_format):
+        blb_frames.append(
+            __df_packed_hours(
+                storage_client, bucket, bucket_path, date_range, standardized_format
+            )
+        )
+    if blb_frames:
+        blb_df = pl.concat(blb_frames, how="vertical")
+        range_df = range_df.join(blb_df, on="hours", how="anti").unique(
+            subset=["hours"], maintain_order=True
+        )
 
-    return gaps.collect()["dates"].to_list()
+    return date_range.to_dates(range_df.collect())
 
 
 def list_blobs_with_prefix(
@@ -369,6 +493,89 @@ def move_blob(  # pylint:disable=too-many-arguments,too-many-locals
     return new_blob
 
 
+def delete_blobs(
+    bucket_name: str,
+    blob_names: Iterable[str],
+    client: Optional[Client] = None,
+    batch_size: int = CFG.STORAGE_BATCH_SIZE,
+) -> None:
+    """Delete blobs of the bucket using batched requests, absent ones are skipped."""
+    client = require_client(client)
+    bucket = get_bucket(bucket_name, client)
+    for chunk in _chunks(list(blob_names), batch_size):
+        try:
+            with client.batch():
+                for blob_name in chunk:
+                    bucket.blob(blob_name).delete(client=client)
+        except NotFound:
+            # batch raises the first failure after all requests are sent,
+            # the rest of the chunk is processed anyway
+            pass
+
+
+def _copy_blob(blob: Tuple[str, str, str, str], client: Client) -> None:
+    src_bucket, src_name, dst_bucket, dst_name = blob
+    get_bucket(src_bucket, client).copy_blob(
+        blob=get_bucket(src_bucket, client).blob(src_name),
+        destination_bucket=get_bucket(dst_bucket, client),
+        new_name=dst_name,
+        client=client,
+    )
+
+
+def copy_blobs(
+    blobs: Iterable[Tuple[str, str, str, str]],
+    client: Optional[Client] = None,
+    batch_size: int = CFG.STORAGE_BATCH_SIZE,
+) -> List[Tuple[str, str, str, str]]:
+    """Copy blobs using batched requests, absent sources are skipped.
+
+    Every item is a tuple of source bucket, source blob name, destination
+    bucket and destination blob name. Returns the copied items.
+    """
+    client = require_client(client)
+    copied = []
+    for chunk in _chunks(list(blobs), batch_size):
+        try:
+            with client.batch():
+                for blob in chunk:
+                    _copy_blob(blob, client)
+        except NotFound:
+            # batch does not tell which requests failed, the chunk is copied
+            # again one by one
+            for blob in chunk:
+                try:
+                    _copy_blob(blob, client)
+                except NotFound:
+                    continue
+                copied.append(blob)
+        else:
+            copied.extend(chunk)
+    return copied
+
+
+def move_blobs(
+    blobs: Iterable[Tuple[str, str, str, str]],
+    client: Optional[Client] = None,
+    batch_size: int = CFG.STORAGE_BATCH_SIZE,
+) -> None:
+    """Move blobs using batched copy requests followed by batched deletes.
+
+    Every item is a tuple of source bucket, source blob name, destination
+    bucket and destination blob name. Absent sources are skipped, only the
+    copied ones are deleted.
+    """
+    client = require_client(client)
+    copied = copy_blobs(blobs, client=client, batch_size=batch_size)
+
+    to_delete = {}
+    for src_bucket, src_name, dst_bucket, dst_name in copied:
+        if (src_bucket, src_name) != (dst_bucket, dst_name):
+            to_delete.setdefault(src_bucket, []).append(src_name)
+    for bucket_name, blob_names in to_delete.items():
+        delete_blobs(bucket_name, blob_names, client=client, batch_size=batch_size)
+
+
 def copy_blob(
     bucket_name: str,
     blob_name: str,
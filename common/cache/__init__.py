@@ -1,6 +1,9 @@
 """LRU Cache"""
-from common.cache.cache import lru_cache_expiring
+from common.cache.cache import CacheInfo, TTLCache, lru_cache_expiring, ttl_cache
 
 __all__ = [
+    "CacheInfo",
+    "TTLCache",
     "lru_cache_expiring",
+    "ttl_cache",
 ]
@@ -1,6 +1,12 @@
 """LRU Cache"""
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import lru_cache, wraps
+from threading import Event, Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional
 
 
 def lru_cache_expiring(maxsize: int = 128, expires: int = 20):
@@ -21,3 +27,154 @@ def lru_cache_expiring(maxsize: int = 128, expires: int = 20):
         return wrapped_func
 
     return wrapper_cache
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """TTL cache statistics"""
+
+    hits: int
+    misses: int
+    loads: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+def get_value_size(value: Any) -> int:
+    """Approximate size of the cached value in bytes"""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8", errors="ignore"))
+    return sys.getsizeof(value)
+
+
+class _Flight:  # pylint:disable=too-few-public-methods
+    """Load of a key shared by the concurrent misses"""
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry expiration.
+
+    Concurrent misses of the same key wait for a single load. Entries are
+    evicted in LRU order once the total size exceeds ``max_bytes``, values
+    larger than ``max_bytes`` are not cached.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        expires: float,
+        sizeof: Callable[[Any], int] = get_value_size,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._expires = expires
+        self._sizeof = sizeof
+        self._lock = Lock()
+        # key -> (value, size, expires at)
+        self._entries: OrderedDict = OrderedDict()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+        self._evictions = 0
+
+    def _pop(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._size_bytes -= size
+
+    def _put(self, key: Hashable, value: Any) -> None:
+        size = self._sizeof(value)
+        if size > self._max_bytes:
+            return
+        if key in self._entries:
+            self._pop(key)
+        while self._entries and self._size_bytes + size > self._max_bytes:
+            self._pop(next(iter(self._entries)))
+            self._evictions += 1
+        self._entries[key] = (value, size, monotonic() + self._expires)
+        self._size_bytes += size
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return cached value of the key, load it on miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[2] > monotonic():
+                    self._hits += 1
+                    self._entries.move_to_end(key)
+                    return entry[0]
+                self._pop(key)
+
+            self._misses += 1
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._flights[key] = _Flight()
+                self._loads += 1
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+        except BaseException as err:
+            flight.error = err
+            raise
+        else:
+            with self._lock:
+                self._put(key, flight.value)
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return flight.value
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def info(self) -> CacheInfo:
+        """Return cache statistics"""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                loads=self._loads,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+
+def ttl_cache(max_bytes: int = 64 * 2**20, expires: float = 3600):
+    """Thread-safe TTL cache decorator, see TTLCache"""
+
+    def wrapper_cache(func):
+        cache = TTLCache(max_bytes=max_bytes, expires=expires)
+
+        @wraps(func)
+        def wrapped_func(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            return cache.get_or_load(key, lambda: func(*args, **kwargs))
+
+        wrapped_func.cache = cache
+        wrapped_func.cache_info = cache.info
+        wrapped_func.cache_clear = cache.clear
+        return wrapped_func
+
+    return wrapper_cache
@@ -0,0 +1,20 @@
+"""Persisted coverage index of the standardized meter hours"""
+from common.coverage_index.coverage_index import (
+    CoverageIndex,
+    get_hour_number,
+    get_index_blob_path,
+    get_missed_standardized_hours,
+    load_coverage_index,
+    save_covered_hours,
+    update_coverage_index,
+)
+
+__all__ = [
+    "CoverageIndex",
+    "get_hour_number",
+    "get_index_blob_path",
+    "get_missed_standardized_hours",
+    "load_coverage_index",
+    "save_covered_hours",
+    "update_coverage_index",
+]
@@ -0,0 +1,282 @@
+"""Persisted coverage index of the standardized meter hours.
+
+The index of a meter is stored next to its standardized files and keeps the
+standardized hours as a sorted list of closed intervals of hour numbers. The
+hour number is the amount of hours since epoch of the hour file name wall
+time, so the index does not depend on the timezone of the readers.
+"""
+import uuid
+from bisect import bisect_right
+from json import dumps, loads
+from typing import Iterable, List, Optional, Tuple
+
+from google.api_core.exceptions import NotFound, PreconditionFailed
+from google.cloud.exceptions import GoogleCloudError
+from google.cloud.storage import Client
+from pendulum import DateTime
+
+from common import settings as CFG
+from common.bucket_helpers import (
+    get_bucket,
+    get_missed_standardized_files,
+    require_client,
+)
+from common.date_utils import GapDatePeriod, format_date, parse
+from common.logging import Logger
+from common.packed_format import XML_FORMAT
+from common.request_helpers import retry
+from common.settings import PROCESSING_DATE_FORMAT
+
+LOGGER = Logger(
+    name="Coverage index",
+    level="DEBUG",
+    description="Coverage index",
+    trace_id=uuid.uuid4(),
+)
+
+INDEX_VERSION = 1
+# Covered hours between candidates listed instead of a separate listing request.
+LISTING_MERGE_HOURS = 24
+
+
+def get_hour_number(file_name: str) -> Optional[int]:
+    """Get hour number of the given hour file name"""
+    try:
+        date = parse(file_name, dt_format=PROCESSING_DATE_FORMAT)
+    except ValueError:
+        return None
+    return int(date.timestamp()) // 3600
+
+
+class CoverageIndex:
+    """Sorted closed intervals of the covered hour numbers"""
+
+    def __init__(self, intervals: Optional[Iterable[Tuple[int, int]]] = None) -> None:
+        self._intervals: List[List[int]] = []
+        self._starts: List[int] = []
+        self._merge([list(interval) for interval in intervals or []])
+
+    def _merge(self, intervals: List[List[int]]) -> None:
+        merged = []
+        for start, end in sorted(self._intervals + intervals):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self._intervals = merged
+        self._starts = [start for start, _ in merged]
+
+    @property
+    def intervals(self) -> List[Tuple[int, int]]:
+        """Covered intervals"""
+        return [(start, end) for start, end in self._intervals]
+
+    def add_hours(self, hours: Iterable[int]) -> None:
+        """Mark the given hour numbers as covered"""
+        self._merge([[hour, hour] for hour in set(hours)])
+
+    def set_range(self, start: int, end: int, hours: Iterable[int]) -> None:
+        """Replace coverage of the closed range with the given hour numbers"""
+        intervals = []
+        for int_start, int_end in self._intervals:
+            if int_start < start:
+                intervals.append([int_start, min(int_end, start - 1)])
+            if int_end > end:
+                intervals.append([max(int_start, end + 1), int_end])
+        self._intervals = []
+        self._merge(
+            intervals + [[hour, hour] for hour in set(hours) if start <= hour <= end]
+        )
+
+    def is_covered(self, hour: int) -> bool:
+        """Check the given hour number is covered"""
+        idx = bisect_right(self._starts, hour) - 1
+        return idx >= 0 and hour <= self._intervals[idx][1]
+
+    def dumps(self) -> str:
+        """Serialize index"""
+        return dumps({"version": INDEX_VERSION, "intervals": self._intervals})
+
+    @classmethod
+    def loads(cls, data: bytes) -> "CoverageIndex":
+        """Deserialize index"""
+        return cls(loads(data)["intervals"])
+
+
+def get_index_blob_path(bucket_path: str) -> str:
+    """Get path of the coverage index for the given standardized path"""
+    return f'{bucket_path.strip("/")}/{CFG.COVERAGE_INDEX_PATH}'
+
+
+def load_coverage_index(
+    bucket_name: str, bucket_path: str, client: Optional[Client] = None
+) -> Tuple[Optional[CoverageIndex], int]:
+    """Load coverage index together with its generation, zero if absent"""
+    storage_client = require_client(client)
+    blob = get_bucket(bucket_name, client=storage_client).blob(
+        get_index_blob_path(bucket_path)
+    )
+    try:
+        data = blob.download_as_bytes(client=storage_client)
+    except NotFound:
+        return None, 0
+    return CoverageIndex.loads(data), int(blob.generation or 0)
+
+
+@retry((PreconditionFailed,))
+def update_coverage_index(  # pylint:disable=too-many-arguments
+    bucket_name: str,
+    bucket_path: str,
+    file_names: Iterable[str],
+    client: Optional[Client] = None,
+    reconcile_range: Optional[Tuple[int, int]] = None,
+) -> CoverageIndex:
+    """Add hour file names to the coverage index.
+
+    The coverage of the ``reconcile_range`` is replaced by the given hours.
+    The index is saved only if it was not changed since loading, otherwise
+    the update is retried.
+    """
+    hours = [hour for hour in map(get_hour_number, file_names) if hour is not None]
+    storage_client = require_client(client)
+    index, generation = load_coverage_index(bucket_name, bucket_path, storage_client)
+    index = index or CoverageIndex()
+    if reconcile_range:
+        index.set_range(*reconcile_range, hours)
+    elif hours:
+        index.add_hours(hours)
+    else:
+        return index
+
+    get_bucket(bucket_name, client=storage_client).blob(
+        get_index_blob_path(bucket_path)
+    ).upload_from_string(
+        index.dumps(),
+        content_type="application/json",
+        client=storage_client,
+        if_generation_match=generation,
+    )
+    return index
+
+
+def save_covered_hours(
+    bucket_name: str,
+    bucket_path: str,
+    file_names: Iterable[str],
+    client: Optional[Client] = None,
+) -> None:
+    """Add saved hour file names to the coverage index, errors are logged only"""
+    if not CFG.COVERAGE_INDEX_ENABLED:
+        return
+    try:
+        update_coverage_index(bucket_name, bucket_path, list(file_names), client)
+    except GoogleCloudError as err:
+        LOGGER.warning(
+            f"Cannot update coverage index of '{bucket_name}/{bucket_path}' "
+            f"due to the error '{err}'."
+        )
+
+
+def _get_candidate_runs(timestamps: Iterable[int]) -> List[Tuple[int, int]]:
+    """Group candidate hours into ranges listed by a single request"""
+    runs = []
+    for timestamp in sorted(set(timestamps)):
+        if runs and timestamp - runs[-1][1] <= LISTING_MERGE_HOURS * 3600:
+            runs[-1][1] = timestamp
+        else:
+            runs.append([timestamp, timestamp])
+    return [(start, end) for start, end in runs]
+
+
+def get_missed_standardized_hours(  # pylint:disable=too-many-arguments,too-many-locals
+    bucket_name: str,
+    bucket_path: Optional[str] = None,
+    start_date: Optional[DateTime] = None,
+    range_hours: int = 24,
+    date_format: str = PROCESSING_DATE_FORMAT,
+    date_range: Optional[GapDatePeriod] = None,
+    client: Optional[Client] = None,
+    standardized_format: str = XML_FORMAT,
+    reconcile: Optional[bool] = None,
+) -> List[DateTime]:
+    """Get missed standardized hours consulting the coverage index first.
+
+    Only hours not covered by the index are confirmed against the bucket
+    listing. Without index or in reconciliation mode the whole range is
+    listed and the index coverage of the range is rebuilt from the listing.
+    """
+    kwargs = {
+        "bucket_name": bucket_name,
+        "bucket_path": bucket_path,
+        "date_format": date_format,
+        "client": client,
+        "standardized_format": standardized_format,
+    }
+    if date_range is None:
+        start_date = start_date or parse()
+        date_range = GapDatePeriod(start_date, range_hours - 1)
+    if (
+        not CFG.COVERAGE_INDEX_ENABLED
+        or not bucket_path
+        or date_format != PROCESSING_DATE_FORMAT
+    ):
+        return get_missed_standardized_files(date_range=date_range, **kwargs)
+
+    storage_client = require_client(client)
+    kwargs["client"] = storage_client
+    reconcile = CFG.COVERAGE_INDEX_RECONCILE if reconcile is None else reconcile
+    range_df = date_range.range.select(["hours", "timestamp"]).collect()
+
+    index = None
+    if not reconcile:
+        index, _ = load_coverage_index(bucket_name, bucket_path, storage_client)
+
+    if index is None:
+        missed = get_missed_standardized_files(date_range=date_range, **kwargs)
+        missed_hours = {format_date(date, date_format) for date in missed}
+        hour_numbers = [get_hour_number(hour) for hour in range_df["hours"]]
+        try:
+            update_coverage_index(
+                bucket_name,
+                bucket_path,
+                [hour for hour in range_df["hours"] if hour not in missed_hours],
+                client=storage_client,
+                reconcile_range=(min(hour_numbers), max(hour_numbers)),
+            )
+        except GoogleCloudError as err:
+            LOGGER.warning(
+                f"Cannot rebuild coverage index of '{bucket_name}/{bucket_path}' "
+                f"due to the error '{err}'."
+            )
+        return missed
+
+    # The listing end offset is exclusive, so the bucket listing reports the
+    # range end hour as missed whatever is stored. It stays a candidate to
+    # keep that, the current hour is refetched until the range moves on.
+    last_timestamp = range_df["timestamp"].max()
+    candidates = {
+        hour: timestamp
+        for hour, timestamp in zip(range_df["hours"], range_df["timestamp"])
+        if timestamp == last_timestamp or not index.is_covered(get_hour_number(hour))
+    }
+
+    missed = []
+    for start_timestamp, end_timestamp in _get_candidate_runs(candidates.values()):
+        # Runs before the range end are listed up to the next hour.
+        if end_timestamp != last_timestamp:
+            end_timestamp += 3600
+        missed.extend(
+            date
+            for date in get_missed_standardized_files(
+                date_range=GapDatePeriod(
+                    parse(end_timestamp, tz_info=date_range.end_date.timezone),
+                    (end_timestamp - start_timestamp) // 3600,
+                ),
+                **kwargs,
+            )
+            if format_date(date, date_format) in candidates
+        )
+    found = set(candidates).difference(format_date(date, date_format) for date in missed)
+    if found:
+        save_covered_hours(bucket_name, bucket_path, found, storage_client)
+    return missed
@@ -11,17 +11,37 @@ from typing import Optional, Union
 
 from lxml import etree
 
-from common.bucket_helpers import file_exists, get_file_contents
+from common.bucket_helpers import get_blob_contents
+from common.cache import ttl_cache
 from common.data_representation.config.base_exceptions import (
     ConfigException,
     XmlTypeException,
 )
 from common.logging import Logger
-from common.settings import OMIT_VALIDATION_BUCKET_NAMES
+from common.settings import (
+    FILE_CONTENTS_CACHE_EXPIRES,
+    FILE_CONTENTS_CACHE_MAX_BYTES,
+    OMIT_VALIDATION_BUCKET_NAMES,
+)
 
 MAX_ID_VALUE = 9223372036854775807
 
 
+@ttl_cache(
+    max_bytes=FILE_CONTENTS_CACHE_MAX_BYTES, expires=FILE_CONTENTS_CACHE_EXPIRES
+)
+def read_config_contents(
+    bucket: str, blob_path: str, binary_mode: bool = False
+) -> Union[bytes, str]:
+    """Download configuration file, concurrent reads share a single download"""
+    data = get_blob_contents(bucket_name=bucket, blob_path=blob_path)
+    if data is None:
+        raise ConfigException(
+            f'The given path "{bucket}/{blob_path}" is not exist or not a file.'
+        )
+    return data if binary_mode else data.decode("utf-8")
+
+
 @dataclass
 class Address:
     """Adres data"""
@@ -161,23 +181,10 @@ class BaseConfig:
 
         self._config_file_info["use"] = "gcp"
 
-        is_cfg_exist = file_exists(
+        data = read_config_contents(
             bucket=self._config_file_info["gcp"]["bucket"],
-            subdirectory=self._config_file_info["gcp"]["path"].lstrip("/"),
-            file_name=self._config_file_info["gcp"]["filename"],
-        )
-
-        if not is_cfg_exist:
-            raise ConfigException(
-                f"The given path \"{self._config_file_info['gcp']['bucket']}/"
-                f"{self._config_file_info['gcp']['path'].lstrip('/')}/"
-                f"{self._config_file_info['gcp']['filename']}\" is not exist or not a file."
-            )
-
-        data = get_file_contents(
-            bucket_name=self._config_file_info["gcp"]["bucket"],
             blob_path=path.join(
-                self._config_file_info["gcp"]["path"],
+                self._config_file_info["gcp"]["path"].lstrip("/"),
                 self._config_file_info["gcp"]["filename"],
             ),
             binary_mode=self._config_file_info["gcp"]["binary_mode"],
@@ -1,23 +1,113 @@
 """Code to process standardized values of meters"""
+import hashlib
 import uuid
-from dataclasses import asdict, dataclass, field, replace
+from copy import deepcopy
+from dataclasses import asdict, dataclass, field
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
 
 import pendulum as pdl
 from lxml import builder, etree
 from pendulum.datetime import DateTime
 
 from common import settings as CFG
-from common.data_representation.config import AuditData, BaseConfig
+from common.data_representation.config import MAX_ID_VALUE, AuditData, BaseConfig
 from common.date_utils import DateParseException, format_date, parse, parse_timezone
 from common.logging import Logger
 
+ESPM_NS = "http://portfoliomanager.energystar.gov/ns"
+XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
+HBD_NS = "http://hourlybuildingdata.com/ns"
+NAMESPACES = {"hbd": HBD_NS, "xsi": XSI_NS, "espm": ESPM_NS}
+SCHEMA_LOCATION = (
+    "http://hourlybuildingdata.com/ns http://hourlybuildingdata.com/ns/main.xsd"
+)
+
+# Element makers keep the configuration only, so they are shared by meters.
+# pylint: disable=c-extension-no-member
+ROOT_ELEMENT_MAKER = builder.ElementMaker(namespace=HBD_NS, nsmap=NAMESPACES)
+HBD_ELEMENT_MAKER = builder.ElementMaker(namespace=HBD_NS)
+ESPM_ELEMENT_MAKER = builder.ElementMaker(namespace=ESPM_NS)
+# pylint: enable=c-extension-no-member
+
+LOGGER = Logger(
+    name="Standardized Meter",
+    level="DEBUG",
+    description="Standardized Meter",
+    trace_id=uuid.uuid4(),
+)
+
 
 class StandardizedMeterException(Exception):
     """Exception class specific to this package."""
 
 
+@lru_cache(maxsize=4096)
+def get_meter_id(meter_uri: str) -> int:
+    """Generate unique id based on meter URI, see BaseConfig.get_unique_id"""
+    # Known pylint issue https://github.com/PyCQA/pylint/issues/4039
+    value = hashlib.shake_256(  # pylint: disable=too-many-function-args
+        meter_uri.encode("utf-8")
+    ).hexdigest(6)
+    return int(value, 16) & MAX_ID_VALUE
+
+
+def _build_meter_xml(  # pylint:disable=too-many-arguments
+    meter_uri: str,
+    start_time: str,
+    end_time: str,
+    usage: str,
+    created_by: str,
+    created_date: str,
+) -> etree._Element:  # pylint: disable=c-extension-no-member
+    root_tag = ROOT_ELEMENT_MAKER.meterData(
+        HBD_ELEMENT_MAKER.meteredData(
+            HBD_ELEMENT_MAKER.meterURI(meter_uri),
+            HBD_ELEMENT_MAKER.startTime(start_time),
+            HBD_ELEMENT_MAKER.endTime(end_time),
+            HBD_ELEMENT_MAKER.usage(usage),
+            HBD_ELEMENT_MAKER.audit(
+                ESPM_ELEMENT_MAKER.createdBy(created_by),
+                ESPM_ELEMENT_MAKER.createdDate(created_date),
+            ),
+        )
+    )
+    root_tag.attrib[f"{{{XSI_NS}}}schemaLocation"] = SCHEMA_LOCATION
+    return root_tag
+
+
+# Copying the prepared tree is a few times cheaper than building it.
+METER_XML_TEMPLATE = _build_meter_xml("", "", "", "", "", "")
+
+
+def meter_to_xml(  # pylint:disable=too-many-arguments
+    meter_uri: str,
+    start_time: str,
+    end_time: str,
+    usage: str,
+    created_by: str,
+    created_date: str,
+) -> etree._Element:  # pylint: disable=c-extension-no-member
+    """Generate XML representation of the meter data"""
+    root_tag = deepcopy(METER_XML_TEMPLATE)
+    metered_data = root_tag[0]
+    metered_data[0].text = meter_uri
+    metered_data[1].text = start_time
+    metered_data[2].text = end_time
+    metered_data[3].text = usage
+    metered_data[4][0].text = created_by
+    metered_data[4][1].text = created_date
+    return root_tag
+
+
+def xml_to_str(root_tag, pretty_print: bool = True) -> bytes:
+    """Serialize meter XML representation"""
+    return etree.tostring(  # pylint: disable=c-extension-no-member
+        root_tag, pretty_print=pretty_print, xml_declaration=True, encoding="UTF-8"
+    )
+
+
 @dataclass
 class StandardizedMeter:
     """An standardazed meter reprezentation dataclass"""
@@ -53,69 +143,42 @@ class StandardizedMeter:
     audit: AuditData = field(default_factory=AuditData)
 
 
-class Meter(BaseConfig):  # pylint: disable=too-many-instance-attributes
-    """An standardazed meter reprezentation object"""
+class MeterValues:
+    """Values of a standardized meter with their validation and serialization.
 
-    espm = "http://portfoliomanager.energystar.gov/ns"
-    xsi = "http://www.w3.org/2001/XMLSchema-instance"
-    hbd = "http://hourlybuildingdata.com/ns"
-    schema_location = (
-        "http://hourlybuildingdata.com/ns http://hourlybuildingdata.com/ns/main.xsd"
-    )
+    Shared by Meter and CompactMeter, the values are kept in the attributes
+    set by _init_values.
+    """
 
-    ST_METER_DATA_TG = "hbd:meterData"
-    ST_METERED_DATA_TG = "hbd:meteredData"
-    ST_METERED_METER_URI_TG = "hbd:meterURI"
-    ST_METERED_START_TIME_TG = "hbd:startTime"
-    ST_METERED_END_TIME_TG = "hbd:endTime"
-    ST_METERED_USAGE_TG = "hbd:usage"
+    __slots__ = ()
 
-    def __init__(
+    def _init_values(
         self,
-        path_info: Optional[str] = None,
-        meter_timezone: str = CFG.DEFAULT_LOCAL_TIMEZONE_NAME,
-        env_timezone: Optional[str] = CFG.ENVIRONMENT_TIME_ZONE,
-        dt_format: str = CFG.PROCESSING_DATE_FORMAT,
-        xml_dt_format: str = CFG.STANDARDIZED_METER_DATE_FORMAT,
+        meter_timezone: str,
+        env_timezone: Optional[str],
+        dt_format: str,
+        xml_dt_format: str,
     ) -> None:
-        super().__init__(path_info=path_info)
         self.meter_tz = parse_timezone(meter_timezone)
         self.env_timezone = parse_timezone(env_timezone)
         self.meter_data_format = dt_format
         self.meter_xml_data_format = xml_dt_format
-        self._namespaces = {"hbd": self.hbd, "xsi": self.xsi, "espm": self.espm}
-        self._root_element_maker = (
-            builder.ElementMaker(  # pylint: disable=c-extension-no-member
-                namespace=self._namespaces["hbd"],
-                nsmap=self._namespaces,
-            )
-        )
-
-        self._hbd_element_maker = (
-            builder.ElementMaker(  # pylint: disable=c-extension-no-member
-                namespace=self._namespaces["hbd"]
-            )
-        )
-
-        self._espm_element_maker = (
-            builder.ElementMaker(  # pylint: disable=c-extension-no-member
-                namespace=self._namespaces["espm"],
-            )
-        )
-
-        self._data = StandardizedMeter()
-
-    def _parse_date(
-        self,
-        value: str,
-        dt_format: str,
-        timezone: Optional[str] = CFG.DEFAULT_LOCAL_TIMEZONE_NAME,
-        msg_prfx: str = "",
-    ) -> DateTime:
+        self._meter_uri = ""
+        self._start_time: Optional[DateTime] = None
+        self._end_time: Optional[DateTime] = None
+        self._usage = Decimal()
+        self._created_by = ""
+        self._created_date = ""
+
+    def _parse_date(self, value: str, msg_prfx: str = "") -> DateTime:
         try:
-            return parse(value, dt_format=dt_format, tz_info=timezone)
+            return parse(
+                value,
+                dt_format=self.meter_data_format,
+                tz_info=CFG.DEFAULT_LOCAL_TIMEZONE_NAME,
+            )
         except DateParseException as err:
-            self._logger.error(
+            LOGGER.error(
                 f'[{msg_prfx}] - Cannot convert given value "{value}" '
                 f'to date due to the error "{err}"'
             )
@@ -123,50 +186,46 @@ class Meter(BaseConfig):  # pylint: disable=too-many-instance-attributes
 
     @property
     def start_time(self):  # pylint: disable=missing-function-docstring
-        return self._data.startTime
+        if self._start_time is None:
+            self._start_time = pdl.now()
+        return self._start_time
 
     @start_time.setter
     def start_time(self, value):
-        self._data.startTime = self._parse_date(
-            value, dt_format=self.meter_data_format, msg_prfx="Start Time"
-        )
+        self._start_time = self._parse_date(value, msg_prfx="Start Time")
 
     @property
     def end_time(self):  # pylint: disable=missing-function-docstring
-        return self._data.endTime
+        if self._end_time is None:
+            self._end_time = pdl.now()
+        return self._end_time
 
     @end_time.setter
     def end_time(self, value):
-        self._data.endTime = self._parse_date(
-            value, dt_format=self.meter_data_format, msg_prfx="End Time"
-        )
+        self._end_time = self._parse_date(value, msg_prfx="End Time")
 
     @property
     def created_date(self):  # pylint: disable=missing-function-docstring
-        return self._data.audit.createdDate
+        return self._created_date
 
     @created_date.setter
     def created_date(self, value):
-
-        date = self._parse_date(
-            value, dt_format=self.meter_data_format, msg_prfx="Created Time"
+        self._created_date = format_date(
+            self._parse_date(value, msg_prfx="Created Time"),
+            self.meter_xml_data_format,
         )
 
-        str_value = format_date(date, self.meter_xml_data_format)
-
-        self._data.audit.createdDate = str_value
-
     @property
     def created_by(self):  # pylint: disable=missing-function-docstring
-        return self._data.audit.createdBy
+        return self._created_by
 
     @created_by.setter
     def created_by(self, value):
-        self._data.audit.createdBy = str(value).strip()
+        self._created_by = str(value).strip()
 
     @property
     def usage(self):  # pylint: disable=missing-function-docstring
-        return self._data.usage
+        return self._usage
 
     @usage.setter
     def usage(self, value):
@@ -175,58 +234,88 @@ class Meter(BaseConfig):  # pylint: disable=too-many-instance-attributes
             raise StandardizedMeterException(
                 f'ERROR: Usage: Looks like given value "{value}" is not a number'
             )
-        self._data.usage = Decimal(value)
+        self._usage = Decimal(value)
 
     @property
     def meter_uri(self):  # pylint: disable=missing-function-docstring
-        return self._data.meterURI
+        return self._meter_uri
 
     @meter_uri.setter
     def meter_uri(self, value):
-        self._data.meterURI = str(value).strip()
+        self._meter_uri = str(value).strip()
 
     @property
     def meter_id(self):  # pylint: disable=missing-function-docstring
-        return self.get_unique_id(self._data.meterURI)
+        return get_meter_id(self._meter_uri)
+
+    def parse_packed_row(self, row: Dict[str, str]) -> None:
+        """Fill the meter with a row of a packed standardized file"""
+        self.meter_uri = row["meterURI"]
+        self.start_time = parse(row["startTime"], dt_format=self.meter_xml_data_format)
+        self.end_time = parse(row["endTime"], dt_format=self.meter_xml_data_format)
+        self.usage = row["usage"]
+        self._created_by = row["createdBy"]
+        self._created_date = row["createdDate"]
 
     def as_xml(self):
         """Generate XML representation of the meter data"""
-
-        root_tag = self._root_element_maker.meterData(
-            self._hbd_element_maker.meteredData(
-                self._hbd_element_maker.meterURI(self.meter_uri),
-                self._hbd_element_maker.startTime(
-                    format_date(self.start_time, dt_format=self.meter_xml_data_format)
-                ),
-                self._hbd_element_maker.endTime(
-                    format_date(self.end_time, dt_format=self.meter_xml_data_format)
-                ),
-                self._hbd_element_maker.usage(str(self.usage)),
-                self._hbd_element_maker.audit(
-                    self._espm_element_maker.createdBy(self.created_by),
-                    self._espm_element_maker.createdDate(self.created_date),
-                ),
-            )
+        return meter_to_xml(
+            meter_uri=self._meter_uri,
+            start_time=format_date(self.start_time, self.meter_xml_data_format),
+            end_time=format_date(self.end_time, self.meter_xml_data_format),
+            usage=str(self._usage),
+            created_by=self._created_by,
+            created_date=self._created_date,
         )
-        root_tag.attrib[f"{{{self.xsi}}}schemaLocation"] = self.schema_location
-        return root_tag
 
     def as_json(self):
         """Convert Data representation to json"""
-        json_data = asdict(self._data)
+        return asdict(self.as_dataclass()) | {
+            "startTime": format_date(self.start_time, self.meter_xml_data_format),
+            "endTime": format_date(self.end_time, self.meter_xml_data_format),
+        }
 
-        for key in ("startTime", "endTime"):
-            json_data[key] = format_date(json_data[key], self.meter_xml_data_format)
-        return json_data
-
-    def as_str(self):
+    def as_str(self, pretty_print: bool = True):
         """Convert XML representation to string"""
-        return etree.tostring(  # pylint: disable=c-extension-no-member
-            self.as_xml(), pretty_print=True, xml_declaration=True, encoding="UTF-8"
+        return xml_to_str(self.as_xml(), pretty_print=pretty_print)
+
+    def as_dataclass(self) -> StandardizedMeter:
+        """Convert to the standardized meter dataclass"""
+        return StandardizedMeter(
+            meterURI=self._meter_uri,
+            startTime=self.start_time,
+            endTime=self.end_time,
+            usage=self._usage,
+            audit=AuditData(createdBy=self._created_by, createdDate=self._created_date),
         )
 
-    def as_dataclass(self) -> dataclass:
-        return replace(self._data)
+
+class Meter(MeterValues, BaseConfig):  # pylint: disable=too-many-instance-attributes
+    """An standardazed meter reprezentation object"""
+
+    espm = ESPM_NS
+    xsi = XSI_NS
+    hbd = HBD_NS
+    schema_location = SCHEMA_LOCATION
+
+    ST_METER_DATA_TG = "hbd:meterData"
+    ST_METERED_DATA_TG = "hbd:meteredData"
+    ST_METERED_METER_URI_TG = "hbd:meterURI"
+    ST_METERED_START_TIME_TG = "hbd:startTime"
+    ST_METERED_END_TIME_TG = "hbd:endTime"
+    ST_METERED_USAGE_TG = "hbd:usage"
+
+    def __init__(
+        self,
+        path_info: Optional[str] = None,
+        meter_timezone: str = CFG.DEFAULT_LOCAL_TIMEZONE_NAME,
+        env_timezone: Optional[str] = CFG.ENVIRONMENT_TIME_ZONE,
+        dt_format: str = CFG.PROCESSING_DATE_FORMAT,
+        xml_dt_format: str = CFG.STANDARDIZED_METER_DATE_FORMAT,
+    ) -> None:
+        super().__init__(path_info=path_info)
+        self._init_values(meter_timezone, env_timezone, dt_format, xml_dt_format)
+        self._namespaces = NAMESPACES
 
     def parse_string_xml(self, data: str, config: dict) -> None:
         parser = etree.XMLParser(  # pylint: disable=c-extension-no-member
@@ -271,13 +360,11 @@ class Meter(BaseConfig):  # pylint: disable=too-many-instance-attributes
                 elif mapped_dt_tag == self.ST_METERED_USAGE_TG:
                     self.usage = data_el.text
                 elif mapped_dt_tag == self.AUDIT_TG:
-                    self._data.audit = replace(
-                        self._data.audit,
-                        **self._parse_audit(
-                            data_el,
-                            allowed_fields=self._get_data_fields(self._data.audit),
-                        ),
+                    audit = self._parse_audit(
+                        data_el, allowed_fields=self._get_data_fields(AuditData())
                     )
+                    self._created_by = audit.get("createdBy", self._created_by)
+                    self._created_date = audit.get("createdDate", self._created_date)
                 else:
                     use = config.get("use", "local").strip().lower()
 
@@ -287,6 +374,36 @@ class Meter(BaseConfig):  # pylint: disable=too-many-instance-attributes
                     )
 
 
+class CompactMeter(MeterValues):  # pylint: disable=too-many-instance-attributes
+    """Lightweight standardized meter used to produce meter values.
+
+    Has the same values and serialization as Meter, without the config
+    reading machinery. Builders are shared and meter id is cached.
+    """
+
+    __slots__ = (
+        "meter_tz",
+        "env_timezone",
+        "meter_data_format",
+        "meter_xml_data_format",
+        "_meter_uri",
+        "_start_time",
+        "_end_time",
+        "_usage",
+        "_created_by",
+        "_created_date",
+    )
+
+    def __init__(
+        self,
+        meter_timezone: str = CFG.DEFAULT_LOCAL_TIMEZONE_NAME,
+        env_timezone: Optional[str] = CFG.ENVIRONMENT_TIME_ZONE,
+        dt_format: str = CFG.PROCESSING_DATE_FORMAT,
+        xml_dt_format: str = CFG.STANDARDIZED_METER_DATE_FORMAT,
+    ) -> None:
+        self._init_values(meter_timezone, env_timezone, dt_format, xml_dt_format)
+
+
 if __name__ == "__main__":
     import json
 
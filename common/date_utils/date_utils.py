@@ -1,9 +1,11 @@
 """Common utils to work with dates"""
+import re
 import uuid
 from copy import deepcopy
 from datetime import datetime, time, timedelta
 from decimal import Decimal
-from typing import Optional, Tuple, Union
+from functools import lru_cache
+from typing import List, Optional, Pattern, Tuple, Union
 
 import pendulum as pdl
 import polars as pl
@@ -60,10 +62,110 @@ TRUNCATE_MAPPER = {
 }
 
 
+# Tokens of the fixed project formats handled without the generic parser,
+# every token is mapped to the DateTime field, its parse/format templates and
+# its strftime directive.
+FIXED_FORMAT_TOKENS = {
+    "YYYY": ("year", r"\d{4}", "04d", "%Y"),
+    "MM": ("month", r"\d{2}", "02d", "%m"),
+    "DD": ("day", r"\d{2}", "02d", "%d"),
+    "HH": ("hour", r"\d{2}", "02d", "%H"),
+    "mm": ("minute", r"\d{2}", "02d", "%M"),
+    "ss": ("second", r"\d{2}", "02d", "%S"),
+}
+FIXED_FORMAT_FIELDS = ("year", "month", "day", "hour", "minute", "second")
+FIXED_FORMAT_DEFAULTS = {"month": 1, "day": 1, "hour": 0, "minute": 0, "second": 0}
+
+# Escaped literal, fixed token, any other token or a single separator
+FIXED_FORMAT_TOKENS_RE = re.compile(r"\[([^\]]*)\]|YYYY|MM|DD|HH|mm|ss|[A-Za-z]+|.")
+
+UTC_TIMEZONE = pdl.timezone("UTC")
+
+
 class DateParseException(Exception):
     """Exception class specific to this package."""
 
 
+@lru_cache(maxsize=128)
+def _split_fixed_format(dt_format: str) -> Optional[List[Tuple[str, bool]]]:
+    """Split pendulum format into pairs of a token and whether it is literal.
+
+    None is returned for formats having tokens other than the fixed ones.
+    """
+    tokens = []
+    for match in FIXED_FORMAT_TOKENS_RE.finditer(dt_format):
+        token = match.group(0)
+        if match.group(1) is not None:
+            tokens.append((match.group(1), True))
+        elif token in FIXED_FORMAT_TOKENS:
+            tokens.append((token, False))
+        elif token.isalpha():
+            return None
+        else:
+            tokens.append((token, True))
+    return tokens
+
+
+@lru_cache(maxsize=128)
+def _get_fixed_format(dt_format: str) -> Optional[Tuple[Pattern, str]]:
+    """Compile pendulum format to regex and str.format template.
+
+    None is returned for formats having tokens other than the fixed ones.
+    """
+    tokens = _split_fixed_format(dt_format)
+    if tokens is None:
+        return None
+
+    pattern, template, fields = [], [], set()
+    for token, is_literal in tokens:
+        if is_literal:
+            pattern.append(re.escape(token))
+            template.append(token.replace("{", "{{").replace("}", "}}"))
+            continue
+        field, regex, spec, _ = FIXED_FORMAT_TOKENS[token]
+        if field in fields:
+            return None
+        fields.add(field)
+        pattern.append(f"(?P<{field}>{regex})")
+        template.append(f"{{{FIXED_FORMAT_FIELDS.index(field)}:{spec}}}")
+    return re.compile("".join(pattern) + r"\Z"), "".join(template)
+
+
+def _parse_fixed(
+    value: str, dt_format: str, tz_info: Optional[Union[FixedTimezone, Timezone]]
+) -> Optional[DateTime]:
+    """Parse value of the fixed format, None if it does not fit the format"""
+    fixed_format = _get_fixed_format(dt_format)
+    if fixed_format is None:
+        return None
+
+    match = fixed_format[0].match(value)
+    if match is None:
+        return None
+
+    fields = {**FIXED_FORMAT_DEFAULTS, **match.groupdict()}
+    try:
+        value = DateTime(
+            *(int(fields[field]) for field in FIXED_FORMAT_FIELDS),
+            tzinfo=UTC_TIMEZONE,
+        )
+    except ValueError:
+        return None
+    # Other timezones are replaced like the generic parser does, so the wall
+    # time of the DST gaps and folds is normalized the same way.
+    if tz_info is None or tz_info == UTC_TIMEZONE:
+        return value
+    return value.replace(tzinfo=tz_info)
+
+
+@lru_cache(maxsize=4096)
+def _format_fixed(  # pylint:disable=too-many-arguments
+    template: str, year: int, month: int, day: int, hour: int, minute: int, second: int
+) -> str:
+    """Format wall time fields with the fixed format template"""
+    return template.format(year, month, day, hour, minute, second)
+
+
 def parse(
     value: Optional[
         Union[
@@ -104,6 +206,16 @@ def parse(
     if isinstance(value, int):
         return pdl.from_timestamp(value, pdl_tz)
 
+    # Project formats are parsed without the generic parser. Values parsed by
+    # the format are UTC ones, others get the given timezone.
+    fast_value = (
+        _parse_fixed(value, dt_format, UTC_TIMEZONE)
+        if dt_format
+        else _parse_fixed(value, CFG.PROCESSING_DATE_FORMAT, pdl_tz)
+    )
+    if fast_value is not None:
+        return fast_value
+
     if not dt_format:
 
         return _pdl_parse(
@@ -392,6 +504,19 @@ def format_date(
     locale: str = "en",
 ) -> str:
     """Format date to string in specified"""
+    if isinstance(date_value, DateTime):
+        fixed_format = _get_fixed_format(dt_format)
+        if fixed_format is not None:
+            return _format_fixed(
+                fixed_format[1],
+                date_value.year,
+                date_value.month,
+                date_value.day,
+                date_value.hour,
+                date_value.minute,
+                date_value.second,
+            )
+
     value = parse(date_value, tz_info=tz_obj)
 
     try:
@@ -440,6 +565,18 @@ def humanize_seconds(value: Union[str, int, Decimal]) -> Union[time, timedelta]:
     return time(hours, minutes, seconds, 0)
 
 
+@lru_cache_expiring(maxsize=128, expires=3600)
+def to_strftime_format(dt_format: str) -> Optional[str]:
+    """Convert pendulum format to strftime one, None if it is not supported"""
+    tokens = _split_fixed_format(dt_format)
+    if tokens is None:
+        return None
+    return "".join(
+        token.replace("%", "%%") if is_literal else FIXED_FORMAT_TOKENS[token][3]
+        for token, is_literal in tokens
+    )
+
+
 class GapDatePeriod:
     """Polaris based Date Period implementation"""
 
@@ -454,6 +591,13 @@ class GapDatePeriod:
         "microseconds": 0,
     }
 
+    # Units having the fixed duration, other ones depend on the calendar.
+    __range_step_seconds = {
+        "hours": 3600,
+        "minutes": 60,
+        "seconds": 1,
+    }
+
     __dates_column__ = "dates"
     __timestamp_column__ = "timestamp"
     __max_timestamp_column__ = "end_timestamp"
@@ -485,20 +629,17 @@ class GapDatePeriod:
         dest_column: str,
         date_format: str = CFG.PROCESSING_DATE_FORMAT,
     ) -> pl.LazyFrame:
-        return frame.lazy().with_columns(
-            (
-                pl.col(date_cl)
-                .apply(lambda x: format_date(x, date_format))
-                .alias(dest_column)
+        strftime_format = to_strftime_format(date_format)
+        if strftime_format is None:
+            return frame.lazy().with_columns(
+                (
+                    pl.col(date_cl)
+                    .apply(lambda x: format_date(x, date_format))
+                    .alias(dest_column)
+                )
             )
-        )
-
-    @staticmethod
-    def _get_timestamp(
-        frame: pl.LazyFrame, date_cl: str, timestamp_cl: str
-    ) -> pl.LazyFrame:
         return frame.lazy().with_columns(
-            (pl.col(date_cl).apply(lambda x: int(x.timestamp())).alias(timestamp_cl))
+            (pl.col(date_cl).dt.strftime(strftime_format).alias(dest_column))
         )
 
     @staticmethod
@@ -513,25 +654,49 @@ class GapDatePeriod:
     ) -> pl.LazyFrame:
         return frame.lazy().with_column((pl.col(timestamp_col).max()).alias(min_col))
 
-    def _get_data_frame(self) -> pl.LazyFrame:
-        dt_range = date_range(
-            start_date=self._start_date,
-            end_date=self._end_date,
-            range_unit=self._range_level,
-        )
+    def _get_timestamps(self) -> pl.Series:
+        start_ts = int(self._start_date.timestamp())
+        end_ts = int(self._end_date.timestamp())
+        step = self.__range_step_seconds.get(self._range_level)
+        if step is None:
+            dt_range = date_range(
+                start_date=self._start_date,
+                end_date=self._end_date,
+                range_unit=self._range_level,
+            )
+            return pl.Series(
+                self.__timestamp_column__, [int(x.timestamp()) for x in dt_range]
+            )
 
-        range_df = pl.DataFrame(dict([(self.__dates_column__, list(dt_range))])).lazy()
+        return pl.arange(
+            min(start_ts, end_ts), max(start_ts, end_ts) + 1, step, eager=True
+        ).alias(self.__timestamp_column__)
+
+    def _get_data_frame(self) -> pl.LazyFrame:
+        range_df = pl.DataFrame([self._get_timestamps()]).lazy()
 
         range_df = (
-            range_df.lazy()
+            range_df.with_columns(
+                pl.from_epoch(self.__timestamp_column__, unit="s")
+                .dt.replace_time_zone("UTC")
+                .dt.convert_time_zone(self._end_date.timezone_name)
+                .alias(self.__dates_column__)
+            )
             .pipe(self._get_date_str, "dates", "hours")
-            .pipe(self._get_timestamp, "dates", "timestamp")
             .pipe(self._get_max_timestamp, "timestamp", "end_time")
             .pipe(self._get_min_timestamp, "timestamp", "start_time")
+            .select(["dates", "hours", "timestamp", "end_time", "start_time"])
         )
 
         return range_df
 
+    def to_dates(self, frame: pl.DataFrame) -> List[DateTime]:
+        """Convert timestamps of the given range rows to dates"""
+        return [
+            pdl.from_timestamp(timestamp, tz=self._end_date.timezone)
+            for timestamp in frame[self.__timestamp_column__]
+        ]
+
     @property
     def start_date(self):
         """Range start date"""
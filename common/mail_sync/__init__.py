@@ -0,0 +1,18 @@
+"""Incremental synchronization of the mail folders"""
+from common.mail_sync.mail_sync import (
+    MailSyncState,
+    fetch_messages,
+    get_state_blob_path,
+    load_mail_sync_state,
+    save_mail_sync_state,
+    search_new_uids,
+)
+
+__all__ = [
+    "MailSyncState",
+    "fetch_messages",
+    "get_state_blob_path",
+    "load_mail_sync_state",
+    "save_mail_sync_state",
+    "search_new_uids",
+]
@@ -0,0 +1,151 @@
+"""Incremental synchronization of the mail folders.
+
+The state of a mail folder keeps its UIDVALIDITY together with the UID
+high-water mark of the messages handled by the previous runs. Only messages
+above the mark are searched, the search returns UIDs only and the bodies of
+the matched messages are fetched in bulk. The mark is dropped when the server
+changes UIDVALIDITY of the folder, since the stored UIDs are not valid anymore.
+"""
+import uuid
+from dataclasses import asdict, dataclass
+from json import dumps, loads
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from google.cloud.exceptions import GoogleCloudError
+from google.cloud.storage import Client
+from imap_tools import A, BaseMailBox, MailMessage, U
+
+from common import settings as CFG
+from common.bucket_helpers import get_blob_contents, get_bucket, require_client
+from common.logging import Logger
+
+LOGGER = Logger(
+    name="Mail sync",
+    level="DEBUG",
+    description="Mail sync",
+    trace_id=uuid.uuid4(),
+)
+
+
+@dataclass
+class MailSyncState:
+    """UIDVALIDITY and UID high-water mark of the mail folder"""
+
+    uidvalidity: int = 0
+    uid: int = 0
+
+    def release(self, pending_uids: Iterable[str]) -> "MailSyncState":
+        """Lower the mark to keep the pending messages for the next run"""
+        pending = [int(uid) for uid in pending_uids]
+        if not pending:
+            return self
+        return MailSyncState(
+            uidvalidity=self.uidvalidity, uid=min(self.uid, min(pending) - 1)
+        )
+
+
+def get_state_blob_path(bucket_path: str) -> str:
+    """Get path of the mail sync state for the given raw path"""
+    return f'{bucket_path.strip("/")}/{CFG.MAIL_SYNC_STATE_PATH}'
+
+
+def _load_states(bucket_name: str, bucket_path: str, client: Client) -> dict:
+    data = get_blob_contents(bucket_name, get_state_blob_path(bucket_path), client)
+    return loads(data) if data else {}
+
+
+def load_mail_sync_state(
+    bucket_name: str,
+    bucket_path: str,
+    folder: str,
+    client: Optional[Client] = None,
+) -> MailSyncState:
+    """Load state of the mail folder, empty state if absent or sync is disabled"""
+    if not CFG.MAIL_SYNC_ENABLED:
+        return MailSyncState()
+    try:
+        states = _load_states(bucket_name, bucket_path, require_client(client))
+    except (GoogleCloudError, ValueError) as err:
+        LOGGER.warning(
+            f"Cannot load mail sync state of '{bucket_name}/{bucket_path}' "
+            f"due to the error '{err}', all matched messages will be fetched."
+        )
+        return MailSyncState()
+    return MailSyncState(**states.get(folder, {}))
+
+
+def save_mail_sync_state(
+    bucket_name: str,
+    bucket_path: str,
+    folder: str,
+    state: MailSyncState,
+    client: Optional[Client] = None,
+) -> None:
+    """Save state of the mail folder, errors are logged only"""
+    if not CFG.MAIL_SYNC_ENABLED:
+        return
+    storage_client = require_client(client)
+    try:
+        states = _load_states(bucket_name, bucket_path, storage_client)
+        states[folder] = asdict(state)
+        get_bucket(bucket_name, client=storage_client).blob(
+            get_state_blob_path(bucket_path)
+        ).upload_from_string(
+            dumps(states), content_type="application/json", client=storage_client
+        )
+    except (GoogleCloudError, ValueError) as err:
+        LOGGER.warning(
+            f"Cannot save mail sync state of '{bucket_name}/{bucket_path}' "
+            f"due to the error '{err}'."
+        )
+
+
+def search_new_uids(
+    mailbox: BaseMailBox, folder: str, criteria: A, state: MailSyncState
+) -> Tuple[List[str], MailSyncState]:
+    """Search UIDs of the matched messages above the mark.
+
+    Returns UIDs in the ascending order together with the folder state the
+    mark is moved to once all of them are handled.
+    """
+    status = mailbox.folder.status(folder, ("UIDVALIDITY", "UIDNEXT"))
+    last_uid = state.uid if state.uidvalidity == status["UIDVALIDITY"] else 0
+    if state.uidvalidity and state.uidvalidity != status["UIDVALIDITY"]:
+        LOGGER.warning(
+            f"UIDVALIDITY of the mail folder '{folder}' has been changed, "
+            "all matched messages will be fetched."
+        )
+
+    new_state = MailSyncState(
+        uidvalidity=status["UIDVALIDITY"], uid=max(last_uid, status["UIDNEXT"] - 1)
+    )
+    if last_uid + 1 >= status["UIDNEXT"]:
+        return [], new_state
+
+    # The range end "*" is the last message even if it is below the range start.
+    uids = sorted(
+        (
+            uid
+            for uid in mailbox.uids(A(criteria, uid=U(last_uid + 1, "*")))
+            if int(uid) > last_uid
+        ),
+        key=int,
+    )
+    if uids:
+        new_state.uid = max(new_state.uid, int(uids[-1]))
+    return uids, new_state
+
+
+def fetch_messages(
+    mailbox: BaseMailBox, uids: List[str], bulk_size: Optional[int] = None
+) -> Iterator[MailMessage]:
+    """Fetch messages by chunks of UIDs, each chunk is fetched by a single command.
+
+    Messages are not marked as seen, so the messages left unprocessed by the
+    caller stay untouched.
+    """
+    bulk_size = max(bulk_size or CFG.MAIL_FETCH_BULK_SIZE, 1)
+    for idx in range(0, len(uids), bulk_size):
+        yield from mailbox.fetch(
+            A(uid=uids[idx : idx + bulk_size]), mark_seen=False, bulk=True
+        )
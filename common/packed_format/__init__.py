@@ -0,0 +1,32 @@
+"""Packed columnar standardized data format"""
+from common.packed_format.packed_format import (
+    NDJSON_FORMAT,
+    PARQUET_FORMAT,
+    XML_FORMAT,
+    PackedFormatException,
+    dumps,
+    get_packed_file_name,
+    get_packed_format,
+    get_packed_hours,
+    get_packed_path,
+    is_packed_format,
+    loads,
+    merge_frames,
+    meters_to_frame,
+)
+
+__all__ = [
+    "NDJSON_FORMAT",
+    "PARQUET_FORMAT",
+    "XML_FORMAT",
+    "PackedFormatException",
+    "dumps",
+    "get_packed_file_name",
+    "get_packed_format",
+    "get_packed_hours",
+    "get_packed_path",
+    "is_packed_format",
+    "loads",
+    "merge_frames",
+    "meters_to_frame",
+]
@@ -0,0 +1,136 @@
+"""Packed columnar representation of standardized meter values.
+
+A packed file contains all standardized hours of a single meter for a day.
+Every row keeps the fields of the standardized meter XML document together
+with the hour file name the XML document would have.
+"""
+import gzip
+from io import BytesIO
+from typing import Any, Iterable, List, Optional, Tuple
+
+import polars as pl
+
+from common import settings as CFG
+from common.date_utils import format_date
+
+XML_FORMAT = "xml"
+NDJSON_FORMAT = "ndjson"
+PARQUET_FORMAT = "parquet"
+
+PACKED_EXTENSIONS = {
+    NDJSON_FORMAT: "ndjson.gz",
+    PARQUET_FORMAT: "parquet",
+}
+
+HOUR_COLUMN = "hour"
+PACKED_SCHEMA = {
+    HOUR_COLUMN: pl.Utf8,
+    "meterURI": pl.Utf8,
+    "startTime": pl.Utf8,
+    "endTime": pl.Utf8,
+    "usage": pl.Utf8,
+    "createdBy": pl.Utf8,
+    "createdDate": pl.Utf8,
+}
+
+
+class PackedFormatException(Exception):
+    """Exception class specific to this package."""
+
+
+def is_packed_format(st_format: Optional[str]) -> bool:
+    """Check the given standardized format is the packed one"""
+    return (st_format or XML_FORMAT).strip().lower() in PACKED_EXTENSIONS
+
+
+def _get_extension(st_format: str) -> str:
+    try:
+        return PACKED_EXTENSIONS[st_format.strip().lower()]
+    except KeyError as err:
+        raise PackedFormatException(
+            f"Unsupported standardized format '{st_format}'."
+        ) from err
+
+
+def get_packed_format(file_name: str) -> Optional[str]:
+    """Get packed format of the given file name, None for not packed files"""
+    for st_format, extension in PACKED_EXTENSIONS.items():
+        if file_name.endswith(f".{extension}"):
+            return st_format
+    return None
+
+
+def get_packed_path(path: str) -> str:
+    """Get path of packed files for the given standardized path"""
+    return f'{path.rstrip("/")}/{CFG.STANDARDIZED_PACKED_PREFIX}'
+
+
+def get_packed_file_name(date: Any, st_format: str) -> str:
+    """Get name of the packed file containing the given date"""
+    return (
+        f"{format_date(date, CFG.STANDARDIZED_PACKED_DATE_FORMAT)}."
+        f"{_get_extension(st_format)}"
+    )
+
+
+def meters_to_frame(rows: Iterable[Tuple[str, Any]]) -> pl.DataFrame:
+    """Build packed frame from pairs of hour file name and standardized meter"""
+    columns = {column: [] for column in PACKED_SCHEMA}
+    dt_format = CFG.STANDARDIZED_METER_DATE_FORMAT
+    for hour, meter in rows:
+        columns[HOUR_COLUMN].append(hour)
+        columns["meterURI"].append(meter.meter_uri)
+        columns["startTime"].append(format_date(meter.start_time, dt_format))
+        columns["endTime"].append(format_date(meter.end_time, dt_format))
+        columns["usage"].append(str(meter.usage))
+        columns["createdBy"].append(meter.created_by)
+        columns["createdDate"].append(meter.created_date)
+    return pl.DataFrame(columns, schema=PACKED_SCHEMA)
+
+
+def merge_frames(existing: Optional[pl.DataFrame], update: pl.DataFrame) -> pl.DataFrame:
+    """Merge packed frames, rows of the update replace existing hours"""
+    if existing is None or existing.is_empty():
+        frame = update
+    else:
+        frame = pl.concat(
+            [existing.select(list(PACKED_SCHEMA)), update], how="vertical"
+        )
+    return frame.unique(subset=[HOUR_COLUMN], keep="last").sort(HOUR_COLUMN)
+
+
+def dumps(frame: pl.DataFrame, st_format: str) -> bytes:
+    """Serialize packed frame"""
+    st_format = st_format.strip().lower()
+    _get_extension(st_format)
+    buffer = BytesIO()
+    if st_format == PARQUET_FORMAT:
+        frame.write_parquet(buffer)
+        return buffer.getvalue()
+
+    frame.write_ndjson(buffer)
+    return gzip.compress(buffer.getvalue())
+
+
+def loads(data: bytes, st_format: str) -> pl.DataFrame:
+    """Deserialize packed frame"""
+    st_format = st_format.strip().lower()
+    _get_extension(st_format)
+    if not data:
+        return pl.DataFrame(schema=PACKED_SCHEMA)
+
+    if st_format == PARQUET_FORMAT:
+        frame = pl.read_parquet(BytesIO(data))
+    else:
+        frame = pl.read_ndjson(BytesIO(gzip.decompress(data)))
+    return frame.select(
+        [pl.col(column).cast(dtype) for column, dtype in PACKED_SCHEMA.items()]
+    )
+
+
+def get_packed_hours(frames: Iterable[pl.DataFrame]) -> List[str]:
+    """Get hour file names stored in the given packed frames"""
+    hours = []
+    for frame in frames:
+        hours.extend(frame[HOUR_COLUMN].to_list())
+    return hours
@@ -10,18 +10,22 @@ import time
 import uuid
 from enum import Enum
 from functools import wraps
+from io import BytesIO
 from json import dumps, loads
 from urllib import parse
+from urllib.error import HTTPError, URLError
 from urllib.request import (
     HTTPBasicAuthHandler,
     HTTPPasswordMgrWithDefaultRealm,
-    Request,
     build_opener,
     install_opener,
-    urlopen,
 )
 
+import requests
+from requests.structures import CaseInsensitiveDict
+
 from common.logging import Logger
+from common.request_helpers.http_client import get_http_session, get_http_timeout
 
 # Assuming that an HTTP (or HTTPS) address :
 # starts with "http://" or "https://"
@@ -76,7 +80,7 @@ def http_request(  # pylint:disable=too-many-arguments
     response_payload_type=PayloadType.TEXT,
     timeout: int = TIMEOUT,
 ):
-    """Wrapper around standard urllib logic to help perform HTTP request related logic."""
+    """Perform HTTP request through the pooled HTTP session."""
 
     if payload:
         if request_payload_type != PayloadType.JSON:
@@ -97,23 +101,43 @@ def http_request(  # pylint:disable=too-many-arguments
             " - the URL is delimited at the end by a space and can contain any"
             "   character"
         )
-    url_request = Request(
-        url=url, data=payload, method=method.name, headers=(headers or {})
-    )
-    with urlopen(url_request, timeout=timeout) as response:  # nosec
+    headers = CaseInsensitiveDict(headers or {})
+    if payload is not None:
+        # urllib default content type of requests having a body
+        headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+
+    try:
+        response = get_http_session().request(
+            method.value,
+            url,
+            data=payload,
+            headers=headers,
+            timeout=get_http_timeout(timeout),
+        )
+    except requests.RequestException as err:
+        raise URLError(err) from err
+
+    # Keep the urllib errors contract of the callers
+    if response.status_code >= 400:
+        raise HTTPError(
+            url,
+            response.status_code,
+            response.reason,
+            response.headers,
+            BytesIO(response.content),
+        )
 
-        if response.getcode() != 200:
-            LOGGER.error("Downtime happened on the integration provider side")
+    if response.status_code != 200:
+        LOGGER.error("Downtime happened on the integration provider side")
 
-        raw_response = response.read()
-        if response_payload_type == PayloadType.TEXT:
-            return raw_response.decode("utf-8")
-        if response_payload_type == PayloadType.JSON:
-            return loads(raw_response)
+    if response_payload_type == PayloadType.TEXT:
+        return response.content.decode("utf-8")
+    if response_payload_type == PayloadType.JSON:
+        return loads(response.content)
 
-        raise JBBRequestHelperException(
-            f"Request payload is not supported yet: {request_payload_type}"
-        )
+    raise JBBRequestHelperException(
+        f"Request payload is not supported yet: {request_payload_type}"
+    )
 
 
 def set_up_basic_authentication(url, username, password):
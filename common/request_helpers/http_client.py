@@ -0,0 +1,58 @@
+"""Pooled HTTP client shared by the REST integrations.
+
+Sessions keep connections alive between requests, so workers fetching
+meter-hours of the same API reuse TCP and TLS connections.
+"""
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from common import settings as CFG
+
+_SESSIONS: Dict[int, requests.Session] = {}
+_SESSIONS_LOCK = Lock()
+
+
+def _create_http_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    # Workers of different participants share the session, so cookies are
+    # never stored.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    # Retries are done by the callers with their own backoff.
+    adapter = HTTPAdapter(
+        pool_connections=CFG.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=pool_size,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_http_session(pool_size: Optional[int] = None) -> requests.Session:
+    """Return the process-wide HTTP session having the given pool size."""
+    pool_size = max(pool_size or CFG.HTTP_POOL_SIZE, 1)
+    session = _SESSIONS.get(pool_size)
+    if session is None:
+        with _SESSIONS_LOCK:
+            session = _SESSIONS.get(pool_size)
+            if session is None:
+                session = _create_http_session(pool_size)
+                _SESSIONS[pool_size] = session
+    return session
+
+
+def close_http_sessions() -> None:
+    """Close all pooled HTTP sessions."""
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+
+def get_http_timeout(read_timeout: Optional[float] = None) -> Tuple[float, float]:
+    """Return connect and read timeouts of HTTP requests."""
+    return CFG.HTTP_CONNECT_TIMEOUT, read_timeout or CFG.HTTP_READ_TIMEOUT
@@ -50,6 +50,8 @@ GCP_REGION = env.str("GCP_REGION", "us-east4")
 GCP_BIGQUERY_REGION = env.str("GCP_BIGQUERY_REGION", "us")
 PROJECT = env.str("PROJECT", "develop-epbp")
 DATASET = env.str("DATASET", "standardized_new")
+# Endpoint of the BigQuery emulator used instead of the real service if set.
+BIGQUERY_EMULATOR_HOST = env.str("BIGQUERY_EMULATOR_HOST", "")
 
 # The prototype preffix must be removed after transition
 if PROJECT == "develop-epbp":
@@ -85,6 +87,14 @@ PARTICIPANT_CONFIG_NAME = "participant.xml"
 DB_LOAD_FUNCTION_NAME = "connector_dbload"
 DW_UPDATE_FUNCTION_NAME = "connector_dw_update"
 
+# Collect meters data dispatcher. Participant configurations are parsed by
+# DISPATCHER_WORKERS_AMOUNT workers and Pub/Sub messages are published in
+# batches, DISPATCHER_PUBLISH_TIMEOUT limits the wait for all publish results.
+DISPATCHER_WORKERS_AMOUNT = env.int("DISPATCHER_WORKERS_AMOUNT", 20)
+DISPATCHER_PUBLISH_MAX_MESSAGES = env.int("DISPATCHER_PUBLISH_MAX_MESSAGES", 100)
+DISPATCHER_PUBLISH_MAX_LATENCY = env.float("DISPATCHER_PUBLISH_MAX_LATENCY", 0.05)
+DISPATCHER_PUBLISH_TIMEOUT = env.int("DISPATCHER_PUBLISH_TIMEOUT", 120)
+
 OMIT_VALIDATION_BUCKET_NAMES = [LANDING_ZONE_BUCKET]
 
 DB_LOAD_RESTORE_FUNCTION_NAME_TEMPLATE = "connector_dbload_restore_"
@@ -109,12 +119,64 @@ DEFAULT_LOCAL_TIMEZONE_NAME: Final[str] = get_localzone().zone
 ENVIRONMENT_TIME_ZONE = env.str("ENVIRONMENT_TIME_ZONE", DEFAULT_LOCAL_TIMEZONE_NAME)
 
 DW_LOAD_FILES_BUCKET_LIMIT = os.environ.get("DW_LOAD_FILES_BUCKET_LIMIT", 10000)
+DW_LOAD_SOURCE_FORMAT = env.str("DW_LOAD_SOURCE_FORMAT", "PARQUET")
+
+# Shared thread pool sizing. Zero means derive the size from CPU and memory.
+THREAD_POOL_MAX_WORKERS = env.int("THREAD_POOL_MAX_WORKERS", 0)
+THREAD_POOL_WORKERS_PER_CPU = env.int("THREAD_POOL_WORKERS_PER_CPU", 16)
+THREAD_POOL_WORKER_MEMORY_MB = env.int("THREAD_POOL_WORKER_MEMORY_MB", 8)
+# Set by the Cloud Functions runtime, falls back to the host memory.
+FUNCTION_MEMORY_MB = env.int("FUNCTION_MEMORY_MB", 0)
+
+# Pooled HTTP client of the REST integrations. The pool size defaults to the
+# workers amount of the caller.
+HTTP_POOL_SIZE = env.int("HTTP_POOL_SIZE", 10)
+HTTP_POOL_CONNECTIONS = env.int("HTTP_POOL_CONNECTIONS", 10)
+HTTP_CONNECT_TIMEOUT = env.float("HTTP_CONNECT_TIMEOUT", 10)
+HTTP_READ_TIMEOUT = env.float("HTTP_READ_TIMEOUT", 60)
+
+STORAGE_BATCH_SIZE = env.int("STORAGE_BATCH_SIZE", 100)
+
+# Concurrent uploads of the pull connectors, producers are blocked while the
+# pending objects exceed the memory cap. Gzip content encoding is transparent
+# to readers since storage serves the objects decompressed.
+UPLOAD_PIPELINE_WORKERS = env.int("UPLOAD_PIPELINE_WORKERS", 16)
+UPLOAD_PIPELINE_MAX_BYTES = env.int("UPLOAD_PIPELINE_MAX_BYTES", 32 * 2**20)
+UPLOAD_GZIP_ENCODING = env.bool("UPLOAD_GZIP_ENCODING", False)
+
+# Cache of the bucket files contents and configurations, entries expire
+# separately and the cache is bounded by the total size of the contents.
+FILE_CONTENTS_CACHE_MAX_BYTES = env.int("FILE_CONTENTS_CACHE_MAX_BYTES", 64 * 2**20)
+FILE_CONTENTS_CACHE_EXPIRES = env.int("FILE_CONTENTS_CACHE_EXPIRES", 3600)
 
 UPDATE_PREFIX = "updates"
 UPDATE_FILENAME_PREFFIX_TMPL = "{update_prefix}-"
 UPDATE_FILENAME_TMPL = "{update_prefix}-{cnt}-{run_date}"
 PROCESSED_PREFIX = "processed"
 
+# Update status manifests of the standardized files are written as NDJSON,
+# optionally gzip compressed. Readers detect the compression by the content.
+UPDATE_MANIFEST_GZIP = env.bool("UPDATE_MANIFEST_GZIP", False)
+
+# Standardized data format, "xml" stores a file per meter hour while "ndjson"
+# and "parquet" pack all hours of a meter day into a single file.
+STANDARDIZED_FORMAT = env.str("STANDARDIZED_FORMAT", "xml")
+STANDARDIZED_PACKED_PREFIX = "packed"
+STANDARDIZED_PACKED_DATE_FORMAT = "YYYY-MM-DD"
+
+# Coverage index of the standardized hours consulted by the gaps detection,
+# the reconciliation mode rebuilds the index from the bucket listings.
+COVERAGE_INDEX_ENABLED = env.bool("COVERAGE_INDEX_ENABLED", True)
+COVERAGE_INDEX_RECONCILE = env.bool("COVERAGE_INDEX_RECONCILE", False)
+COVERAGE_INDEX_PATH = "coverage/index.json"
+
+# Incremental sync of the mail integrations keeps the UIDVALIDITY and UID
+# high-water mark of the mail folder next to the raw files, so the messages
+# older than the mark are neither searched nor fetched again.
+MAIL_SYNC_ENABLED = env.bool("MAIL_SYNC_ENABLED", True)
+MAIL_SYNC_STATE_PATH = "mail_sync/state.json"
+MAIL_FETCH_BULK_SIZE = env.int("MAIL_FETCH_BULK_SIZE", 20)
+
 UTC_TIMEZONE = pdl.timezone("UTC")
 
 CONED_CLIENT_ID = os.environ.get("CONED_CLIENT_ID")
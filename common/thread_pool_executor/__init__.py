@@ -1,6 +1,12 @@
 """Thread executor wrapper"""
-from common.thread_pool_executor.thread_pool_executor import run_thread_pool_executor
+from common.thread_pool_executor.thread_pool_executor import (
+    get_thread_pool_executor,
+    run_thread_pool_executor,
+    shutdown_thread_pool_executor,
+)
 
 __all__ = [
+    "get_thread_pool_executor",
     "run_thread_pool_executor",
+    "shutdown_thread_pool_executor",
 ]
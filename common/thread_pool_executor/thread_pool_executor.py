@@ -1,26 +1,114 @@
 """Thread executor wrapper"""
-from concurrent.futures import ALL_COMPLETED, ThreadPoolExecutor, wait
+import os
+from concurrent.futures import ALL_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import wraps
+from threading import BoundedSemaphore, Lock, current_thread
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from common import settings as CFG
+
+POOL_THREAD_NAME_PREFIX = "jbb_pool"
+
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_LOCK = Lock()
+
+
+def _get_memory_mb() -> int:
+    """Return memory available for the process in megabytes."""
+    if CFG.FUNCTION_MEMORY_MB:
+        return CFG.FUNCTION_MEMORY_MB
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // 2**20
+    except (AttributeError, ValueError, OSError):
+        return 0
+
+
+def get_pool_size() -> int:
+    """Calculate the shared pool size from configuration, CPU and memory."""
+    if CFG.THREAD_POOL_MAX_WORKERS > 0:
+        return CFG.THREAD_POOL_MAX_WORKERS
+
+    pool_size = (os.cpu_count() or 1) * CFG.THREAD_POOL_WORKERS_PER_CPU
+    memory_mb = _get_memory_mb()
+    if memory_mb and CFG.THREAD_POOL_WORKER_MEMORY_MB > 0:
+        pool_size = min(pool_size, memory_mb // CFG.THREAD_POOL_WORKER_MEMORY_MB)
+    return max(pool_size, 1)
+
+
+def get_thread_pool_executor() -> ThreadPoolExecutor:
+    """Return the process-wide thread pool, creating it on first use."""
+    global _POOL  # pylint:disable=global-statement
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = ThreadPoolExecutor(
+                    max_workers=get_pool_size(),
+                    thread_name_prefix=POOL_THREAD_NAME_PREFIX,
+                )
+    return _POOL
+
+
+def shutdown_thread_pool_executor(wait_on_done: bool = True) -> None:
+    """Shutdown the process-wide thread pool."""
+    global _POOL  # pylint:disable=global-statement
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=wait_on_done)
+            _POOL = None
+
+
+def _is_pool_thread() -> bool:
+    return current_thread().name.startswith(POOL_THREAD_NAME_PREFIX)
+
+
+def _bounded(worker: Callable, semaphore: BoundedSemaphore) -> Callable:
+    @wraps(worker)
+    def wrapper(*args, **kwargs):
+        with semaphore:
+            return worker(*args, **kwargs)
+
+    return wrapper
+
 
 def run_thread_pool_executor(
     workers: List[Tuple[Callable, List[Any]]],
     worker_replica: int = 1,
     wait_on_done: bool = True,
-    max_pool_workers: int = 10,
-) -> Optional[Dict]:
-    """Run the given workers in thread poll executor."""
+    max_pool_workers: Optional[int] = None,
+) -> Dict[Future, str]:
+    """Run the given workers in the shared thread pool executor.
+
+    Workers submitted from a thread of the shared pool run in a private
+    executor, otherwise they could wait for the threads held by their caller.
+    The ``max_pool_workers`` limits the amount of concurrently running
+    workers of this call.
+    """
+    semaphore = BoundedSemaphore(max_pool_workers) if max_pool_workers else None
+    private_executor = None
+    if _is_pool_thread():
+        private_executor = ThreadPoolExecutor(
+            max_workers=max_pool_workers or len(workers) * worker_replica or 1
+        )
+        executor = private_executor
+    else:
+        executor = get_thread_pool_executor()
+
     futures = {}
-    with ThreadPoolExecutor(max_workers=max_pool_workers) as executor:
-        for idx, (worker, args) in enumerate(workers, 1):
-            for replica_idx in range(1, worker_replica + 1):
-                key = f"{idx}_{replica_idx}_{worker.__name__}"
-                if replica_idx == 1:
-                    args.append(key)
-                else:
-                    args[-1] = key
-                fut = executor.submit(worker, *args)
-                futures[fut] = key
-        if wait_on_done:
-            wait(futures, timeout=1, return_when=ALL_COMPLETED)
+    for idx, (worker, args) in enumerate(workers, 1):
+        target = _bounded(worker, semaphore) if semaphore else worker
+        for replica_idx in range(1, worker_replica + 1):
+            key = f"{idx}_{replica_idx}_{worker.__name__}"
+            if replica_idx == 1:
+                args.append(key)
+            else:
+                args[-1] = key
+            fut = executor.submit(target, *args)
+            futures[fut] = key
+
+    if private_executor is not None:
+        # Submitted workers keep running, the threads exit once they are done.
+        private_executor.shutdown(wait=False)
+
+    if wait_on_done:
+        wait(futures, return_when=ALL_COMPLETED)
     return futures
@@ -0,0 +1,14 @@
+"""Update status manifests of the standardized files"""
+from common.update_manifest.update_manifest import (
+    ManifestWriter,
+    get_hour_id,
+    load_manifest,
+    loads_manifest,
+)
+
+__all__ = [
+    "ManifestWriter",
+    "get_hour_id",
+    "load_manifest",
+    "loads_manifest",
+]
@@ -0,0 +1,166 @@
+"""Update status manifests of the standardized files.
+
+A manifest is written in a single pass as NDJSON, a compact JSON record per
+line: a ``file`` record per standardized file, an ``update`` record per meter
+hour value and the ``amounts`` record last. It is optionally gzip compressed.
+Readers accept both the NDJSON and the previous single JSON document.
+"""
+import gzip
+import uuid
+from io import BytesIO
+from json import JSONDecodeError, JSONEncoder, loads
+from math import isfinite
+from typing import Any, Dict, Optional, Union
+
+from google.cloud.storage import Client
+from pendulum import DateTime
+
+from common import settings as CFG
+from common.bucket_helpers import get_file_contents
+from common.date_utils import format_date
+from common.logging import Logger
+
+LOGGER = Logger(
+    name="Update manifest",
+    level="DEBUG",
+    description="Update manifest",
+    trace_id=uuid.uuid4(),
+)
+
+GZIP_MAGIC = b"\x1f\x8b"
+DEFAULT_HOUR_ID_DATE_FORMAT = "YYYYMMDDHH"
+
+_ENCODER = JSONEncoder(separators=(",", ":"), check_circular=False)
+_encode_str = _ENCODER.encode
+
+# Records are formatted from templates, the same as the compact JSON encoding
+# of the record dicts without building them.
+_FILE_RECORD_TMPL = '{{"file":{{"bucket":{},"path":{},"filename":{}}}}}\n'
+_UPDATE_RECORD_TMPL = (
+    '{{"update":{{"data":{},"ref_hour_id":{},"ref_meter_id":{},'
+    '"ref_participant_id":{}}}}}\n'
+)
+_AMOUNTS_RECORD_TMPL = '{{"amounts":{}}}\n'
+
+
+def get_hour_id(start_time: Any) -> int:
+    """Get hour id of the meter hour start time"""
+    if CFG.HOUR_ID_DATE_FORMAT == DEFAULT_HOUR_ID_DATE_FORMAT and isinstance(
+        start_time, DateTime
+    ):
+        return (
+            (start_time.year * 100 + start_time.month) * 100 + start_time.day
+        ) * 100 + start_time.hour
+    return int(format_date(start_time, CFG.HOUR_ID_DATE_FORMAT))
+
+
+class ManifestWriter:
+    """Incremental writer of the update status manifest"""
+
+    def __init__(self, gzip_encoding: Optional[bool] = None) -> None:
+        self._gzip_encoding = (
+            CFG.UPDATE_MANIFEST_GZIP if gzip_encoding is None else gzip_encoding
+        )
+        self._buffer = BytesIO()
+        self._value: Optional[bytes] = None
+        self.files = 0
+        self.amounts = 0
+
+    def _write(self, line: str) -> None:
+        if self._value is not None:
+            raise ValueError("The manifest is finished already.")
+        self._buffer.write(line.encode("utf-8"))
+
+    def add_file(self, bucket: str, path: str, filename: str) -> None:
+        """Add standardized file location"""
+        self._write(
+            _FILE_RECORD_TMPL.format(
+                _encode_str(bucket), _encode_str(path), _encode_str(filename)
+            )
+        )
+        self.files += 1
+
+    def add_update(self, meter: Any, participant_id: int) -> None:
+        """Add meter hour value"""
+        data = float(meter.usage)
+        self._write(
+            _UPDATE_RECORD_TMPL.format(
+                repr(data) if isfinite(data) else _ENCODER.encode(data),
+                get_hour_id(meter.start_time),
+                int(meter.meter_id),
+                int(participant_id),
+            )
+        )
+        self.amounts += 1
+
+    def getvalue(self, amounts: Optional[int] = None) -> bytes:
+        """Finish the manifest on the first call and return its body"""
+        if self._value is None:
+            self._write(
+                _AMOUNTS_RECORD_TMPL.format(
+                    self.amounts if amounts is None else amounts
+                )
+            )
+            body = self._buffer.getvalue()
+            self._buffer = None
+            self._value = (
+                gzip.compress(body, compresslevel=6, mtime=0)
+                if self._gzip_encoding
+                else body
+            )
+        return self._value
+
+
+def loads_manifest(data: Union[str, bytes, None]) -> Dict[str, Any]:
+    """Load the manifest of the NDJSON or the previous JSON format.
+
+    Raises JSONDecodeError or OSError if the manifest is malformed.
+    """
+    if not data:
+        return {}
+    if isinstance(data, bytes):
+        if data.startswith(GZIP_MAGIC):
+            data = gzip.decompress(data)
+        data = data.decode("utf-8")
+
+    first_line = data.lstrip().partition("\n")[0]
+    try:
+        record = loads(first_line)
+    except JSONDecodeError:
+        record = None
+    if not isinstance(record, dict) or "files" in record or "updates" in record:
+        return loads(data)
+
+    manifest = {"amounts": None, "files": [], "updates": []}
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        record = loads(line)
+        if "update" in record:
+            manifest["updates"].append(record["update"])
+        elif "file" in record:
+            manifest["files"].append(record["file"])
+        elif "amounts" in record:
+            manifest["amounts"] = record["amounts"]
+    if manifest["amounts"] is None:
+        manifest["amounts"] = len(manifest["updates"])
+    return manifest
+
+
+def load_manifest(
+    bucket: str, path: str, filename: str, client: Optional[Client] = None
+) -> Dict[str, Any]:
+    """Download and load the manifest, empty one if it is malformed"""
+    fl_path = f'{path.lstrip("/")}/{filename}'
+    try:
+        return loads_manifest(
+            get_file_contents(
+                bucket_name=bucket, blob_path=fl_path, binary_mode=True, client=client
+            )
+        )
+    except (JSONDecodeError, UnicodeDecodeError, OSError) as err:
+        LOGGER.error(
+            f"Cannot load update status file 'gs://{bucket}/{fl_path}' due to "
+            f"the error {err}."
+        )
+    return {}
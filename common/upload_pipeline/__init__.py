@@ -0,0 +1,12 @@
+"""Bounded concurrent upload of the bucket objects"""
+from common.upload_pipeline.upload_pipeline import (
+    UploadObject,
+    UploadPipeline,
+    upload_object,
+)
+
+__all__ = [
+    "UploadObject",
+    "UploadPipeline",
+    "upload_object",
+]
@@ -0,0 +1,150 @@
+"""Bounded concurrent upload of the bucket objects.
+
+Objects are uploaded by a dedicated pool of threads, so producers do not wait
+for the upload latency. Putting an object blocks while the size of the pending
+objects exceeds the memory cap, which throttles producers to the upload
+throughput. Every object is retried separately.
+"""
+import gzip
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Condition
+from typing import Callable, Optional, Set, Union
+
+from google.cloud.exceptions import GoogleCloudError
+from google.cloud.storage import Client
+
+from common import settings as CFG
+from common.bucket_helpers import get_bucket, require_client
+from common.request_helpers import retry
+
+UPLOAD_THREAD_NAME_PREFIX = "jbb_upload"
+
+
+@dataclass
+class UploadObject:
+    """Object to upload"""
+
+    bucket: str
+    path: str
+    file_name: str
+    body: Union[str, bytes]
+    content_type: Optional[str] = None
+
+    @property
+    def blob_path(self) -> str:
+        """Path of the object blob"""
+        return f'{(self.path or "").strip("/")}/{self.file_name}'
+
+
+@retry((GoogleCloudError,))
+def upload_object(
+    obj: UploadObject, gzip_encoding: bool = False, client: Optional[Client] = None
+) -> None:
+    """Upload the object, compressed with gzip content encoding if requested"""
+    storage_client = require_client(client)
+    blob = get_bucket(obj.bucket, client=storage_client).blob(obj.blob_path)
+    if not gzip_encoding:
+        blob.upload_from_string(
+            obj.body, content_type=obj.content_type, client=storage_client
+        )
+        return
+
+    is_text = isinstance(obj.body, str)
+    blob.content_encoding = "gzip"
+    blob.upload_from_string(
+        gzip.compress(obj.body.encode("utf-8") if is_text else obj.body),
+        content_type=obj.content_type
+        or ("text/plain" if is_text else "application/octet-stream"),
+        client=storage_client,
+    )
+
+
+OnDone = Callable[[UploadObject, Optional[Exception]], None]
+
+
+class UploadPipeline:
+    """Concurrent uploader having the memory cap of the pending objects"""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        gzip_encoding: Optional[bool] = None,
+        client: Optional[Client] = None,
+    ) -> None:
+        self._max_bytes = max_bytes or CFG.UPLOAD_PIPELINE_MAX_BYTES
+        self._gzip_encoding = (
+            CFG.UPLOAD_GZIP_ENCODING if gzip_encoding is None else gzip_encoding
+        )
+        self._client = client
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(workers or CFG.UPLOAD_PIPELINE_WORKERS, 1),
+            thread_name_prefix=UPLOAD_THREAD_NAME_PREFIX,
+        )
+        self._condition = Condition()
+        self._pending_bytes = 0
+        # Completed uploads are dropped, so the bookkeeping does not grow with
+        # the amount of the uploaded objects.
+        self._futures: Set[Future] = set()
+        self._failed = 0
+
+    def __enter__(self) -> "UploadPipeline":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def put(self, obj: UploadObject, on_done: Optional[OnDone] = None) -> Future:
+        """Queue the object upload, blocks while the memory cap is exceeded.
+
+        The ``on_done`` callback is called from the upload thread with the
+        object and the upload error, if any.
+        """
+        size = len(obj.body)
+        with self._condition:
+            # A single object larger than the cap is uploaded alone.
+            self._condition.wait_for(
+                lambda: not self._pending_bytes
+                or self._pending_bytes + size <= self._max_bytes
+            )
+            self._pending_bytes += size
+            future = self._executor.submit(self._upload, obj, size, on_done)
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future: Future) -> None:
+        with self._condition:
+            self._futures.discard(future)
+            self._failed += future.exception() is not None
+            if not self._futures:
+                self._condition.notify_all()
+
+    def _upload(self, obj: UploadObject, size: int, on_done: Optional[OnDone]) -> None:
+        error = None
+        try:
+            upload_object(obj, self._gzip_encoding, self._client)
+        except GoogleCloudError as err:
+            error = err
+        finally:
+            with self._condition:
+                self._pending_bytes -= size
+                self._condition.notify_all()
+        if on_done is not None:
+            on_done(obj, error)
+        if error is not None:
+            raise error
+
+    def join(self) -> int:
+        """Wait for the queued uploads, return amount of the failed ones"""
+        with self._condition:
+            self._condition.wait_for(lambda: not self._futures)
+            failed, self._failed = self._failed, 0
+        return failed
+
+    def close(self) -> int:
+        """Wait for the queued uploads and stop the upload threads"""
+        failed = self.join()
+        self._executor.shutdown(wait=True)
+        return failed
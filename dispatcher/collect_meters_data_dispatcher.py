@@ -5,10 +5,14 @@ Entry point for dispatcher based on scheduler events.
 import json
 import uuid
 from collections import Counter
+from concurrent import futures
 from copy import deepcopy
+from queue import Empty, Queue
+from typing import Any, Dict, List, Set, Tuple
 
 from google.api_core.exceptions import Forbidden
 from google.cloud import pubsub_v1
+from googleapiclient.errors import HttpError
 
 from common import settings as CFG
 from common.bucket_helpers import get_buckets_list
@@ -17,15 +21,153 @@ from common.data_representation.config.base_exceptions import (
     XmlTypeException,
 )
 from common.data_representation.config.participant import ParticipantConfig
-from common.dispatcher import is_cloud_function_exists
+from common.dispatcher import list_cloud_functions
 from common.elapsed_time import elapsed_timer
 from common.logging import Logger
+from common.thread_pool_executor import run_thread_pool_executor
 
 
-def main():
+def _parse_participant_config_worker(
+    buckets: Queue,
+    configs: Queue,
+    logger: Logger,
+    worker_idx: str,  # pylint:disable=unused-argument
+) -> None:
+    """Parse participant configurations of the queued buckets"""
+    while True:
+        try:
+            bucket_idx, bucket = buckets.get_nowait()
+        except Empty:
+            break
+
+        full_config_name = (
+            f"{bucket.name}/{CFG.CONFIG_BASE_PATH}/{CFG.PARTICIPANT_CONFIG_NAME}"
+        )
+        participant_id = int(bucket.name.lstrip(CFG.BUCKET_PREFFIX))
+        with elapsed_timer() as cnfg_prs_elpsd:
+            try:
+                cfg = ParticipantConfig()
+                cfg.read_from_bucket(
+                    bucket=bucket.name,
+                    subdirectory=CFG.CONFIG_BASE_PATH,
+                    filename=CFG.PARTICIPANT_CONFIG_NAME,
+                    binary_mode=False,
+                )
+                json_cfg = cfg.as_json()
+            except (ConfigException, XmlTypeException) as err:
+                logger.error(
+                    f"Cannot parse participant {participant_id} configuration "
+                    f"due to the {err}. Skipping."
+                )
+                continue
+            except Forbidden as fb_err:
+                logger.error(
+                    f"Can not read participant {participant_id} configuration "
+                    f"{full_config_name} file du to the error '{fb_err}'. Skiping"
+                )
+                continue
+            else:
+                logger.debug(
+                    f"Completed {full_config_name} parsing.",
+                    extra={"labels": {"elapsed_time": cnfg_prs_elpsd()}},
+                )
+
+        configs.put((bucket_idx, bucket.name, participant_id, json_cfg))
+
+
+def _parse_participant_configs(
+    buckets: List[Any], logger: Logger
+) -> List[Tuple[str, int, Dict[str, Any]]]:
+    """Parse participant configurations concurrently, keeping buckets order"""
+    buckets_queue, configs_queue = Queue(), Queue()
+    for bucket_idx, bucket in enumerate(buckets):
+        logger.debug(f"Processing {bucket.name}")
+        if CFG.DEBUG and bucket.name not in CFG.DEBUG_BUCKETS:
+            logger.warning(
+                f"Enabled  DEBUG mode. Disabled {bucket.name} bucket. Skipping"
+            )
+            continue
+        buckets_queue.put((bucket_idx, bucket))
+
+    if buckets_queue.empty():
+        return []
+
+    for fut in run_thread_pool_executor(
+        workers=[
+            (
+                _parse_participant_config_worker,
+                [buckets_queue, configs_queue, logger],
+            )
+        ],
+        worker_replica=min(CFG.DISPATCHER_WORKERS_AMOUNT, buckets_queue.qsize()),
+    ):
+        try:
+            fut.result()
+        except Exception as err:  # pylint: disable=broad-except
+            logger.error(f"Participant configuration parsing failed due to '{err}'")
+
+    configs = []
+    while not configs_queue.empty():
+        configs.append(configs_queue.get())
+    return [config[1:] for config in sorted(configs, key=lambda x: x[0])]
+
+
+def _get_deployed_functions(logger: Logger) -> Set[str]:
+    """Get names of cloud functions deployed to the environment"""
+    with elapsed_timer() as elapsed:
+        try:
+            functions = set(map(str.strip, list_cloud_functions()))
+        except HttpError as err:
+            logger.error(f"Can not get deployed cloud functions due to '{err}'")
+            functions = set()
+        logger.debug(
+            f"Loaded {len(functions)} deployed cloud functions.",
+            extra={"labels": {"elapsed_time": elapsed()}},
+        )
+    return functions
+
+
+def _collect_publish_failures(
+    pending: List[Tuple[futures.Future, str, int]], logger: Logger
+) -> int:
+    """Wait for the published messages and report failed ones"""
+    _, not_done = futures.wait(
+        [future for future, _, _ in pending],
+        timeout=CFG.DISPATCHER_PUBLISH_TIMEOUT,
+        return_when=futures.ALL_COMPLETED,
+    )
+
+    failures = 0
+    for future, cnctr_fnctn, participant_id in pending:
+        if future in not_done:
+            failures += 1
+            logger.error(
+                f"Publishing {cnctr_fnctn} of participant {participant_id} "
+                "timed out."
+            )
+        elif future.exception() is not None:
+            failures += 1
+            logger.error(
+                f"Can not push data to gcp topic {cnctr_fnctn} of participant "
+                f"{participant_id} due to the error '{future.exception()}'"
+            )
+        else:
+            logger.debug(
+                f"Data pushed to gcp topic {cnctr_fnctn} of participant "
+                f"{participant_id} with result {future.result()}"
+            )
+    return failures
+
+
+def main():  # pylint:disable=too-many-locals
     """Entry point logic."""
 
-    publisher = pubsub_v1.PublisherClient()
+    publisher = pubsub_v1.PublisherClient(
+        batch_settings=pubsub_v1.types.BatchSettings(
+            max_messages=CFG.DISPATCHER_PUBLISH_MAX_MESSAGES,
+            max_latency=CFG.DISPATCHER_PUBLISH_MAX_LATENCY,
+        )
+    )
 
     logger = Logger(
         name="INTEGRATIONS DISPATCHER",
@@ -45,120 +187,74 @@ def main():
             logger.error(f"Can not get buckets list due to the error '{err}'")
             buckets = []
 
-        for bucket in buckets:
-            logger.debug(f"Processing {bucket.name}")
-            if CFG.DEBUG and bucket.name not in CFG.DEBUG_BUCKETS:
-                logger.warning(
-                    f"Enabled  DEBUG mode. Disabled {bucket.name} bucket. Skipping"
-                )
-                continue
+        participants = _parse_participant_configs(buckets, logger)
+        deployed_functions = _get_deployed_functions(logger)
 
-            full_config_name = (
-                f"{bucket.name}/{CFG.CONFIG_BASE_PATH}/{CFG.PARTICIPANT_CONFIG_NAME}"
-            )
-            # Entry Point for bucket operation multiprocessing
-            participant_id = int(bucket.name.lstrip(CFG.BUCKET_PREFFIX))
-            with elapsed_timer() as cnfg_prs_elpsd:
-                try:
-                    cfg = ParticipantConfig()
-                    cfg.read_from_bucket(
-                        bucket=bucket.name,
-                        subdirectory=CFG.CONFIG_BASE_PATH,
-                        filename=CFG.PARTICIPANT_CONFIG_NAME,
-                        binary_mode=False,
-                    )
-                    json_cfg = cfg.as_json()
-                except (ConfigException, XmlTypeException) as err:
-                    logger.error(
-                        f"Cannot parse participant {participant_id} configuration "
-                        f"due to the {err}. Skipping."
-                    )
-                    continue
-                except Forbidden as fb_err:
-                    logger.error(
-                        f"Can not read participant {participant_id} configuration"
-                        " {bucket.name}/{CFG.CONFIG_BASE_PATH}/"
-                        f"{CFG.PARTICIPANT_CONFIG_NAME} file du to the error "
-                        f"'{fb_err}'. Skiping"
-                    )
-                    continue
-                else:
-                    logger.debug(
-                        f"Completed {full_config_name} parsing.",
-                        extra={"labels": {"elapsed_time": cnfg_prs_elpsd()}},
-                    )
-
-            if not json_cfg.get("connectors", []):
-                logger.warning(
-                    f"Parsed participant configuration '{full_config_name}' "
-                    f"does not contain defined connectors"
+        pending = []
+        cnctrs_cnt = Counter()
+        with elapsed_timer() as dispatch_elapsed:
+            for bucket_name, participant_id, json_cfg in participants:
+                full_config_name = (
+                    f"{bucket_name}/{CFG.CONFIG_BASE_PATH}/"
+                    f"{CFG.PARTICIPANT_CONFIG_NAME}"
                 )
-            if CFG.DEBUG:
-                cnctrs_cnt = Counter()
-            for cnctr_cfg in json_cfg.get("connectors", []):
-                cnctr_fnctn = cnctr_cfg.get("function", "")
-                if not cnctr_fnctn:
+                if not json_cfg.get("connectors", []):
                     logger.warning(
-                        f"Unexist connector name in {full_config_name}. " "Skip."
-                    )
-                    continue
-
-                with elapsed_timer() as gcp_func_ex_elpsd:
-                    is_connector_exists = is_cloud_function_exists(cnctr_fnctn)
-                    logger.debug(
-                        f"Completed check of cloud function {cnctr_fnctn} "
-                        "deployment.",
-                        extra={"labels": {"elapsed_time": gcp_func_ex_elpsd()}},
-                    )
-                if not CFG.DEBUG and not is_connector_exists:
-                    logger.error(
-                        f"The given connector '{cnctr_fnctn}' is not deployed "
-                        f"to the '{CFG.PROJECT}' environment. Skipping"
-                    )
-                    continue
-
-                with elapsed_timer() as payload_ellapsed:
-                    payload = _get_meter_payload(cnctr_cfg, participant_id)
-                    logger.debug(
-                        f"The function {cnctr_fnctn} payload formed.",
-                        extra={"labels": {"elapsed_time": payload_ellapsed()}},
+                        f"Parsed participant configuration '{full_config_name}' "
+                        f"does not contain defined connectors"
                     )
+                for cnctr_cfg in json_cfg.get("connectors", []):
+                    cnctr_fnctn = cnctr_cfg.get("function", "")
+                    if not cnctr_fnctn:
+                        logger.warning(
+                            f"Unexist connector name in {full_config_name}. " "Skip."
+                        )
+                        continue
 
-                logger.info(f"Running {cnctr_fnctn}")
+                    if not CFG.DEBUG and cnctr_fnctn.strip() not in deployed_functions:
+                        logger.error(
+                            f"The given connector '{cnctr_fnctn}' is not deployed "
+                            f"to the '{CFG.PROJECT}' environment. Skipping"
+                        )
+                        continue
 
-                with elapsed_timer() as gcp_func_call_ellapsed:
-                    topic_path = publisher.topic_path(  # pylint: disable=no-member
-                        CFG.PROJECT, cnctr_fnctn
-                    )
+                    payload = _get_meter_payload(cnctr_cfg, participant_id)
+                    logger.info(f"Running {cnctr_fnctn}")
 
                     if CFG.DEBUG:
-                        json_cfg = {
-                            "data": payload,
-                        }
                         file_name = CFG.LOCAL_PATH.joinpath(
-                            f"participant_payload_{bucket.name[-1]}_"
+                            f"participant_payload_{bucket_name[-1]}_"
                             f"{cnctr_fnctn}_{cnctrs_cnt[cnctr_fnctn]}.json"
                         )
                         with open(file_name, "w", encoding="UTF-8") as prtcpnt_fl:
-                            json.dump(json_cfg, prtcpnt_fl, indent=4)
+                            json.dump({"data": payload}, prtcpnt_fl, indent=4)
                         cnctrs_cnt[cnctr_fnctn] += 1
                         continue
 
-                    message_json = json.dumps(
-                        {
-                            "data": payload,
-                        }
+                    topic_path = publisher.topic_path(  # pylint: disable=no-member
+                        CFG.PROJECT, cnctr_fnctn
                     )
-                    data = message_json.encode("utf-8")
-                    logger.debug(f"TOPIC PATH {topic_path}")
-                    future = publisher.publish(topic_path, data=data)
-                    result = future.result()
-                    logger.debug(
-                        f"Data pushed to gcp topic {cnctr_fnctn}. "
-                        f"with result {result}",
-                        extra={"labels": {"elapsed_time": gcp_func_call_ellapsed()}},
+                    data = json.dumps({"data": payload}).encode("utf-8")
+                    pending.append(
+                        (
+                            publisher.publish(topic_path, data=data),
+                            cnctr_fnctn,
+                            participant_id,
+                        )
                     )
 
+            failures = _collect_publish_failures(pending, logger) if pending else 0
+            logger.info(
+                f"Dispatched {len(pending) - failures} of {len(pending)} connectors "
+                f"calls for {len(participants)} participants.",
+                extra={
+                    "labels": {
+                        "dispatch_latency": dispatch_elapsed(),
+                        "failures": failures,
+                    }
+                },
+            )
+
     logger.debug(
         "Completed loop.", extra={"labels": {"elapsed_time": global_ellapsed()}}
     )
@@ -184,6 +280,9 @@ def _get_meter_payload(raw_cnctr_cfg: dict, participant_id: int) -> dict:
             "participant_id": participant_id,
             "timezone": raw_cnctr_cfg.get("timezone", ""),
             "fetch_strategy": deepcopy(raw_cnctr_cfg.get("fetchStrategy", {})),
+            "standardized_format": raw_cnctr_cfg.get("parameters", {}).get(
+                "standardized_format", ""
+            ),
         },
     }
 
@@ -175,29 +175,27 @@ class DbLoadDispatcher(BaseDispatcher):
         description: str,
         worker_idx: int,  # pylint:disable=unused-argument
     ) -> None:
-        empty_run_count = 0
         while True:
-            if payload_queue.empty():
-                if empty_run_count == 3:
-                    break
-                empty_run_count += 1
-            else:
-                payload = payload_queue.get()
-                message_json = json.dumps(
-                    {
-                        "data": payload,
-                    }
-                )
+            try:
+                payload = payload_queue.get_nowait()
+            except queue.Empty:
+                break
 
-                payload_data = message_json.encode("utf-8")
+            message_json = json.dumps(
+                {
+                    "data": payload,
+                }
+            )
 
-                publish_future = publisher.publish(topic_path, data=payload_data)
+            payload_data = message_json.encode("utf-8")
 
-                publish_future.add_done_callback(
-                    done_callback(publish_future, payload, description=description)
-                )
-                futures_queue.put(publish_future)
-                payload_queue.task_done()
+            publish_future = publisher.publish(topic_path, data=payload_data)
+
+            publish_future.add_done_callback(
+                done_callback(publish_future, payload, description=description)
+            )
+            futures_queue.put(publish_future)
+            payload_queue.task_done()
 
     def _save_payload_locally(self):
         with elapsed_timer() as elapsed:
@@ -96,28 +96,25 @@ class DwUpdateWorker(BaseDispatcher):
             )
             return None
 
-        empty_run_count = 0
         while True:
-            if self._payload_queue.empty():
-                if empty_run_count == 5:
-                    break
-                empty_run_count += 1
-            else:
+            try:
+                payload = self._payload_queue.get_nowait()
+            except queue.Empty:
+                break
 
-                payload = self._payload_queue.get()
-                message_json = json.dumps(
-                    {
-                        "data": payload,
-                    }
-                )
-                payload_data = message_json.encode("utf-8")
-                publish_future = self._publisher.publish(
-                    self._topic_path, data=payload_data
-                )
-                done_callback = _DwUpdateWorkerCallback(payload)
-                publish_future.add_done_callback(done_callback.callback)
-                futures_queue.put(publish_future)
-                self._payload_queue.task_done()
+            message_json = json.dumps(
+                {
+                    "data": payload,
+                }
+            )
+            payload_data = message_json.encode("utf-8")
+            publish_future = self._publisher.publish(
+                self._topic_path, data=payload_data
+            )
+            done_callback = _DwUpdateWorkerCallback(payload)
+            publish_future.add_done_callback(done_callback.callback)
+            futures_queue.put(publish_future)
+            self._payload_queue.task_done()
 
 
 class DwUpdateScheduler(BaseDispatcher):
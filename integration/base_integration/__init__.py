@@ -6,13 +6,16 @@ from integration.base_integration.base import (  # GeneralInfo,; Meters,
     BasePullConnector,
     BasePushConnector,
     MeterConfig,
+    MetersIndex,
     T
 )
 from integration.base_integration.base_worker import (
     BaseFetchWorker,
     BaseStandardizeWorker,
     BaseWorker,
+    StageMetrics,
     UpdateConfig,
+    consumes,
 )
 from integration.base_integration.config import (
     ExtraInfo,
@@ -30,9 +33,12 @@ __all__ = [
     "BasePushConnector",
     "BaseConnector",
     "MeterConfig",
+    "MetersIndex",
     "StorageInfo",
     "BaseWorker",
     "UpdateConfig",
+    "StageMetrics",
+    "consumes",
     "BaseFetchWorker",
     "BaseStandardizeWorker",
     "MalformedConfig",
@@ -13,6 +13,7 @@ from json import dumps, loads
 from json.decoder import JSONDecodeError
 from pathlib import Path
 from queue import Queue
+from threading import Lock
 from typing import (
     Any,
     Callable,
@@ -38,14 +39,17 @@ from common import settings as CFG
 from common.bucket_helpers import (
     get_file_contents,
     list_blobs_with_prefix,
-    move_blob,
+    move_blobs,
     upload_file_to_bucket,
 )
-from common.data_representation.standardized.meter import Meter
+from common.coverage_index import save_covered_hours
+from common.data_representation.standardized.meter import CompactMeter, Meter
 from common.date_utils import format_date, parse, parse_timezone
 from common.elapsed_time import elapsed_timer
 from common.logging import Logger
 from common.thread_pool_executor import run_thread_pool_executor
+from common.update_manifest import ManifestWriter, load_manifest
+from common.upload_pipeline import UploadObject, UploadPipeline
 from integration.base_integration.config import StorageInfo
 from integration.base_integration.exceptions import (
     ConfigValidationError,
@@ -69,6 +73,54 @@ class MeterConfig:
     storage: StorageInfo = field(default_factory=StorageInfo)
 
 
+class MetersIndex:
+    """Index of the meters configs by name, type, meter URI and id.
+
+    Names, types and URIs are matched case insensitive, empty ones included.
+    The first config wins for the duplicated keys, the same as the linear
+    lookup. The index is a snapshot of the meters, changes of the meters list
+    or configs made in place are not seen until the index is rebuilt.
+    """
+
+    def __init__(self, meters: Optional[Iterable[Any]] = None) -> None:
+        self.meters = meters
+        self.by_name: Dict[str, Any] = {}
+        self.by_type: Dict[str, Any] = {}
+        self.by_uri: Dict[str, Any] = {}
+        self.by_id: Dict[int, Any] = {}
+        for mtr_cfg in meters or []:
+            for index, value in (
+                (self.by_name, getattr(mtr_cfg, "meter_name", None)),
+                (self.by_type, getattr(mtr_cfg, "type", None)),
+                (self.by_uri, getattr(mtr_cfg, "meter_uri", None)),
+            ):
+                if value is not None:
+                    index.setdefault(self._key(value), mtr_cfg)
+            meter_id = getattr(mtr_cfg, "meter_id", None)
+            if meter_id is not None:
+                self.by_id.setdefault(int(meter_id), mtr_cfg)
+
+    @staticmethod
+    def _key(value: Any) -> str:
+        return str(value).strip().lower()
+
+    def get_by_name(self, mtr_name: str) -> Optional[Any]:
+        """Get meter config by the meter name"""
+        return self.by_name.get(self._key(mtr_name))
+
+    def get_by_type(self, mtr_type: str) -> Optional[Any]:
+        """Get meter config by the meter type"""
+        return self.by_type.get(self._key(mtr_type))
+
+    def get_by_uri(self, meter_uri: str) -> Optional[Any]:
+        """Get meter config by the meter URI"""
+        return self.by_uri.get(self._key(meter_uri))
+
+    def get_by_id(self, meter_id: int) -> Optional[Any]:
+        """Get meter config by the meter id"""
+        return self.by_id.get(int(meter_id))
+
+
 class BaseAbstractConnnector:
     """Base Integration"""
 
@@ -138,6 +190,24 @@ class BaseConnector(BaseAbstractConnnector):
         self._gaps_worker: Optional[Any] = None
         self._fetch_worker: Optional[Any] = None
         self._standardize_worker: Optional[Any] = None
+        self._upload_pipeline: Optional[UploadPipeline] = None
+
+    def _get_upload_pipeline(self) -> UploadPipeline:
+        if self._upload_pipeline is None:
+            self._upload_pipeline = UploadPipeline()
+        return self._upload_pipeline
+
+    def _wait_for_uploads(self) -> None:
+        """Wait for the queued uploads of the fetched and standardized files"""
+        if self._upload_pipeline is None:
+            return
+        with elapsed_timer() as elapsed:
+            failed = self._upload_pipeline.close()
+            self._upload_pipeline = None
+            self._logger.debug(
+                f"Completed uploading files, {failed} failed.",
+                extra={"labels": {"elapsed_time": elapsed()}},
+            )
 
     @staticmethod
     def split_into_chunks(seq: Iterable[List[Any]], size: int) -> Tuple[List[Any]]:
@@ -203,6 +273,13 @@ class BaseConnector(BaseAbstractConnnector):
             )
             return data
 
+    def _load_update_manifest(self, bucket: str, path: str, filename: str) -> Dict:
+        try:
+            return load_manifest(bucket=bucket, path=path, filename=filename)
+        except NotFound as err:
+            self._logger.error(f"Cannot load file due to the error {err}.")
+        return {}
+
     def _load_text_data(
         self,
         bucket: str,
@@ -227,9 +304,9 @@ class BaseConnector(BaseAbstractConnnector):
     # standardize workers
     def _standardize_generic(
         self, data: dict, mtr_cfg: dict, getter: Callable
-    ) -> Meter:
+    ) -> CompactMeter:
 
-        meter = Meter()
+        meter = CompactMeter()
 
         meter.created_date = self._run_time
         meter.start_time = mtr_cfg["start_date"]
@@ -395,6 +472,7 @@ class BasePushConnector(BaseConnector):
         self._fetched_junk_files: List[Dict[str, Any]] = []
         self._standardized_files: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         self._standardized_files_count: Counter = Counter()
+        self._standardized_files_lock = Lock()
         self._config: Optional[Any] = None
 
     @staticmethod
@@ -404,28 +482,25 @@ class BasePushConnector(BaseConnector):
         destination_queue: queue.Queue,
         worker_idx: int,
     ) -> None:
-        empty_run_count = 0
         while True:
-            if worker_queue.empty():
-                if empty_run_count == 3:
-                    break
-                empty_run_count += 1
-            else:
-                b_file = worker_queue.get()
-                try:
-                    filename = Path(b_file.name).name
-                    fl_path = destination_path.joinpath(filename)
-                    b_file.download_to_filename(fl_path)
-                    destination_queue.put((filename, fl_path))
-                except gcp_eceptions.NotFound as err:
-                    # TODO: Redesign to use log queue
-                    print(
-                        f"ERROR: WORKER {worker_idx}: "
-                        f"Cannot download file {b_file.name} due to the "
-                        f"error '{err}'"
-                    )
-                finally:
-                    worker_queue.task_done()
+            try:
+                b_file = worker_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                filename = Path(b_file.name).name
+                fl_path = destination_path.joinpath(filename)
+                b_file.download_to_filename(fl_path)
+                destination_queue.put((filename, fl_path))
+            except gcp_eceptions.NotFound as err:
+                # TODO: Redesign to use log queue
+                print(
+                    f"ERROR: WORKER {worker_idx}: "
+                    f"Cannot download file {b_file.name} due to the "
+                    f"error '{err}'"
+                )
+            finally:
+                worker_queue.task_done()
 
     def _download_blobs_to_filename_pool(
         self,
@@ -468,27 +543,32 @@ class BasePushConnector(BaseConnector):
         worker_idx: int,  # pylint: disable=unused-argument
     ) -> None:
         """Internal worker used for move blobs"""
-        empty_run_count = 0
         while True:
-            if worker_queue.empty():
-                if empty_run_count == 3:
+            fl_infos = []
+            while len(fl_infos) < CFG.STORAGE_BATCH_SIZE:
+                try:
+                    fl_infos.append(worker_queue.get_nowait())
+                except queue.Empty:
                     break
-                empty_run_count += 1
-            else:
-                fl_info = worker_queue.get()
-                blob_name = f"{fl_info['preffix'].rstrip('/')}/{fl_info['filename']}"
-                new_blob_name = (
-                    f"{fl_info['destination_preffix'].rstrip('/')}/"
-                    f"{fl_info['destination_filename']}"
-                )
-                move_blob(
-                    bucket_name=fl_info["bucket"],
-                    blob_name=blob_name,
-                    destination_bucket=fl_info["destination_bucket"],
-                    new_blob_name=new_blob_name,
-                    quiet=True,
+            if not fl_infos:
+                break
+            try:
+                move_blobs(
+                    blobs=[
+                        (
+                            fl_info["bucket"],
+                            f"{fl_info['preffix'].rstrip('/')}/"
+                            f"{fl_info['filename']}",
+                            fl_info["destination_bucket"],
+                            f"{fl_info['destination_preffix'].rstrip('/')}/"
+                            f"{fl_info['destination_filename']}",
+                        )
+                        for fl_info in fl_infos
+                    ],
                 )
-                worker_queue.task_done()
+            finally:
+                for _ in fl_infos:
+                    worker_queue.task_done()
 
     def _move_files_pool(
         self,
@@ -538,21 +618,18 @@ class BasePushConnector(BaseConnector):
         worker_idx: int,  # pylint: disable=unused-argument
     ) -> None:
         """Upload file worker"""
-        empty_run_count = 0
         while True:
-            if worker_queue.empty():
-                if empty_run_count == 3:
-                    break
-                empty_run_count += 1
-            else:
-                fl_info = worker_queue.get()
-                upload_file_to_bucket(
-                    bucket_name=fl_info["bucket"],
-                    blob_path=fl_info["preffix"],
-                    file_name=fl_info["filename"],
-                    blob_text=fl_info["file_body"],
-                )
-                worker_queue.task_done()
+            try:
+                fl_info = worker_queue.get_nowait()
+            except queue.Empty:
+                break
+            upload_file_to_bucket(
+                bucket_name=fl_info["bucket"],
+                blob_path=fl_info["preffix"],
+                file_name=fl_info["filename"],
+                blob_text=fl_info["file_body"],
+            )
+            worker_queue.task_done()
 
     def _get_workers_amount(
         self, queue_size: int, max_worker_amount: Optional[int] = None
@@ -768,7 +845,6 @@ class BasePushConnector(BaseConnector):
         update_filename_tmpl: str,
         worker_idx: int,  # pylint: disable=unused-argument
     ) -> None:
-        empty_run_count = 0
         cnt = 0
         files = queue.Queue(maxsize=chunk_size)
 
@@ -788,41 +864,39 @@ class BasePushConnector(BaseConnector):
                 )
 
         while True:
-            if standardized_files_queue.empty():
-                if empty_run_count == 3:
-                    if not files.empty():
-                        put_in_update_queue(
-                            file_name=update_filename_tmpl.format(
-                                update_prefix=update_prefix,
-                                cnt=cnt,
-                                run_date=run_date,
-                            ),
-                            filebody=files,
-                        )
-                    break
-                empty_run_count += 1
-                # TODO: Add storing last data portion
-            else:
-                file_info = standardized_files_queue.get()
-                try:
-                    fl_data = {
-                        "bucket": file_info["bucket"],
-                        "path": file_info["preffix"],
-                        "filename": file_info["filename"],
-                    }
-                    files.put_nowait(fl_data)
-                except queue.Full:
-                    put_in_update_queue(
-                        file_name=update_filename_tmpl.format(
-                            update_prefix=update_prefix,
-                            cnt=cnt,
-                            run_date=run_date,
-                        ),
-                        filebody=files,
-                    )
-                    cnt += 1
-                    files = queue.Queue(maxsize=chunk_size)
-                    files.put_nowait(fl_data)
+            try:
+                file_info = standardized_files_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fl_data = {
+                    "bucket": file_info["bucket"],
+                    "path": file_info["preffix"],
+                    "filename": file_info["filename"],
+                }
+                files.put_nowait(fl_data)
+            except queue.Full:
+                put_in_update_queue(
+                    file_name=update_filename_tmpl.format(
+                        update_prefix=update_prefix,
+                        cnt=cnt,
+                        run_date=run_date,
+                    ),
+                    filebody=files,
+                )
+                cnt += 1
+                files = queue.Queue(maxsize=chunk_size)
+                files.put_nowait(fl_data)
+
+        if not files.empty():
+            put_in_update_queue(
+                file_name=update_filename_tmpl.format(
+                    update_prefix=update_prefix,
+                    cnt=cnt,
+                    run_date=run_date,
+                ),
+                filebody=files,
+            )
 
     def _save_standardize_update_status(self) -> None:
         with elapsed_timer() as elapsed:
@@ -872,26 +946,47 @@ class BasePushConnector(BaseConnector):
                 extra={"labels": {"elapsed_time": elapsed()}},
             )
 
-    def _upload_standardized_to_buckets(
-        self,
-        st_files: Dict[str, List[Dict[str, Any]]],
-        worker_replica: int = DEFAULT_WORKER_REPLICA_AMOUNT,
-    ) -> None:
-        with elapsed_timer() as elapsed:
-            self._logger.debug("Uploading standardized files.")
-            data = sum(st_files.values(), [])
-            self._pool_upload_blobs_to_storage(
-                st_files=data,
-                worker_replica=self._get_workers_amount(len(data), worker_replica),
-            )
-            self._logger.debug(
-                "Uploaded standardized files.",
-                extra={"labels": {"elapsed_time": elapsed()}},
-            )
+    def _put_standardized_file(self, fl_info: Dict[str, Any]) -> None:
+        """Queue upload of the standardized file as soon as it is generated.
+
+        Only the location of the uploaded file is kept for the update status,
+        so memory does not grow with the standardized files bodies.
+        """
+        meter_type = fl_info["meter_type"]
+
+        def on_done(obj: UploadObject, err: Optional[Exception]) -> None:
+            if err is not None:
+                self._logger.error(
+                    f"Cannot save standardized {meter_type} file "
+                    f"{obj.bucket}/{obj.path}/{obj.file_name} due to the error "
+                    f"'{err}'"
+                )
+                return
+            with self._standardized_files_lock:
+                self._standardized_files[meter_type].append(
+                    {
+                        "meter_type": meter_type,
+                        "bucket": obj.bucket,
+                        "preffix": obj.path,
+                        "filename": obj.file_name,
+                    }
+                )
+                self._standardized_files_count[meter_type] += 1
+
+        self._get_upload_pipeline().put(
+            UploadObject(
+                bucket=fl_info["bucket"],
+                path=fl_info["preffix"],
+                file_name=fl_info["filename"],
+                body=fl_info["file_body"],
+            ),
+            on_done=on_done,
+        )
 
     def save_update_status(self) -> None:
         with elapsed_timer() as elapsed:
             self._logger.info("Saving update status.")
+            self._wait_for_uploads()
             self._save_standardize_update_status()
             self._move_processed_fetched_files()
             self._save_fetch_update_status()
@@ -921,64 +1016,82 @@ class BasePullConnector(BaseConnector):
         self._cfg_fetch: Optional[Any] = None  # should be replaced in child
         self._cfg_meters: Optional[Any] = None  # should be replaced in child
         self._config: Optional[Any] = None  # should be replaced in child
+        self._meters_index: Optional[MetersIndex] = None
+
+    @property
+    def meters_index(self) -> MetersIndex:
+        """Index of the configured meters.
+
+        It is rebuilt if the meters list is replaced, a list changed in place
+        needs ``_meters_index`` to be reset.
+        """
+        meters = getattr(self._config, "meters", None)
+        if self._meters_index is None or self._meters_index.meters is not meters:
+            self._meters_index = MetersIndex(meters)
+        return self._meters_index
+
+    def _after_configuration(self, config: T, *args, **kwargs) -> T:
+        """Index configured meters"""
+        config = super()._after_configuration(config, *args, **kwargs)
+        self._meters_index = MetersIndex(getattr(config, "meters", None))
+        return config
 
     def _save_fetched_data(
         self, blob_text: str, filename: str, meter_name: str
     ) -> None:
-        try:
-            upload_file_to_bucket(
-                self._config.extra.raw.bucket,
-                dumps(blob_text),
-                blob_path=self._config.extra.raw.path,
+        def on_done(obj: UploadObject, err: Optional[Exception]) -> None:
+            if err is not None:
+                self._logger.error(
+                    f"Cannot save meter '{meter_name}' file "
+                    f"{obj.bucket}/{obj.path}/{obj.file_name} due to the error "
+                    f"'{err}'"
+                )
+            else:
+                self._fetched_files[meter_name].add(
+                    (obj.bucket, obj.path, obj.file_name)
+                )
+
+        self._get_upload_pipeline().put(
+            UploadObject(
+                bucket=self._config.extra.raw.bucket,
+                path=self._config.extra.raw.path,
                 file_name=filename,
-            )
-        except GoogleCloudError as err:
-            self._logger.error(
-                f"Cannot save meter '{meter_name}' file "
-                f"{self._config.raw.bucket}/{self._config.extra.raw.path}"
-                f"/{filename} due to the error '{err}'"
-            )
-        else:
-            self._fetched_files[meter_name].add(
-                (self._config.extra.raw.bucket, self._config.extra.raw.path, filename)
-            )
+                body=dumps(blob_text),
+            ),
+            on_done=on_done,
+        )
 
     def _save_standardized_data(
         self, data: Meter, filename: str, mtr_cfg: MeterConfig
     ) -> None:
-        with elapsed_timer() as elapsed:
-            self._logger.debug("Saving standardized data.")
-            try:
-                upload_file_to_bucket(
-                    mtr_cfg.standardized.bucket,
-                    data.as_str(),
-                    blob_path=mtr_cfg.standardized.path,
-                    file_name=filename,
-                )
-            except GoogleCloudError as err:
+        def on_done(obj: UploadObject, err: Optional[Exception]) -> None:
+            if err is not None:
                 self._logger.error(
                     "Cannot save standardized meter data of "
                     f"{mtr_cfg.type} and hour '{filename}' by path "
-                    f"{mtr_cfg.standardized.bucket}/{mtr_cfg.standardized.path}"
-                    f"/{filename} due to the error '{err}'"
+                    f"{obj.bucket}/{obj.path}/{filename} due to the error '{err}'"
                 )
             else:
                 self._standardized_files[mtr_cfg.type.strip().lower()].append(
-                    (
-                        mtr_cfg.standardized.bucket,
-                        mtr_cfg.standardized.path,
-                        filename,
-                        data,
-                    )
+                    (obj.bucket, obj.path, filename, data)
                 )
-            self._logger.debug(
-                f"Saved standardized data into {mtr_cfg.standardized.bucket}/"
-                f"{mtr_cfg.standardized.path}/{filename}.",
-                extra={"labels": {"elapsed_time": elapsed()}},
-            )
+
+        self._get_upload_pipeline().put(
+            UploadObject(
+                bucket=mtr_cfg.standardized.bucket,
+                path=mtr_cfg.standardized.path,
+                file_name=filename,
+                body=data.as_str(),
+            ),
+            on_done=on_done,
+        )
 
     def _upload_update_status_file(
-        self, raw_data: dict, str_bucket: str, str_path: str, filename: str
+        self,
+        raw_data: Union[dict, bytes],
+        str_bucket: str,
+        str_path: str,
+        filename: str,
     ) -> None:
         with elapsed_timer() as elapsed:
             self._logger.debug(
@@ -987,7 +1100,7 @@ class BasePullConnector(BaseConnector):
             try:
                 upload_file_to_bucket(
                     self._config.extra.raw.bucket,
-                    dumps(raw_data),
+                    dumps(raw_data) if isinstance(raw_data, dict) else raw_data,
                     blob_path=str_path,
                     file_name=filename,
                 )
@@ -1042,22 +1155,29 @@ class BasePullConnector(BaseConnector):
         )
 
     def _get_meter_config_by_name(self, mtr_name: str) -> Optional[Any]:
-        for mtr_cfg in self._config.meters:
-            if mtr_cfg.meter_name.strip().lower() == mtr_name.strip().lower():
-                return mtr_cfg
-        return None
+        return self.meters_index.get_by_name(mtr_name)
 
     def _get_meter_config_by_type(self, mtr_type: str) -> Optional[Any]:
-        for mtr_cfg in self._config.meters:
-            self._logger.debug(f"meter type is - {mtr_cfg.type}")
-            if mtr_cfg.type.strip().lower() == mtr_type.strip().lower():
-                return mtr_cfg
-        return None
+        return self.meters_index.get_by_type(mtr_type)
+
+    def _save_standardize_manifest(
+        self, manifest: ManifestWriter, mtr_cfg: Any, cnt: int, run_date: str
+    ) -> None:
+        self._upload_update_status_file(
+            raw_data=manifest.getvalue(),
+            str_bucket=mtr_cfg.standardized.bucket,
+            str_path=str(
+                Path(mtr_cfg.standardized.path).joinpath(self.__update_prefix__)
+            ),
+            filename=self.__update_filename_tmpl__.format(
+                update_prefix=self.__update_prefix__, cnt=cnt, run_date=run_date
+            ),
+        )
 
     def _save_standardize_update_status(self) -> None:
         with elapsed_timer() as elapsed:
             self._logger.debug("Saving standardize update status.")
-            filename = format_date(self._run_time, CFG.PROCESSING_DATE_FORMAT)
+            run_date = format_date(self._run_time, CFG.PROCESSING_DATE_FORMAT)
             self._logger.debug(
                 f"Standardized files items - {list(self._standardized_files.keys())}"
             )
@@ -1069,54 +1189,36 @@ class BasePullConnector(BaseConnector):
                         f"{mtr_type}. Skipping"
                     )
                     continue
-                cache = set()
-                json_data = {"files": []}
-                for mtr_fl_info in mtr_files:
-                    key = mtr_fl_info[:-1]
-                    if key not in cache:
-                        json_data["files"].append(mtr_fl_info)
-                        cache.add(key)
-
-                if json_data["files"]:
-                    chunks = self.split_into_chunks(
-                        json_data["files"], self.__max_chunk_size__
+                participant_id = int(self._config.extra.participant_id)
+                cache, file_names, manifest, cnt = set(), [], None, 0
+                for bucket, path, file_name, mtr in mtr_files:
+                    if (bucket, path, file_name) in cache:
+                        continue
+                    cache.add((bucket, path, file_name))
+                    file_names.append(file_name)
+
+                    if manifest is None:
+                        manifest = ManifestWriter()
+                    manifest.add_file(bucket, path, file_name)
+                    manifest.add_update(mtr, participant_id)
+                    if manifest.amounts >= self.__max_chunk_size__:
+                        cnt += 1
+                        self._save_standardize_manifest(
+                            manifest, mtr_cfg, cnt, run_date
+                        )
+                        manifest = None
+
+                if manifest is not None:
+                    self._save_standardize_manifest(
+                        manifest, mtr_cfg, cnt + 1, run_date
                     )
-                    save_path = Path(mtr_cfg.standardized.path).joinpath(
-                        self.__update_prefix__
+
+                if file_names:
+                    save_covered_hours(
+                        bucket_name=mtr_cfg.standardized.bucket,
+                        bucket_path=mtr_cfg.standardized.path,
+                        file_names=file_names,
                     )
-                    for indx, chunk in enumerate(chunks, 1):
-                        data = {"amounts": len(chunk), "files": [], "updates": []}
-
-                        for bucket, path, filename, mtr in chunk:
-                            data["files"].append(
-                                {"bucket": bucket, "path": path, "filename": filename}
-                            )
-
-                            data["updates"].append(
-                                {
-                                    "data": float(mtr.usage),
-                                    "ref_hour_id": int(
-                                        format_date(
-                                            mtr.start_time, CFG.HOUR_ID_DATE_FORMAT
-                                        )
-                                    ),
-                                    "ref_meter_id": int(mtr.meter_id),
-                                    "ref_participant_id": int(
-                                        self._config.extra.participant_id
-                                    ),
-                                }
-                            )
-
-                        self._upload_update_status_file(
-                            raw_data=data,
-                            str_bucket=mtr_cfg.standardized.bucket,
-                            str_path=str(save_path),
-                            filename=self.__update_filename_tmpl__.format(
-                                update_prefix=self.__update_prefix__,
-                                cnt=indx,
-                                run_date=filename,
-                            ),
-                        )
                 else:
                     self._logger.warning("Fetch update status is empty.")
             self._logger.debug(
@@ -1128,6 +1230,7 @@ class BasePullConnector(BaseConnector):
     def save_update_status(self) -> None:
         with elapsed_timer() as elapsed:
             self._logger.info("Saving update status.")
+            self._wait_for_uploads()
             self._save_fetch_update_status()
             self._save_standardize_update_status()
             self._logger.info(
@@ -4,27 +4,49 @@ import time
 import uuid
 from abc import abstractmethod
 from collections import Counter
-from dataclasses import dataclass
+from concurrent.futures import wait
+from dataclasses import dataclass, field
+from itertools import chain
 from json import JSONDecodeError, dumps, loads
 from pathlib import Path
 from queue import Queue
 from threading import Lock
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from timeit import default_timer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from dataclass_factory import Factory, Schema
 from expiringdict import ExpiringDict
+from google.api_core.exceptions import NotFound, PreconditionFailed
 from google.cloud.exceptions import GoogleCloudError
 from google.cloud.storage import Client
 from googleapiclient.errors import HttpError
 from pendulum import DateTime
+from requests import Session
 
 import common.settings as CFG
-from common.bucket_helpers import file_exists, get_file_contents, upload_file_to_bucket
-from common.data_representation.standardized.meter import Meter
+from common.bucket_helpers import (
+    file_exists,
+    get_bucket,
+    get_existing_files,
+    get_file_contents,
+    upload_file_to_bucket,
+)
+from common.coverage_index import save_covered_hours
+from common.data_representation.standardized.meter import CompactMeter
 from common.date_utils import format_date, truncate
 from common.logging import Logger, ThreadPoolExecutorLogger
-from common.request_helpers import retry
+from common.packed_format import (
+    get_packed_file_name,
+    get_packed_path,
+    is_packed_format,
+    merge_frames,
+    meters_to_frame,
+)
+from common.packed_format import dumps as packed_dumps
+from common.packed_format import loads as packed_loads
+from common.request_helpers import get_http_session, retry
 from common.thread_pool_executor import run_thread_pool_executor
+from common.update_manifest import ManifestWriter
 from integration.base_integration.exceptions import EmptyRawFile
 from integration.wattime.data import DataFile
 
@@ -38,6 +60,55 @@ class UpdateConfig:
     file_name_preffix: str = ""
 
 
+@dataclass
+class PackedFile:
+    """Standardized files merged into a packed file once it is saved"""
+
+    file_name: str = ""
+    bucket: str = ""
+    path: str = ""
+    files: List[Any] = field(default_factory=list)
+
+
+class EndOfStream:  # pylint:disable=too-few-public-methods
+    """Marker put into a consumer queue once upstream stages are completed"""
+
+    def __repr__(self) -> str:
+        return "END_OF_STREAM"
+
+
+END_OF_STREAM = EndOfStream()
+
+
+@dataclass
+class StageMetrics:
+    """Throughput and idle metrics of a single consumer stage"""
+
+    stage: str = ""
+    processed: int = 0
+    idle_time: float = 0.0
+    busy_time: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Processed items per second of busy time"""
+        return self.processed / self.busy_time if self.busy_time else 0.0
+
+
+def consumes(queue_attr: str) -> Callable:
+    """Mark worker method as a blocking consumer of the given queue attribute.
+
+    Consumers marked this way are started together with the upstream stages
+    and stop only after the runtime puts END_OF_STREAM into their queue.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func.__consumes__ = queue_attr
+        return func
+
+    return decorator
+
+
 class BaseWorker:  # pylint: disable=too-many-instance-attributes
     """Base Worker functionality"""
 
@@ -73,6 +144,8 @@ class BaseWorker:  # pylint: disable=too-many-instance-attributes
         self._factory = Factory(
             default_schema=Schema(trim_trailing_underscore=False, skip_internal=False)
         )
+        self._stage_metrics: Dict[str, StageMetrics] = {}
+        self._metrics_lock: Lock = Lock()
 
     def process_consumer_results(self, futures, logs) -> None:
         """Process worker statuses and collected logs"""
@@ -96,24 +169,141 @@ class BaseWorker:  # pylint: disable=too-many-instance-attributes
     ) -> None:
         if not isinstance(consumers, list):
             consumers = [consumers]
-        futures = []
+        self._stage_metrics = {}
+        self._metrics_lock = Lock()
+        if run_parallel:
+            for stages in self._split_into_pipelines(consumers):
+                self._run_pipeline(stages)
+        else:
+            for consumer, arguments in consumers:
+                logs = Queue()
+                self._close_consumer_input(consumer, replicas=1)
+                consumer(*arguments, logs, f"worker_idx_{uuid.uuid4()}")
+                self.process_consumer_results([], logs)
+        self._log_stage_metrics()
+
+    @staticmethod
+    def _split_into_pipelines(
+        consumers: List[Tuple[Callable, List[Any]]]
+    ) -> List[List[Tuple[Callable, List[Any]]]]:
+        """Group consumers into pipelines running concurrently.
+
+        A blocking consumer joins the pipeline of the previous stages. A
+        consumer without declared input queue relies on the queue being
+        filled before the start, so it waits for the previous pipeline.
+        """
+        pipelines = []
         for consumer, arguments in consumers:
-            logs = Queue()
-            args = arguments + [logs]
-            if run_parallel:
-                futures = run_thread_pool_executor(
-                    workers=[
-                        (
-                            consumer,
-                            args,
-                        )
-                    ],
-                    worker_replica=self.__workers_amount__,
-                )
+            if pipelines and getattr(consumer, "__consumes__", None):
+                pipelines[-1].append((consumer, arguments))
             else:
-                args.append(f"worker_idx_{uuid.uuid4()}")
-                consumer(*args)
-            self.process_consumer_results(futures, logs)
+                pipelines.append([(consumer, arguments)])
+        return pipelines
+
+    def _get_replicas(
+        self, consumer: Callable  # pylint:disable=unused-argument
+    ) -> int:
+        """Get amount of replicas of the given pipeline stage"""
+        return self.__workers_amount__
+
+    def _run_pipeline(self, stages: List[Tuple[Callable, List[Any]]]) -> None:
+        logs = Queue()
+        stage_futures = [
+            run_thread_pool_executor(
+                workers=[(consumer, arguments + [logs])],
+                worker_replica=self._get_replicas(consumer),
+                wait_on_done=False,
+            )
+            for consumer, arguments in stages
+        ]
+
+        for (consumer, _), futures in zip(stages, stage_futures):
+            # All upstream stages are completed at this point so nothing
+            # else can be put into the stage input queue.
+            self._close_consumer_input(consumer, self._get_replicas(consumer))
+            wait(futures)
+
+        self.process_consumer_results(chain.from_iterable(stage_futures), logs)
+
+    def _close_consumer_input(self, consumer: Callable, replicas: int) -> None:
+        queue_attr = getattr(consumer, "__consumes__", None)
+        if queue_attr:
+            self._close_queue(getattr(self, queue_attr), replicas)
+
+    @staticmethod
+    def _close_queue(task_queue: Queue, replicas: int) -> None:
+        """Put end of stream marker for each consumer replica"""
+        for _ in range(replicas):
+            task_queue.put(END_OF_STREAM)
+
+    def _consume(self, task_queue: Queue, stage: str) -> Iterator[Any]:
+        """Block on the given queue and yield items until end of stream"""
+        while True:
+            idle_start = default_timer()
+            item = task_queue.get()
+            idle_time = default_timer() - idle_start
+            if item is END_OF_STREAM:
+                task_queue.task_done()
+                self._update_stage_metrics(stage, idle_time=idle_time)
+                break
+
+            busy_start = default_timer()
+            try:
+                yield item
+            finally:
+                task_queue.task_done()
+                self._update_stage_metrics(
+                    stage,
+                    processed=1,
+                    idle_time=idle_time,
+                    busy_time=default_timer() - busy_start,
+                )
+
+    def _update_stage_metrics(
+        self,
+        stage: str,
+        processed: int = 0,
+        idle_time: float = 0.0,
+        busy_time: float = 0.0,
+    ) -> None:
+        with self._metrics_lock:
+            metrics = self._stage_metrics.setdefault(stage, StageMetrics(stage=stage))
+            metrics.processed += processed
+            metrics.idle_time += idle_time
+            metrics.busy_time += busy_time
+
+    @property
+    def stage_metrics(self) -> Dict[str, StageMetrics]:
+        """Metrics of the stages started by the latest consumers run"""
+        return dict(self._stage_metrics)
+
+    def _log_stage_metrics(self) -> None:
+        for metrics in self._stage_metrics.values():
+            self._logger.debug(
+                f"[{metrics.stage}] - Processed {metrics.processed} items.",
+                extra={
+                    "labels": {
+                        "processed": metrics.processed,
+                        "idle_time": round(metrics.idle_time, 3),
+                        "busy_time": round(metrics.busy_time, 3),
+                        "throughput": round(metrics.throughput, 3),
+                    }
+                },
+            )
+
+    @staticmethod
+    def _pop_expiring_item(storage: ExpiringDict) -> Tuple[Any, Any]:
+        """Pop the oldest item of the expiring dict, KeyError if it is empty.
+
+        ``ExpiringDict.popitem`` returns values together with their
+        timestamps, so the item is popped by its key instead.
+        """
+        with storage.lock:
+            try:
+                key = next(iter(storage))
+            except StopIteration as err:
+                raise KeyError("Expiring dict is empty.") from err
+            return key, storage.pop(key)
 
     @staticmethod
     @retry((HttpError,))
@@ -187,6 +377,17 @@ class BaseWorker:  # pylint: disable=too-many-instance-attributes
         """Configure worker before run"""
         self._run_time = run_time
 
+    @property
+    def _http_session(self) -> Session:
+        """Pooled HTTP session sized to the workers amount"""
+        return get_http_session(pool_size=self.__workers_amount__)
+
+    @property
+    def _standardized_format(self) -> str:
+        """Standardized data format configured for the participant"""
+        extra = getattr(self._config, "extra", None)
+        return getattr(extra, "standardized_format", "") or CFG.STANDARDIZED_FORMAT
+
     @staticmethod
     def _clear_queue(task_queue: Queue):
         with task_queue.mutex:
@@ -198,76 +399,67 @@ class BaseWorker:  # pylint: disable=too-many-instance-attributes
     def _add_to_update(self, file: Dict, chunk_storage: Dict) -> None:
         pass
 
+    @staticmethod
+    def _upload_file(file_info: Any) -> None:
+        upload_file_to_bucket(
+            bucket_name=file_info.bucket,
+            blob_path=file_info.path,
+            file_name=file_info.file_name,
+            blob_text=file_info.body,
+        )
+
     def _save_files_worker(
         self,
         files_queue: Queue,
         logs: Queue,
         worker_idx: str,
+        stage: str = "save_files_worker",
+        on_saved: Optional[Callable[[Any], None]] = None,
+        save: Optional[Callable[[Any], None]] = None,
     ) -> None:
-        if files_queue.empty():
-            logs.put(
-                (
-                    "WARNING",
-                    self._trace_id,
-                    f"[Saving data] - [{worker_idx}]. The files queue is empty. "
-                    "Shutdown worker.",
+        save = save or self._upload_file
+        for file_info in self._consume(files_queue, stage=stage):
+            retry_count = 0
+            delay = 0.5
+            while retry_count < self.__max_retry_count__:
+                filepath = (
+                    f"{file_info.bucket}/{file_info.path}/{file_info.file_name}/"
                 )
-            )
-            return None
-        empty_run_count = 0
-        while True:
-            if files_queue.empty():
-                if empty_run_count == 3:
-                    break
-                empty_run_count += 1
-            else:
-                file_info = files_queue.get()
-                retry_count = 0
-                delay = 0.5
-                while retry_count < self.__max_retry_count__:
-                    filepath = (
-                        f"{file_info.bucket}/{file_info.path}/"
-                        f"{file_info.file_name}/"
-                    )
-                    try:
-                        upload_file_to_bucket(
-                            bucket_name=file_info.bucket,
-                            blob_path=file_info.path,
-                            file_name=file_info.file_name,
-                            blob_text=file_info.body,
+                try:
+                    save(file_info)
+                    logs.put(
+                        (
+                            "INFO",
+                            self._trace_id,
+                            f"[{worker_idx}] - Saved file '{filepath}'.",
                         )
+                    )
+                    if on_saved is not None:
+                        on_saved(file_info)
+                    break
+                except GoogleCloudError as err:
+                    retry_count += 1
+                    delay = retry_count
+                    if retry_count < self.__max_retry_count__:
                         logs.put(
                             (
-                                "INFO",
+                                "WARNING",
                                 self._trace_id,
-                                f"[{worker_idx}] - Saved file '{filepath}'.",
+                                f"Cannot upload file '{filepath}' due "
+                                f"to the {err}. Try to save in a "
+                                "few seconds.",
                             )
                         )
-                        break
-                    except GoogleCloudError as err:
-                        retry_count += 1
-                        delay = retry_count
-                        if retry_count < self.__max_retry_count__:
-                            logs.put(
-                                (
-                                    "WARNING",
-                                    self._trace_id,
-                                    f"Cannot upload file '{filepath}' due "
-                                    f"to the {err}. Try to save in a "
-                                    "few seconds.",
-                                )
-                            )
-                        else:
-                            logs.put(
-                                (
-                                    "ERROR",
-                                    self._trace_id,
-                                    f"Cannot upload file '{filepath}' due "
-                                    f"to the {err}.",
-                                )
+                    else:
+                        logs.put(
+                            (
+                                "ERROR",
+                                self._trace_id,
+                                f"Cannot upload file '{filepath}' due "
+                                f"to the {err}.",
                             )
-                        time.sleep(delay)
-                files_queue.task_done()
+                        )
+                    time.sleep(delay)
 
     def _adjust_meter_date(
         self, date: DateTime, truncate_lvl: Optional[str] = None
@@ -305,21 +497,28 @@ class BaseFetchWorker(BaseWorker):
             max_len=2000, max_age_seconds=3600
         )
         self._update_config: Optional[UpdateConfig] = None
+        self._raw_files: Optional[Set[str]] = None
+        self._raw_files_lock = Lock()
+        self._missed_raw_files: Set[str] = set()
 
+    @consumes("_shadow_fetched_files_queue")
     def save_fetched_files_worker(self, logs: Queue, worker_idx: str) -> None:
         """Worker used to upload fetched files to cloud storage"""
         self._save_files_worker(
             files_queue=self._shadow_fetched_files_queue,
             logs=logs,
             worker_idx=worker_idx,
+            stage="save_fetched_files_worker",
         )
 
+    @consumes("_fetch_update_queue")
     def save_fetch_status_worker(self, logs: Queue, worker_idx: str) -> None:
         """Worker used to upload fetch status to storage"""
         self._save_files_worker(
             files_queue=self._fetch_update_queue,
             logs=logs,
             worker_idx=worker_idx,
+            stage="save_fetch_status_worker",
         )
 
     @abstractmethod
@@ -344,6 +543,46 @@ class BaseFetchWorker(BaseWorker):
         self._clear_queue(self._shadow_fetched_files_queue)
         self._fetch_update_file_buffer.clear()
         self._fetch_update_counter = Counter()
+        self._raw_files = None
+        missed_hours = self._missed_hours_queue
+        self._missed_raw_files = (
+            {self._get_raw_filename(mtr_hr) for mtr_hr in list(missed_hours)}
+            if isinstance(missed_hours, ExpiringDict)
+            else set()
+        )
+
+    def _get_raw_filename(self, mtr_hr: DateTime) -> str:
+        """Get raw file name of the missed hour"""
+        return format_date(mtr_hr, CFG.PROCESSING_DATE_FORMAT)
+
+    @retry((HttpError,))
+    def _list_raw_files(self, client: Optional[Client] = None) -> Set[str]:
+        return get_existing_files(
+            bucket=self._config.extra.raw.bucket,
+            subdirectory=self._config.extra.raw.path,
+            file_names=self._missed_raw_files,
+            client=client,
+        )
+
+    def _is_raw_file_exists(
+        self, file_name: str, client: Optional[Client] = None
+    ) -> bool:
+        """Check the raw file exists.
+
+        Raw files of the missed hours are listed once per run instead of
+        requesting every file, other files are requested one by one.
+        """
+        if file_name not in self._missed_raw_files:
+            return self._is_file_exists(
+                bucket=self._config.extra.raw.bucket,
+                path=self._config.extra.raw.path,
+                file_name=file_name,
+                client=client,
+            )
+        with self._raw_files_lock:
+            if self._raw_files is None:
+                self._raw_files = self._list_raw_files(client)
+        return file_name in self._raw_files
 
     def _add_to_update(self, file: Dict, chunk_storage: Queue) -> None:
         self._add_to_updates_generic(
@@ -423,8 +662,10 @@ class BaseFetchWorker(BaseWorker):
     def finalize_fetch_update_status(self) -> None:
         """Save all not full chunk into update status"""
         with self._lock:
-            while len(self._fetch_update_file_buffer):
-                chunk_id_key, chunk_storage = self._fetch_update_file_buffer.popitem()
+            while self._fetch_update_file_buffer:
+                chunk_id_key, chunk_storage = self._pop_expiring_item(
+                    self._fetch_update_file_buffer
+                )
                 self._finalize_update_status_generic(
                     chunk_id_key=chunk_id_key,
                     chunk_storage=chunk_storage,
@@ -454,93 +695,113 @@ class BaseStandardizeWorker(BaseWorker):
         self._st_update_counter = Counter()
         self._st_base_update_file_name: Optional[str] = None
         self._fetch_update_file_buffer: Optional[ExpiringDict] = None
+        self._packed_files: Dict[Tuple[str, str, str], List[Any]] = {}
+        self._covered_hours: Dict[Tuple[str, str], Set[str]] = {}
         self._factory = Factory(
             default_schema=Schema(trim_trailing_underscore=False, skip_internal=False)
         )
 
+    @consumes("_raw_files_queue")
     def run_standardize_worker(
         self,
         logs: Queue,
-        worker_idx: str,
+        worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Run Standardize worker"""
-        if self._raw_files_queue.empty():
-            logs.put(
-                (
-                    "WARNING",
-                    self._trace_id,
-                    f"[Standardizing data] - [{worker_idx}] - The raw files "
-                    "queue is empty. Shutdown worker.",
-                )
-            )
-            return None
-        empty_run_count = 0
-        while True:
-            if self._raw_files_queue.empty():
-                if empty_run_count == 3:
-                    logs.put(
-                        (
-                            "INFO",
-                            self._trace_id,
-                            f"[Standardizing data] - [{worker_idx}] - The raw files "
-                            "queue is empty. Shutdown worker.",
-                        )
+        for raw_file_data in self._consume(
+            self._raw_files_queue, stage="run_standardize_worker"
+        ):
+            try:
+                standardized_obj = self._standardize(raw_file_obj=raw_file_data)
+            except (RuntimeError, EmptyRawFile) as err:
+                logs.put(
+                    (
+                        "ERROR",
+                        self._trace_id,
+                        f"Skip standardizing due to the error '{err}'",
                     )
-                    break
-                empty_run_count += 1
+                )
             else:
-                raw_file_data = self._raw_files_queue.get()
-                try:
-                    standardized_obj = self._standardize(raw_file_obj=raw_file_data)
-                except (RuntimeError, EmptyRawFile) as err:
-                    logs.put(
-                        (
-                            "ERROR",
-                            self._trace_id,
-                            f"Skip standardizing due to the error '{err}'",
-                        )
-                    )
-                else:
-                    if not isinstance(standardized_obj, list):
-                        standardized_obj = [standardized_obj]
-                    # TODO: Change code to use an iterable object
-                    for st_obj in standardized_obj:
+                if not isinstance(standardized_obj, list):
+                    standardized_obj = [standardized_obj]
+                # TODO: Change code to use an iterable object
+                for st_obj in standardized_obj:
+                    if is_packed_format(self._standardized_format):
+                        self._add_to_packed(st_obj)
+                    else:
                         self._st_files_queue.put(st_obj)
-                        # self._add_to_update(standardized_obj, self._st_update_queue)
-                        self._add_to_update(st_obj)
-
-                self._raw_files_queue.task_done()
+                    self._add_to_update(st_obj)
 
+    @consumes("_st_files_queue")
     def save_standardized_files_worker(self, logs: Queue, worker_idx: str) -> None:
         """Upload standardized data on cloud storage"""
         self._save_files_worker(
             files_queue=self._st_files_queue,
             logs=logs,
             worker_idx=worker_idx,
+            stage="save_standardized_files_worker",
+            on_saved=self._add_covered_hour,
         )
 
+    @consumes("_st_update_queue")
     def save_standardize_status_worker(self, logs: Queue, worker_idx: str) -> None:
         """Upload standardizion status on cloud storage"""
         self._save_files_worker(
             files_queue=self._st_update_queue,
             logs=logs,
             worker_idx=worker_idx,
+            stage="save_standardize_status_worker",
+            on_saved=self._add_covered_packed_hours,
+            save=self._save_standardize_status_file,
         )
 
+    def _run_consumers(
+        self, consumers: List[Tuple[Callable, List[Any]]], run_parallel: bool = True
+    ) -> None:
+        super()._run_consumers(consumers, run_parallel)
+        self.save_coverage_index()
+
+    def _add_covered_hour(self, file: DataFile) -> None:
+        with self._lock:
+            self._covered_hours.setdefault((file.bucket, file.path), set()).add(
+                file.file_name
+            )
+
+    def _add_covered_packed_hours(self, file: Any) -> None:
+        if not isinstance(file, PackedFile):
+            return
+        with self._lock:
+            for st_file in file.files:
+                self._covered_hours.setdefault(
+                    (st_file.bucket, st_file.path), set()
+                ).add(st_file.file_name)
+
+    def save_coverage_index(self) -> None:
+        """Add saved standardized hours to the coverage index of the meters"""
+        with self._lock:
+            covered_hours, self._covered_hours = self._covered_hours, {}
+
+        for (bucket, path), hours in covered_hours.items():
+            save_covered_hours(bucket_name=bucket, bucket_path=path, file_names=hours)
+
     def configure(self, run_time: DateTime) -> None:
         super().configure(run_time=run_time)
         self._clear_queue(self._st_files_queue)
         self._clear_queue(self._st_update_queue)
         self._st_update_file_buffer.clear()
         self._st_update_counter = Counter()
+        self._packed_files.clear()
+        self._covered_hours.clear()
 
         self._st_base_update_file_name = format_date(
             truncate(self._run_time, level="hour"), CFG.PROCESSING_DATE_FORMAT
         )
 
-    def _standardize_generic(self, data: Dict, mtr_cfg: Any, getter: Callable) -> Meter:
+    def _standardize_generic(
+        self, data: Dict, mtr_cfg: Any, getter: Callable
+    ) -> CompactMeter:
 
-        meter = Meter()
+        meter = CompactMeter()
 
         usage, start_date, end_date = getter(data)
 
@@ -577,11 +838,67 @@ class BaseStandardizeWorker(BaseWorker):
             elif chunk_key not in self._st_update_counter:
                 self._st_update_counter[chunk_key] = chunk_id
 
+    def _get_packed_location(self, file: DataFile) -> Tuple[str, str, str]:
+        return (
+            file.bucket,
+            get_packed_path(file.path),
+            get_packed_file_name(file.meter.start_time, self._standardized_format),
+        )
+
+    def _add_to_packed(self, file: DataFile) -> None:
+        location = self._get_packed_location(file)
+        with self._lock:
+            self._packed_files.setdefault(location, []).append(file)
+
+    def _save_standardize_status_file(self, file_info: Any) -> None:
+        if isinstance(file_info, PackedFile):
+            self._save_packed_file(file_info)
+        else:
+            self._upload_file(file_info)
+
+    @retry((PreconditionFailed,))
+    def _save_packed_file(self, packed_file: PackedFile) -> None:
+        """Merge standardized files into the packed file and save it.
+
+        The packed file is saved only if it was not changed since loading,
+        otherwise it is loaded and merged again.
+        """
+        st_format = self._standardized_format
+        blob = get_bucket(packed_file.bucket).blob(
+            f'{packed_file.path.strip("/")}/{packed_file.file_name}'
+        )
+        try:
+            existing = packed_loads(blob.download_as_bytes(), st_format)
+            generation = int(blob.generation or 0)
+        except NotFound:
+            existing, generation = None, 0
+        frame = merge_frames(
+            existing,
+            meters_to_frame((fl.file_name, fl.meter) for fl in packed_file.files),
+        )
+        blob.upload_from_string(
+            packed_dumps(frame, st_format),
+            if_generation_match=generation,
+        )
+
+    def finalize_packed_files(self) -> None:
+        """Queue standardized files grouped by packed files for saving"""
+        with self._lock:
+            packed_files, self._packed_files = self._packed_files, {}
+
+        for (bucket, path, file_name), files in packed_files.items():
+            self._st_update_queue.put(
+                PackedFile(file_name=file_name, bucket=bucket, path=path, files=files)
+            )
+
     def finalize_standardize_update_status(self) -> None:
         """Save all not full chunk into update status"""
+        self.finalize_packed_files()
         with self._lock:
-            while len(self._st_update_file_buffer):
-                chunk_id_key, chunk_storage = self._st_update_file_buffer.popitem()
+            while self._st_update_file_buffer:
+                chunk_id_key, chunk_storage = self._pop_expiring_item(
+                    self._st_update_file_buffer
+                )
 
                 chunk_reg = self.__update_chunk_main_part_regex__.match(chunk_id_key)
 
@@ -603,12 +920,10 @@ class BaseStandardizeWorker(BaseWorker):
             chunk_id = self._st_update_counter[chunk_key]
 
             update_path, bucket = None, ""
-
-            update = {
-                "amounts": self._st_update_counter[chunk_id_key],
-                "files": [],
-                "updates": [],
-            }
+            is_packed = is_packed_format(self._standardized_format)
+            packed_locations = set()
+            participant_id = int(self._config.extra.participant_id)
+            manifest = ManifestWriter()
 
             while not chunk_storage.empty():
                 mtr_file = chunk_storage.get()
@@ -617,26 +932,17 @@ class BaseStandardizeWorker(BaseWorker):
                     update_path = Path(mtr_file.path).joinpath(self._update_preffix)
                     bucket = mtr_file.bucket
 
-                update["files"].append(
-                    {
-                        "bucket": mtr_file.bucket,
-                        "path": mtr_file.path,
-                        "filename": mtr_file.file_name,
-                    }
-                )
+                if not is_packed:
+                    manifest.add_file(
+                        mtr_file.bucket, mtr_file.path, mtr_file.file_name
+                    )
+                else:
+                    packed_location = self._get_packed_location(mtr_file)
+                    if packed_location not in packed_locations:
+                        packed_locations.add(packed_location)
+                        manifest.add_file(*packed_location)
 
-                update["updates"].append(
-                    {
-                        "ref_hour_id": int(
-                            format_date(
-                                mtr_file.meter.start_time, CFG.HOUR_ID_DATE_FORMAT
-                            )
-                        ),
-                        "ref_participant_id": int(self._config.extra.participant_id),
-                        "ref_meter_id": int(mtr_file.meter.meter_id),
-                        "data": float(mtr_file.meter.usage),
-                    }
-                )
+                manifest.add_update(mtr_file.meter, participant_id)
 
                 chunk_storage.task_done()
 
@@ -649,7 +955,9 @@ class BaseStandardizeWorker(BaseWorker):
                     ),
                     bucket=bucket,
                     path=str(update_path),
-                    body=dumps(update, indent=4, sort_keys=True),
+                    body=manifest.getvalue(
+                        amounts=self._st_update_counter[chunk_id_key]
+                    ),
                     cfg={},
                 )
             )
@@ -657,8 +965,10 @@ class BaseStandardizeWorker(BaseWorker):
     def finalize_fetch_update_status(self) -> None:
         """Save all not full chunk into update status"""
         with self._lock:
-            while len(self._st_update_file_buffer):
-                chunk_id_key, chunk_storage = self._fetch_update_file_buffer.popitem()
+            while self._fetch_update_file_buffer:
+                chunk_id_key, chunk_storage = self._pop_expiring_item(
+                    self._fetch_update_file_buffer
+                )
                 self._finalize_update_status_generic(
                     chunk_id_key=chunk_id_key,
                     chunk_storage=chunk_storage,
@@ -28,6 +28,7 @@ class ExtraInfo:
     timezone: str = ""
     fetch_strategy: FetchStrategy = field(default_factory=FetchStrategy)
     raw: StorageInfo = field(default_factory=StorageInfo)
+    standardized_format: str = ""
 
 
 @dataclass
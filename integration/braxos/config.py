@@ -18,5 +18,6 @@ class BraxosCfg:  # pylint:disable=too-many-instance-attributes
     key: Union[str, RSAKey] = ""
     server: str = ""
     username: str = ""
+    sftp_sessions: int = 4
     gap_regeneration_window: int = -1
     timestamp_shift: TimeShift = field(default_factory=TimeShift)
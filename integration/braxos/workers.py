@@ -1,13 +1,16 @@
 """ Braxos Workers module"""
 
+import shutil
 import tempfile
+import time
 import uuid
 from abc import abstractmethod
 from collections import Counter
 from io import StringIO
 from pathlib import Path
-from queue import Queue
-from typing import Any, Dict, List, Optional
+from queue import Empty, Queue
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
 
 import pysftp
 from dataclass_factory import Factory, Schema
@@ -18,11 +21,17 @@ from paramiko.ssh_exception import SSHException
 from pendulum import DateTime
 
 import common.settings as CFG
-from common.bucket_helpers import get_missed_standardized_files, require_client
+from common.bucket_helpers import require_client
+from common.coverage_index import get_missed_standardized_hours
 from common.data_representation.standardized.meter import Meter
 from common.date_utils import GapDatePeriod, format_date, parse, truncate
 from common.logging import Logger, ThreadPoolExecutorLogger
-from integration.base_integration import BaseFetchWorker, BaseStandardizeWorker
+from common.request_helpers import retry
+from integration.base_integration import (
+    BaseFetchWorker,
+    BaseStandardizeWorker,
+    consumes,
+)
 from integration.braxos.data_structures import DataFile, StandardizedFile
 from integration.braxos.exception import EmptyDataInterruption, LoadFromConnectorAPI
 
@@ -37,7 +46,6 @@ class GapsDetectionWorker(BaseFetchWorker):
     __created_by__ = "Braxos Missed Hours Worker"
     __description__ = "Braxos Integration"
     __name__ = "Braxos Missed Hours Worker"
-    __max_idle_run_count__ = 5
 
     def __init__(  # pylint:disable=super-init-not-called
         self,
@@ -65,6 +73,7 @@ class GapsDetectionWorker(BaseFetchWorker):
         for mtr_cfg in self._config.meters:
             self._meters_queue.put(mtr_cfg)
 
+    @consumes("_meters_queue")
     def missed_hours_consumer(
         self,
         storage_client: Client,
@@ -72,22 +81,14 @@ class GapsDetectionWorker(BaseFetchWorker):
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Get missed hours"""
-        if self._meters_queue.empty():
-            self._th_logger.warning("Meters queue is empty.")
-            return None
-        empty_run_count = 0
-        while True:
-            if self._meters_queue.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-                continue
-
-            mtr_cfg = self._meters_queue.get()
-            mtr_msd_poll_hrs = get_missed_standardized_files(
+        for mtr_cfg in self._consume(
+            self._meters_queue, stage="missed_hours_consumer"
+        ):
+            mtr_msd_poll_hrs = get_missed_standardized_hours(
                 bucket_name=mtr_cfg.standardized.bucket,
                 bucket_path=mtr_cfg.standardized.path,
                 range_hours=self._config.gap_regeneration_window,
+                standardized_format=self._standardized_format,
                 client=storage_client,
                 date_range=self._expected_hours,
             )
@@ -108,7 +109,6 @@ class GapsDetectionWorker(BaseFetchWorker):
                 self._th_logger.info(
                     f"Meter {mtr_cfg.meter_name} is up to date.",
                 )
-            self._meters_queue.task_done()
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
@@ -137,7 +137,6 @@ class FetchWorker(BaseFetchWorker):
 
     __max_retry_count__ = 3
     __retry_delay__ = 0.5
-    __max_idle_run_count__ = 5
 
     def __init__(
         self,
@@ -156,21 +155,24 @@ class FetchWorker(BaseFetchWorker):
         self._missed_hours_queue: ExpiringDict = missed_hours
 
         self._raw_fetch_queue = Queue()
+        self._downloads_queue = Queue()
         self._fetch_counter = Counter()
+        self._provider_files: Optional[Dict[str, int]] = None
+        self._provider_files_lock = Lock()
 
         self._factory = Factory(
             default_schema=Schema(trim_trailing_underscore=False, skip_internal=False)
         )
 
+    def _get_raw_filename(self, mtr_hr: DateTime) -> str:
+        return self.__provider_filename_tmpl__.format(
+            provider_datetime=format_date(mtr_hr, self.__braxos_api_datetime_format__)
+        )
+
     def _load_from_file(
         self, filename: str, storage_client: Client, logs: Queue
     ) -> Optional[Dict]:
-        fl_exists = self._is_file_exists(
-            client=storage_client,
-            bucket=self._config.extra.raw.bucket,
-            path=self._config.extra.raw.path,
-            file_name=filename,
-        )
+        fl_exists = self._is_raw_file_exists(file_name=filename, client=storage_client)
         if not fl_exists:
             raise LoadFromConnectorAPI(
                 f"The local file 'gs://{self._config.extra.raw.bucket}/"
@@ -198,98 +200,194 @@ class FetchWorker(BaseFetchWorker):
             )
         return data
 
-    def fetch_consumer(  # pylint:disable=too-many-locals
+    def configure(self, run_time: DateTime) -> None:
+        super().configure(run_time=run_time)
+        self._clear_queue(self._downloads_queue)
+        self._provider_files = None
+
+    def _connect(self) -> pysftp.Connection:
+        cnopts = pysftp.CnOpts()
+        cnopts.hostkeys = None
+        cnopts.log = True
+
+        return pysftp.Connection(
+            host=self._config.server,
+            username=self._config.username,
+            private_key=self._config.key,
+            cnopts=cnopts,
+        )
+
+    @retry((SSHException, EOFError, OSError))
+    def _list_provider_files(self) -> Dict[str, int]:
+        """Get sizes of the files available on the server"""
+        with self._connect() as sftp:
+            return {attr.filename: attr.st_size for attr in sftp.listdir_attr()}
+
+    def _get_provider_files(self) -> Dict[str, int]:
+        """Get sizes of the files available on the server, listed once per run"""
+        with self._provider_files_lock:
+            if self._provider_files is None:
+                self._provider_files = self._list_provider_files()
+        return self._provider_files
+
+    def _get_replicas(self, consumer: Callable) -> int:
+        if consumer == self.download_worker:
+            return max(self._config.sftp_sessions, 1)
+        return super()._get_replicas(consumer)
+
+    @staticmethod
+    def _download(
+        sftp: pysftp.Connection, provider_filename: str, file_size: int, filepath: Path
+    ) -> str:
+        """Download provider file resuming the partially transferred one"""
+        offset = filepath.stat().st_size if filepath.exists() else 0
+        if offset > file_size:
+            filepath.unlink()
+            offset = 0
+
+        if offset < file_size:
+            with sftp.open(provider_filename, "rb") as remote_file:
+                remote_file.seek(offset)
+                remote_file.prefetch(file_size)
+                with open(filepath, "ab") as file:
+                    shutil.copyfileobj(remote_file, file)
+
+        if filepath.stat().st_size != file_size:
+            raise EOFError(
+                f"Downloaded {filepath.stat().st_size} bytes of {file_size} bytes."
+            )
+        with open(filepath, "r", encoding="utf-8") as file:
+            data = file.read()
+        filepath.unlink()
+        return data
+
+    def _put_fetched_file(
+        self, mtr_hr: DateTime, mtr_cfgs: Queue, filename: str, data: str
+    ) -> DataFile:
+        file_info = DataFile(
+            file_name=filename,
+            bucket=self._config.extra.raw.bucket,
+            path=self._config.extra.raw.path,
+            body=data,
+            meters=mtr_cfgs,
+        )
+        file_info.timestamps.put(mtr_hr)
+
+        self._fetched_files_queue.put(file_info)
+        self._shadow_fetched_files_queue.put(file_info)
+        return file_info
+
+    def prefetch_consumer(
         self,
         storage_client: Client,
         logs: Queue,
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
-        """Fetch data worker"""
-        if not bool(len(self._missed_hours_queue)):
-            self._th_logger.warning(
-                "Missed hours queue is empty. Maybe data up to date.",
+        """Queue downloads of the missed hours available on the server.
+
+        Hours saved in the bucket already are loaded from it, hours absent in
+        the server listing are skipped without requesting them.
+        """
+        while True:
+            try:
+                mtr_hr, mtr_cfgs = self._pop_expiring_item(self._missed_hours_queue)
+            except KeyError:
+                break
+
+            mtr_hr = truncate(mtr_hr, level="hour")
+            provider_filename = self._get_raw_filename(mtr_hr)
+            try:
+                data = self._load_from_file(
+                    filename=provider_filename,
+                    storage_client=storage_client,
+                    logs=logs,
+                )
+            except LoadFromConnectorAPI:
+                pass
+            else:
+                self._put_fetched_file(mtr_hr, mtr_cfgs, provider_filename, data)
+                continue
+
+            provider_files = self._get_provider_files()
+            if provider_filename not in provider_files:
+                self._th_logger.warning(
+                    f"The file {provider_filename} is absent on the server. Skipping."
+                )
+                continue
+            self._downloads_queue.put(
+                (mtr_hr, mtr_cfgs, provider_filename, provider_files[provider_filename])
             )
-            return None
-        empty_run_count = 0
-        cnopts = pysftp.CnOpts()
-        cnopts.hostkeys = None
-        cnopts.log = True
 
-        params = {
-            "host": self._config.server,
-            "username": self._config.username,
-            "private_key": self._config.key,
-        }
-        params["cnopts"] = cnopts
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with pysftp.Connection(**params) as sftp:
-                while True:
-                    if not bool(len(self._missed_hours_queue)):
-                        if empty_run_count == self.__max_idle_run_count__:
-                            break
-                        empty_run_count += 1
-                    else:
-                        mtr_hr, mtr_cfgs = self._missed_hours_queue.popitem()
-                        mtr_hr = truncate(mtr_hr, level="hour")
-                        provider_filename = self.__provider_filename_tmpl__.format(
-                            provider_datetime=format_date(
-                                mtr_hr, self.__braxos_api_datetime_format__
-                            )
-                        )
+    def download_worker(self, download_dir: Path, logs: Queue, worker_idx: str) -> None:
+        """Download queued provider files using a separate SFTP session"""
+        sftp = None
+        try:
+            while True:
+                try:
+                    item = self._downloads_queue.get_nowait()
+                except Empty:
+                    break
 
-                        try:
-                            data = self._load_from_file(
-                                filename=provider_filename,
-                                storage_client=storage_client,
-                                logs=logs,
-                            )
-                            add_to_update = False
-                        except LoadFromConnectorAPI as err:
-                            self._th_logger.info(
-                                f"Canot load the local file due to the reason '{err}'"
-                                " Loading from the WatTime API"
+                mtr_hr, mtr_cfgs, provider_filename, file_size = item
+                data = None
+                for retry_count in range(1, self.__max_retry_count__ + 1):
+                    try:
+                        sftp = sftp or self._connect()
+                        data = self._download(
+                            sftp,
+                            provider_filename,
+                            file_size,
+                            download_dir.joinpath(provider_filename),
+                        )
+                        break
+                    except (SSHException, EOFError, OSError) as err:
+                        logs.put(
+                            (
+                                "WARNING",
+                                self._trace_id,
+                                f"[{worker_idx}] - Cannot download the file "
+                                f"{provider_filename} due to the error {err}. "
+                                "Resuming in a few seconds.",
                             )
-                            filepath = Path(temp_dir).joinpath(provider_filename)
-                            try:
-                                sftp.get(provider_filename, str(filepath))
-                            except (FileNotFoundError, SSHException) as ft_err:
-                                self._th_logger.error(
-                                    f"Cannot download the file {provider_filename} due to "
-                                    f"the error {ft_err}"
-                                )
-                                continue
-                            with open(filepath, "r", encoding="utf-8") as file:
-                                data = file.read()
-
-                            add_to_update = True
-
-                        file_info = DataFile(
-                            file_name=provider_filename,
-                            bucket=self._config.extra.raw.bucket,
-                            path=self._config.extra.raw.path,
-                            body=data,
-                            meters=mtr_cfgs,
                         )
-                        file_info.timestamps.put(mtr_hr)
+                        if sftp is not None:
+                            sftp.close()
+                            sftp = None
+                        time.sleep(retry_count * self.__retry_delay__)
 
-                        self._fetched_files_queue.put(file_info)
-                        self._shadow_fetched_files_queue.put(file_info)
-                        if add_to_update:
-                            self._add_to_update(
-                                file_info, self._fetch_update_file_buffer
-                            )
+                if data is None:
+                    self._th_logger.error(
+                        f"Cannot download the file {provider_filename}. Skipping."
+                    )
+                else:
+                    file_info = self._put_fetched_file(
+                        mtr_hr, mtr_cfgs, provider_filename, data
+                    )
+                    self._add_to_update(file_info, self._fetch_update_file_buffer)
+                self._downloads_queue.task_done()
+        finally:
+            if sftp is not None:
+                sftp.close()
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
         self.configure(run_time)
-        self._run_consumers(
-            [
-                (self.fetch_consumer, [require_client()]),
-                (self.save_fetched_files_worker, []),
-            ],
-            run_parallel=RUN_FETCH_PARALLEL,
-        )
+        if not bool(len(self._missed_hours_queue)):
+            self._logger.warning("Missed hours queue is empty. Maybe data up to date.")
+        # Partially transferred files are kept between the attempts in the
+        # directory of this run, so concurrent runs do not share them.
+        download_dir = Path(tempfile.mkdtemp(prefix="braxos-"))
+        try:
+            self._run_consumers(
+                [
+                    (self.prefetch_consumer, [require_client()]),
+                    (self.download_worker, [download_dir]),
+                    (self.save_fetched_files_worker, []),
+                ],
+                run_parallel=RUN_FETCH_PARALLEL,
+            )
+        finally:
+            shutil.rmtree(download_dir, ignore_errors=True)
         self.finalize_fetch_update_status()
         self._run_consumers(
             [
@@ -23,6 +23,7 @@ class ExtraInfo:
     participant_id: int = -1
     timezone: str = ""
     fetch_strategy: FetchStrategy = field(default_factory=FetchStrategy)
+    standardized_format: str = ""
 
 
 # TODO: Should be moved to base config in future
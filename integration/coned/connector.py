@@ -9,13 +9,14 @@ from abc import abstractmethod
 from dataclasses import asdict
 from json import JSONDecodeError, dumps, load, loads
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.error import HTTPError, URLError
 
 from dataclass_factory import Factory
+from pendulum import DateTime
 
 from common import settings as CFG
-from common.bucket_helpers import get_missed_standardized_files
+from common.coverage_index import get_missed_standardized_hours
 from common.date_utils import format_date, parse, truncate
 from common.elapsed_time import elapsed_timer
 from common.logging import Logger
@@ -27,6 +28,7 @@ from common.request_helpers import (
 )
 from integration.base_integration import BasePullConnector, MalformedConfig
 from integration.coned.config import ConedCfg
+from integration.coned.espi import get_hour_usage, get_interval_usage
 from integration.coned.exception import UnxpectedBehavior
 
 
@@ -65,7 +67,7 @@ class ConEdConnector(BasePullConnector):
                 start_date = truncate(
                     self._run_time.subtract(hours=self.__hours_delay__), level="hour"
                 )
-                mtr_msd_poll_hrs = get_missed_standardized_files(
+                mtr_msd_poll_hrs = get_missed_standardized_hours(
                     start_date=start_date,
                     bucket_name=mtr_cfg.standardized.bucket,
                     bucket_path=mtr_cfg.standardized.path,
@@ -161,6 +163,55 @@ class ConEdConnector(BasePullConnector):
                 )
         raise UnxpectedBehavior("Unxpected behavior")
 
+    def _fetch_feed(
+        self, headers: Dict, published_min: str, published_max: str
+    ) -> Optional[Tuple[str, Dict[int, float]]]:
+        """Fetch feed of the day together with its interval usage"""
+        try:
+            url = (
+                "https://api.coned.com/gbc/v1/resource/Subscription/"
+                f"{self._config.subscription_id}/UsagePoint/"
+                f"{self._config.usage_point_id}/MeterReading/"
+                f"{self._config.meter_reading_id}/IntervalBlock/"
+                f"SP_{self._config.usage_point_id}_KWH%20"
+                f"{self._config.interval}%20Minute%20Interval%20"
+                "Read%20Interval"
+            )
+            parameters = {
+                "publishedMin": published_min,
+                "publishedMax": published_max,
+            }
+
+            meter_response = self._retry_request(
+                url=url,
+                parameters=parameters,
+                headers=headers,
+                method=HTTPRequestMethod.GET,
+                request_payload_type=PayloadType.JSON,
+                response_payload_type=PayloadType.TEXT,
+                timeout=self.__request_timeout__,
+            )
+        except JBBRequestHelperException:
+            self._logger.error(
+                f"No data from historical API for {published_min}. Skipping..."
+            )
+            return None
+        except UnxpectedBehavior:
+            self._logger.error(
+                "Cannot retieve meter data. See logs for the "
+                "more information. Skipping..."
+            )
+            return None
+
+        try:
+            return meter_response, get_interval_usage(meter_response)
+        except ET.ParseError as err:
+            self._logger.error(
+                f"Cannot parse meter data of {published_min} "
+                f"due to the error '{err}'. Skipping..."
+            )
+            return None
+
     def fetch_and_standardize(self) -> None:
         """Fetch and standardize"""
         with elapsed_timer() as elapsed:
@@ -206,10 +257,10 @@ class ConEdConnector(BasePullConnector):
             }
             headers["Authorization"] = f'Bearer {response["access_token"]}'
 
-            processed_days = {()}
-
-            meter_response = None
-
+            # All meters share the same feed, so the missed hours are grouped
+            # by the day of their feed. Every day is fetched and parsed once and
+            # released as soon as the hours of all the meters are processed.
+            day_hours: Dict[Tuple[str, str], List[Tuple[str, Any, Dict, DateTime]]] = {}
             for mtr_name, missed_hours in self._missed_hours.items():
                 mtr_cfg = self._get_meter_config_by_name(mtr_name)
                 if not mtr_cfg:
@@ -217,126 +268,48 @@ class ConEdConnector(BasePullConnector):
                         "Cannot find meter config for the given type "
                         f"{mtr_name}. Skipping..."
                     )
+                    continue
 
                 mtr_cfg_json = asdict(mtr_cfg)
 
                 for missed_hour in missed_hours:
                     current_time = truncate(parse(missed_hour), level="hour")
-                    filename = format_date(current_time, CFG.PROCESSING_DATE_FORMAT)
-
-                    value = 0
-
-                    published_max = format_date(current_time, self.__api_date_time__)
-
                     published_min = format_date(
                         current_time.subtract(hours=self.__min_hours_delta__),
                         self.__api_date_time__,
                     )
+                    published_max = format_date(current_time, self.__api_date_time__)
+                    day_hours.setdefault((published_min, published_max), []).append(
+                        (mtr_name, mtr_cfg, mtr_cfg_json, current_time)
+                    )
 
+            for (published_min, published_max), hours in day_hours.items():
+                feed = self._fetch_feed(headers, published_min, published_max)
+                if feed is None:
+                    continue
+                meter_response, interval_usage = feed
+
+                for mtr_name, mtr_cfg, mtr_cfg_json, current_time in hours:
+                    filename = format_date(current_time, CFG.PROCESSING_DATE_FORMAT)
                     previous_requested_hour = current_time.subtract(
                         hours=self.__previous_hour_delta__
                     )
 
-                    if published_min not in processed_days:
-                        try:
-                            processed_days.add(published_min)
-                            url = (
-                                "https://api.coned.com/gbc/v1/resource/Subscription/"
-                                f"{self._config.subscription_id}/UsagePoint/"
-                                f"{self._config.usage_point_id}/MeterReading/"
-                                f"{self._config.meter_reading_id}/IntervalBlock/"
-                                f"SP_{self._config.usage_point_id}_KWH%20"
-                                f"{self._config.interval}%20Minute%20Interval%20"
-                                "Read%20Interval"
-                            )
-                            parameters = {
-                                "publishedMin": published_min,
-                                "publishedMax": published_max,
-                            }
-
-                            meter_response = self._retry_request(
-                                url=url,
-                                parameters=parameters,
-                                headers=headers,
-                                method=HTTPRequestMethod.GET,
-                                request_payload_type=PayloadType.JSON,
-                                response_payload_type=PayloadType.TEXT,
-                                timeout=self.__request_timeout__,
-                            )
-                        except JBBRequestHelperException:
-                            self._logger.error(
-                                "No data from historical API for "
-                                f"{missed_hour}. Skipping..."
-                            )
-                            continue
-                        except UnxpectedBehavior:
-                            self._logger.error(
-                                "Cannot retieve meter data. See logs for the "
-                                "more information. Skipping..."
-                            )
-                            continue
-
-                    required_intervals = [
-                        math.floor(
-                            truncate(previous_requested_hour, level="hour").timestamp()
-                        )
-                    ]
+                    hour_start = math.floor(
+                        truncate(previous_requested_hour, level="hour").timestamp()
+                    )
                     interval = int(self._config.interval)
-                    for _ in range((60 // interval) - 1):
-                        required_intervals.append(
-                            required_intervals[-1] + (interval * 60)
-                        )
+                    required_intervals = range(
+                        hour_start,
+                        hour_start + (60 // interval) * interval * 60,
+                        interval * 60,
+                    )
+
+                    self._logger.info(list(required_intervals))
 
-                    self._logger.info(required_intervals)
-
-                    data_was_found = False
-
-                    # TODO: Rewrite as XPath
-                    root = ET.fromstring(meter_response)
-                    for item in root:
-                        if item.tag != "{http://www.w3.org/2005/Atom}entry":
-                            continue
-                        for item2 in item:
-                            if item2.tag != "{http://www.w3.org/2005/Atom}content":
-                                continue
-                            for item3 in item2:
-                                if item3.tag != "{http://naesb.org/espi}intervalBlocks":
-                                    continue
-                                for item4 in item3:
-                                    if (
-                                        item4.tag
-                                        != "{http://naesb.org/espi}intervalBlock"
-                                    ):
-                                        continue
-                                    for item5 in item4:
-                                        if (
-                                            item5.tag
-                                            == "{http://naesb.org/espi}intervalReading"
-                                        ):
-                                            current_value = None
-                                            applicable = False
-                                            for item6 in item5:
-                                                if (
-                                                    item6.tag
-                                                    == "{http://naesb.org/espi}value"
-                                                ):
-                                                    current_value = float(item6.text)
-                                                elif (
-                                                    item6.tag
-                                                    == "{http://naesb.org/espi}timePeriod"
-                                                ):
-                                                    for item7 in item6:
-                                                        if (
-                                                            item7.tag
-                                                            == "{http://naesb.org/espi}start"
-                                                        ) and (
-                                                            int(item7.text)
-                                                            in required_intervals
-                                                        ):
-                                                            applicable = True
-                                                            data_was_found = True
-                                            if applicable:
-                                                value += current_value
+                    data_was_found, value = get_hour_usage(
+                        interval_usage, required_intervals
+                    )
 
                     if data_was_found:
                         self._save_fetched_data(
@@ -351,7 +324,7 @@ class ConEdConnector(BasePullConnector):
                         )
 
                         stndrdzd_mtr_data = self._standardize_generic(
-                            data=None, getter=lambda x: value, mtr_cfg=mtr_cfg_json
+                            data=value, getter=lambda x: x, mtr_cfg=mtr_cfg_json
                         )
 
                         self._save_standardized_data(
@@ -0,0 +1,71 @@
+"""Streaming parser of ConEd Espi Atom feeds"""
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from io import BytesIO
+from typing import Dict, Iterable, Iterator, Tuple, Union
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ESPI_NS = "http://naesb.org/espi"
+
+# Path of IntervalReading elements below the feed root element
+INTERVAL_READING_PATH = (
+    f"{{{ATOM_NS}}}entry",
+    f"{{{ATOM_NS}}}content",
+    f"{{{ESPI_NS}}}intervalBlocks",
+    f"{{{ESPI_NS}}}intervalBlock",
+    f"{{{ESPI_NS}}}intervalReading",
+)
+VALUE_TAG = f"{{{ESPI_NS}}}value"
+START_PATH = f"{{{ESPI_NS}}}timePeriod/{{{ESPI_NS}}}start"
+
+
+def iter_interval_readings(feed: Union[str, bytes]) -> Iterator[Tuple[int, float]]:
+    """Yield start timestamp and value of each IntervalReading of the feed.
+
+    Elements are released as soon as they are parsed, so memory does not
+    grow with the amount of days in the feed.
+    """
+    if isinstance(feed, str):
+        feed = feed.encode("utf-8")
+
+    path = []
+    for event, elem in ET.iterparse(BytesIO(feed), events=("start", "end")):
+        if event == "start":
+            path.append(elem)
+            continue
+
+        if len(path) == len(INTERVAL_READING_PATH) + 1 and all(
+            parent.tag == tag for parent, tag in zip(path[1:], INTERVAL_READING_PATH)
+        ):
+            value = elem.findtext(VALUE_TAG)
+            start = elem.findtext(START_PATH)
+            if value is not None and start is not None:
+                yield int(start), float(value)
+
+        path.pop()
+        # Drop parsed elements, only the elements being built are kept
+        if path and len(path) <= len(INTERVAL_READING_PATH):
+            path[-1].remove(elem)
+
+
+def get_interval_usage(feed: Union[str, bytes]) -> Dict[int, float]:
+    """Sum readings of the feed by their interval start timestamp"""
+    usage = defaultdict(float)
+    for start, value in iter_interval_readings(feed):
+        usage[start] += value
+    return dict(usage)
+
+
+def get_hour_usage(
+    interval_usage: Dict[int, float], intervals: Iterable[int]
+) -> Tuple[bool, float]:
+    """Get usage of the hour consisting of the given intervals.
+
+    Returns whether any reading of the hour is present and the hour usage.
+    """
+    found, value = False, 0
+    for interval in intervals:
+        if interval in interval_usage:
+            found = True
+            value += interval_usage[interval]
+    return found, value
@@ -1,14 +1,12 @@
 """Integration used to load all Participant meta info like meter, properties
     and so on in DW.
 
-    MVP. At the moment contains simliest sync approach.
-    All operations run one by one without any paralelization approach.
-    This way used to provide first deliverable MVP asap. In next iteration code
-    below should be redesigned aith asyncio approarch.
+    Participant meters, properties, properties mappers and contact are staged
+    as a snapshot and applied with a few set-based MERGE statements of a single
+    transaction. Calendar and meters association rows are loaded in batches.
 """
 # pylint: disable=logging-fstring-interpolation
 # pylint: disable=too-many-lines
-import datetime as dt
 import hashlib
 import uuid
 from collections import defaultdict
@@ -17,12 +15,21 @@ from enum import Enum
 from json import dumps
 from operator import itemgetter
 from queue import Queue
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import holidays
+import polars as pl
 from dataclass_factory import Factory
 from google.api_core.exceptions import BadRequest
-from google.cloud.bigquery import Client
+from google.cloud.bigquery import (
+    ArrayQueryParameter,
+    Client,
+    QueryJobConfig,
+    ScalarQueryParameter,
+    ScalarQueryParameterType,
+    StructQueryParameter,
+    StructQueryParameterType,
+)
 from google.oauth2 import service_account
 from pendulum.datetime import DateTime
 
@@ -260,52 +267,60 @@ class DwUpdateConnector(BasePullConnector):
         "calendar",
     )
 
-    __meters_insert_rows_sql__ = """
-        INSERT INTO `{project}.standardized_new.meters`
+    # The whole participant snapshot is passed as array query parameters and
+    # applied by a single multi-statement transaction.
+    __participant_snapshot_sync_sql__ = """
+        BEGIN TRANSACTION;
+
+        MERGE `{project}.standardized_new.meters` AS trg
+        USING (SELECT * FROM UNNEST(@meters)) AS src
+        ON trg.ref_participant_id = src.ref_participant_id
+            AND trg.meter_id = src.meter_id
+        WHEN MATCHED THEN UPDATE SET
+            meter_uri = src.meter_uri,
+            type = src.type,
+            unitOfMeasure = src.unitOfMeasure,
+            updateFrequency = src.updateFrequency,
+            haystack = src.haystack
+        WHEN NOT MATCHED BY TARGET THEN INSERT
         (
            meter_id,
            meter_uri,
            ref_participant_id,
            type,
            unitOfMeasure,
-           updateFrequency, 
+           updateFrequency,
            haystack
         ) VALUES (
-            {meter_id}, 
-            '{meter_uri}', 
-            {ref_participant_id},
-            '{type}', 
-            '{unitOfMeasure}', 
-            '{updateFrequency}', 
-            '{haystack}'
-        );
-    """
-
-    __meters_delete_rows_sql__ = """
-        DELETE
-        FROM `{project}.standardized_new.meters`
-        WHERE ref_participant_id={participant_id};
-    """
-
-    __participant_insert_rows_sql__ = """
-        INSERT INTO `{project}.standardized_new.participants`
-        (
-           participant_id,
-           name
-        ) VALUES (
-           {participant_id},
-           '{name}'
-        );
-    """
-
-    __participant_delete_rows_sql__ = """
-        DELETE 
-        FROM `{project}.standardized_new.participants`
-        WHERE participant_id={participant_id};
-    """
-
-    __properties_insert_rows_sql__ = """
-        INSERT INTO `{project}.standardized_new.properties`
+            src.meter_id,
+            src.meter_uri,
+            src.ref_participant_id,
+            src.type,
+            src.unitOfMeasure,
+            src.updateFrequency,
+            src.haystack
+        )
+        WHEN NOT MATCHED BY SOURCE AND trg.ref_participant_id = @participant_id
+        THEN DELETE;
+
+        MERGE `{project}.standardized_new.properties` AS trg
+        USING (SELECT * FROM UNNEST(@properties)) AS src
+        ON trg.ref_participant_id = src.ref_participant_id
+            AND trg.property_id = src.property_id
+        WHEN MATCHED THEN UPDATE SET
+            ref_region_id = src.ref_region_id,
+            property_uri = src.property_uri,
+            name = src.name,
+            address1 = src.address1,
+            address2 = src.address2,
+            city = src.city,
+            country = src.country,
+            state = src.state,
+            postal_code = src.postal_code,
+            footage = src.footage,
+            footage_10_categories = src.footage_10_categories,
+            footage_3_categories = src.footage_3_categories
+        WHEN NOT MATCHED BY TARGET THEN INSERT
         (
            ref_region_id,
            property_id,
@@ -322,29 +337,124 @@ class DwUpdateConnector(BasePullConnector):
            footage_10_categories,
            footage_3_categories
         ) VALUES (
-           {ref_region_id},
-           {property_id},
-           '{property_uri}',
-           {ref_participant_id},
-           '{name}',
-           '{address1}',
-           '{address2}',
-           '{city}',
-           '{country}',
-           '{state}',
-           '{postal_code}',
-           {footage},
-           '{footage_10_categories}',
-           '{footage_3_categories}'
+           src.ref_region_id,
+           src.property_id,
+           src.property_uri,
+           src.ref_participant_id,
+           src.name,
+           src.address1,
+           src.address2,
+           src.city,
+           src.country,
+           src.state,
+           src.postal_code,
+           src.footage,
+           src.footage_10_categories,
+           src.footage_3_categories
+        )
+        WHEN NOT MATCHED BY SOURCE AND trg.ref_participant_id = @participant_id
+        THEN DELETE;
+
+        MERGE `{project}.standardized_new.properties_mapper` AS trg
+        USING (
+            SELECT mpr.ref_participant_id AS ref_participant_id,
+                mpr.ref_property_id AS ref_property_id,
+                mpr.property_hash AS property_hash,
+                ltr.name AS property_letter
+            FROM (
+                SELECT pm.*,
+                    ROW_NUMBER() OVER (ORDER BY pm.position) AS letter_idx
+                FROM UNNEST(@properties_mapper) AS pm
+                WHERE NOT EXISTS (
+                    SELECT 1
+                    FROM `{project}.standardized_new.properties_mapper` AS ex
+                    WHERE ex.ref_participant_id = pm.ref_participant_id
+                        AND ex.ref_property_id = pm.ref_property_id
+                        AND ex.property_hash = pm.property_hash
+                )
+            ) AS mpr
+            JOIN (
+                SELECT name,
+                    ROW_NUMBER() OVER (ORDER BY number ASC) AS letter_idx
+                FROM `{project}.standardized_new._number_letters_mapper`
+                WHERE name NOT IN (
+                    SELECT property_letter
+                    FROM `{project}.standardized_new.properties_mapper`
+                )
+            ) AS ltr ON mpr.letter_idx = ltr.letter_idx
+        ) AS src
+        ON trg.ref_participant_id = src.ref_participant_id
+            AND trg.ref_property_id = src.ref_property_id
+            AND trg.property_hash = src.property_hash
+        WHEN NOT MATCHED BY TARGET THEN INSERT
+        (
+            ref_participant_id,
+            ref_property_id,
+            property_hash,
+            property_letter
+        ) VALUES (
+            src.ref_participant_id,
+            src.ref_property_id,
+            src.property_hash,
+            src.property_letter
         );
-    """
 
-    __properties_delete_rows_sql__ = """
-        DELETE 
-        FROM `{project}.standardized_new.properties`
-        WHERE ref_participant_id={participant_id}
+        MERGE `{project}.standardized_new.participants` AS trg
+        USING (SELECT * FROM UNNEST(@participants)) AS src
+        ON trg.participant_id = src.participant_id
+        WHEN MATCHED THEN UPDATE SET name = src.name
+        WHEN NOT MATCHED BY TARGET THEN INSERT
+        (
+           participant_id,
+           name
+        ) VALUES (
+           src.participant_id,
+           src.name
+        )
+        WHEN NOT MATCHED BY SOURCE AND trg.participant_id = @participant_id
+        THEN DELETE;
+
+        COMMIT TRANSACTION;
     """
 
+    __meters_snapshot_fields__ = (
+        ("meter_id", "INT64"),
+        ("meter_uri", "STRING"),
+        ("ref_participant_id", "INT64"),
+        ("type", "STRING"),
+        ("unitOfMeasure", "STRING"),
+        ("updateFrequency", "STRING"),
+        ("haystack", "STRING"),
+    )
+
+    __properties_snapshot_fields__ = (
+        ("ref_region_id", "INT64"),
+        ("property_id", "INT64"),
+        ("property_uri", "STRING"),
+        ("ref_participant_id", "INT64"),
+        ("name", "STRING"),
+        ("address1", "STRING"),
+        ("address2", "STRING"),
+        ("city", "STRING"),
+        ("country", "STRING"),
+        ("state", "STRING"),
+        ("postal_code", "STRING"),
+        ("footage", "INT64"),
+        ("footage_10_categories", "STRING"),
+        ("footage_3_categories", "STRING"),
+    )
+
+    __properties_mapper_snapshot_fields__ = (
+        ("position", "INT64"),
+        ("ref_participant_id", "INT64"),
+        ("ref_property_id", "INT64"),
+        ("property_hash", "STRING"),
+    )
+
+    __participants_snapshot_fields__ = (
+        ("participant_id", "INT64"),
+        ("name", "STRING"),
+    )
     __calendar_get_latest_date__ = """
         SELECT cl.hour_id AS hour_id,
             cl.ref_region_id AS ref_region_id,
@@ -499,38 +609,6 @@ class DwUpdateConnector(BasePullConnector):
             AND ma.ref_participant_id=pt.ref_participant_id);
     """
 
-    __properties_mapper_get_row_query__ = """
-        SELECT * 
-        FROM `{project}.standardized_new.properties_mapper`
-        WHERE ref_participant_id={ref_participant_id}
-            AND ref_property_id={ref_property_id}
-            AND property_hash="{property_hash}"
-    """
-
-    __properties_mapper_get_letter_query__ = """
-        SELECT * 
-        FROM `{project}.standardized_new._number_letters_mapper` 
-        WHERE name not in (
-            SELECT property_letter FROM `{project}.standardized_new.properties_mapper`
-        ) 
-        ORDER BY number ASC LIMIT 1;    
-    """
-
-    __properties_mapper_insert_rows_query__ = """
-        INSERT INTO `{project}.standardized_new.properties_mapper`
-        (
-            ref_participant_id,
-            ref_property_id,
-            property_hash,
-            property_letter
-        ) VALUES (
-            {ref_participant_id},
-            {ref_property_id},
-            '{property_hash}',
-            '{property_letter}'
-        );
-    """
-
     __participant_meters_keys__ = (
         "type",
         "meter_id",
@@ -745,9 +823,15 @@ class DwUpdateConnector(BasePullConnector):
         return Client(credentials=credentials)
 
     @retry(BadRequest)
-    def _db_run_query(self, connection: Client, query: str) -> None:
+    def _db_run_query(
+        self,
+        connection: Client,
+        query: str,
+        query_parameters: Optional[List[Any]] = None,
+    ) -> None:
         query_str = self.__format_query_string(query)
-        query = connection.query(query_str)
+        job_config = QueryJobConfig(query_parameters=query_parameters or [])
+        query = connection.query(query_str, job_config=job_config)
         res = query.result()
         return res
 
@@ -756,53 +840,6 @@ class DwUpdateConnector(BasePullConnector):
         parts = map(str.strip, query.split("\n"))
         return " ".join(parts).strip()
 
-    def _delete_participant_rows(self, connection: Client) -> None:
-        with elapsed_timer() as elapsed:
-            self._logger.debug("Starting properties rows deletion.")
-
-            query = self.__participant_delete_rows_sql__.format(
-                project=CFG.PROJECT, participant_id=self._extra_info.participant_id
-            )
-            self._db_run_query(connection=connection, query=query)
-            if self._participant_info.contact is None:
-                self._logger.error(
-                    "Can not delete participant rows due to absent contact in "
-                    "configuration.",
-                )
-
-            self._logger.debug(
-                "Deleted participant rows.",
-                extra={
-                    "labels": {
-                        "elapsed_time": elapsed(),
-                    },
-                },
-            )
-
-    def _insert_participant_data(self, connection: Client) -> None:
-        with elapsed_timer() as elapsed:
-            self._logger.debug("Starting participant processing.")
-
-            if self._participant_info.contact is not None:
-                query = self.__participant_insert_rows_sql__.format(
-                    project=CFG.PROJECT,
-                    participant_id=self._extra_info.participant_id,
-                    name=self._participant_info.contact.name,
-                )
-
-                self._db_run_query(connection=connection, query=query)
-            else:
-                self._logger.debug("Absent Contact configuration.")
-
-            self._logger.debug(
-                "Completed participant processing.",
-                extra={
-                    "labels": {
-                        "elapsed_time": elapsed(),
-                    },
-                },
-            )
-
     def _get_regions(self, connection: Client) -> Dict[int, Region]:
         with elapsed_timer() as elapsed:
             self._logger.debug("Start fetching region ids.")
@@ -860,46 +897,102 @@ class DwUpdateConnector(BasePullConnector):
 
             return result
 
+    @staticmethod
+    def __get_names_frame(
+        column: str, dates: Dict[int, DateTime], name_format: str, abbr_format: str
+    ) -> pl.DataFrame:
+        return pl.DataFrame(
+            {
+                column: list(dates.keys()),
+                f"{column}_name": [x.format(name_format) for x in dates.values()],
+                f"{column}_name_abbr": [x.format(abbr_format) for x in dates.values()],
+            },
+            schema={
+                column: pl.Int64,
+                f"{column}_name": pl.Utf8,
+                f"{column}_name_abbr": pl.Utf8,
+            },
+        )
+
     def __generate_calendar_rows(
         self, start_date: DateTime, end_date: DateTime, rg_inf: Region
-    ) -> List:
+    ) -> List[Dict[str, Any]]:
+        """Generate calendar rows of the hours from start to end date inclusive.
+
+        Rows are built as columns, holidays are resolved once per year.
+        """
         with elapsed_timer() as elapsed:
             self._logger.debug("Generate absent rows.", extra={"type": "Calendar"})
-            dt_range = date_range(
-                start_date=start_date, end_date=end_date, range_unit="hours"
+            cnt_holidays = holidays.country_holidays(
+                rg_inf.country, years=range(start_date.year, end_date.year + 1)
             )
+            holiday_ids = [
+                day.year * 10000 + day.month * 100 + day.day
+                for day in cnt_holidays.keys()
+            ]
 
-            result = []
-            cnt_holidays = holidays.country_holidays(rg_inf.country)
-
-            for date in dt_range:
-                dt_utc = date.in_tz("UTC")
+            month_names = self.__get_names_frame(
+                "month", {x: DateTime(2000, x, 1) for x in range(1, 13)}, "MMMM", "MMM"
+            )
+            # Calendar keeps pendulum day of week minus one, so Sunday is -1.
+            # 2000-01-03 is Monday.
+            dow_names = self.__get_names_frame(
+                "dow", {x % 7 - 1: DateTime(2000, 1, 2 + x) for x in range(1, 8)},
+                "dddd",
+                "ddd",
+            )
 
-                dt_holiday = dt.date(
-                    date.year,
-                    date.month,
-                    date.day,
+            dt_utc = pl.col("dt_utc")
+            dt_local = dt_utc.dt.convert_time_zone(rg_inf.timezone)
+            frame = (
+                pl.DataFrame(
+                    [
+                        pl.arange(
+                            int(start_date.timestamp()),
+                            int(end_date.timestamp()) + 1,
+                            3600,
+                            eager=True,
+                        ).alias("timestamp")
+                    ]
                 )
-
-                is_holiday = bool(cnt_holidays.get(dt_holiday))
-
-                result.append(
-                    CalendarRow(
-                        hour_id=int(format_date(dt_utc, "YYYYMMDDHH")),
-                        year=dt_utc.year,
-                        day=dt_utc.day_of_year,
-                        date=dt_utc.day,
-                        month=dt_utc.month,
-                        hour=dt_utc.hour,
-                        dow=dt_utc.day_of_week - 1,
-                        working_day=not is_holiday,
-                        month_name=format_date(dt_utc, "MMMM"),
-                        month_name_abbr=format_date(dt_utc, "MMM"),
-                        dow_name=format_date(dt_utc, "dddd"),
-                        dow_name_abbr=format_date(dt_utc, "ddd"),
-                        ref_region_id=rg_inf.region_id,
-                    )
+                .lazy()
+                .with_columns(
+                    pl.from_epoch("timestamp", unit="s")
+                    .dt.replace_time_zone("UTC")
+                    .alias("dt_utc")
                 )
+                .with_columns(
+                    [
+                        dt_utc.dt.year().cast(pl.Int64).alias("year"),
+                        dt_utc.dt.ordinal_day().cast(pl.Int64).alias("day"),
+                        dt_utc.dt.day().cast(pl.Int64).alias("date"),
+                        dt_utc.dt.month().cast(pl.Int64).alias("month"),
+                        dt_utc.dt.hour().cast(pl.Int64).alias("hour"),
+                        (dt_utc.dt.weekday().cast(pl.Int64) % 7 - 1).alias("dow"),
+                        ~(
+                            dt_local.dt.year().cast(pl.Int64) * 10000
+                            + dt_local.dt.month().cast(pl.Int64) * 100
+                            + dt_local.dt.day().cast(pl.Int64)
+                        )
+                        .is_in(holiday_ids)
+                        .alias("working_day"),
+                        pl.lit(rg_inf.region_id).cast(pl.Int64).alias("ref_region_id"),
+                    ]
+                )
+                .with_columns(
+                    (
+                        pl.col("year") * 1000000
+                        + pl.col("month") * 10000
+                        + pl.col("date") * 100
+                        + pl.col("hour")
+                    ).alias("hour_id")
+                )
+                .join(month_names.lazy(), on="month", how="left")
+                .join(dow_names.lazy(), on="dow", how="left")
+                .sort("timestamp")
+                .select([x.name for x in fields(CalendarRow)])
+                .collect()
+            )
 
             self._logger.debug(
                 "Generate absent rows.",
@@ -907,10 +1000,11 @@ class DwUpdateConnector(BasePullConnector):
                     "type": "Calendar",
                     "labels": {
                         "elapsed_time": elapsed(),
+                        "rows": frame.height,
                     },
                 },
             )
-            return result
+            return frame.to_dicts()
 
     def _update_calendar(self, connection: Client) -> None:
         regions = self._get_regions(connection)
@@ -927,7 +1021,7 @@ class DwUpdateConnector(BasePullConnector):
             active_regions = st_rg_ids.intersection(exist_ids)
 
             if new_regions:
-                for region_id in regions:
+                for region_id in new_regions:
                     region = regions.get(region_id, None)
                     if not region:
                         self._logger.error(
@@ -965,10 +1059,13 @@ class DwUpdateConnector(BasePullConnector):
                         self._run_time.in_tz(region.timezone), level="hour"
                     )
                     for row in calendar.get(region_id, []):
-                        start_date = parse(
-                            str(row.hour_id), "YYYYMMDDHH", tz_info="UTC"
-                        ).in_tz(region.timezone)
-                        if start_date >= end_date:
+                        # Only hours after the latest one in the table are added.
+                        start_date = (
+                            parse(str(row.hour_id), "YYYYMMDDHH", tz_info="UTC")
+                            .in_tz(region.timezone)
+                            .add(hours=1)
+                        )
+                        if start_date > end_date:
                             self._logger.debug(
                                 f"The Region {region_id} is up to date. Skipping",
                             )
@@ -983,7 +1080,7 @@ class DwUpdateConnector(BasePullConnector):
             if rows:
                 insert_json_data(
                     connection=connection,
-                    json_rows=self._factory.dump(rows),
+                    json_rows=rows,
                     full_table_id=f"{CFG.PROJECT}.standardized_new.calendar",
                     schema=CALENDAR_SCHEMA,
                     max_worker_replica=5,
@@ -1190,193 +1287,178 @@ class DwUpdateConnector(BasePullConnector):
                 extra={"lebels": {"elapsed_time": elapsed()}},
             )
 
-    def _delete_properties_rows(self, connection: Client) -> None:
-        with elapsed_timer() as elapsed:
-            self._logger.debug("Deleting properties rows")
-            query = self.__properties_delete_rows_sql__.format(
-                project=CFG.PROJECT, participant_id=self._extra_info.participant_id
-            )
-            self._db_run_query(connection=connection, query=query)
-            if self._participant_info.properties is None:
-                self._logger.debug(
-                    "Can not delete properties rows due to absent properties "
-                    "configuration.",
-                )
+    def _get_meters_snapshot(self) -> List[Dict[str, Any]]:
+        rows = {}
+        if self._participant_info.connectors is None:
+            self._logger.error("Absent Connectors configuration.")
+            return []
 
-            self._logger.debug(
-                "Deleted properties rows.",
-                extra={"lebels": {"elapsed_time": elapsed()}},
-            )
+        for connector in self._participant_info.connectors:
+            for meter_name, meter in (connector.meters or {}).items():
+                if meter.meter_id in rows:
+                    self._logger.warning(
+                        "Found duplication meter info in meter "
+                        f"{meter_name} of connector {connector.function}. "
+                        "Skiping ",
+                    )
+                    continue
+
+                rows[meter.meter_id] = {
+                    "meter_id": meter.meter_id,
+                    "meter_uri": meter.meter_uri,
+                    "ref_participant_id": self._extra_info.participant_id,
+                    "type": meter.type,
+                    "unitOfMeasure": meter.unitOfMeasure,
+                    "updateFrequency": meter.updateFrequency,
+                    "haystack": ", ".join(set(meter.tags["ids"])),
+                }
+        return list(rows.values())
 
-    def _insert_properties_data(self, connection: Client) -> None:
-        with elapsed_timer() as elapsed:
-            self._logger.debug("Processing properties")
+    def _get_properties_snapshot(self) -> List[Dict[str, Any]]:
+        rows = {}
+        for m_property in self._participant_info.properties.values():
+            general_info = m_property.general_info
+            if general_info.property_id in rows:
+                self._logger.warning(
+                    "Found duplication property info "
+                    f"{self._extra_info.participant_id}. participant. "
+                    "Skiping",
+                )
+                continue
+
+            rows[general_info.property_id] = {
+                "ref_region_id": 0,  # TODO: Should be fixed after three
+                # months probation period.
+                "property_id": general_info.property_id,
+                "property_uri": general_info.propertyURI,
+                "ref_participant_id": self._extra_info.participant_id,
+                "name": general_info.name,
+                "address1": general_info.address.address1,
+                "address2": general_info.address.address2,
+                "city": general_info.address.city,
+                "country": general_info.address.country,
+                "state": general_info.address.state,
+                "postal_code": general_info.address.postalCode,
+                "footage": int(general_info.grossFloorArea.value),
+                "footage_10_categories": "0",
+                "footage_3_categories": "0",
+            }
+        return list(rows.values())
+
+    def _get_properties_mapper_snapshot(self) -> List[Dict[str, Any]]:
+        rows = {}
+        for m_property in self._participant_info.properties.values():
+            general_info = m_property.general_info
+            key = (
+                general_info.property_id,
+                str(self.get_unique_id(general_info.name)),
+            )
+            # The position keeps the letters assignment order of properties
+            rows.setdefault(
+                key,
+                {
+                    "position": len(rows),
+                    "ref_participant_id": self._extra_info.participant_id,
+                    "ref_property_id": key[0],
+                    "property_hash": key[1],
+                },
+            )
+        return list(rows.values())
 
-            deduplication_check = set()
-            count = 0
+    def _get_participants_snapshot(self) -> List[Dict[str, Any]]:
+        if self._participant_info.contact is None:
+            self._logger.error("Absent Contact configuration.")
+            return []
 
-            if self._participant_info.properties is not None:
-                properties = self._participant_info.properties.items()
-                for property_name, m_property in properties:
-                    self._logger.debug(f"Processing '{property_name}' property.")
+        return [
+            {
+                "participant_id": self._extra_info.participant_id,
+                "name": self._participant_info.contact.name,
+            }
+        ]
 
-                    query = self.__properties_insert_rows_sql__.format(
-                        project=CFG.PROJECT,
-                        ref_region_id=0,  # TODO: Should be fixed after three
-                        # months probation period.
-                        property_id=m_property.general_info.property_id,
-                        property_uri=m_property.general_info.propertyURI,
-                        ref_participant_id=self._extra_info.participant_id,
-                        name=m_property.general_info.name,
-                        address1=m_property.general_info.address.address1,
-                        address2=m_property.general_info.address.address2,
-                        city=m_property.general_info.address.city,
-                        country=m_property.general_info.address.country,
-                        state=m_property.general_info.address.state,
-                        postal_code=m_property.general_info.address.postalCode,
-                        footage=m_property.general_info.grossFloorArea.value,
-                        footage_10_categories=0,
-                        footage_3_categories=0,
-                    )
+    @staticmethod
+    def __get_snapshot_parameter(
+        name: str, snapshot_fields: Tuple[Tuple[str, str], ...], rows: List[Dict]
+    ) -> ArrayQueryParameter:
+        return ArrayQueryParameter(
+            name,
+            StructQueryParameterType(
+                *(
+                    ScalarQueryParameterType(fl_type, name=fl_name)
+                    for fl_name, fl_type in snapshot_fields
+                )
+            ),
+            [
+                StructQueryParameter(
+                    None,
+                    *(
+                        ScalarQueryParameter(fl_name, fl_type, row[fl_name])
+                        for fl_name, fl_type in snapshot_fields
+                    ),
+                )
+                for row in rows
+            ],
+        )
 
-                    if query in deduplication_check:
-                        self._logger.warning(
-                            "Found duplication property info "
-                            f"{self._extra_info.participant_id}. participant. "
-                            "Skiping",
-                        )
-                        continue
-                    deduplication_check.add(query)
+    def _sync_participant_snapshot(self, connection: Client) -> None:
+        with elapsed_timer() as elapsed:
+            self._logger.debug("Starting participant snapshot sync.")
 
-                    self._db_run_query(connection=connection, query=query)
-                    count += 1
-            else:
+            if self._participant_info.properties is None:
+                self._participant_info.properties = {}
                 self._logger.error("Absent Properties configuration.")
 
-            self._logger.debug(
-                f"Completed properties processing. Processed {count} properties.",
-                extra={"labels": {"elapsed_time": elapsed()}},
-            )
+            snapshot = {
+                "meters": (
+                    self.__meters_snapshot_fields__,
+                    self._get_meters_snapshot(),
+                ),
+                "properties": (
+                    self.__properties_snapshot_fields__,
+                    self._get_properties_snapshot(),
+                ),
+                "properties_mapper": (
+                    self.__properties_mapper_snapshot_fields__,
+                    self._get_properties_mapper_snapshot(),
+                ),
+                "participants": (
+                    self.__participants_snapshot_fields__,
+                    self._get_participants_snapshot(),
+                ),
+            }
 
-    def _upsert_properties_mapper_data(self, connection: Client) -> None:
-        # TODO: Refactor to use parallel operations
-        # TODO: Add duplicates check
-        with elapsed_timer() as elapsed:
-            ref_participant_id = self._extra_info.participant_id
-            self._logger.debug(
-                f"Processing '{ref_participant_id}' participant's properties mappers"
+            query_parameters = [
+                ScalarQueryParameter(
+                    "participant_id", "INT64", self._extra_info.participant_id
+                )
+            ]
+            query_parameters.extend(
+                self.__get_snapshot_parameter(name, snapshot_fields, rows)
+                for name, (snapshot_fields, rows) in snapshot.items()
             )
-            if self._participant_info.properties is not None:
-                properties = self._participant_info.properties.items()
 
-                for property_name, m_property in properties:
-                    self._logger.debug(f"Processing '{property_name}' property.")
-
-                    ref_property_id = m_property.general_info.property_id
-                    property_name = m_property.general_info.name
-                    property_hash = str(self.get_unique_id(property_name))
-
-                    # check if letter already present in mapper
-                    # key is ref_participant_id, ref_property_id property_hash
-                    query = self.__properties_mapper_get_row_query__.format(
-                        project=CFG.PROJECT,
-                        ref_participant_id=ref_participant_id,
-                        ref_property_id=ref_property_id,
-                        property_hash=property_hash,
-                    )
+            self._db_run_query(
+                connection=connection,
+                query=self.__participant_snapshot_sync_sql__.format(
+                    project=CFG.PROJECT
+                ),
+                query_parameters=query_parameters,
+            )
 
-                    rows = list(self._db_run_query(connection, query=query))
-                    rows = list(map(dict, rows))
-                    if not rows:
-                        query = self.__properties_mapper_get_letter_query__.format(
-                            project=CFG.PROJECT
-                        )
-                        rows = list(self._db_run_query(connection, query=query))
-                        rows = list(map(dict, rows))
-                        property_letter = rows[0]["name"]
-
-                        query = self.__properties_mapper_insert_rows_query__.format(
-                            project=CFG.PROJECT,
-                            ref_participant_id=ref_participant_id,
-                            ref_property_id=ref_property_id,
-                            property_hash=property_hash,
-                            property_letter=property_letter,
-                        )
-                        self._db_run_query(connection, query=query)
-                    else:
-                        self._logger.warning(
-                            f"The property '{property_name}' already contain "
-                            "assigned letter"
-                        )
-                    self._logger.debug(
-                        f"Completed property '{property_name}' processing."
-                    )
             self._logger.debug(
-                f"Completed '{ref_participant_id}' participant's "
-                "properties mappers processing",
+                "Completed participant snapshot sync.",
                 extra={
                     "labels": {
-                        "elapsed time": elapsed(),
+                        "elapsed_time": elapsed(),
+                        **{
+                            f"{name}_rows": len(rows)
+                            for name, (_, rows) in snapshot.items()
+                        },
                     }
                 },
             )
 
-    def _delete_meters_rows(self, connection: Client) -> None:
-        with elapsed_timer() as elapsed:
-            self._logger.debug("Starting meters rows deletion.")
-
-            query = self.__meters_delete_rows_sql__.format(
-                project=CFG.PROJECT, participant_id=self._extra_info.participant_id
-            )
-            self._db_run_query(connection=connection, query=query)
-            self._logger.debug(
-                "Deleted meter rows fot the participant "
-                f"#{self._extra_info.participant_id}.",
-                extra={"labels": {"elapsed_timer": elapsed()}},
-            )
-
-    def _insert_meters(self, connection: Client) -> None:
-        with elapsed_timer() as elapsed:
-            self._logger.debug("Starting meters processing.")
-            deduplication_check = set()
-            count = 0
-            if self._participant_info.connectors is None:
-                self._logger.error("Absent Connectors configuration. Exit")
-
-            for connector in self._participant_info.connectors:
-                self._logger.debug(f"Starting {connector.function} processing.")
-                for meter_name, meter in connector.meters.items():
-                    self._logger.debug(f"Starting {meter_name} processing.")
-
-                    query = self.__meters_insert_rows_sql__.format(
-                        project=CFG.PROJECT,
-                        meter_id=meter.meter_id,
-                        meter_uri=meter.meter_uri,
-                        ref_participant_id=self._extra_info.participant_id,
-                        type=meter.type,
-                        unitOfMeasure=meter.unitOfMeasure,
-                        updateFrequency=meter.updateFrequency,
-                        haystack=", ".join(set(meter.tags["ids"])),
-                    )
-
-                    if query in deduplication_check:
-                        self._logger.warning(
-                            "Found duplication meter info in meter "
-                            f"{meter_name} of connector {connector.function}. "
-                            "Skiping ",
-                        )
-                        continue
-                    deduplication_check.add(query)
-
-                    self._db_run_query(connection=connection, query=query)
-                    count += 1
-                self._logger.debug(f"Completed {connector.function} processing.")
-
-            self._logger.debug(
-                f"Completed meters processing. Processed {count} meters.",
-                extra={"labels": {"elapsed_time": elapsed()}},
-            )
-
     def __delete_orphan_meters_association(
         self, check_query: str, delete_query: str, orphan_type: str, connection: Client
     ) -> None:
@@ -1442,16 +1524,7 @@ class DwUpdateConnector(BasePullConnector):
             action_scope = self._extra_info.scope
 
             if action_scope == ScopeUpdate.full:
-                self._delete_meters_rows(dw_connection)
-                self._insert_meters(dw_connection)
-
-                self._delete_properties_rows(dw_connection)
-                self._insert_properties_data(dw_connection)
-                self._upsert_properties_mapper_data(dw_connection)
-
-                self._delete_participant_rows(dw_connection)
-                self._insert_participant_data(dw_connection)
-
+                self._sync_participant_snapshot(dw_connection)
                 self._upsert_meters_association_data(dw_connection)
             elif action_scope == ScopeUpdate.update:
                 self._upsert_meters_association_data(dw_connection)
@@ -1,13 +1,17 @@
 """Integration used to load all standardized data into Data Warehouse"""
 import base64
 import uuid
+from io import BytesIO
 from json import JSONDecodeError, dumps
 from queue import Queue
-from time import time
+from time import sleep
 from typing import Any, Dict, List, Optional
 
+import polars as pl
 from dataclass_factory import Factory
+from google.api_core.client_options import ClientOptions
 from google.api_core.exceptions import BadRequest, Forbidden, NotFound
+from google.auth.credentials import AnonymousCredentials
 from google.cloud.bigquery import (
     Client,
     LoadJobConfig,
@@ -18,7 +22,6 @@ from google.cloud.bigquery import (
 )
 from google.oauth2 import service_account
 from googleapiclient.errors import HttpError
-from pandas import DataFrame
 
 from common import settings as CFG
 from common.db_helper import get_db_connection
@@ -65,6 +68,13 @@ class DwLoadConnector(BasePullConnector):
         UPDATE SET data = dt_src.data
     """
     __data_primary_key__ = ["ref_hour_id", "ref_meter_id", "ref_participant_id"]
+    __data_schema__ = {
+        "ref_hour_id": pl.Int64,
+        "ref_participant_id": pl.Int64,
+        "ref_meter_id": pl.Int64,
+        "data": pl.Float64,
+    }
+    __source_format__ = CFG.DW_LOAD_SOURCE_FORMAT.strip().upper()
 
     def __init__(self, env_tz_info):
         super().__init__(env_tz_info=env_tz_info)
@@ -117,6 +127,12 @@ class DwLoadConnector(BasePullConnector):
 
     @staticmethod
     def _get_connection() -> Client:
+        if CFG.BIGQUERY_EMULATOR_HOST:
+            return Client(
+                project=CFG.PROJECT,
+                client_options=ClientOptions(api_endpoint=CFG.BIGQUERY_EMULATOR_HOST),
+                credentials=AnonymousCredentials(),
+            )
         if not LOCAL_RUN:
             return Client()
         credentials = service_account.Credentials.from_service_account_file(SECRET_PATH)
@@ -205,54 +221,77 @@ class DwLoadConnector(BasePullConnector):
         table = Table(self._temp_tbl_id, schema=self._meter_data_tbl_schema)
         client.delete_table(table, not_found_ok=True)
 
-    def _get_data_rows(self) -> List[Dict[str, Any]]:
+    def _get_data_frame(self) -> pl.DataFrame:
         if self._update_data_q is None or self._update_data_q.empty():
             self._logger.warning("Update data does not exists or empty. Skip.")
-            return []
+            return pl.DataFrame(schema=self.__data_schema__)
 
-        rec_df = DataFrame.from_records(list(self._update_data_q.queue))
-        rec_raw_cnt = len(rec_df)
+        rec_df = pl.concat(
+            [
+                pl.from_dicts(batch, schema=self.__data_schema__)
+                for batch in self._update_data_q.queue
+                if batch
+            ]
+            or [pl.DataFrame(schema=self.__data_schema__)],
+            how="vertical",
+        )
+        rec_raw_cnt = rec_df.height
         self._logger.debug(f"Found a '{rec_raw_cnt}' records for loading.")
 
-        rec_df.drop_duplicates(subset=self.__data_primary_key__, inplace=True)
+        rec_df = rec_df.unique(
+            subset=self.__data_primary_key__, keep="first", maintain_order=True
+        )
 
-        rec_cnt = len(rec_df)
+        rec_cnt = rec_df.height
 
         self._logger.debug(f"Removed '{rec_raw_cnt - rec_cnt}' dublicate records.")
 
-        return rec_df.to_dict("records")
+        return rec_df
+
+    def _get_data_rows(self) -> List[Dict[str, Any]]:
+        return self._get_data_frame().to_dicts()
+
+    def _load_data_frame(self, client: Client, data_frame: pl.DataFrame) -> int:
+        job_config = LoadJobConfig()
+        job_config.schema = self._meter_data_tbl_schema
+
+        if self.__source_format__ == SourceFormat.PARQUET:
+            job_config.source_format = SourceFormat.PARQUET
+            parquet_data = BytesIO()
+            data_frame.write_parquet(parquet_data, compression="snappy")
+            job = client.load_table_from_file(
+                parquet_data, self._temp_tbl_id, job_config=job_config, rewind=True
+            )
+        else:
+            job_config.source_format = SourceFormat.NEWLINE_DELIMITED_JSON
+            job = client.load_table_from_json(
+                data_frame.to_dicts(), self._temp_tbl_id, job_config=job_config
+            )
+        return job.result().output_rows
 
     def _insert_updates_in_dw(self, client: Client) -> int:
         self._logger.info("Loading data in the DataWarehouse.")
-        rows = self._get_data_rows()
+        data_frame = self._get_data_frame()
 
-        if not rows:
+        if data_frame.is_empty():
             self._logger.warning("Update data does not exists or empty. Skip.")
             return 0
 
         self._create_temporary_table(client=client)
 
-        job_config = LoadJobConfig()
-        job_config.source_format = SourceFormat.NEWLINE_DELIMITED_JSON
-        job_config.schema = self._meter_data_tbl_schema
-
         retry_count, delay = 0, self.__retry_delay__
 
         while retry_count < self.__max_retry_count__:
 
             try:
-                job = client.load_table_from_json(
-                    rows, self._temp_tbl_id, job_config=job_config
-                )
-                res = job.result()
-                return res.output_rows
+                return self._load_data_frame(client=client, data_frame=data_frame)
             except (BadRequest, Forbidden, NotFound, HttpError) as err:
                 retry_count += 1
                 delay *= retry_count
-                time.sleep(delay)
+                sleep(delay)
                 self._logger.error(
-                    f"Failed json data insertion  due to the error '{err}'"
-                    f"Retrying in {delay} seconds..."
+                    f"Failed {self.__source_format__} data insertion due to the "
+                    f"error '{err}'. Retrying in {delay} seconds..."
                 )
             else:
                 # TODO: Try to use clear_queue methid here
@@ -12,17 +12,21 @@ import base64
 import logging
 from dataclasses import dataclass, field
 from json import dumps, loads
+from typing import List
 
 from google.api_core.exceptions import BadRequest
 from google.cloud.exceptions import GoogleCloudError
+from polars.exceptions import ComputeError
 
 from common import settings as CFG
-from common.bucket_helpers import list_blobs_with_prefix, move_blob
+from common.bucket_helpers import get_blob_contents, list_blobs_with_prefix, move_blob
 from common.data_representation.config import XmlTypeException, ConfigException
 from common.data_representation.standardized.meter import Meter as MeterValue, StandardizedMeterException
 from common.date_utils import format_date
 from common.db_helper import get_db_connection
 from common.elapsed_time import elapsed_timer
+from common.packed_format import get_packed_format
+from common.packed_format import loads as packed_loads
 from common.request_helpers import retry
 from common.sql_templates import generate_insert_sql_meters_data
 from integration.base_integration import (
@@ -184,7 +188,7 @@ class DwLoadConnector(BasePullConnector):
             updt.meta_info.storage.bucket = meter_config.storage.bucket
             updt.meta_info.storage.path = mtr_path
 
-            raw_data = self._load_json_data(
+            raw_data = self._load_update_manifest(
                 bucket=updt.meta_info.storage.bucket,
                 path=updt.meta_info.storage.path,
                 filename=updt.meta_info.filename,
@@ -261,6 +265,36 @@ class DwLoadConnector(BasePullConnector):
             ),
         )
 
+    @staticmethod
+    def _read_meter_values(blk_fl: FileInfo) -> List[MeterValue]:
+        """Read meter values of the standardized file, every hour of packed files"""
+        st_format = get_packed_format(blk_fl.filename)
+        if st_format is None:
+            meter_data = MeterValue()
+            meter_data.read_from_bucket(
+                bucket=blk_fl.storage.bucket,
+                subdirectory=blk_fl.storage.path,
+                filename=blk_fl.filename,
+                binary_mode=False,
+            )
+            return [meter_data]
+
+        data = get_blob_contents(
+            bucket_name=blk_fl.storage.bucket,
+            blob_path=f'{blk_fl.storage.path.strip("/")}/{blk_fl.filename}',
+        )
+        try:
+            frame = packed_loads(data, st_format)
+        except (OSError, ComputeError) as err:
+            raise StandardizedMeterException(err) from err
+
+        meter_values = []
+        for row in frame.iter_rows(named=True):
+            meter_data = MeterValue()
+            meter_data.parse_packed_row(row)
+            meter_values.append(meter_data)
+        return meter_values
+
     def _process_new_standardized_files(self) -> None:
         if not self._updates_bucket.updates:
             logging.warning(
@@ -281,14 +315,8 @@ class DwLoadConnector(BasePullConnector):
                     f"{blk_fl.filename}"
                 )
 
-                meter_data = MeterValue()
                 try:
-                    meter_data.read_from_bucket(
-                        bucket=blk_fl.storage.bucket,
-                        subdirectory=blk_fl.storage.path,
-                        filename=blk_fl.filename,
-                        binary_mode=False,
-                    )
+                    meter_values = self._read_meter_values(blk_fl)
                 except (
                     StandardizedMeterException,
                     XmlTypeException,
@@ -301,39 +329,40 @@ class DwLoadConnector(BasePullConnector):
                     )
                     continue
 
-                logging.debug("meter_data.meter_uri", meter_data.meter_uri)
-                logging.debug("mtr_cfg.meter_uri", mtr_cfg.meter_uri)
-
-                if meter_data.meter_uri != mtr_cfg.meter_uri:
-                    logging.warning(
-                        f"WARNING: {self.__description__}: "
-                        f"Meter uri {meter_data.meter_uri} found in the file "
-                        f"{blk_fl.storage.bucket}/{blk_fl.storage.path}"
-                        f"does not equal to uri in correponded meter configuration."
-                        f"{mtr_cfg.meter_uri}. Replacing"
+                for meter_data in meter_values:
+                    logging.debug("meter_data.meter_uri", meter_data.meter_uri)
+                    logging.debug("mtr_cfg.meter_uri", mtr_cfg.meter_uri)
+
+                    if meter_data.meter_uri != mtr_cfg.meter_uri:
+                        logging.warning(
+                            f"WARNING: {self.__description__}: "
+                            f"Meter uri {meter_data.meter_uri} found in the file "
+                            f"{blk_fl.storage.bucket}/{blk_fl.storage.path}"
+                            f"does not equal to uri in correponded meter configuration."
+                            f"{mtr_cfg.meter_uri}. Replacing"
+                        )
+                        meter_data.meter_uri = mtr_cfg.meter_uri
+
+                    logging.debug(
+                        f"DEBUG: {self.__description__}: Completed processing standardized file "
+                        f"{blk_fl.storage.bucket}/{blk_fl.storage.path}/"
+                        f"{blk_fl.filename}"
                     )
-                    meter_data.meter_uri = mtr_cfg.meter_uri
-
-                logging.debug(
-                    f"DEBUG: {self.__description__}: Completed processing standardized file "
-                    f"{blk_fl.storage.bucket}/{blk_fl.storage.path}/"
-                    f"{blk_fl.filename}"
-                )
 
-                logging.debug(
-                    f"DEBUG: {self.__description__}: Start db loading of procesed data from "
-                    f"{blk_fl.storage.bucket}/{blk_fl.storage.path}/"
-                    f"{blk_fl.filename}"
-                )
-                self._db_load(
-                    connection=dw_connection,
-                    data=meter_data,
-                )
-                logging.debug(
-                    f"DEBUG: {self.__description__}: Completed db loading of procesed data from "
-                    f"{blk_fl.storage.bucket}/{blk_fl.storage.path}/"
-                    f"{blk_fl.filename}"
-                )
+                    logging.debug(
+                        f"DEBUG: {self.__description__}: Start db loading of procesed data from "
+                        f"{blk_fl.storage.bucket}/{blk_fl.storage.path}/"
+                        f"{blk_fl.filename}"
+                    )
+                    self._db_load(
+                        connection=dw_connection,
+                        data=meter_data,
+                    )
+                    logging.debug(
+                        f"DEBUG: {self.__description__}: Completed db loading of procesed data from "
+                        f"{blk_fl.storage.bucket}/{blk_fl.storage.path}/"
+                        f"{blk_fl.filename}"
+                    )
             self._move_to_processed(updt_file=updt_bulk.meta_info)
         dw_connection.close()
 
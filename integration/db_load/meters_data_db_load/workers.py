@@ -14,7 +14,8 @@ from pendulum import DateTime
 from common import settings as CFG
 from common.bucket_helpers import list_blobs_with_prefix, move_blob, require_client
 from common.logging import Logger, ThreadPoolExecutorLogger
-from integration.base_integration import BaseWorker
+from common.update_manifest import load_manifest
+from integration.base_integration import BaseWorker, consumes
 from integration.db_load.meters_data_db_load.data_structures import FileIno
 
 LOAD_UPDATES_FILES_PARALLEL = True
@@ -31,7 +32,6 @@ class LoadUpdatesFilesWorker(BaseWorker):
 
     __update_prefix__ = CFG.UPDATE_PREFIX
     __update_filename_preffix_tmpl__ = CFG.UPDATE_FILENAME_PREFFIX_TMPL
-    __max_idle_run_count__ = 5
 
     def __init__(  # pylint:disable=super-init-not-called
         self,
@@ -54,28 +54,12 @@ class LoadUpdatesFilesWorker(BaseWorker):
         for mtr_cfg in self._config.meters:
             self._task_q.put(mtr_cfg.extra.standardized)
 
+    @consumes("_task_q")
     def load_updates_consumer(
         self, storage_client: Client, logs: Queue, worker_idx: str
     ) -> None:
         """Load update"""
-        if self._task_q.empty():
-            logs.put(
-                (
-                    "WARNING",
-                    worker_idx,
-                    "Meters queue is empty.",
-                )
-            )
-            return None
-        empty_run_count = 0
-        while True:
-            if self._task_q.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-                continue
-            mtr_cfg = self._task_q.get()
-
+        for mtr_cfg in self._consume(self._task_q, stage="load_updates_consumer"):
             mtr_path = Path(mtr_cfg.path).joinpath(self.__update_prefix__)
 
             update_files = list_blobs_with_prefix(
@@ -102,8 +86,6 @@ class LoadUpdatesFilesWorker(BaseWorker):
                         )
                     )
 
-            self._task_q.task_done()
-
     def run(self, run_time: DateTime) -> None:
         """Run loop Entrypoint"""
         self.configure(run_time)
@@ -125,7 +107,6 @@ class LoadUpdatesdataWorker(BaseWorker):
     __name__ = "DB Load Load update data"
 
     __rows_max_size__ = CFG.DW_LOAD_FILES_BUCKET_LIMIT
-    __max_idle_run_count__ = 5
 
     def __init__(
         self,
@@ -155,28 +136,14 @@ class LoadUpdatesdataWorker(BaseWorker):
         self._clear_queue(self._loaded_update_files_q)
         self._updata_data_counter.clear()
 
+    @consumes("_update_files_q")
     def load_updates_data_consumer(
         self, storage_client: Client, logs: Queue, worker_idx: str
     ) -> None:
         """Update files loading"""
-        if self._update_files_q.empty():
-            logs.put(
-                (
-                    "WARNING",
-                    worker_idx,
-                    "Meters queue is empty.",
-                )
-            )
-            return None
-        empty_run_count = 0
-        while True:
-            if self._update_files_q.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-                continue
-            upd_fl = self._update_files_q.get()
-
+        for upd_fl in self._consume(
+            self._update_files_q, stage="load_updates_data_consumer"
+        ):
             logs.put(
                 (
                     "DEBUG",
@@ -186,12 +153,11 @@ class LoadUpdatesdataWorker(BaseWorker):
                 )
             )
 
-            upd_json = self._load_json_data(
+            upd_json = load_manifest(
                 bucket=str(upd_fl.bucket),
                 path=str(upd_fl.path),
                 filename=str(upd_fl.filename),
                 client=storage_client,
-                logs=logs,
             )
 
             with self._lock:
@@ -208,8 +174,7 @@ class LoadUpdatesdataWorker(BaseWorker):
                         )
                     )
                     break
-                for row in upd_json.get("updates", []):
-                    self._updata_data_q.put(row)
+                self._updata_data_q.put(upd_json.get("updates", []))
                 logs.put(
                     (
                         "DEBUG",
@@ -221,8 +186,6 @@ class LoadUpdatesdataWorker(BaseWorker):
                 self._updata_data_counter["row_count"] += batch_size
                 self._loaded_update_files_q.put(upd_fl)
 
-            self._update_files_q.task_done()
-
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
         self.configure(run_time)
@@ -247,7 +210,6 @@ class FinalizeUpdatesWorker(BaseWorker):
     __update_prefix__ = CFG.UPDATE_PREFIX
     __update_filename_preffix_tmpl__ = CFG.UPDATE_FILENAME_PREFFIX_TMPL
     __processed_prefix__ = CFG.PROCESSED_PREFIX
-    __max_idle_run_count__ = 5
     __max_retry_count__ = 3
     __retry_delay__ = 0.5
 
@@ -265,28 +227,14 @@ class FinalizeUpdatesWorker(BaseWorker):
             description=self.__description__, trace_id=self._trace_id
         )
 
+    @consumes("_update_files_q")
     def updates_to_processed_consumer(
         self, storage_client: Client, logs: Queue, worker_idx: str
     ) -> None:
         """Move processed update files"""
-        if self._update_files_q.empty():
-            logs.put(
-                (
-                    "WARNING",
-                    worker_idx,
-                    "Meters queue is empty.",
-                )
-            )
-            return None
-        empty_run_count = 0
-        while True:
-            if self._update_files_q.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-                continue
-            upd_fl = self._update_files_q.get()
-
+        for upd_fl in self._consume(
+            self._update_files_q, stage="updates_to_processed_consumer"
+        ):
             if not upd_fl.filename.startswith(self.__update_prefix__):
                 logs.put(
                     (
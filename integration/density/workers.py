@@ -16,11 +16,17 @@ from google.cloud.storage import Client
 from pendulum import DateTime
 
 import common.settings as CFG
-from common.bucket_helpers import get_missed_standardized_files, require_client
+from common.bucket_helpers import require_client
+from common.coverage_index import get_missed_standardized_hours
 from common.data_representation.standardized.meter import Meter
 from common.date_utils import GapDatePeriod, format_date, parse, truncate
 from common.logging import Logger, ThreadPoolExecutorLogger
-from integration.base_integration import BaseFetchWorker, BaseStandardizeWorker
+from common.request_helpers import get_http_timeout
+from integration.base_integration import (
+    BaseFetchWorker,
+    BaseStandardizeWorker,
+    consumes,
+)
 from integration.density.data_structture import DataFile, StandardizedFile
 from integration.density.exception import (
     EmptyDataInterruption,
@@ -40,7 +46,6 @@ class GapsDetectionWorker(BaseFetchWorker):
     __created_by__ = "Density Missed Hours Worker"
     __description__ = "Density Integration"
     __name__ = "Density Missed Hours Worker"
-    __max_idle_run_count__ = 5
 
     def __init__(  # pylint:disable=super-init-not-called
         self,
@@ -67,6 +72,7 @@ class GapsDetectionWorker(BaseFetchWorker):
         for mtr_cfg in self._config.meters:
             self._meters_queue.put(mtr_cfg)
 
+    @consumes("_meters_queue")
     def missed_hours_consumer(
         self,
         storage_client: Client,
@@ -74,22 +80,14 @@ class GapsDetectionWorker(BaseFetchWorker):
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Get missed data points"""
-        if self._meters_queue.empty():
-            self._th_logger.warning("Meters queue is empty.")
-            return None
-        empty_run_count = 0
-        while True:
-            if self._meters_queue.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-                continue
-
-            mtr_cfg = self._meters_queue.get()
-            mtr_msd_poll_hrs = get_missed_standardized_files(
+        for mtr_cfg in self._consume(
+            self._meters_queue, stage="missed_hours_consumer"
+        ):
+            mtr_msd_poll_hrs = get_missed_standardized_hours(
                 bucket_name=mtr_cfg.standardized.bucket,
                 bucket_path=mtr_cfg.standardized.path,
                 range_hours=self._config.gap_regeneration_window,
+                standardized_format=self._standardized_format,
                 date_range=self._expected_hours,
                 client=storage_client,
             )
@@ -109,7 +107,6 @@ class GapsDetectionWorker(BaseFetchWorker):
                 self._th_logger.info(
                     f"Meter {mtr_cfg.meter_name} is up to date.",
                 )
-            self._meters_queue.task_done()
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
@@ -136,7 +133,6 @@ class FetchWorker(BaseFetchWorker):
     __density_api_date_format__ = "YYYY-MM-DD[T]HH:mm:ss[Z]"
     __max_retry_count__ = 3
     __retry_delay__ = 0.5
-    __max_idle_run_count__ = 5
     __request_timeout__ = 60
 
     def __init__(
@@ -162,16 +158,16 @@ class FetchWorker(BaseFetchWorker):
             default_schema=Schema(trim_trailing_underscore=False, skip_internal=False)
         )
 
+    def _get_raw_filename(self, mtr_hr: str) -> str:
+        return format_date(
+            truncate(parse(mtr_hr), level="hour"), CFG.PROCESSING_DATE_FORMAT
+        )
+
     # TODO: @todo MUST be moved to base class after rirst relise
     def _load_from_file(
         self, filename: str, storage_client: Client, logs: Queue
     ) -> Optional[Dict]:
-        fl_exists = self._is_file_exists(
-            client=storage_client,
-            bucket=self._config.extra.raw.bucket,
-            path=self._config.extra.raw.path,
-            file_name=filename,
-        )
+        fl_exists = self._is_raw_file_exists(file_name=filename, client=storage_client)
         if not fl_exists:
             raise LoadFromConnectorAPI(
                 f"The local file 'gs://{self._config.extra.raw.bucket}/"
@@ -206,11 +202,11 @@ class FetchWorker(BaseFetchWorker):
         data = None
         while retry_count < self.__max_retry_count__:
             try:
-                result = requests.get(
+                result = self._http_session.get(
                     url,
                     params=params,
                     headers=headers,
-                    timeout=self.__request_timeout__,
+                    timeout=get_http_timeout(self.__request_timeout__),
                 )
                 if result.status_code == HTTPStatus.OK.value:
                     data = result.json()
@@ -249,66 +245,63 @@ class FetchWorker(BaseFetchWorker):
                 "Missed hours queue is empty. Maybe data up to date.",
             )
             return None
-        empty_run_count = 0
         possible_errors = (requests.exceptions.JSONDecodeError,)
         fetch_url = self.__fetch_url__.format(self._config.space_id)
 
         while True:
-            if not bool(len(self._missed_hours_queue)):
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-            else:
-                mtr_hr, mtr_cfgs = self._missed_hours_queue.popitem()
+            try:
+                mtr_hr, mtr_cfgs = self._pop_expiring_item(self._missed_hours_queue)
+            except KeyError:
+                break
 
-                start_date = truncate(parse(mtr_hr), level="hour")
+            start_date = truncate(parse(mtr_hr), level="hour")
 
-                filename = format_date(start_date, CFG.PROCESSING_DATE_FORMAT)
+            filename = self._get_raw_filename(mtr_hr)
+            try:
                 try:
-                    try:
-                        data = self._load_from_file(
-                            filename=filename, storage_client=storage_client, logs=logs
-                        )
-                        add_to_update = False
-                    except LoadFromConnectorAPI as err:
-                        self._th_logger.info(
-                            f"Canot load the local file due to the reason '{err}'"
-                            " Loading from the WatTime API"
-                        )
-                        data = self._request_data(
-                            url=fetch_url,
-                            params={
-                                "start_time": format_date(
-                                    start_date, self.__density_api_date_format__
-                                ),
-                                "end_time": format_date(
-                                    start_date.add(minutes=59, seconds=59),
-                                    self.__density_api_date_format__,
-                                ),
-                            },
-                            headers={"Authorization": f"Bearer {self._config.token}"},
-                        )
-                        add_to_update = True
-                except possible_errors as err:
-                    self._th_logger.error(
-                        f"Cannot fetch data for '{mtr_hr}' due to the error '{err}'."
-                        " Skipping."
+                    data = self._load_from_file(
+                        filename=filename, storage_client=storage_client, logs=logs
                     )
-                    continue
-
-                file_info = DataFile(
-                    file_name=filename,
-                    bucket=self._config.extra.raw.bucket,
-                    path=self._config.extra.raw.path,
-                    body=dumps(data, indent=4, sort_keys=True),
-                    meters=mtr_cfgs,
+                    add_to_update = False
+                except LoadFromConnectorAPI as err:
+                    self._th_logger.info(
+                        f"Canot load the local file due to the reason '{err}'"
+                        " Loading from the WatTime API"
+                    )
+                    data = self._request_data(
+                        url=fetch_url,
+                        params={
+                            "start_time": format_date(
+                                start_date, self.__density_api_date_format__
+                            ),
+                            "end_time": format_date(
+                                start_date.add(minutes=59, seconds=59),
+                                self.__density_api_date_format__,
+                            ),
+                        },
+                        headers={"Authorization": f"Bearer {self._config.token}"},
+                    )
+                    add_to_update = True
+            except possible_errors as err:
+                self._th_logger.error(
+                    f"Cannot fetch data for '{mtr_hr}' due to the error '{err}'."
+                    " Skipping."
                 )
-                file_info.timestamps.put(mtr_hr)
+                continue
+
+            file_info = DataFile(
+                file_name=filename,
+                bucket=self._config.extra.raw.bucket,
+                path=self._config.extra.raw.path,
+                body=dumps(data, indent=4, sort_keys=True),
+                meters=mtr_cfgs,
+            )
+            file_info.timestamps.put(mtr_hr)
 
-                self._fetched_files_queue.put(file_info)
-                self._shadow_fetched_files_queue.put(file_info)
-                if add_to_update:
-                    self._add_to_update(file_info, self._fetch_update_file_buffer)
+            self._fetched_files_queue.put(file_info)
+            self._shadow_fetched_files_queue.put(file_info)
+            if add_to_update:
+                self._add_to_update(file_info, self._fetch_update_file_buffer)
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
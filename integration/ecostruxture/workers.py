@@ -6,7 +6,7 @@ from collections import Counter
 from io import BytesIO
 from pathlib import Path
 from queue import Queue
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import openpyxl
 import polars as pl
@@ -17,11 +17,22 @@ from imap_tools import A, MailBox, MailMessageFlags
 from pendulum import DateTime
 
 import common.settings as CFG
-from common.bucket_helpers import get_missed_standardized_files, require_client
+from common.bucket_helpers import require_client
+from common.coverage_index import get_missed_standardized_hours
 from common.data_representation.standardized.meter import Meter
 from common.date_utils import GapDatePeriod, date_range, format_date, parse, truncate
 from common.logging import Logger, ThreadPoolExecutorLogger
-from integration.base_integration import BaseFetchWorker, BaseStandardizeWorker
+from common.mail_sync import (
+    fetch_messages,
+    load_mail_sync_state,
+    save_mail_sync_state,
+    search_new_uids,
+)
+from integration.base_integration import (
+    BaseFetchWorker,
+    BaseStandardizeWorker,
+    consumes,
+)
 from integration.ecostruxture.data_structures import (
     DataFile,
     FetchedFile,
@@ -40,7 +51,6 @@ class GapsDetectionWorker(BaseFetchWorker):
     __created_by__ = "Ecostruxture Missed Hours Worker"
     __description__ = "Ecostruxture Integration"
     __name__ = "Ecostruxture Missed Hours Worker"
-    __max_idle_run_count__ = 5
 
     __workers_amount__ = 30
 
@@ -69,6 +79,7 @@ class GapsDetectionWorker(BaseFetchWorker):
         for mtr_cfg in self._config.meters:
             self._meters_queue.put(mtr_cfg)
 
+    @consumes("_meters_queue")
     def missed_hours_consumer(
         self,
         storage_client: Client,
@@ -76,23 +87,14 @@ class GapsDetectionWorker(BaseFetchWorker):
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Get missed data points"""
-        if self._meters_queue.empty():
-            self._th_logger.warning("Meters queue is empty.")
-            return None
-        empty_run_count = 0
-
-        while True:
-            if self._meters_queue.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-                continue
-
-            mtr_cfg = self._meters_queue.get()
-            mtr_msd_poll_hrs = get_missed_standardized_files(
+        for mtr_cfg in self._consume(
+            self._meters_queue, stage="missed_hours_consumer"
+        ):
+            mtr_msd_poll_hrs = get_missed_standardized_hours(
                 bucket_name=mtr_cfg.standardized.bucket,
                 bucket_path=mtr_cfg.standardized.path,
                 range_hours=self._config.gap_regeneration_window,
+                standardized_format=self._standardized_format,
                 client=storage_client,
                 date_range=self._expected_hours,
             )
@@ -112,7 +114,6 @@ class GapsDetectionWorker(BaseFetchWorker):
                 )
             else:
                 self._th_logger.info(f"Meter {mtr_cfg.meter_name} is up to date.")
-            self._meters_queue.task_done()
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
@@ -139,25 +140,21 @@ class FetchWorker(BaseFetchWorker):
     __mail_processed__ = "ECOSTRUXTURE_PROCESSED"
     __max_pool_size__ = 20
 
+    __summary_sheet__ = "Summary"
     __sheet_first_value_row__ = 2
     __sheet_date_column__ = 1
+    __sheet_consumption_column__ = 2
 
     __fetch_file_name_tmpl__ = "{base_file_name}_{idx}"
-    __sheet_execess_cols__ = (3, 4)
-    __max_idle_run_count__ = 5
 
     __raw_consumption_col__ = "RawConsumption"
-    __raw_meter_hour_col__ = "RawDates"
+    __df_sheet_col__ = "Sheet"
     __df_timestamp_coll__ = "Timestamp"
-    __df_date_times_col__ = "Dates"
-    __df_aligned_date_times_col__ = "AlignedDates"
-    __df_adjusted_date_times_col__ = "AdjustedDates"
-    __df_aligned_adjusted_date_times_col__ = "AlignedAdjustedDates"
     __df_meter_hour_col__ = "MeterHour"
     __df_consumption_col__ = "Consumption"
 
     __default_meter_date__ = "1970-01-01T00:00"
-    __default_raw_consumption = 0
+    __default_raw_consumption = 0.0
 
     def __init__(
         self,
@@ -257,42 +254,66 @@ class FetchWorker(BaseFetchWorker):
     def fetch(self) -> None:
         """Get new excel"""
         idle = False
+        folder = str(self.__mail_root_folder__)
+        raw = self._config.extra.raw
+        storage_client = require_client()
         with self._get_mail_connection() as mailbox:
-            query = self._get_message_query()
-
-            msgs = list(mailbox.fetch(query))
-
-            for msg in msgs:
-                if idle:
-                    self._skipped_messages_q.put(msg.uid)
-                    continue
+            uids, sync_state = search_new_uids(
+                mailbox=mailbox,
+                folder=folder,
+                criteria=self._get_message_query(),
+                state=load_mail_sync_state(
+                    raw.bucket, raw.path, folder, storage_client
+                ),
+            )
 
+            for msg in fetch_messages(mailbox, uids):
                 attachements = self.filter_mail_attachments(msg.attachments)
                 qsize = self._fetch_counter["atachements"]
                 if qsize + len(attachements) >= self.__max_pool_size__:
                     idle = True
-                    self._skipped_messages_q.put(msg.uid)
-                    continue
+                    break
 
+                self._fetch_counter["atachements"] += len(attachements)
                 self._processed_messages_q.put(msg.uid)
                 for attachement in attachements:
                     self._fetched_atachments_q.put((msg.uid, attachement))
 
+            if idle:
+                processed = set(self._processed_messages_q.queue)
+                for uid in uids:
+                    if uid not in processed:
+                        self._skipped_messages_q.put(uid)
+                sync_state = sync_state.release(self._skipped_messages_q.queue)
+
             self._move_processed_msgs(mailbox)
             self._mark_as_unread_skipped_msgs(mailbox)
+            save_mail_sync_state(
+                raw.bucket, raw.path, folder, sync_state, storage_client
+            )
 
             if self._fetched_atachments_q.empty():
                 self._logger.warning(
                     "The new messages or related attachements were not found."
                 )
 
-    def _read_excel(self, data: bytes):
-        excel = openpyxl.reader.excel.load_workbook(data, read_only=False)
-        excel.remove_sheet(excel["Summary"])
-        return excel
+    def _read_excel(self, data: BytesIO) -> Any:
+        return openpyxl.load_workbook(data, read_only=True)
+
+    def _get_data_sheets(self, workbook: Any) -> List[Any]:
+        return [
+            sheet
+            for sheet in workbook.worksheets
+            if sheet.title != self.__summary_sheet__
+        ]
 
     def _get_meter_hour_form_excel(self, workbook) -> Set[DateTime]:
         sheet = workbook.active
+        if sheet is None or sheet.title == self.__summary_sheet__:
+            sheets = self._get_data_sheets(workbook)
+            if not sheets:
+                return set()
+            sheet = sheets[0]
         date = sheet.cell(
             row=self.__sheet_first_value_row__, column=self.__sheet_date_column__
         ).value
@@ -316,146 +337,75 @@ class FetchWorker(BaseFetchWorker):
                 )
                 self._clear_queue(self._skipped_messages_q)
 
-    def __df_rename_columns(self, data_df: pl.LazyFrame) -> pl.LazyFrame:
-        return data_df.lazy().rename(
-            {
-                "column_0": self.__raw_meter_hour_col__,
-                "column_1": self.__raw_consumption_col__,
-            }
-        )
-
-    @staticmethod
-    def __df_set_date_type(
-        data_df: pl.LazyFrame, date_col: str, dest_col: str
-    ) -> pl.LazyFrame:
-        return data_df.lazy().with_columns(
-            (pl.col(date_col).apply(lambda y: parse(y, tz_info="UTC"))).alias(dest_col)
-        )
-
-    def __df_adjust_dates(
-        self, data_df: pl.LazyFrame, date_col: str, dest_col: str
-    ) -> pl.LazyFrame:
-        return data_df.lazy().with_columns(
-            (pl.col(date_col).apply(self._adjust_meter_date)).alias(dest_col)
-        )
-
-    @staticmethod
-    def __df_truncate_dates(
-        data_df: pl.LazyFrame, date_col: str, dest_col: str, level: str
-    ) -> pl.LazyFrame:
-        return data_df.lazy().with_columns(
-            (pl.col(date_col).apply(lambda y: truncate(y, level=level))).alias(dest_col)
-        )
-
-    @staticmethod
-    def __df_get_timestamp(
-        data_df: pl.LazyFrame, date_col: str, dest_col: str
-    ) -> pl.LazyFrame:
-        return data_df.lazy().with_columns(
-            (pl.col(date_col).apply(lambda y: int(y.timestamp()))).alias(dest_col)
-        )
-
-    @staticmethod
-    def __df_get_meter_hour(
-        data_df: pl.LazyFrame, date_col: str, dest_col: str
-    ) -> pl.LazyFrame:
-        return data_df.lazy().with_columns(
-            (
-                pl.col(date_col).apply(
-                    lambda y: format_date(y, CFG.PROCESSING_DATE_FORMAT)
-                )
-            ).alias(dest_col)
-        )
-
     @staticmethod
     def __df_remove_dublicates(data_df: pl.LazyFrame) -> pl.LazyFrame:
         return data_df.lazy().unique()
 
-    @staticmethod
-    def __df_remove_nulls(data_df: pl.LazyFrame, columns: List[str]) -> pl.LazyFrame:
-        return data_df.lazy().filter(pl.col(columns).is_null().is_not())
+    def _get_raw_consumption(self, value: Any) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return self.__default_raw_consumption
 
-    @staticmethod
-    def __df_fill_nulls(data_df: pl.LazyFrame, column: str, value: Any) -> pl.LazyFrame:
-        return data_df.lazy().with_columns(
-            pl.col(column).fill_null(
-                pl.lit(value),
-            ),
+    def _get_date_values(self, value: Any) -> Tuple[str, int]:
+        """Get meter hour and timestamp of the raw date"""
+        mtr_dt = self._adjust_meter_date(parse(value, tz_info="UTC"))
+        return (
+            format_date(truncate(mtr_dt, level="hour"), CFG.PROCESSING_DATE_FORMAT),
+            int(mtr_dt.timestamp()),
         )
 
-    @staticmethod
-    def __df_set_type_inline(
-        data_df: pl.LazyFrame, column: str, pl_type: Any
-    ) -> pl.LazyFrame:
-        return data_df.lazy().with_columns(
-            pl.col(column).cast(pl_type, strict=False).keep_name()
-        )
+    def _get_data_pl_df(self, workbook: Any) -> pl.LazyFrame:
+        """Read the allowed sheets row by row into a single frame"""
+        columns = {
+            self.__df_sheet_col__: [],
+            self.__df_meter_hour_col__: [],
+            self.__df_timestamp_coll__: [],
+            self.__raw_consumption_col__: [],
+        }
+        dates = {}
+        for sheet in self._get_data_sheets(workbook):
+            if sheet.title not in self._allowed_sheet_names:
+                self._th_logger.warning(f"Found unexpected sheet '{sheet.title}'. Skip")
+                continue
+            for raw_date, raw_value in sheet.iter_rows(
+                min_row=self.__sheet_first_value_row__,
+                min_col=self.__sheet_date_column__,
+                max_col=self.__sheet_consumption_column__,
+                values_only=True,
+            ):
+                if raw_date is None:
+                    raw_date = self.__default_meter_date__
+                if raw_date not in dates:
+                    dates[raw_date] = self._get_date_values(raw_date)
+                meter_hour, timestamp = dates[raw_date]
+                columns[self.__df_sheet_col__].append(sheet.title)
+                columns[self.__df_meter_hour_col__].append(meter_hour)
+                columns[self.__df_timestamp_coll__].append(timestamp)
+                columns[self.__raw_consumption_col__].append(
+                    self._get_raw_consumption(raw_value)
+                )
 
-    def _get_data_pl_df(self, data: Any) -> pl.LazyFrame:
-        if not data:
+        if not columns[self.__df_sheet_col__]:
             raise EmptyDataInterruption("Recieved Empty Data")
 
-        sheet_data = data.values
-        next(sheet_data)[0:]  # pylint:disable=expression-not-assigned
-        mtr_df = pl.DataFrame(sheet_data).lazy()
-
         return (
-            mtr_df.pipe(self.__df_rename_columns)
-            .pipe(self.__df_remove_dublicates)
-            .pipe(
-                self.__df_fill_nulls,
-                self.__raw_meter_hour_col__,
-                self.__default_meter_date__,
-            )
-            .pipe(self.__df_set_type_inline, self.__raw_consumption_col__, pl.Float64)
-            .pipe(
-                self.__df_fill_nulls,
-                self.__raw_consumption_col__,
-                self.__default_raw_consumption,
+            pl.DataFrame(
+                columns,
+                schema={
+                    self.__df_sheet_col__: pl.Utf8,
+                    self.__df_meter_hour_col__: pl.Utf8,
+                    self.__df_timestamp_coll__: pl.Int64,
+                    self.__raw_consumption_col__: pl.Float64,
+                },
             )
             .pipe(self.__df_remove_dublicates)
-            .pipe(
-                self.__df_remove_nulls,
-                [self.__raw_consumption_col__, self.__raw_meter_hour_col__],
-            )
-            .pipe(
-                self.__df_set_date_type,
-                self.__raw_meter_hour_col__,
-                self.__df_date_times_col__,
-            )
-            .pipe(
-                self.__df_adjust_dates,
-                self.__df_date_times_col__,
-                self.__df_adjusted_date_times_col__,
-            )
-            .pipe(
-                self.__df_truncate_dates,
-                self.__df_date_times_col__,
-                self.__df_aligned_date_times_col__,
-                "hour",
-            )
-            .pipe(
-                self.__df_truncate_dates,
-                self.__df_adjusted_date_times_col__,
-                self.__df_aligned_adjusted_date_times_col__,
-                "hour",
-            )
-            .pipe(
-                self.__df_get_meter_hour,
-                self.__df_aligned_adjusted_date_times_col__,
-                self.__df_meter_hour_col__,
-            )
-            .pipe(
-                self.__df_get_timestamp,
-                self.__df_adjusted_date_times_col__,
-                self.__df_timestamp_coll__,
-            )
             .sort([self.__df_timestamp_coll__])
         )
 
     @staticmethod
     def __df_min_inline(
-        data_df: pl.LazyFrame, data_col: str, group_col: str, suffix: str = "_min"
+        data_df: pl.LazyFrame, data_col: str, group_col: List[str], suffix: str = "_min"
     ) -> pl.LazyFrame:
         return data_df.lazy().with_columns(
             (pl.col(data_col).min().over(group_col).suffix(suffix))
@@ -463,15 +413,7 @@ class FetchWorker(BaseFetchWorker):
 
     @staticmethod
     def __df_max_inline(
-        data_df: pl.LazyFrame, data_col: str, group_col: str, suffix: str = "_max"
-    ) -> pl.LazyFrame:
-        return data_df.lazy().with_columns(
-            (pl.col(data_col).max().over(group_col).suffix(suffix))
-        )
-
-    @staticmethod
-    def __df_max_inline(
-        data_df: pl.LazyFrame, data_col: str, group_col: str, suffix: str = "_max"
+        data_df: pl.LazyFrame, data_col: str, group_col: List[str], suffix: str = "_max"
     ) -> pl.LazyFrame:
         return data_df.lazy().with_columns(
             (pl.col(data_col).max().over(group_col).suffix(suffix))
@@ -497,12 +439,12 @@ class FetchWorker(BaseFetchWorker):
             data_df.pipe(
                 self.__df_min_inline,
                 self.__raw_consumption_col__,
-                self.__df_meter_hour_col__,
+                [self.__df_sheet_col__, self.__df_meter_hour_col__],
             )
             .pipe(
                 self.__df_max_inline,
                 self.__raw_consumption_col__,
-                self.__df_meter_hour_col__,
+                [self.__df_sheet_col__, self.__df_meter_hour_col__],
             )
             .pipe(
                 self.__df_difference_inline,
@@ -512,51 +454,38 @@ class FetchWorker(BaseFetchWorker):
             )
         )
 
-    def _get_workbook_idx(self, workbook: Any) -> Dict:
-        sheets_idx = {}
-
-        for sheet_name in workbook.sheetnames:
-            if sheet_name not in self._allowed_sheet_names:
-                self._th_logger.warning(f"Found unexpected sheet '{sheet_name}'. Skip")
-                continue
-            sheet = workbook.get_sheet_by_name(sheet_name)
-            sheet.delete_cols(*self.__sheet_execess_cols__)
-            try:
-                raw_data_df = self._get_data_pl_df(sheet)
-                raw_data_df = self._get_consumption_pl_df(raw_data_df)
-            except EmptyDataInterruption as err:
-                self._th_logger.error(
-                    f"Can not load meter data to a Dataframe due to the err '{err}'"
-                )
-                continue
-            else:
-                sheets_idx[sheet_name] = raw_data_df
-        return sheets_idx
+    def _get_workbook_idx(self, workbook: Any) -> Dict[Tuple[str, str], pl.DataFrame]:
+        """Index consumption of the workbook by sheet name and meter hour"""
+        try:
+            data_df = self._get_consumption_pl_df(
+                self._get_data_pl_df(workbook)
+            ).collect()
+        except EmptyDataInterruption as err:
+            self._th_logger.error(
+                f"Can not load meter data to a Dataframe due to the err '{err}'"
+            )
+            return {}
+        return data_df.partition_by(
+            [self.__df_sheet_col__, self.__df_meter_hour_col__], as_dict=True
+        )
 
+    @consumes("_fetched_atachments_q")
     def unbundle_fetch_data_consumer(
         self,
         logs: Queue,  # pylint:disable=unused-argument
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Split excel document by sheets for paralelization"""
-        if self._fetched_atachments_q.empty():
-            self._th_logger.warning("Attachements queue is empty.")
-            return None
-        empty_run_count = 0
-        while True:
-            if self._fetched_atachments_q.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    self._move_skipped_to_inbox()
-                    break
-
-                empty_run_count += 1
-                continue
-            msg_uid, attachement = self._fetched_atachments_q.get()
-
+        for msg_uid, attachement in self._consume(
+            self._fetched_atachments_q, stage="unbundle_fetch_data_consumer"
+        ):
             mtr_wb = self._read_excel(BytesIO(attachement.payload))
-            day_hours = self._get_meter_hour_form_excel(mtr_wb)
-
-            hours = set(self._missed_hours_queue.keys()).intersection(day_hours)
+            try:
+                day_hours = self._get_meter_hour_form_excel(mtr_wb)
+                hours = set(self._missed_hours_queue.keys()).intersection(day_hours)
+                sheets_idx = self._get_workbook_idx(mtr_wb) if hours else {}
+            finally:
+                mtr_wb.close()
 
             if hours:
                 with self._lock:
@@ -574,16 +503,20 @@ class FetchWorker(BaseFetchWorker):
                 )
                 self._shadow_fetched_files_queue.put(file_info)
                 self._add_to_update(file_info, self._fetch_update_file_buffer)
-                sheets_idx = self._get_workbook_idx(mtr_wb)
+                sheet_names = {sheet_name for sheet_name, _ in sheets_idx}
 
                 for mtr_hr in hours:
                     with self._lock:
                         mtr_cfgs = self._missed_hours_queue.get(mtr_hr, None)
                         mtr_cfgs = list(mtr_cfgs.queue) if mtr_cfgs else []
+                    meter_hour = format_date(
+                        self._adjust_meter_date(mtr_hr, truncate_lvl="hour"),
+                        CFG.PROCESSING_DATE_FORMAT,
+                    )
                     for mtr_cfg in mtr_cfgs:
                         mt_name = Path(mtr_cfg.meter_name).stem
                         sheet_name = self._config.meters_sheet_mapper.get(mt_name, "")
-                        if not sheet_name or sheet_name not in sheets_idx:
+                        if not sheet_name or sheet_name not in sheet_names:
                             self._th_logger.warning(
                                 f"Cannot find sheet '{sheet_name}' related "
                                 f"to meter '{mt_name}' in gs://"
@@ -592,18 +525,25 @@ class FetchWorker(BaseFetchWorker):
                             )
                             continue
 
+                        hour_df = sheets_idx.get((sheet_name, meter_hour))
+                        if hour_df is None:
+                            self._th_logger.warning(
+                                f"Sheet '{sheet_name}' of the meter '{mt_name}' "
+                                f"does not contain data for '{meter_hour}' point."
+                            )
+                            continue
+
                         data_file = DataFile(
                             file_name=filename,
                             bucket=self._config.extra.raw.bucket,
                             path=self._config.extra.raw.path,
-                            body=sheets_idx[sheet_name].collect(),
+                            body=hour_df,
                         )
                         data_file.timestamps.put(mtr_hr)
                         data_file.meters.put(mtr_cfg)
                         self._fetched_files_queue.put(data_file)
             else:
                 self._skipped_messages_q.put(msg_uid)
-            self._fetched_atachments_q.task_done()
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
@@ -617,6 +557,8 @@ class FetchWorker(BaseFetchWorker):
             ],
             run_parallel=RUN_FETCH_PARALLEL,
         )
+        # Skipped messages are moved once all the attachements are unbundled.
+        self._move_skipped_to_inbox()
         self.finalize_fetch_update_status()
         self._run_consumers(
             [
@@ -17,7 +17,11 @@ from common.data_representation.config.participant import (
 )
 from common.data_representation.standardized.meter import Meter as MeterValue
 from common.data_representation.standardized.meter import StandardizedMeterException
-from integration.base_integration import BaseFetchWorker, BaseStandardizeWorker
+from integration.base_integration import (
+    BaseFetchWorker,
+    BaseStandardizeWorker,
+    consumes,
+)
 from integration.facit.data_structures import DataFile, MoveFile, StandardizedFile
 
 RUN_FETCH_PARALLEL = True
@@ -112,52 +116,42 @@ class FetchWorker(BaseFetchWorker):
             self._add_to_update(file_info, self._fetch_update_file_buffer)
 
     # TODO @todo Should be refactored. 
+    @consumes("_fetch_processed_q")
     def _move_processed_files_consumer(
         self,
         storage_client: Client,
-        logs: Queue,        # pylint:disable=unused-argument
-        worker_idx: str,    # pylint:disable=unused-argument
+        logs: Queue,  # pylint:disable=unused-argument
+        worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
-        if self._fetch_processed_q.empty():
-            self._th_logger.warning(
-                "The files queue is empty. Shutdown worker.",
+        for file_info in self._consume(
+            self._fetch_processed_q, stage="move_processed_files_consumer"
+        ):
+            self._th_logger.debug(
+                f"Moving file gs://{file_info.bucket}/{file_info.path}/"
+                f"{file_info.filename}"
+                f" to gs://{file_info.destination_bucket}/"
+                f"/{file_info.destination_path}"
+                f"{file_info.destination_filename}"
             )
-            return None
-        empty_run_count = 0
-        while True:
-            if self._fetch_processed_q.empty():
-                if empty_run_count == 3:
-                    break
-                empty_run_count += 1
-            else:
-                file_info = self._fetch_processed_q.get()
-                self._th_logger.debug(
-                    f"Moving file gs://{file_info.bucket}/{file_info.path}/"
-                    f"{file_info.filename}"
-                    f" to gs://{file_info.destination_bucket}/"
-                    f"/{file_info.destination_path}"
-                    f"{file_info.destination_filename}"
-                )
 
-                move_blob(
-                    client=storage_client,
-                    bucket_name=file_info.bucket,
-                    blob_name=str(Path(file_info.path).joinpath(file_info.filename)),
-                    destination_bucket=file_info.destination_bucket,
-                    new_blob_name=str(
-                        Path(file_info.destination_path).joinpath(
-                            file_info.destination_filename
-                        )
-                    ),
-                    quiet=True,
-                )
-                self._th_logger.debug(
-                    f"Moved file 'gs://{file_info.bucket}/{file_info.path}"
-                    f"{file_info.filename}' to the "
-                    f"'gs://{file_info.destination_bucket}/"
-                    f"{file_info.destination_path}/{file_info.destination_filename}'.",
-                )
-                self._fetch_processed_q.task_done()
+            move_blob(
+                client=storage_client,
+                bucket_name=file_info.bucket,
+                blob_name=str(Path(file_info.path).joinpath(file_info.filename)),
+                destination_bucket=file_info.destination_bucket,
+                new_blob_name=str(
+                    Path(file_info.destination_path).joinpath(
+                        file_info.destination_filename
+                    )
+                ),
+                quiet=True,
+            )
+            self._th_logger.debug(
+                f"Moved file 'gs://{file_info.bucket}/{file_info.path}"
+                f"{file_info.filename}' to the "
+                f"'gs://{file_info.destination_bucket}/"
+                f"{file_info.destination_path}/{file_info.destination_filename}'.",
+            )
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entry point"""
@@ -283,52 +277,42 @@ class StandardizeWorker(BaseStandardizeWorker):
 
         return standardized_files
 
+    @consumes("_st_processed_q")
     def _move_processed_files_consumer(
         self,
         storage_client: Client,
-        logs: Queue,        # pylint:disable=unused-argument
-        worker_idx: str,    # pylint:disable=unused-argument
+        logs: Queue,  # pylint:disable=unused-argument
+        worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
-        if self._st_processed_q.empty():
-            self._th_logger.warning(
-                "The files queue is empty. Shutdown worker.",
+        for file_info in self._consume(
+            self._st_processed_q, stage="move_processed_files_consumer"
+        ):
+            self._th_logger.debug(
+                f"Moving file gs://{file_info.bucket}/{file_info.path}/"
+                f"{file_info.filename}"
+                f" to gs://{file_info.destination_bucket}/"
+                f"/{file_info.destination_path}"
+                f"{file_info.destination_filename}"
             )
-            return None
-        empty_run_count = 0
-        while True:
-            if self._st_processed_q.empty():
-                if empty_run_count == 3:
-                    break
-                empty_run_count += 1
-            else:
-                file_info = self._st_processed_q.get()
-                self._th_logger.debug(
-                    f"Moving file gs://{file_info.bucket}/{file_info.path}/"
-                    f"{file_info.filename}"
-                    f" to gs://{file_info.destination_bucket}/"
-                    f"/{file_info.destination_path}"
-                    f"{file_info.destination_filename}"
-                )
 
-                move_blob(
-                    client=storage_client,
-                    bucket_name=file_info.bucket,
-                    blob_name=str(Path(file_info.path).joinpath(file_info.filename)),
-                    destination_bucket=file_info.destination_bucket,
-                    new_blob_name=str(
-                        Path(file_info.destination_path).joinpath(
-                            file_info.destination_filename
-                        )
-                    ),
-                    quiet=True,
-                )
-                self._th_logger.debug(
-                    f"Moved file 'gs://{file_info.bucket}/{file_info.path}"
-                    f"{file_info.filename}' to the "
-                    f"'gs://{file_info.destination_bucket}/"
-                    f"{file_info.destination_path}/{file_info.destination_filename}'.",
-                )
-                self._st_processed_q.task_done()
+            move_blob(
+                client=storage_client,
+                bucket_name=file_info.bucket,
+                blob_name=str(Path(file_info.path).joinpath(file_info.filename)),
+                destination_bucket=file_info.destination_bucket,
+                new_blob_name=str(
+                    Path(file_info.destination_path).joinpath(
+                        file_info.destination_filename
+                    )
+                ),
+                quiet=True,
+            )
+            self._th_logger.debug(
+                f"Moved file 'gs://{file_info.bucket}/{file_info.path}"
+                f"{file_info.filename}' to the "
+                f"'gs://{file_info.destination_bucket}/"
+                f"{file_info.destination_path}/{file_info.destination_filename}'.",
+            )
 
     # TODO: @todo Possible candite to be in base class. Or boiler plate code
     def run(self, run_time: DateTime) -> None:
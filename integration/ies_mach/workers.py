@@ -16,11 +16,17 @@ from google.cloud.storage import Client
 from pendulum import DateTime
 
 import common.settings as CFG
-from common.bucket_helpers import get_missed_standardized_files, require_client
+from common.bucket_helpers import require_client
+from common.coverage_index import get_missed_standardized_hours
 from common.data_representation.standardized.meter import Meter
 from common.date_utils import GapDatePeriod, format_date, parse, truncate
 from common.logging import Logger, ThreadPoolExecutorLogger
-from integration.base_integration import BaseFetchWorker, BaseStandardizeWorker
+from common.request_helpers import get_http_timeout
+from integration.base_integration import (
+    BaseFetchWorker,
+    BaseStandardizeWorker,
+    consumes,
+)
 from integration.ies_mach.data_structures import DataFile, StandardizedFile
 from integration.ies_mach.exceptions import (
     EmptyDataInterruption,
@@ -40,7 +46,6 @@ class GapsDetectionWorker(BaseFetchWorker):
     __created_by__ = "IES Mach Missed Hours Worker"
     __description__ = "IES Mach Integration"
     __name__ = "IES Mach Missed Hours Worker"
-    __max_idle_run_count__ = 5
 
     def __init__(  # pylint:disable=super-init-not-called
         self,
@@ -67,6 +72,7 @@ class GapsDetectionWorker(BaseFetchWorker):
         for mtr_cfg in self._config.meters:
             self._meters_queue.put(mtr_cfg)
 
+    @consumes("_meters_queue")
     def missed_hours_consumer(
         self,
         storage_client: Client,
@@ -74,23 +80,14 @@ class GapsDetectionWorker(BaseFetchWorker):
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Retrieving missed data points."""
-        if self._meters_queue.empty():
-            self._th_logger.warning("Meters queue is empty.")
-            return None
-        empty_run_count = 0
-        while True:
-            if self._meters_queue.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-                continue
-
-            mtr_cfg = self._meters_queue.get()
-
-            mtr_msd_poll_hrs = get_missed_standardized_files(
+        for mtr_cfg in self._consume(
+            self._meters_queue, stage="missed_hours_consumer"
+        ):
+            mtr_msd_poll_hrs = get_missed_standardized_hours(
                 bucket_name=mtr_cfg.standardized.bucket,
                 bucket_path=mtr_cfg.standardized.path,
                 range_hours=self._config.gap_regeneration_window,
+                standardized_format=self._standardized_format,
                 client=storage_client,
                 date_range=self._expected_hours
             )
@@ -110,7 +107,6 @@ class GapsDetectionWorker(BaseFetchWorker):
                 self._th_logger.info(
                     f"Meter {mtr_cfg.meter_name} is up to date.",
                 )
-            self._meters_queue.task_done()
 
     def run(self, run_time: DateTime) -> None:
         """Run loop Entrypoint"""
@@ -144,7 +140,6 @@ class FetchWorker(BaseFetchWorker):
 
     __max_retry_count__ = 3
     __retry_delay__ = 0.5
-    __max_idle_run_count__ = 5
     __request_timeout__ = 60
 
     __raw_meter_hour_col__ = "RawDates"
@@ -225,11 +220,11 @@ class FetchWorker(BaseFetchWorker):
         data = None
         while retry_count < self.__max_retry_count__:
             try:
-                result = requests.post(
+                result = self._http_session.post(
                     url,
                     json=json_params,
                     headers=headers,
-                    timeout=self.__request_timeout__,
+                    timeout=get_http_timeout(self.__request_timeout__),
                 )
                 if result.status_code == HTTPStatus.OK.value:
                     data = result.json()
@@ -17,11 +17,17 @@ from pandas import DataFrame
 from pendulum import DateTime
 
 import common.settings as CFG
-from common.bucket_helpers import get_missed_standardized_files, require_client
+from common.bucket_helpers import require_client
+from common.coverage_index import get_missed_standardized_hours
 from common.data_representation.standardized.meter import Meter
 from common.date_utils import format_date, parse, truncate
 from common.logging import Logger, ThreadPoolExecutorLogger
-from integration.base_integration import BaseFetchWorker, BaseStandardizeWorker
+from common.request_helpers import get_http_timeout
+from integration.base_integration import (
+    BaseFetchWorker,
+    BaseStandardizeWorker,
+    consumes,
+)
 from integration.irisys.data_structures import DataFile, StandardizedFile
 from integration.irisys.exceptions import (
     EmptyDataInterruption,
@@ -40,7 +46,6 @@ class GapsDetectionWorker(BaseFetchWorker):
     __created_by__ = "Irisys Missed Hours Worker"
     __description__ = "Irisys Integration"
     __name__ = "Irisys Missed Hours Worker"
-    __max_idle_run_count__ = 5
 
     def __init__(  # pylint:disable=super-init-not-called
         self,
@@ -64,6 +69,7 @@ class GapsDetectionWorker(BaseFetchWorker):
         for mtr_cfg in self._config.meters:
             self._meters_queue.put(mtr_cfg)
 
+    @consumes("_meters_queue")
     def missed_hours_consumer(
         self,
         storage_client: Client,
@@ -71,22 +77,14 @@ class GapsDetectionWorker(BaseFetchWorker):
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Get missed meter hours"""
-        if self._meters_queue.empty():
-            self._th_logger.warning("Meters queue is empty.")
-            return None
-        empty_run_count = 0
-        while True:
-            if self._meters_queue.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-                continue
-
-            mtr_cfg = self._meters_queue.get()
-            mtr_msd_poll_hrs = get_missed_standardized_files(
+        for mtr_cfg in self._consume(
+            self._meters_queue, stage="missed_hours_consumer"
+        ):
+            mtr_msd_poll_hrs = get_missed_standardized_hours(
                 bucket_name=mtr_cfg.standardized.bucket,
                 bucket_path=mtr_cfg.standardized.path,
                 range_hours=self._config.gap_regeneration_window,
+                standardized_format=self._standardized_format,
                 client=storage_client,
             )
             if mtr_msd_poll_hrs:
@@ -105,7 +103,6 @@ class GapsDetectionWorker(BaseFetchWorker):
                 self._th_logger.info(
                     f"Meter {mtr_cfg.meter_name} is up to date.",
                 )
-            self._meters_queue.task_done()
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
@@ -136,7 +133,6 @@ class FetchWorker(BaseFetchWorker):
 
     __max_retry_count__ = 3
     __retry_delay__ = 0.5
-    __max_idle_run_count__ = 5
     __request_timeout__ = 60
 
     def __init__(
@@ -167,12 +163,7 @@ class FetchWorker(BaseFetchWorker):
     def _load_from_file(
         self, filename: str, storage_client: Client, logs: Queue
     ) -> Optional[Dict]:
-        fl_exists = self._is_file_exists(
-            client=storage_client,
-            bucket=self._config.extra.raw.bucket,
-            path=self._config.extra.raw.path,
-            file_name=filename,
-        )
+        fl_exists = self._is_raw_file_exists(file_name=filename, client=storage_client)
         if not fl_exists:
             raise LoadFromConnectorAPI(
                 f"The local file 'gs://{self._config.extra.raw.bucket}/"
@@ -207,11 +198,11 @@ class FetchWorker(BaseFetchWorker):
         data = None
         while retry_count < self.__max_retry_count__:
             try:
-                result = requests.get(
+                result = self._http_session.get(
                     url,
                     params=params,
                     headers=headers,
-                    timeout=self.__request_timeout__,
+                    timeout=get_http_timeout(self.__request_timeout__),
                 )
                 if result.status_code == HTTPStatus.OK.value:
                     data = result.json()
@@ -250,60 +241,58 @@ class FetchWorker(BaseFetchWorker):
             )
             return None
 
-        empty_run_count = 0
         possible_errors = (EmptyResponse, requests.exceptions.JSONDecodeError)
 
         while True:
-            if not bool(len(self._missed_hours_queue)):
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-            else:
-                mtr_hr, mtr_cfgs = self._missed_hours_queue.popitem()
-                filename = format_date(mtr_hr, CFG.PROCESSING_DATE_FORMAT)
+            try:
+                mtr_hr, mtr_cfgs = self._pop_expiring_item(self._missed_hours_queue)
+            except KeyError:
+                break
+
+            filename = self._get_raw_filename(mtr_hr)
+            try:
                 try:
-                    try:
-                        data = self._load_from_file(
-                            filename=filename, storage_client=storage_client, logs=logs
-                        )
-                        add_to_update = False
-                    except LoadFromConnectorAPI as err:
-                        self._th_logger.info(
-                            f"Canot load the local file due to the reason '{err}'"
-                            " Loading from the WatTime API"
-                        )
-
-                        data = self._request_data(
-                            url=self.__fetch_url__,
-                            params={
-                                "format": "json",
-                                "auth_token": self._config.auth_token,
-                                "zone_id": self._config.zone_id,
-                                "date": format_date(mtr_hr, self.__api_date_format__),
-                            },
-                            headers={},
-                        )
-                        add_to_update = True
-                except possible_errors as err:
-                    self._th_logger.error(
-                        f"Cannot fetch data for '{mtr_hr}' due to the error '{err}'."
-                        " Skipping."
+                    data = self._load_from_file(
+                        filename=filename, storage_client=storage_client, logs=logs
+                    )
+                    add_to_update = False
+                except LoadFromConnectorAPI as err:
+                    self._th_logger.info(
+                        f"Canot load the local file due to the reason '{err}'"
+                        " Loading from the WatTime API"
                     )
-                    continue
 
-                file_info = DataFile(
-                    file_name=filename,
-                    bucket=self._config.extra.raw.bucket,
-                    path=self._config.extra.raw.path,
-                    body=dumps(data, indent=4, sort_keys=True),
-                    meters=mtr_cfgs,
+                    data = self._request_data(
+                        url=self.__fetch_url__,
+                        params={
+                            "format": "json",
+                            "auth_token": self._config.auth_token,
+                            "zone_id": self._config.zone_id,
+                            "date": format_date(mtr_hr, self.__api_date_format__),
+                        },
+                        headers={},
+                    )
+                    add_to_update = True
+            except possible_errors as err:
+                self._th_logger.error(
+                    f"Cannot fetch data for '{mtr_hr}' due to the error '{err}'."
+                    " Skipping."
                 )
-                file_info.timestamps.put(mtr_hr)
+                continue
+
+            file_info = DataFile(
+                file_name=filename,
+                bucket=self._config.extra.raw.bucket,
+                path=self._config.extra.raw.path,
+                body=dumps(data, indent=4, sort_keys=True),
+                meters=mtr_cfgs,
+            )
+            file_info.timestamps.put(mtr_hr)
 
-                self._fetched_files_queue.put(file_info)
-                self._shadow_fetched_files_queue.put(file_info)
-                if add_to_update:
-                    self._add_to_update(file_info, self._fetch_update_file_buffer)
+            self._fetched_files_queue.put(file_info)
+            self._shadow_fetched_files_queue.put(file_info)
+            if add_to_update:
+                self._add_to_update(file_info, self._fetch_update_file_buffer)
 
     def run(self, run_time: DateTime) -> None:
         """Run loop Entrypoint"""
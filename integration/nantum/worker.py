@@ -24,11 +24,17 @@ from google.cloud.storage import Client
 from pendulum import DateTime
 
 from common import settings as CFG
-from common.bucket_helpers import get_missed_standardized_files, require_client
+from common.bucket_helpers import require_client
+from common.coverage_index import get_missed_standardized_hours
 from common.data_representation.standardized.meter import Meter
 from common.date_utils import format_date, parse, truncate
 from common.logging import Logger, ThreadPoolExecutorLogger
-from integration.base_integration import BaseFetchWorker, BaseStandardizeWorker
+from common.request_helpers import get_http_timeout
+from integration.base_integration import (
+    BaseFetchWorker,
+    BaseStandardizeWorker,
+    consumes,
+)
 from integration.nantum.data_structures import (
     DataFile,
     FetchFile,
@@ -48,7 +54,6 @@ class GapsDetectionWorker(BaseFetchWorker):
     __created_by__ = "Nantum Missed Hours Worker"
     __description__ = "Nantum Integration"
     __name__ = "Nantum Missed Hours Worker"
-    __max_idle_run_count__ = 5
 
     def __init__(  # pylint:disable=super-init-not-called
         self,
@@ -71,6 +76,7 @@ class GapsDetectionWorker(BaseFetchWorker):
         for mtr_cfg in self._config.meters:
             self._meters_queue.put(mtr_cfg)
 
+    @consumes("_meters_queue")
     def missed_hours_consumer(
         self,
         storage_client: Client,
@@ -79,23 +85,15 @@ class GapsDetectionWorker(BaseFetchWorker):
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Get missed data points"""
-        if self._meters_queue.empty():
-            self._th_logger.warning("Meters queue is empty.")
-            return None
-        empty_run_count = 0
-        while True:
-            if self._meters_queue.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-                continue
-
-            mtr_cfg = self._meters_queue.get()
-            mtr_msd_poll_hrs = get_missed_standardized_files(
+        for mtr_cfg in self._consume(
+            self._meters_queue, stage="missed_hours_consumer"
+        ):
+            mtr_msd_poll_hrs = get_missed_standardized_hours(
                 start_date=start_date,
                 bucket_name=mtr_cfg.standardized.bucket,
                 bucket_path=mtr_cfg.standardized.path,
                 range_hours=self._config.gap_regeneration_window,
+                standardized_format=self._standardized_format,
                 client=storage_client,
             )
             if mtr_msd_poll_hrs:
@@ -111,7 +109,6 @@ class GapsDetectionWorker(BaseFetchWorker):
                 )
             else:
                 self._th_logger.info(f"Meter {mtr_cfg.meter_name} is up to date.")
-            self._meters_queue.task_done()
 
     def run(self, start_date: DateTime, run_time: DateTime) -> None:
         """Run loop entrypoint"""
@@ -149,7 +146,6 @@ class FetchWorker(BaseFetchWorker):
 
     __date_format__ = "YYYY-MM-DD"
     __fetch_file_name_tmpl__ = "{base_file_name}_{idx}"
-    __max_idle_run_count__ = 5
 
     __doc_day_start_shift_hours__ = 3
     __doc_day_duration_hours__ = 26
@@ -275,11 +271,11 @@ class FetchWorker(BaseFetchWorker):
 
         while retry_count < self.__max_retry_count__:
             try:
-                result = requests.get(
+                result = self._http_session.get(
                     url,
                     params=params,
                     headers=headers,
-                    timeout=self.__request_timeout__,
+                    timeout=get_http_timeout(self.__request_timeout__),
                 )
                 if result.status_code == HTTPStatus.OK.value:
                     break
@@ -1,5 +1,6 @@
 """ OpenWeather Workers module"""
 
+import time
 import uuid
 from abc import abstractmethod
 from collections import Counter
@@ -7,7 +8,7 @@ from http import HTTPStatus
 from json import dumps, loads
 from math import floor
 from queue import Queue
-from time import time
+from timeit import default_timer
 from typing import Any, List, Optional
 
 import requests
@@ -18,15 +19,17 @@ from pandas import DataFrame
 from pendulum import DateTime
 
 from common import settings as CFG
-from common.bucket_helpers import (
-    file_exists,
-    get_missed_standardized_files,
-    require_client,
-)
+from common.bucket_helpers import require_client
+from common.coverage_index import get_missed_standardized_hours
 from common.data_representation.standardized.meter import Meter
 from common.date_utils import GapDatePeriod, format_date, parse, truncate
 from common.logging import Logger, ThreadPoolExecutorLogger
-from integration.base_integration import BaseFetchWorker, BaseStandardizeWorker
+from common.request_helpers import get_http_timeout
+from integration.base_integration import (
+    BaseFetchWorker,
+    BaseStandardizeWorker,
+    consumes,
+)
 from integration.openweather.data_structures import DataFile, StandardizedFile
 
 RUN_GAPS_PARALLEL = True
@@ -40,7 +43,6 @@ class GapsDetectionWorker(BaseFetchWorker):
     __created_by__ = "OpenWeather Missed Hours Worker"
     __description__ = "OpenWeather Integration"
     __name__ = "OpenWeather Missed Hours Worker"
-    __max_idle_run_count__ = 5
 
     def __init__(  # pylint:disable=super-init-not-called
         self,
@@ -68,6 +70,7 @@ class GapsDetectionWorker(BaseFetchWorker):
         for mtr_cfg in self._config.meters:
             self._meters_queue.put(mtr_cfg)
 
+    @consumes("_meters_queue")
     def missed_hours_consumer(
         self,
         storage_client: Client,
@@ -75,22 +78,14 @@ class GapsDetectionWorker(BaseFetchWorker):
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Get missed data points"""
-        if self._meters_queue.empty():
-            self._th_logger.warning("Meters queue is empty.")
-            return None
-        empty_run_count = 0
-        while True:
-            if self._meters_queue.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-                continue
-
-            mtr_cfg = self._meters_queue.get()
-            mtr_msd_poll_hrs = get_missed_standardized_files(
+        for mtr_cfg in self._consume(
+            self._meters_queue, stage="missed_hours_consumer"
+        ):
+            mtr_msd_poll_hrs = get_missed_standardized_hours(
                 bucket_name=mtr_cfg.standardized.bucket,
                 bucket_path=mtr_cfg.standardized.path,
                 range_hours=self._config.gap_regeneration_window,
+                standardized_format=self._standardized_format,
                 client=storage_client,
                 date_range=self._expected_hours,
             )
@@ -110,7 +105,6 @@ class GapsDetectionWorker(BaseFetchWorker):
                 self._th_logger.info(
                     f"Meter {mtr_cfg.meter_name} is up to date.",
                 )
-            self._meters_queue.task_done()
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
@@ -138,7 +132,6 @@ class FetchWorker(BaseFetchWorker):
 
     __max_retry_count__ = 3
     __retry_delay__ = 0.5
-    __max_idle_run_count__ = 5
     __request_timeout__ = 60
 
     def __init__(
@@ -164,37 +157,13 @@ class FetchWorker(BaseFetchWorker):
             default_schema=Schema(trim_trailing_underscore=False, skip_internal=False)
         )
 
-    def _request_data(
-        self, client: Client, filename: str, dt_time: DateTime, logs: Queue
-    ) -> dict:
+    def _request_data(self, dt_time: DateTime) -> dict:
         result, retry_count, delay = {}, 0, self.__retry_delay__
+        r_data = floor(dt_time.in_timezone("UTC").timestamp())
 
         while retry_count < self.__max_retry_count__:
-
-            is_file_exists = file_exists(
-                client=client,
-                bucket=self._config.extra.raw.bucket,
-                subdirectory=self._config.extra.raw.path,
-                file_name=filename,
-            )
-
-            if is_file_exists:
-                self._th_logger.warning(
-                    f"The File {self._config.extra.raw.bucket}/"
-                    f"{self._config.extra.raw.path}/{filename} alredy exists."
-                    "Loading from bucket"
-                )
-                return self._load_json_data(
-                    client=client,
-                    bucket=self._config.extra.raw.bucket,
-                    path=self._config.extra.raw.path,
-                    filename=filename,
-                    logs=logs,
-                )
-
             try:
-                r_data = floor(dt_time.in_timezone("UTC").timestamp())
-                result = requests.get(
+                result = self._http_session.get(
                     self.__api_url__,
                     params={
                         "lat": self._config.city_coordinates_latitude,
@@ -204,11 +173,12 @@ class FetchWorker(BaseFetchWorker):
                         "units": "imperial",
                     },
                     headers={"Content-Type": "application/json"},
-                    timeout=self.__request_timeout__,
+                    timeout=get_http_timeout(self.__request_timeout__),
                 )
                 if result.status_code == HTTPStatus.OK.value:
                     result = result.json()
                     break
+                result = {}
                 retry_count += 1
                 delay *= retry_count
                 time.sleep(delay)
@@ -222,7 +192,7 @@ class FetchWorker(BaseFetchWorker):
                 delay *= retry_count
 
                 self._th_logger.error(
-                    f"Recieved error '{err} during requesting data.' ",
+                    f"Recieved error '{err} during requesting data.' "
                     f"lat - {self._config.city_coordinates_latitude}; "
                     f"lon - {self._config.city_coordinates_longitude}; "
                     f"dt - {r_data}",
@@ -232,6 +202,24 @@ class FetchWorker(BaseFetchWorker):
 
         return result
 
+    def _load_hour(self, client: Client, mtr_hr: DateTime, logs: Queue) -> dict:
+        """Load the stored raw file of the hour or request the hour data"""
+        filename = self._get_raw_filename(mtr_hr)
+        if self._is_raw_file_exists(file_name=filename, client=client):
+            self._th_logger.warning(
+                f"The File {self._config.extra.raw.bucket}/"
+                f"{self._config.extra.raw.path}/{filename} alredy exists."
+                "Loading from bucket"
+            )
+            return self._load_json_data(
+                client=client,
+                bucket=self._config.extra.raw.bucket,
+                path=self._config.extra.raw.path,
+                filename=filename,
+                logs=logs,
+            )
+        return self._request_data(dt_time=mtr_hr)
+
     def fetch_consumer(
         self,
         storage_client: Client,
@@ -239,39 +227,40 @@ class FetchWorker(BaseFetchWorker):
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Fetch data Consumer"""
-        if not bool(len(self._missed_hours_queue)):
-            self._th_logger.warning(
-                "Missed hours queue is empty. Maybe data up to date.",
-            )
-            return None
-        empty_run_count = 0
+        # The timemachine endpoint returns a single point per request, so the
+        # hours are fetched by the consumer replicas in parallel. Missed hours
+        # are collected by the gaps detection stage which is completed before
+        # fetching, so an empty cache means end of stream.
         while True:
-            if not bool(len(self._missed_hours_queue)):
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-            else:
-                mtr_hr, mtr_cfgs = self._missed_hours_queue.popitem()
-                filename = format_date(mtr_hr, CFG.PROCESSING_DATE_FORMAT)
-                data = self._request_data(
-                    client=storage_client, filename=filename, dt_time=mtr_hr, logs=logs
-                )
-                if not data:
-                    self._th_logger.error(f"Recieved empty repose for '{mtr_hr}'.")
-                    continue
-
-                file_info = DataFile(
-                    file_name=filename,
-                    bucket=self._config.extra.raw.bucket,
-                    path=self._config.extra.raw.path,
-                    body=dumps(data, sort_keys=True, indent=4),
-                    meters=mtr_cfgs,
-                )
-                file_info.timestamps.put(mtr_hr)
+            try:
+                mtr_hr, mtr_cfgs = self._pop_expiring_item(self._missed_hours_queue)
+            except KeyError:
+                break
+
+            busy_start = default_timer()
+            filename = self._get_raw_filename(mtr_hr)
+            data = self._load_hour(client=storage_client, mtr_hr=mtr_hr, logs=logs)
+            if not data:
+                self._th_logger.error(f"Recieved empty repose for '{mtr_hr}'.")
+                continue
 
-                self._fetched_files_queue.put(file_info)
-                self._shadow_fetched_files_queue.put(file_info)
-                self._add_to_update(file_info, self._fetch_update_file_buffer)
+            file_info = DataFile(
+                file_name=filename,
+                bucket=self._config.extra.raw.bucket,
+                path=self._config.extra.raw.path,
+                body=dumps(data, sort_keys=True, indent=4),
+                meters=mtr_cfgs,
+            )
+            file_info.timestamps.put(mtr_hr)
+
+            self._fetched_files_queue.put(file_info)
+            self._shadow_fetched_files_queue.put(file_info)
+            self._add_to_update(file_info, self._fetch_update_file_buffer)
+            self._update_stage_metrics(
+                "fetch_consumer",
+                processed=1,
+                busy_time=default_timer() - busy_start,
+            )
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
@@ -16,7 +16,11 @@ from common import settings as CFG
 from common.bucket_helpers import list_blobs_with_prefix, move_blob, require_client
 from common.data_representation.standardized.meter import Meter
 from common.date_utils import format_date, parse
-from integration.base_integration import BaseFetchWorker, BaseStandardizeWorker
+from integration.base_integration import (
+    BaseFetchWorker,
+    BaseStandardizeWorker,
+    consumes,
+)
 from integration.orion.data_structures import DataFile, MoveFile, StandardizedFile
 from integration.orion.exceptions import EmptyDataInterruption, RawFileValidationError
 
@@ -39,8 +43,6 @@ class FetchWorker(BaseFetchWorker):
     __failed_folder__ = "failed"
     __processed_files__ = "processed"
 
-    __max_idle_run_count__ = 5
-
     __csv_min_len__ = 2
     __csv_first_row_len__ = 2
     __csv_first_row_header__ = "date"
@@ -182,6 +184,7 @@ class FetchWorker(BaseFetchWorker):
                 f"equal with expected '{self.__csv_second_row_header__}'"
             )
 
+    @consumes("_tmp_task_q")
     def fetch_consumer(
         self,
         storage_client: Client,
@@ -189,18 +192,7 @@ class FetchWorker(BaseFetchWorker):
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Fetch data worker"""
-        if self._tmp_task_q.empty():
-            self._th_logger.warning("Meters queue is empty.")
-            return None
-        empty_run_count = 0
-        while True:
-            if self._tmp_task_q.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-                continue
-
-            file_info = self._tmp_task_q.get()
+        for file_info in self._consume(self._tmp_task_q, stage="fetch_consumer"):
             data = self._retry_load_data(
                 client=storage_client,
                 bucket=file_info.bucket,
@@ -255,55 +247,44 @@ class FetchWorker(BaseFetchWorker):
                     destination_path=self._processed_folder,
                 )
             )
-            self._tmp_task_q.task_done()
 
     # TODO @todo Should be refactored.
+    @consumes("_fetch_processed_q")
     def _move_processed_files_consumer(
         self,
         storage_client: Client,
         logs: Queue,  # pylint:disable=unused-argument
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
-        if self._fetch_processed_q.empty():
-            self._th_logger.warning(
-                "The files queue is empty. Shutdown worker.",
+        for file_info in self._consume(
+            self._fetch_processed_q, stage="move_processed_files_consumer"
+        ):
+            self._th_logger.debug(
+                f"Moving file gs://{file_info.bucket}/{file_info.path}/"
+                f"{file_info.filename}"
+                f" to gs://{file_info.destination_bucket}/"
+                f"/{file_info.destination_path}"
+                f"{file_info.destination_filename}"
             )
-            return None
-        empty_run_count = 0
-        while True:
-            if self._fetch_processed_q.empty():
-                if empty_run_count == 3:
-                    break
-                empty_run_count += 1
-            else:
-                file_info = self._fetch_processed_q.get()
-                self._th_logger.debug(
-                    f"Moving file gs://{file_info.bucket}/{file_info.path}/"
-                    f"{file_info.filename}"
-                    f" to gs://{file_info.destination_bucket}/"
-                    f"/{file_info.destination_path}"
-                    f"{file_info.destination_filename}"
-                )
 
-                move_blob(
-                    client=storage_client,
-                    bucket_name=file_info.bucket,
-                    blob_name=str(Path(file_info.path).joinpath(file_info.filename)),
-                    destination_bucket=file_info.destination_bucket,
-                    new_blob_name=str(
-                        Path(file_info.destination_path).joinpath(
-                            file_info.destination_filename
-                        )
-                    ),
-                    quiet=True,
-                )
-                self._th_logger.debug(
-                    f"Moved file 'gs://{file_info.bucket}/{file_info.path}"
-                    f"{file_info.filename}' to the "
-                    f"'gs://{file_info.destination_bucket}/"
-                    f"{file_info.destination_path}/{file_info.destination_filename}'.",
-                )
-                self._fetch_processed_q.task_done()
+            move_blob(
+                client=storage_client,
+                bucket_name=file_info.bucket,
+                blob_name=str(Path(file_info.path).joinpath(file_info.filename)),
+                destination_bucket=file_info.destination_bucket,
+                new_blob_name=str(
+                    Path(file_info.destination_path).joinpath(
+                        file_info.destination_filename
+                    )
+                ),
+                quiet=True,
+            )
+            self._th_logger.debug(
+                f"Moved file 'gs://{file_info.bucket}/{file_info.path}"
+                f"{file_info.filename}' to the "
+                f"'gs://{file_info.destination_bucket}/"
+                f"{file_info.destination_path}/{file_info.destination_filename}'.",
+            )
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entry point"""
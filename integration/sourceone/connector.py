@@ -12,11 +12,10 @@ from typing import Optional
 from dataclass_factory import Factory
 
 from common import settings as CFG
-from common.bucket_helpers import get_missed_standardized_files
+from common.coverage_index import get_missed_standardized_hours
 from common.date_utils import format_date, truncate
 from common.elapsed_time import elapsed_timer
 from common.logging import Logger
-from common.thread_pool_executor import run_thread_pool_executor
 from integration.base_integration import BasePushConnector
 from integration.sourceone.config import SourceoneCfg
 from integration.sourceone.data_structures import FetchPayload
@@ -95,71 +94,8 @@ class SourceOneBaseConnector(BasePushConnector):
         self.standardize()
         self.save_update_status()
 
-    # TODO: Should be moved to base class during moving all integrations in
-    # paralell approach
-    def process_worker_run_results(self, futures, logs) -> None:
-        """Process worker statuses and collected logs"""
-        for res in futures:
-            try:
-                res.result()
-            except Exception as err:  # pylint: disable=broad-except
-                self._logger.error(
-                    f"ERROR: Received error '{err}' during downloading blobs"
-                )
-
-        while not logs.empty():
-            level, _, message = logs.get()
-            self._logger.log(level, message)
-            logs.task_done()
-
     def save_update_status(self) -> None:
-        self._save_fetch_update_status()
-        self._save_standardize_update_status()
-
-    def _save_fetch_update_status(self) -> None:
-        with elapsed_timer() as elapsed:
-            self._logger.info("Saving fetching data update status")
-
-            logs = Queue()
-
-            futures = run_thread_pool_executor(
-                workers=[
-                    (
-                        self._fetch_worker.save_fetch_status_worker,
-                        [logs],
-                    )
-                ],
-                worker_replica=self.__workers_amount__,
-            )
-
-            self.process_worker_run_results(futures, logs)
-
-            self._logger.info(
-                "Saved fetching update status.",
-                extra={"labels": {"elapsed_time": elapsed()}},
-            )
-
-    def _save_standardize_update_status(self) -> None:
-        with elapsed_timer() as elapsed:
-            self._logger.info(f"Saving {self.__name__} standardized data update status")
-
-            logs = Queue()
-            futures = run_thread_pool_executor(
-                workers=[
-                    (
-                        self._standardize_worker.save_standardize_status_worker,
-                        [logs],
-                    )
-                ],
-                worker_replica=self.__workers_amount__,
-            )
-
-            self.process_worker_run_results(futures, logs)
-
-            self._logger.info(
-                f"Saved {self.__name__} standardizing update status.",
-                extra={"labels": {"elapsed_time": elapsed()}},
-            )
+        """Update status is saved by the workers runs"""
 
     @abstractmethod
     def get_missed_hours(self) -> None:
@@ -212,7 +148,7 @@ class SourceOneConnector(SourceOneBaseConnector):
             counter = Counter()
             for mtr_cfg in self._config.meters:
                 mtr_msd_poll_hrs = sorted(
-                    get_missed_standardized_files(
+                    get_missed_standardized_hours(
                         start_date=truncate(self._run_time, level="hour"),
                         bucket_name=mtr_cfg.standardized.bucket,
                         bucket_path=mtr_cfg.standardized.path,
@@ -250,26 +186,7 @@ class SourceOneConnector(SourceOneBaseConnector):
                 )
                 return None
 
-            logs = Queue()
-
-            self._fetch_worker.configure(self._run_time)
-
-            workers = (
-                self._fetch_worker.run_fetch_worker,
-                self._fetch_worker.save_fetched_files_worker,
-            )
-
-            for worker in workers:
-                futures = run_thread_pool_executor(
-                    workers=[
-                        (
-                            worker,
-                            [logs],
-                        )
-                    ],
-                    worker_replica=self.__workers_amount__,
-                )
-                self.process_worker_run_results(futures, logs)
+            self._fetch_worker.run(self._run_time)
 
             self._logger.info(
                 f"Completed {self.__name__} data fetching.",
@@ -290,27 +207,7 @@ class SourceOneConnector(SourceOneBaseConnector):
                 )
                 return None
 
-            logs = Queue()
-            self._standardize_worker.configure(self._run_time)
-
-            workers = (
-                self._standardize_worker.run_standardize_worker,
-                self._standardize_worker.save_standardized_files_worker,
-            )
-
-            for worker in workers:
-                futures = run_thread_pool_executor(
-                    workers=[
-                        (
-                            worker,
-                            [logs],
-                        )
-                    ],
-                    worker_replica=self.__workers_amount__,
-                )
-                self.process_worker_run_results(futures, logs)
-
-            self._standardize_worker.finalize_standardize_update_status()
+            self._standardize_worker.run(self._run_time)
 
             self._logger.info(
                 "Completed data standardization.",
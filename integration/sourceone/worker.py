@@ -3,7 +3,7 @@
 from collections import Counter
 from io import StringIO
 from pathlib import Path
-from queue import Queue
+from queue import Empty, Queue
 from threading import Lock
 from typing import Any, List, Optional
 
@@ -14,8 +14,15 @@ from pandas import DataFrame
 from pendulum import DateTime
 
 from common import settings as CFG
+from common.bucket_helpers import require_client
 from common.data_representation.standardized.meter import Meter
 from common.date_utils import format_date, parse, truncate
+from common.mail_sync import (
+    fetch_messages,
+    load_mail_sync_state,
+    save_mail_sync_state,
+    search_new_uids,
+)
 from integration.base_integration import BaseFetchWorker, BaseStandardizeWorker
 from integration.sourceone.data_structures import DataFile
 
@@ -139,39 +146,65 @@ class FetchWorker(BaseFetchWorker):
 
     def run_fetch_worker(self, logs: Queue, worker_idx: str) -> None:
         processed, skipped = set(), set()
-        processing = True
         counter = Counter()
         data_blobs = []
+        folder = str(self.__mail_root_folder__)
+        raw = self._config.extra.raw
+        storage_client = require_client()
         with self._get_mail_connection() as mailbox:
-            query = self._get_message_query()
-
-            for msg in mailbox.fetch(query):
-                if processing:
-                    attachements = self.filter_mail_attachments(msg.attachments)
-                    expected_cnt = counter["1"] + len(attachements)
-                    if expected_cnt >= self.__raw_files_pool_size__:
-                        processing = False
-                        skipped.add(msg.uid)
-                        continue
-
-                    data_blobs += list(map(lambda x: x.payload, attachements))
-                    processed.add(msg.uid)
-                else:
-                    skipped.add(msg.uid)
+            uids, sync_state = search_new_uids(
+                mailbox=mailbox,
+                folder=folder,
+                criteria=self._get_message_query(),
+                state=load_mail_sync_state(
+                    raw.bucket, raw.path, folder, storage_client
+                ),
+            )
+
+            for msg in fetch_messages(mailbox, uids):
+                attachements = self.filter_mail_attachments(msg.attachments)
+                expected_cnt = counter["1"] + len(attachements)
+                if expected_cnt >= self.__raw_files_pool_size__:
+                    break
+
+                counter["1"] = expected_cnt
+                data_blobs += list(map(lambda x: x.payload, attachements))
+                processed.add(msg.uid)
+
+            skipped = set(uids).difference(processed)
             self._move_processed_msgs(
                 mailbox=mailbox,
-                uids=processed,
+                uids=list(processed),
                 folder=self._get_mail_processed_folder(mailbox, logs, worker_idx),
                 logs=logs,
                 worker_idx=worker_idx,
             )
 
             self._mark_as_unread_skipped_msgs(
-                mailbox=mailbox, uids=skipped, logs=logs, worker_idx=worker_idx
+                mailbox=mailbox, uids=list(skipped), logs=logs, worker_idx=worker_idx
+            )
+            save_mail_sync_state(
+                raw.bucket,
+                raw.path,
+                folder,
+                sync_state.release(skipped),
+                storage_client,
             )
 
         self._unbundle_blobs(raw_blobs=data_blobs, logs=logs, worker_idx=worker_idx)
 
+    def run(self, run_time: DateTime) -> None:
+        """Run loop entrypoint"""
+        self.configure(run_time)
+        self._run_consumers(
+            [
+                (self.run_fetch_worker, []),
+                (self.save_fetched_files_worker, []),
+            ]
+        )
+        self.finalize_fetch_update_status()
+        self._run_consumers([(self.save_fetch_status_worker, [])])
+
     def _unbundle_blobs(  # pylint:disable=unused-argument
         self, raw_blobs: List[str], logs: Queue, worker_idx: str
     ) -> None:
@@ -187,33 +220,31 @@ class FetchWorker(BaseFetchWorker):
             )
             return None
 
-        empty_run_count = 0
-
+        # Missed hours are collected before fetching, so the queue is drained.
         while True:
-            if self._missed_hours_queue.empty():
-                if empty_run_count == 3:
-                    break
-                empty_run_count += 1
-            else:
-                raw_object = self._missed_hours_queue.get()
-                for blob in raw_blobs:
-                    file_name = self.__fetch_file_name_tmpl__.format(
-                        base_file_name=raw_object.file_name,
-                        idx=self._fetch_counter["file_id"],
-                    )
-                    self._fetch_counter["file_id"] += 1
-                    file_info = DataFile(
-                        file_name=file_name,
-                        bucket=self._config.extra.raw.bucket,
-                        path=self._config.extra.raw.path,
-                        body=blob,
-                        cfg=raw_object.meter_cfg,
-                        missed_hours=raw_object.meters_hours,
-                    )
-                    self._fetched_files_queue.put(file_info)
-                    self._shadow_fetched_files_queue.put(file_info)
-                    self._add_to_update(file_info, self._fetch_update_file_buffer)
-                self._missed_hours_queue.task_done()
+            try:
+                raw_object = self._missed_hours_queue.get_nowait()
+            except Empty:
+                break
+
+            for blob in raw_blobs:
+                file_name = self.__fetch_file_name_tmpl__.format(
+                    base_file_name=raw_object.file_name,
+                    idx=self._fetch_counter["file_id"],
+                )
+                self._fetch_counter["file_id"] += 1
+                file_info = DataFile(
+                    file_name=file_name,
+                    bucket=self._config.extra.raw.bucket,
+                    path=self._config.extra.raw.path,
+                    body=blob,
+                    cfg=raw_object.meter_cfg,
+                    missed_hours=raw_object.meters_hours,
+                )
+                self._fetched_files_queue.put(file_info)
+                self._shadow_fetched_files_queue.put(file_info)
+                self._add_to_update(file_info, self._fetch_update_file_buffer)
+            self._missed_hours_queue.task_done()
 
 
 class StandardizeWorker(BaseStandardizeWorker):
@@ -301,3 +332,15 @@ class StandardizeWorker(BaseStandardizeWorker):
             )
 
         return standardized_files
+
+    def run(self, run_time: DateTime) -> None:
+        """Run loop entrypoint"""
+        self.configure(run_time)
+        self._run_consumers(
+            [
+                (self.run_standardize_worker, []),
+                (self.save_standardized_files_worker, []),
+            ]
+        )
+        self.finalize_standardize_update_status()
+        self._run_consumers([(self.save_standardize_status_worker, [])])
@@ -5,9 +5,10 @@ from abc import abstractmethod
 from collections import Counter, defaultdict
 from http import HTTPStatus
 from json import dumps, loads
-from queue import Queue
+from queue import Empty, Queue
 from threading import Lock
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
 
 import requests
 from dataclass_factory import Factory, Schema
@@ -17,26 +18,47 @@ from pendulum import DateTime
 from requests.auth import HTTPBasicAuth
 
 from common import settings as CFG
-from common.bucket_helpers import get_missed_standardized_files, require_client
+from common.bucket_helpers import require_client
+from common.coverage_index import get_missed_standardized_hours
 from common.data_representation.standardized.meter import Meter
 from common.date_utils import GapDatePeriod, format_date, parse, truncate
 from common.logging import Logger, ThreadPoolExecutorLogger
+from common.request_helpers import get_http_timeout
 from integration.base_integration import (
     BaseFetchWorker,
     BaseStandardizeWorker,
     EmptyRawFile,
+    consumes,
 )
 from integration.wattime.data import DataFile, StandardizedFile
-from integration.wattime.exceptions import (
-    AuthtorizeException,
-    EmptyResponse,
-    LoadFromWattime,
-)
+from integration.wattime.exceptions import AuthtorizeException, EmptyResponse
 
 RUN_GAPS_PARALLEL = True
 RUN_FETCH_PARALLEL = True
 RUN_STANDARDIZE_PARALLEL = True
 
+# Wattime tokens expire in 30 minutes, they are shared by all workers a bit less.
+TOKEN_EXPIRES_SECONDS = 25 * 60
+TOKENS_CACHE = ExpiringDict(max_len=100, max_age_seconds=TOKEN_EXPIRES_SECONDS)
+TOKENS_LOCK = Lock()
+
+
+def split_into_ranges(
+    hours: Iterable[DateTime], max_hours: int
+) -> List[List[DateTime]]:
+    """Split hours into sorted ranges of consecutive hours"""
+    ranges = []
+    for hour in sorted(hours):
+        if (
+            ranges
+            and int(hour.timestamp()) - int(ranges[-1][-1].timestamp()) <= 3600
+            and len(ranges[-1]) < max_hours
+        ):
+            ranges[-1].append(hour)
+        else:
+            ranges.append([hour])
+    return ranges
+
 
 class MarginalEmGapsDetectionWorker(BaseFetchWorker):
     """Wattime Marginal get missed hours worker functionality"""
@@ -44,7 +66,6 @@ class MarginalEmGapsDetectionWorker(BaseFetchWorker):
     __created_by__ = "Wattime Marginal Missed Hours Worker"
     __description__ = "Wattime Marginal Integration"
     __name__ = "Wattime Marginal Missed Hours Worker"
-    __max_idle_run_count__ = 5
 
     def __init__(  # pylint:disable=super-init-not-called
         self,
@@ -71,6 +92,7 @@ class MarginalEmGapsDetectionWorker(BaseFetchWorker):
         for mtr_cfg in self._config.meters:
             self._meters_queue.put(mtr_cfg)
 
+    @consumes("_meters_queue")
     def missed_hours_consumer(
         self,
         storage_client: Client,
@@ -78,22 +100,14 @@ class MarginalEmGapsDetectionWorker(BaseFetchWorker):
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Get missed data points."""
-        if self._meters_queue.empty():
-            self._th_logger.warning("Meters queue is empty.")
-            return None
-        empty_run_count = 0
-        while True:
-            if self._meters_queue.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-                continue
-
-            mtr_cfg = self._meters_queue.get()
-            mtr_msd_poll_hrs = get_missed_standardized_files(
+        for mtr_cfg in self._consume(
+            self._meters_queue, stage="missed_hours_consumer"
+        ):
+            mtr_msd_poll_hrs = get_missed_standardized_hours(
                 bucket_name=mtr_cfg.standardized.bucket,
                 bucket_path=mtr_cfg.standardized.path,
                 range_hours=self._config.gap_regeneration_window,
+                standardized_format=self._standardized_format,
                 client=storage_client,
                 date_range=self._expected_hours,
             )
@@ -111,7 +125,6 @@ class MarginalEmGapsDetectionWorker(BaseFetchWorker):
                 )
             else:
                 self._th_logger.info(f"Meter {mtr_cfg.meter_name} is up to date.")
-            self._meters_queue.task_done()
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
@@ -137,6 +150,29 @@ class WatTimeBaseFetchWorker(BaseFetchWorker):
 
     __max_retry_count__ = 3
     __retry_delay__ = 0.5
+    # Wattime recommends pulling no more than a month of data per query.
+    __max_range_hours__ = 24 * 30
+
+    def __init__(
+        self,
+        missed_hours: ExpiringDict,
+        fetched_files: Queue,
+        fetch_update: Queue,
+        config: Any,
+    ) -> None:
+        super().__init__(
+            missed_hours=missed_hours,
+            fetched_files=fetched_files,
+            fetch_update=fetch_update,
+            config=config,
+        )
+        self._fetch_counter = Counter()
+        self._base_filename: Optional[str] = None
+
+    def configure(self, run_time: DateTime) -> None:
+        super().configure(run_time=run_time)
+        self._fetch_counter.clear()
+        self._base_filename = format_date(self._run_time, CFG.PROCESSING_DATE_FORMAT)
 
     def authorize(self) -> str:
         """Retrive Wattime token"""
@@ -144,14 +180,14 @@ class WatTimeBaseFetchWorker(BaseFetchWorker):
             raise AuthtorizeException(
                 "Configuration is not run or provided empty credential"
             )
-        retry_count, delay = 0, 1
+        retry_count, delay, token = 0, 1, None
 
         while retry_count < self.__max_retry_count__:
             try:
-                resp = requests.get(
+                resp = self._http_session.get(
                     self.__auth_url__,
                     auth=HTTPBasicAuth(self._config.username, self._config.password),
-                    timeout=self.__request_timeout__,
+                    timeout=get_http_timeout(self.__request_timeout__),
                 )
                 if resp.status_code == HTTPStatus.OK.value:
                     token = resp.json().get("token")
@@ -164,10 +200,26 @@ class WatTimeBaseFetchWorker(BaseFetchWorker):
                 retry_count += 1
                 delay = retry_count * self.__retry_delay__
                 time.sleep(delay)
+        if not token:
+            raise AuthtorizeException("Cannot connect to the authorization server.")
+        return token
+
+    def get_token(self, expired_token: Optional[str] = None) -> str:
+        """Get token shared by the workers until it expires.
+
+        The ``expired_token`` rejected by the server is replaced by a new
+        one unless another worker has already replaced it.
+        """
+        key = (self.__auth_url__, self._config.username)
+        with TOKENS_LOCK:
+            token = TOKENS_CACHE.get(key)
+            if not token or token == expired_token:
+                token = self.authorize()
+                TOKENS_CACHE[key] = token
         return token
 
     def _request_data(self, url: str, params: dict, token: Optional[str]) -> Tuple:
-        retry_count, delay = 0, 0.5
+        retry_count = 0
         auth_errors = (
             HTTPStatus.UNAUTHORIZED.value,
             HTTPStatus.FORBIDDEN.value,
@@ -176,82 +228,100 @@ class WatTimeBaseFetchWorker(BaseFetchWorker):
         # From requests version 2.26 url params encoding is forced without
         # ablity to prevent. See more details at
         # https://github.com/psf/requests/issues/5964#issuecomment-949013046
-        # At the same time Wattime doesn't support encoded parameters in a queue
-        # So we must to build full url by self
-
-        query = ""
-        if params:
-            query_params = list(map(lambda x: f"{x[0]}={x[1]}", params.items()))
-            query = "&".join(query_params)
-
-        full_url = f"{url}?{query}" if query else url
+        # At the same time Wattime doesn't support encoded time separators, so
+        # the query is encoded by self keeping them as is.
+        query = urlencode(params, safe=":")
         data = {}
         while retry_count < self.__max_retry_count__:
             try:
-                result = requests.get(
-                    full_url,
-                    params={},
+                result = self._http_session.get(
+                    url,
+                    params=query,
                     headers={"Authorization": f"Bearer {token}"},
-                    timeout=self.__request_timeout__,
+                    timeout=get_http_timeout(self.__request_timeout__),
                 )
                 if result.status_code == HTTPStatus.OK.value:
                     data = result.json()
                     break
                 if result.status_code in auth_errors:
-                    token = self.authorize()
-                    retry_count += 1
-                    delay = retry_count
-                    time.sleep(delay)
+                    token = self.get_token(expired_token=token)
+                retry_count += 1
+                time.sleep(retry_count * self.__retry_delay__)
             except (requests.ConnectionError, requests.ConnectTimeout):
                 retry_count += 1
-                delay = retry_count
-                time.sleep(delay)
+                time.sleep(retry_count * self.__retry_delay__)
 
-        if not data or result.status_code != HTTPStatus.OK.value:
+        if result is None or result.status_code != HTTPStatus.OK.value:
             raise EmptyResponse(
-                "Cannot run request corectly"
-                f"Response status code is {result.status_code}. "
-                f"Response message is {result.text}. Response parameters: - "
-                f"{params}; "
+                "Cannot run request corectly. "
+                f"Response status code is "
+                f"{getattr(result, 'status_code', None)}. "
+                f"Response message is {getattr(result, 'text', None)}. "
+                f"Response parameters: - {params}; "
             )
 
         return data, token
 
-    def _load_from_file(
-        self, filename: str, storage_client: Client, logs: Queue
-    ) -> Optional[Dict]:
-        fl_exists = self._is_file_exists(
-            client=storage_client,
-            bucket=self._config.extra.raw.bucket,
-            path=self._config.extra.raw.path,
-            file_name=filename,
+    def _request_range(
+        self, hours: List[DateTime], token: Optional[str]
+    ) -> Tuple[List[Dict], str]:
+        """Request data points of the given range of hours at once"""
+        return self._request_data(
+            url=self.__fetch_url__,
+            params={
+                "ba": self._config.grid_regions_name,
+                "starttime": format_date(hours[0], CFG.PROCESSING_DATE_FORMAT),
+                "endtime": format_date(hours[-1], CFG.PROCESSING_DATE_FORMAT),
+            },
+            token=token,
         )
-        if not fl_exists:
-            raise LoadFromWattime(
-                f"The local file 'gs://{self._config.extra.raw.bucket}/"
-                f"{self._config.extra.raw.path}/{filename}'"
-                "is absent"
+
+    def _put_range_file(
+        self, hours: List[DateTime], points: List[Dict], mtr_cfgs: List[Any]
+    ) -> None:
+        """Put data points of the range hours into a single raw file"""
+        expected_hours = {int(hour.timestamp()): hour for hour in hours}
+        range_points, range_hours = [], {}
+        for point in points:
+            point_hour = int(
+                truncate(parse(point.get("point_time")), level="hour").timestamp()
             )
-        self._th_logger.warning(
-            f"File 'gs://{self._config.extra.raw.bucket}/"
-            f"{self._config.extra.raw.path}/{filename} already exists. "
-            "Loading from the bucket."
-        )
-        data = self._retry_load_json_data(
+            if point_hour not in expected_hours:
+                self._th_logger.error(
+                    f"Found excess date in '{point.get('point_time')}' hour in "
+                    "response. Skipping."
+                )
+                continue
+            range_points.append(point)
+            range_hours[point_hour] = expected_hours[point_hour]
+
+        if not range_points:
+            self._th_logger.error(
+                f"Recieved empty response from '{hours[0]}' to '{hours[-1]}'."
+            )
+            return
+
+        with self._lock:
+            filename = self.__fetch_file_name_tmpl__.format(
+                base_file_name=self._base_filename,
+                idx=self._fetch_counter["file_id"],
+            )
+            self._fetch_counter["file_id"] += 1
+
+        file_info = DataFile(
+            file_name=filename,
             bucket=self._config.extra.raw.bucket,
             path=self._config.extra.raw.path,
-            filename=filename,
-            logs=logs,
-            client=storage_client,
+            body=dumps(range_points, indent=4, sort_keys=True),
         )
+        for hour in sorted(range_hours.values()):
+            file_info.timestamps.put(hour)
+        for cfg in mtr_cfgs:
+            file_info.meters.put(cfg)
 
-        if not data:
-            raise LoadFromWattime(
-                f"The raw file 'gs://{self._config.extra.raw.bucket}/"
-                f"{self._config.extra.raw.path}/{filename}'"
-                "is empty. Skipping"
-            )
-        return data
+        self._fetched_files_queue.put(file_info)
+        self._shadow_fetched_files_queue.put(file_info)
+        self._add_to_update(file_info, self._fetch_update_file_buffer)
 
     @abstractmethod
     def run_fetch_worker(self, logs: Queue, worker_idx: int) -> None:
@@ -261,15 +331,29 @@ class WatTimeBaseFetchWorker(BaseFetchWorker):
 class WatTimeBaseStandardizeWorker(BaseStandardizeWorker):
     """Wattime base standardize worker functionality"""
 
+    @staticmethod
+    def _get_hour_points(json_data: List[Dict]) -> Dict[int, List[Dict]]:
+        """Group data points of a raw file by the hour timestamp"""
+        hour_points = defaultdict(list)
+        for point in sorted(json_data, key=lambda x: x.get("point_time") or ""):
+            if point.get("point_time"):
+                point_hour = truncate(parse(point["point_time"]), level="hour")
+                hour_points[int(point_hour.timestamp())].append(point)
+        return hour_points
+
     def _standardize(self, raw_file_obj: DataFile) -> List[DataFile]:
         """Standardize the given raw file"""
-        json_data = loads(raw_file_obj.body)
-        # TODO: Redesign worker to process all meter points in parallel
+        hour_points = self._get_hour_points(loads(raw_file_obj.body))
+        mtr_cfgs = []
+        while not raw_file_obj.meters.empty():
+            mtr_cfgs.append(raw_file_obj.meters.get())
+            raw_file_obj.meters.task_done()
+
         standardized_files = []
         while not raw_file_obj.timestamps.empty():
             mtr_hr = raw_file_obj.timestamps.get()
-            while not raw_file_obj.meters.empty():
-                mtr_cfg = raw_file_obj.meters.get()
+            json_data = hour_points.get(int(mtr_hr.timestamp()), [])
+            for mtr_cfg in mtr_cfgs:
                 meter_type = mtr_cfg.type.strip().lower().replace(" ", "_")
                 stndrdz_mthd_nm = f"_standardize_{meter_type}"
                 stndrdz_func = getattr(self, stndrdz_mthd_nm, "")
@@ -294,10 +378,10 @@ class WatTimeBaseStandardizeWorker(BaseStandardizeWorker):
                         )
                 except EmptyRawFile:
                     raise EmptyRawFile(  # pylint:disable=raise-missing-from
-                        f"Detected empty body in the RawFile 'gs://{mtr_cfg.bucket}/'"
-                        f"{mtr_cfg.path}/{raw_file_obj.file_name}"
+                        "Detected empty body of the hour "
+                        f"'{mtr_hr}' in the RawFile 'gs://{raw_file_obj.bucket}/"
+                        f"{raw_file_obj.path}/{raw_file_obj.file_name}'"
                     )
-                raw_file_obj.meters.task_done()
             raw_file_obj.timestamps.task_done()
         return standardized_files
 
@@ -330,7 +414,6 @@ class MarginalEmFetchWorker(WatTimeBaseFetchWorker):
 
     __max_retry_count__ = 3
     __retry_delay__ = 0.5
-    __max_idle_run_count__ = 5
 
     def __init__(
         self,
@@ -349,90 +432,81 @@ class MarginalEmFetchWorker(WatTimeBaseFetchWorker):
         self._missed_hours_queue: ExpiringDict = missed_hours
 
         self._raw_fetch_queue = Queue()
+        self._ranges_queue = Queue()
 
         self._factory = Factory(
             default_schema=Schema(trim_trailing_underscore=False, skip_internal=False)
         )
 
+    def configure(self, run_time: DateTime) -> None:
+        super().configure(run_time=run_time)
+        self._clear_queue(self._ranges_queue)
+
+    def _group_missed_hours(self) -> None:
+        """Group missed hours of the same meters into ranges fetched at once"""
+        meters_hours = {}
+        while True:
+            try:
+                mtr_hr, mtr_cfgs = self._pop_expiring_item(
+                    self._missed_hours_queue
+                )
+            except KeyError:
+                break
+
+            mtr_cfg_list = list(mtr_cfgs.queue)
+            key = tuple(sorted(cfg.meter_uri for cfg in mtr_cfg_list))
+            meters_hours.setdefault(key, (mtr_cfg_list, []))[1].append(mtr_hr)
+
+        for mtr_cfg_list, hours in meters_hours.values():
+            for hours_range in split_into_ranges(hours, self.__max_range_hours__):
+                self._ranges_queue.put((hours_range, mtr_cfg_list))
+
     def fetch_consumer(
         self,
-        storage_client: Client,
+        storage_client: Client,  # pylint:disable=unused-argument
         logs: Queue,  # pylint:disable=unused-argument
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Fetch missed data points"""
-        if not bool(len(self._missed_hours_queue)):
+        if self._ranges_queue.empty():
             self._th_logger.warning(
                 "Missed hours queue is empty. Maybe data up to date."
             )
             return None
-        empty_run_count = 0
         possible_errors = (
             AuthtorizeException,
             EmptyResponse,
             requests.exceptions.JSONDecodeError,
         )
         try:
-            token = self.authorize()
+            token = self.get_token()
         except AuthtorizeException as err:
             self._th_logger.error(f"Cannot fetch data due to the error '{err}'. Exit.")
             return None
 
+        # Missed hours are grouped into ranges before fetching, so an empty
+        # queue means end of stream.
         while True:
-            if not bool(len(self._missed_hours_queue)):
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-            else:
-                mtr_hr, mtr_cfgs = self._missed_hours_queue.popitem()
-                filename = format_date(mtr_hr, CFG.PROCESSING_DATE_FORMAT)
-                add_to_update = (False,)
-                try:
-                    try:
-                        data = self._load_from_file(
-                            filename=filename, storage_client=storage_client, logs=logs
-                        )
-                        add_to_update = False
-                    except LoadFromWattime as err:
-                        self._th_logger.info(
-                            f"Canot load the local file due to the reason '{err}'"
-                            " Loading from th eWatTime API"
-                        )
-                        mtr_dt = format_date(mtr_hr, CFG.PROCESSING_DATE_FORMAT)
-                        data, token = self._request_data(
-                            url=self.__fetch_url__,
-                            params={
-                                "ba": self._config.grid_regions_name,
-                                "starttime": mtr_dt,
-                                "endtime": mtr_dt,
-                            },
-                            token=token,
-                        )
-                        add_to_update = True
-                except possible_errors as err:
-                    self._th_logger.error(
-                        f"Cannot fetch data for '{mtr_hr}' due to the error '{err}'."
-                        " Skipping."
-                    )
-                    continue
+            try:
+                hours_range, mtr_cfgs = self._ranges_queue.get_nowait()
+            except Empty:
+                break
 
-                file_info = DataFile(
-                    file_name=filename,
-                    bucket=self._config.extra.raw.bucket,
-                    path=self._config.extra.raw.path,
-                    body=dumps(data, indent=4, sort_keys=True),
-                    meters=mtr_cfgs,
+            try:
+                data, token = self._request_range(hours_range, token)
+            except possible_errors as err:
+                self._th_logger.error(
+                    f"Cannot fetch data from '{hours_range[0]}' to "
+                    f"'{hours_range[-1]}' due to the error '{err}'. Skipping."
                 )
-                file_info.timestamps.put(mtr_hr)
-
-                self._fetched_files_queue.put(file_info)
-                self._shadow_fetched_files_queue.put(file_info)
-                if add_to_update:
-                    self._add_to_update(file_info, self._fetch_update_file_buffer)
+            else:
+                self._put_range_file(hours_range, data, mtr_cfgs)
+            self._ranges_queue.task_done()
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
         self.configure(run_time)
+        self._group_missed_hours()
         self._run_consumers(
             [
                 (self.fetch_consumer, [require_client()]),
@@ -484,8 +558,8 @@ class AverageEmGapsDetectionWorker(BaseFetchWorker):
     __created_by__ = "OpenWeather Missed Hours Worker"
     __description__ = "OpenWeather Integration"
     __name__ = "OpenWeather Missed Hours Worker"
-    __max_idle_run_count__ = 5
     __default_delay_hours__ = 12
+    __max_range_hours__ = WatTimeBaseFetchWorker.__max_range_hours__
 
     def __init__(  # pylint:disable=super-init-not-called
         self,
@@ -512,6 +586,7 @@ class AverageEmGapsDetectionWorker(BaseFetchWorker):
         for mtr_cfg in self._config.meters:
             self._meters_queue.put(mtr_cfg)
 
+    @consumes("_meters_queue")
     def missed_hours_consumer(
         self,
         storage_client: Client,
@@ -519,23 +594,15 @@ class AverageEmGapsDetectionWorker(BaseFetchWorker):
         worker_idx: str,  # pylint:disable=unused-argument
     ) -> None:
         """Get missed integration points"""
-        if self._meters_queue.empty():
-            self._th_logger.warning("Meters queue is empty.")
-            return None
-        empty_run_count = 0
-        while True:
-            if self._meters_queue.empty():
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-                continue
-
-            mtr_cfg = self._meters_queue.get()
+        for mtr_cfg in self._consume(
+            self._meters_queue, stage="missed_hours_consumer"
+        ):
             mtr_msd_poll_hrs = sorted(
-                get_missed_standardized_files(
+                get_missed_standardized_hours(
                     bucket_name=mtr_cfg.standardized.bucket,
                     bucket_path=mtr_cfg.standardized.path,
                     range_hours=self._config.gap_regeneration_window,
+                    standardized_format=self._standardized_format,
                     client=storage_client,
                     date_range=self._expected_hours,
                 )
@@ -553,17 +620,11 @@ class AverageEmGapsDetectionWorker(BaseFetchWorker):
                 )
                 continue
 
-            # Group range by month to make one wattime call with month range maximum
-            missed_hrs_index = defaultdict(list)
-            for hour in mtr_msd_poll_hrs:
-                missed_hrs_index[hour.month].append(hour)
-
-            for _, hours in missed_hrs_index.items():
-                if len(hours) == 1:
-                    key = tuple(hours[0], hours[0].add(hours=1))
-                else:
-                    key = tuple(sorted(hours))
-
+            # Group missed hours into ranges fetched by a single wattime call
+            for hours in split_into_ranges(
+                mtr_msd_poll_hrs, self.__max_range_hours__
+            ):
+                key = tuple(hours)
                 self._missed_hours_cache.setdefault(key, Queue())
                 self._missed_hours_cache[key].put(mtr_cfg)
 
@@ -571,8 +632,6 @@ class AverageEmGapsDetectionWorker(BaseFetchWorker):
                 f"Found {len(mtr_msd_poll_hrs)} in '{mtr_cfg.meter_name}' meter.",
             )
 
-            self._meters_queue.task_done()
-
     def run(self, run_time: DateTime) -> None:
         """Run loop Entrypoint"""
         self.configure(run_time)
@@ -610,7 +669,7 @@ class AverageEmFetchWorker(WatTimeBaseFetchWorker):
         is greater than 12 hours
         3. Split miised hours in data ranges not more than 1 month
         5. Fetch al miised point
-        6. Save all fetched pints in separate raw file
+        6. Save all fetched points of a range in a single raw file
         7. Standardize all fetched raw files using usual approach
     """
 
@@ -622,7 +681,6 @@ class AverageEmFetchWorker(WatTimeBaseFetchWorker):
 
     __max_retry_count__ = 3
     __retry_delay__ = 0.5
-    __max_idle_run_count__ = 5
 
     def __init__(
         self,
@@ -645,15 +703,6 @@ class AverageEmFetchWorker(WatTimeBaseFetchWorker):
         self._factory = Factory(
             default_schema=Schema(trim_trailing_underscore=False, skip_internal=False)
         )
-        self._fetch_counter = Counter()
-        self._fetch_lock: Lock = Lock()
-
-        self._base_filename: Optional[str] = None
-
-    def configure(self, run_time: DateTime) -> None:
-        super().configure(run_time=run_time)
-        self._fetch_counter.clear()
-        self._base_filename = format_date(self._run_time, CFG.PROCESSING_DATE_FORMAT)
 
     def fetch_consumer(
         self,
@@ -666,78 +715,37 @@ class AverageEmFetchWorker(WatTimeBaseFetchWorker):
                 "Missed hours queue is empty. Maybe data up to date."
             )
             return None
-        empty_run_count = 0
         possible_errors = (
             AuthtorizeException,
             EmptyResponse,
             requests.exceptions.JSONDecodeError,
         )
         try:
-            token = self.authorize()
+            token = self.get_token()
         except AuthtorizeException as err:
             self._th_logger.error(f"Cannot fetch data due to the error '{err}'. Exit.")
             return None
         while True:
-            if not bool(len(self._missed_hours_queue)):
-                if empty_run_count == self.__max_idle_run_count__:
-                    break
-                empty_run_count += 1
-            else:
-                mtr_hours, mtr_cfgs = self._missed_hours_queue.popitem()
-                mtr_cfg_list = []
-                # TODO: Should Be redesigned to use threadsafety cached approach
-                while not mtr_cfgs.empty():
-                    mtr_cfg_list.append(mtr_cfgs.get())
-                    mtr_cfgs.task_done()
-                try:
-                    start_date = format_date(mtr_hours[0], CFG.PROCESSING_DATE_FORMAT)
-                    end_date = format_date(mtr_hours[-1], CFG.PROCESSING_DATE_FORMAT)
-
-                    data, token = self._request_data(
-                        url=self.__fetch_url__,
-                        params={
-                            "ba": self._config.grid_regions_name,
-                            "starttime": start_date,
-                            "endtime": end_date,
-                        },
-                        token=token,
-                    )
-
-                except possible_errors as err:
-                    self._th_logger.error(
-                        f"Cannot fetch data from  '{start_date}'  to '{end_date}' due "
-                        f"to the error '{err}'. Skipping."
-                    )
-                    continue
-
-                for point in data:
-                    point_data = truncate(parse(point.get("point_time")), level="hour")
-                    if point_data not in mtr_hours:
-                        self._th_logger.error(
-                            f"Found excess date in '{point_data}' hour in response."
-                            " Skipping."
-                        )
-                        continue
-                    with self._lock:
-                        filename = self.__fetch_file_name_tmpl__.format(
-                            base_file_name=self._base_filename,
-                            idx=self._fetch_counter["file_id"],
-                        )
-                        self._fetch_counter["file_id"] += 1
-
-                    file_info = DataFile(
-                        file_name=filename,
-                        bucket=self._config.extra.raw.bucket,
-                        path=self._config.extra.raw.path,
-                        body=dumps([point], indent=4, sort_keys=True),
-                    )
-                    file_info.timestamps.put(point_data)
-                    for cfg in mtr_cfg_list:
-                        file_info.meters.put(cfg)
+            try:
+                mtr_hours, mtr_cfgs = self._pop_expiring_item(self._missed_hours_queue)
+            except KeyError:
+                break
+
+            mtr_cfg_list = []
+            # TODO: Should Be redesigned to use threadsafety cached approach
+            while not mtr_cfgs.empty():
+                mtr_cfg_list.append(mtr_cfgs.get())
+                mtr_cfgs.task_done()
+            try:
+                data, token = self._request_range(list(mtr_hours), token)
+            except possible_errors as err:
+                self._th_logger.error(
+                    f"Cannot fetch data from '{mtr_hours[0]}' to "
+                    f"'{mtr_hours[-1]}' due to the error '{err}'. Skipping."
+                )
+                continue
 
-                    self._fetched_files_queue.put(file_info)
-                    self._shadow_fetched_files_queue.put(file_info)
-                    self._add_to_update(file_info, self._fetch_update_file_buffer)
+            self._put_range_file(list(mtr_hours), data, mtr_cfg_list)
 
     def run(self, run_time: DateTime) -> None:
         """Run loop entrypoint"""
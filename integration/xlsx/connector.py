@@ -3,16 +3,18 @@ import json
 import tempfile
 import uuid
 from dataclasses import dataclass, field
+from decimal import Decimal
 from json import dumps, load
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 import pandas as pd
+import pendulum as pdl
 from dataclass_factory import Factory
 
 from common import settings as CFG
-from common.data_representation.standardized.meter import Meter
-from common.date_utils import format_date, parse, truncate
+from common.data_representation.standardized.meter import meter_to_xml, xml_to_str
+from common.date_utils import format_date
 from common.elapsed_time import elapsed_timer
 from common.logging import Logger
 from integration.base_integration import BasePushConnector, StorageInfo
@@ -61,6 +63,7 @@ class ExtraInfo:
     participant_id: int = -1
     timezone: str = ""
     fetch_strategy: FetchStrategy = field(default_factory=FetchStrategy)
+    standardized_format: str = ""
 
 
 @dataclass
@@ -77,6 +80,8 @@ class XLSXConnector(BasePushConnector):
     __created_by__ = "XLSX Connector"
     __description__ = "XLSX Integration"
     __xlsx_sheet_name__ = "Sheet1"
+    __xlsx_time_column__ = "Time"
+    __xlsx_value_column__ = "Value"
 
     def __init__(self, env_tz_info):
         super().__init__(env_tz_info=env_tz_info)
@@ -117,26 +122,86 @@ class XLSXConnector(BasePushConnector):
 
     def _xlsx_read_validate(self, file_path: str) -> pd.DataFrame:
 
+        columns = (self.__xlsx_time_column__, self.__xlsx_value_column__)
         try:
-            dataframe = pd.read_excel(file_path, sheet_name=self.__xlsx_sheet_name__)
+            dataframe = pd.read_excel(
+                file_path,
+                sheet_name=self.__xlsx_sheet_name__,
+                usecols=lambda column: column in columns,
+            )
         except FileParsingError as err:
             raise FileParsingError(  # pylint:disable=raise-missing-from
                 f"Can not read raw {file_path} file due to the error {err}"
             )
 
-        columns = dataframe.columns.values.tolist()
-        if "Time" not in columns:
-            raise RawFileValidationError(
-                f"Time column should be present in file {file_path} due to template."
-            )
-
-        if "Value" not in columns:
-            raise RawFileValidationError(
-                f"Value column should be present in file {file_path} due to template."
-            )
+        for column in columns:
+            if column not in dataframe.columns:
+                raise RawFileValidationError(
+                    f"{column} column should be present in file {file_path} "
+                    "due to template."
+                )
 
         return dataframe
 
+    def _get_hours_usage(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Get valid usage values by hour, the last value of an hour is taken"""
+        times = pd.to_datetime(dataframe[self.__xlsx_time_column__], errors="coerce")
+        if times.dt.tz is not None:
+            times = times.dt.tz_localize(None)
+        hours_df = pd.DataFrame(
+            {
+                "hour": times.dt.floor("H"),
+                "usage": pd.to_numeric(
+                    dataframe[self.__xlsx_value_column__], errors="coerce"
+                ),
+            }
+        ).dropna()
+        return hours_df.drop_duplicates(subset=["hour"], keep="last")
+
+    def _get_hours_rows(self, hours_df: pd.DataFrame) -> List[Tuple[str, ...]]:
+        """Get file name, start time, end time and usage of every hour"""
+        xml_format = CFG.STANDARDIZED_METER_DATE_FORMAT
+        rows = []
+        for hour, usage in zip(hours_df["hour"], hours_df["usage"]):
+            start_date = pdl.instance(hour.to_pydatetime(), tz="UTC")
+            rows.append(
+                (
+                    format_date(start_date, CFG.PROCESSING_DATE_FORMAT),
+                    format_date(start_date, xml_format),
+                    format_date(start_date.add(minutes=59, seconds=59), xml_format),
+                    str(Decimal(str(usage))),
+                )
+            )
+        return rows
+
+    def _standardize_file(self, dataframe: pd.DataFrame) -> Tuple[int, int]:
+        """Queue upload of meters standardized files, return hours and files amount"""
+        rows = self._get_hours_rows(self._get_hours_usage(dataframe))
+        created_date = format_date(self._run_time, CFG.STANDARDIZED_METER_DATE_FORMAT)
+        for meter_info in self._config.meters:
+            meter_type = meter_info.type.strip()
+            meter_uri = str(meter_info.meter_uri).strip()
+            for filename, start_time, end_time, usage in rows:
+                self._put_standardized_file(
+                    {
+                        "meter_type": meter_type,
+                        "bucket": meter_info.standardized.bucket,
+                        "preffix": meter_info.standardized.path,
+                        "filename": filename,
+                        "file_body": xml_to_str(
+                            meter_to_xml(
+                                meter_uri=meter_uri,
+                                start_time=start_time,
+                                end_time=end_time,
+                                usage=usage,
+                                created_by=self.__created_by__,
+                                created_date=created_date,
+                            )
+                        ),
+                    }
+                )
+        return len(rows), len(rows) * len(self._config.meters)
+
     def standardize(self, working_directory: tempfile.TemporaryDirectory) -> None:
         with elapsed_timer() as elapsed:
             self._logger.debug("Standardizing new files.")
@@ -145,8 +210,6 @@ class XLSXConnector(BasePushConnector):
                 self._logger.error("Absent fetched data. Run fetch before")
             else:
                 for _, fl_info in enumerate(self._fetched_files, 1):
-                    self._logger.info(f"FILE INFO {fl_info}")
-
                     try:
                         dfs = self._xlsx_read_validate(fl_info["local"])
                     except (FileNotExists, RawFileValidationError) as err:
@@ -170,41 +233,12 @@ class XLSXConnector(BasePushConnector):
                         )
                         continue
 
-                    for _, row in dfs.iterrows():
-                        self._logger.info(
-                            f"TIME AND VALUE IN ROW {row['Time']}, {row['Value']}"
-                        )
-
-                        for _, meter_info in enumerate(self._config.meters, 1):
-
-                            start_date = truncate(parse(row["Time"]), level="hour")
-                            value = row["Value"]
-
-                            meter = Meter()
-                            meter.created_date = self._run_time
-                            meter.start_time = start_date
-                            meter.end_time = start_date.add(minutes=59, seconds=59)
-                            meter.created_by = self.__created_by__
-                            meter.usage = value
-                            meter.meter_uri = meter_info.meter_uri
-
-                            meter_type = meter_info.type.strip()
-                            self._standardized_files[meter_type].append(
-                                {
-                                    "meter_type": meter_info.type.strip(),
-                                    "bucket": meter_info.standardized.bucket,
-                                    "path": meter_info.standardized.path,
-                                    "filename": format_date(
-                                        start_date, CFG.PROCESSING_DATE_FORMAT
-                                    ),
-                                    "file_body": meter.as_str(),
-                                }
-                            )
-                            self._standardized_files_count[meter_type] += 1
-            self._upload_standardized_to_buckets(
-                self._standardized_files,
-                worker_replica=20,
-            )
+                    hours, files = self._standardize_file(dfs)
+                    self._logger.info(
+                        f"Standardized file '{fl_info['filename']}': {len(dfs)} "
+                        f"rows, {hours} valid hours, {files} standardized files."
+                    )
+            self._wait_for_uploads()
 
             self._logger.debug(
                 f"Processed {sum(self._standardized_files_count.values())} "